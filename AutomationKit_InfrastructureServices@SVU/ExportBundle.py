@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Use-Case: Offline Bundle export, for the air-gapped `HTTPD` / `TOMCAT` nodes.
+
+"""
+	Resolve and download the packages of a component set once, and write them to
+	a single offline bundle, along with a manifest of their versions, URIs and digests.
+
+	Usage: python3 ExportBundle.py {httpd | tomcat} <BUNDLE_FILE> [--refresh]
+
+	Copy the bundle over (or share it over NFS), and pass `--bundle <BUNDLE_FILE>`
+	to the build scripts on the air-gapped nodes. The `DOWNLOAD_MANAGER` is then
+	satisfied from the bundle, without any network call.
+"""
+
+################################## MODULE IMPORT SECTION ##################################
+
+# Import the `SYS` module to read the command-line options.
+import sys
+
+# Generic cache configurations module.
+import helpers.BuildConfig.Cache.CacheConfig
+
+# Generic `HTTPD` and `TOMCAT` configurations modules.
+import helpers.BuildConfig.Httpd.HttpdConfig, helpers.BuildConfig.Tomcat.TomcatConfig
+
+# Import the stage timings, to write out the Build Trace at the end of the run.
+import helpers.Utilities.TraceUtility
+
+# Import the Supervisor Script to Co-ordinate and control the Build Process flow.
+import helpers.BuildSupervisor
+
+###########################################################################################
+
+# The component sets, that can be bundled.
+BUNDLE_TARGETS = {
+	'httpd' : (helpers.BuildSupervisor.HttpdAutomate, helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT),
+	'tomcat': (helpers.BuildSupervisor.TomcatAutomate, helpers.BuildConfig.Tomcat.TomcatConfig.ENVIRONMENT)
+}
+
+command_arguments = [command_argument for command_argument in sys.argv[1:] if command_argument != '--refresh']
+if len(command_arguments) != 2 or command_arguments[0] not in BUNDLE_TARGETS:
+	sys.exit(__doc__)
+
+# Pass `--refresh` to re-resolve the latest versions, bypassing the resolution cache.
+if '--refresh' in sys.argv[1:]:
+	helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_REFRESH = True
+
+###################################### START THE BUNDLE EXPORT ###################################
+
+automate_class, build_environment = BUNDLE_TARGETS[command_arguments[0]]
+try:
+	automate_class.__init__(build_environment)
+	automate_class.export_bundle(command_arguments[1])
+finally:
+	helpers.Utilities.TraceUtility.shared_trace_recorder.finish()
@@ -1,31 +1,60 @@
-#!/usr/bin/env python3
-
-# Use-Case: Sample `HTTPD` & {`APR`, `APR-UTIL` and `PCRE`} Build and Installation script.
-# Author: Dipankar Achinta, <@tweeting_dipa>
-
-"""
-	This is a sample `HTTPD` Build and Installation Use-Case script.
-	Do not use this file. Just take this as a reference on how to
-	use the Automation-Kit to install the softwares that you need
-	and the ones that this utility supports (as of now).
-
-	Use the `AutomateBuild.py` file (same directory as this file),
-	to house the Build Script suitable for your Environment / Project's needs.
-"""
-
-################################## MODULE IMPORT SECTION ##################################
-
-# Generic `HTTPD` configurations module.
-import helpers.BuildConfig.Httpd.HttpdConfig
-
-# Import the Supervisor Script to Co-ordinate and control the Build Process flow.
-import helpers.BuildSupervisor
-
-###########################################################################################
-
-###################################### START `HTTPD` INSTALLATION PROCESS ###################################
-
-# Initiate `HTTPD` and its dependency (i.e., {`APR`, `APR-UTIL` and `PCRE`}) Download, Build and Install.
-# Wait for the Magic to Happen!!!
-helpers.BuildSupervisor.HttpdAutomate.__init__(helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT)
-helpers.BuildSupervisor.HttpdAutomate.initiate_build_workflow()
+#!/usr/bin/env python3
+
+# Use-Case: Sample `HTTPD` & {`APR`, `APR-UTIL` and `PCRE`} Build and Installation script.
+# Author: Dipankar Achinta, <@tweeting_dipa>
+
+"""
+	This is a sample `HTTPD` Build and Installation Use-Case script.
+	Do not use this file. Just take this as a reference on how to
+	use the Automation-Kit to install the softwares that you need
+	and the ones that this utility supports (as of now).
+
+	Use the `AutomateBuild.py` file (same directory as this file),
+	to house the Build Script suitable for your Environment / Project's needs.
+"""
+
+################################## MODULE IMPORT SECTION ##################################
+
+# Import the `SYS` module to read the command-line options.
+import sys
+
+# Generic cache and common configurations modules.
+import helpers.BuildConfig.Cache.CacheConfig, helpers.BuildConfig.Common.CommonConfig
+
+# Generic `HTTPD` configurations module.
+import helpers.BuildConfig.Httpd.HttpdConfig
+
+# Import the stage timings, to write out the Build Trace at the end of the run.
+import helpers.Utilities.TraceUtility
+
+# Import the Supervisor Script to Co-ordinate and control the Build Process flow.
+import helpers.BuildSupervisor
+
+###########################################################################################
+
+###################################### START `HTTPD` INSTALLATION PROCESS ###################################
+
+# Pass `--refresh` to re-resolve the latest versions, bypassing the resolution cache.
+if '--refresh' in sys.argv[1:]:
+	helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_REFRESH = True
+
+# Pass `--bundle <BUNDLE_FILE>` to take the packages from an offline bundle (see `ExportBundle.py`),
+# without any network call.
+if '--bundle' in sys.argv[1:-1]:
+	helpers.BuildConfig.Common.CommonConfig.OFFLINE_BUNDLE = sys.argv[sys.argv.index('--bundle') + 1]
+
+# A rerun of a failed build resumes at its first incomplete stage (see `CommonConfig.WORKFLOW_JOURNAL_ENABLED`).
+# Pass `--build-id <BUILD_ID>` to journal the build under its own id, and `--fresh` to run every stage again.
+if '--build-id' in sys.argv[1:-1]:
+	helpers.BuildConfig.Common.CommonConfig.WORKFLOW_BUILD_ID = sys.argv[sys.argv.index('--build-id') + 1]
+if '--fresh' in sys.argv[1:]:
+	helpers.BuildConfig.Common.CommonConfig.WORKFLOW_JOURNAL_FRESH = True
+
+# Initiate `HTTPD` and its dependency (i.e., {`APR`, `APR-UTIL` and `PCRE`}) Download, Build and Install.
+# Wait for the Magic to Happen!!!
+# The stage timings are written out at the end of the run (see `LoggerConfig.TRACE_FILENAME`).
+try:
+	helpers.BuildSupervisor.HttpdAutomate.__init__(helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT)
+	helpers.BuildSupervisor.HttpdAutomate.initiate_build_workflow()
+finally:
+	helpers.Utilities.TraceUtility.shared_trace_recorder.finish()
@@ -1,32 +1,54 @@
-#!/usr/bin/env python3
-
-# Use-Case: Sample `TOMCAT` & `JDK / JRE` Downloader and Installation script.
-# Author: Dipankar Achinta, <@tweeting_dipa>
-
-"""
-	This is a sample `TOMCAT` Installation Use-Case script.
-	Do not use this file. Just take this as a reference on how to
-	use the Automation-Kit to install the softwares that you need
-	and the ones that this utility supports (as of now).
-
-	Use the `AutomateBuild.py` file (same directory as this file),
-	to house the Build Script suitable for your Environment / Project's needs.
-"""
-
-################################## MODULE IMPORT SECTION ##################################
-
-# Generic `TOMCAT` configurations module.
-import helpers.BuildConfig.Tomcat.TomcatConfig
-
-# Import the Supervisor Script to Co-ordinate and control the Build Process flow.
-# Importing both, to test out the Generic Supervisor as well as the @SVU specific Supervisor.
-import helpers.BuildSupervisor, helpers.SVUCustomBuildSupervisor
-
-###########################################################################################
-
-###################################### START `TOMCAT` INSTALLATION PROCESS ###################################
-
-# Initiate `TOMCAT` and its dependency (i.e., `JDK / JRE`) Download and Install.
-# Wait for the Magic to Happen!!!
-helpers.BuildSupervisor.TomcatAutomate.__init__(helpers.BuildConfig.Tomcat.TomcatConfig.ENVIRONMENT)
-helpers.BuildSupervisor.TomcatAutomate.initiate_build_workflow()
+#!/usr/bin/env python3
+
+# Use-Case: Sample `TOMCAT` & `JDK / JRE` Downloader and Installation script.
+# Author: Dipankar Achinta, <@tweeting_dipa>
+
+"""
+	This is a sample `TOMCAT` Installation Use-Case script.
+	Do not use this file. Just take this as a reference on how to
+	use the Automation-Kit to install the softwares that you need
+	and the ones that this utility supports (as of now).
+
+	Use the `AutomateBuild.py` file (same directory as this file),
+	to house the Build Script suitable for your Environment / Project's needs.
+"""
+
+################################## MODULE IMPORT SECTION ##################################
+
+# Import the `SYS` module to read the command-line options.
+import sys
+
+# Generic cache and common configurations modules.
+import helpers.BuildConfig.Cache.CacheConfig, helpers.BuildConfig.Common.CommonConfig
+
+# Generic `TOMCAT` configurations module.
+import helpers.BuildConfig.Tomcat.TomcatConfig
+
+# Import the stage timings, to write out the Build Trace at the end of the run.
+import helpers.Utilities.TraceUtility
+
+# Import the Supervisor Script to Co-ordinate and control the Build Process flow.
+# Importing both, to test out the Generic Supervisor as well as the @SVU specific Supervisor.
+import helpers.BuildSupervisor, helpers.SVUCustomBuildSupervisor
+
+###########################################################################################
+
+###################################### START `TOMCAT` INSTALLATION PROCESS ###################################
+
+# Pass `--refresh` to re-resolve the latest versions, bypassing the resolution cache.
+if '--refresh' in sys.argv[1:]:
+	helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_REFRESH = True
+
+# Pass `--bundle <BUNDLE_FILE>` to take the packages from an offline bundle (see `ExportBundle.py`),
+# without any network call.
+if '--bundle' in sys.argv[1:-1]:
+	helpers.BuildConfig.Common.CommonConfig.OFFLINE_BUNDLE = sys.argv[sys.argv.index('--bundle') + 1]
+
+# Initiate `TOMCAT` and its dependency (i.e., `JDK / JRE`) Download and Install.
+# Wait for the Magic to Happen!!!
+# The stage timings are written out at the end of the run (see `LoggerConfig.TRACE_FILENAME`).
+try:
+	helpers.BuildSupervisor.TomcatAutomate.__init__(helpers.BuildConfig.Tomcat.TomcatConfig.ENVIRONMENT)
+	helpers.BuildSupervisor.TomcatAutomate.initiate_build_workflow()
+finally:
+	helpers.Utilities.TraceUtility.shared_trace_recorder.finish()
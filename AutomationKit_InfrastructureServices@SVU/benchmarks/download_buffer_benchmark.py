@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# Benchmark of the download writer loop: the reusable, adaptive `READINTO` buffer (see `BufferUtility`)
+# against the former fixed `IOConfig.CHUNK` reads (a fresh `BYTES` object per chunk), on a package served
+# by a local, unthrottled `HTTP` server (in a process of its own, hence its work isn't counted).
+# Prints the throughput, the `CPU` time, the number of reads, the chunk objects allocated (the `BYTES` objects
+# handed out by the response, per MiB downloaded, and the bytes they hold) and the peak memory (`TRACEMALLOC`) of each.
+# Run from the package directory: `python3 benchmarks/download_buffer_benchmark.py [--package-mib N] [--runs N]`.
+
+import argparse, http.server, logging, multiprocessing, os, statistics, sys, tempfile, time, tracemalloc
+
+# The benchmark imports the `HELPERS` package from the package directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import helpers.BuildConfig.IO.IOConfig
+import helpers.Utilities.BufferUtility, helpers.Utilities.HttpSessionUtility
+from urllib.request import Request
+
+def serve_package(package_bytes, server_port):
+	# Serves a package of `PACKAGE_BYTES` bytes at any path, as fast as the socket takes it.
+	package_block = os.urandom(1024 * 1024)
+
+	class PackageHandler(http.server.BaseHTTPRequestHandler):
+		protocol_version = 'HTTP/1.1'
+
+		def log_message(self, *args):
+			pass
+
+		def do_GET(self):
+			self.send_response(200)
+			self.send_header('Content-Length', str(package_bytes))
+			self.end_headers()
+			for block_start in range(0, package_bytes, len(package_block)):
+				self.wfile.write(package_block[:package_bytes - block_start])
+
+	package_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), PackageHandler)
+	server_port.value = package_server.server_address[1]
+	package_server.serve_forever()
+
+class CountingResponse(object):
+	# Counts the chunk objects the response allocates for the loop: a `BYTES` object per `READ`,
+	# none for a `READINTO` (it fills the buffer of the caller).
+	def __init__(self, response_object):
+		self.response_object = response_object
+		self.chunk_objects   = 0
+		self.chunk_bytes     = 0
+
+	def read(self, amt=None):
+		response_chunk = self.response_object.read(amt)
+		self.chunk_objects += 1
+		self.chunk_bytes   += len(response_chunk)
+		return response_chunk
+
+	def readinto(self, buffer_object):
+		return self.response_object.readinto(buffer_object)
+
+def fixed_chunk_download(response_object, package_object):
+	# The download writer loop before the adaptive buffer: a fresh `BYTES` object per `CHUNK` read.
+	read_count = 0
+	while True:
+		response_chunk = response_object.read(helpers.BuildConfig.IO.IOConfig.CHUNK)
+		read_count += 1
+		if not response_chunk:
+			return read_count
+		package_object.write(response_chunk)
+
+def adaptive_buffer_download(response_object, package_object):
+	# The download writer loop of `WebUtility`: reads into one reusable buffer, sized by the throughput.
+	read_buffer, read_count = helpers.Utilities.BufferUtility.AdaptiveBuffer(), 0
+	while True:
+		response_chunk = read_buffer.readinto(response_object)
+		read_count += 1
+		if not response_chunk:
+			return read_count
+		package_object.write(response_chunk)
+
+def measure(download_function, package_url, package_location, runs):
+	run_results = []
+	for _ in range(runs):
+		response_object = CountingResponse(helpers.Utilities.HttpSessionUtility.shared_session.urlopen(Request(package_url)))
+		tracemalloc.start()
+		wall_start, cpu_start = time.perf_counter(), time.process_time()
+		try:
+			with open(package_location, 'wb') as package_object:
+				read_count = download_function(response_object, package_object)
+		finally:
+			response_object.response_object.close()
+		run_results.append((time.perf_counter() - wall_start, time.process_time() - cpu_start, read_count,
+							tracemalloc.get_traced_memory()[1], response_object.chunk_objects, response_object.chunk_bytes))
+		tracemalloc.stop()
+	return run_results
+
+def main():
+	argument_parser = argparse.ArgumentParser()
+	argument_parser.add_argument('--package-mib', type=int, default=256)
+	argument_parser.add_argument('--runs', type=int, default=3)
+	benchmark_arguments = argument_parser.parse_args()
+
+	logging.disable(logging.CRITICAL)
+	package_bytes = benchmark_arguments.package_mib * 1024 * 1024
+
+	server_port    = multiprocessing.Value('i', 0)
+	server_process = multiprocessing.Process(target=serve_package, args=(package_bytes, server_port), daemon=True)
+	server_process.start()
+	while not server_port.value:
+		time.sleep(0.05)
+	package_url = 'http://127.0.0.1:' + str(server_port.value) + '/package.tar.gz'
+
+	try:
+		with tempfile.TemporaryDirectory() as benchmark_base:
+			print('package: ' + str(benchmark_arguments.package_mib) + ' MiB, median of ' +
+					str(benchmark_arguments.runs) + ' runs')
+			for loop_label, download_function in (('fixed chunk', fixed_chunk_download),
+													('adaptive buffer', adaptive_buffer_download)):
+				run_results = measure(download_function, package_url, os.path.join(benchmark_base, 'package.tar.gz'),
+										benchmark_arguments.runs)
+				print('%-16s %7.1f MiB/s  cpu %.2fs  reads %6d  chunk objects %6.1f/MiB (%5.1f MiB)  peak %5.1f MiB' % (
+						loop_label, benchmark_arguments.package_mib / statistics.median(result[0] for result in run_results),
+						statistics.median(result[1] for result in run_results), run_results[-1][2],
+						run_results[-1][4] / benchmark_arguments.package_mib, run_results[-1][5] / (1024 * 1024),
+						max(result[3] for result in run_results) / (1024 * 1024)))
+	finally:
+		server_process.terminate()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Benchmark of the extraction backends of the `UNTAR_MANAGER` (see `UntarConfig.EXTRACT_BACKEND`).
+# Extracts a set of synthetic source packages (shaped like the `HTTPD`, `APR`, `APR-UTIL` and `PCRE`
+# source tarballs) sequentially, in threads, and in worker processes, and prints the wall time of each.
+# Run from the package directory: `python3 benchmarks/extract_backend_benchmark.py [--runs N] [--workers N]`.
+
+import argparse, io, logging, os, random, shutil, statistics, sys, tarfile, tempfile, time
+
+# The benchmark imports the `HELPERS` package from the package directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import helpers.BuildConfig.Common.CommonConfig, helpers.BuildConfig.Untar.UntarConfig
+import helpers.TaskManager, helpers.UntarPackage, helpers.Utilities.ExtractEngineUtility
+
+# The packages, by component: (number of members, mean member size).
+PACKAGE_SHAPES = {'Httpd': (2900, 3000), 'Apr': (900, 1900), 'Apr-Util': (750, 1700), 'Pcre': (560, 4200)}
+
+def write_packages(download_base):
+	# Source code like members: words out of a small vocabulary, hence they compress like sources do.
+	package_random = random.Random(1)
+	vocabulary     = [('w' + str(word_number)).encode() for word_number in range(500)]
+	for component, (member_count, member_size) in PACKAGE_SHAPES.items():
+		with tarfile.open(os.path.join(download_base, component.lower() + '-1.0.tar.gz'), 'w:gz') as tar_file:
+			for member_number in range(member_count):
+				member_bytes = b' '.join(package_random.choice(vocabulary)
+											for _ in range(max(1, int(package_random.expovariate(1 / member_size)) // 4)))
+				tar_member = tarfile.TarInfo(component.lower() + '-1.0/d' + str(member_number % 40) + '/f' +
+												str(member_number) + '.c')
+				tar_member.size = len(member_bytes)
+				tar_file.addfile(tar_member, io.BytesIO(member_bytes))
+
+def tar_binaries():
+	return {component: {'thread_name'  : component,
+						'thread_worker': helpers.UntarPackage.UntarPackageThread,
+						'thread_args'  : {'tar_file_name': component.lower() + '-1.0.tar.gz', 'tar_package_type': component + '/'}}
+				for component in PACKAGE_SHAPES}
+
+def run_backend(extract_base, extract_backend, task_workers):
+	helpers.BuildConfig.Untar.UntarConfig.EXTRACT_BACKEND   = extract_backend
+	helpers.BuildConfig.Common.CommonConfig.TASK_MAX_WORKERS = task_workers
+	shutil.rmtree(extract_base, ignore_errors=True)
+	helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY = extract_base + '/'
+
+	untar_manager = helpers.TaskManager.UntarManager()
+	run_start     = time.perf_counter()
+	untar_manager.begin(tar_binaries())
+	run_seconds   = time.perf_counter() - run_start
+
+	extracted_members = sum(len(member_manifest) for member_manifest in untar_manager.member_manifests.values())
+	if extracted_members != sum(member_count for member_count, _ in PACKAGE_SHAPES.values()):
+		raise SystemExit('Extracted ' + str(extracted_members) + ' Members with the ' + extract_backend + ' Backend')
+	return run_seconds
+
+def main():
+	argument_parser = argparse.ArgumentParser()
+	argument_parser.add_argument('--runs', type=int, default=5)
+	argument_parser.add_argument('--workers', type=int, default=len(PACKAGE_SHAPES))
+	benchmark_arguments = argument_parser.parse_args()
+
+	logging.disable(logging.CRITICAL)
+	helpers.BuildConfig.Untar.UntarConfig.EXTRACT_PROCESS_MAX_WORKERS = benchmark_arguments.workers
+
+	with tempfile.TemporaryDirectory() as benchmark_base:
+		helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE = benchmark_base + '/'
+		write_packages(benchmark_base)
+
+		# The worker processes are forked upfront, like the build supervisors do, before any threads run.
+		helpers.BuildConfig.Untar.UntarConfig.EXTRACT_BACKEND = 'process'
+		helpers.UntarPackage.start_process_pool(len(PACKAGE_SHAPES))
+
+		print('cores: ' + str(os.cpu_count()) + ', free cores: ' +
+				str(helpers.Utilities.ExtractEngineUtility.free_cores()) + ', runs: ' + str(benchmark_arguments.runs))
+		for run_label, extract_backend, task_workers in (('sequential (1 thread)', 'thread', 1),
+															('threads', 'thread', benchmark_arguments.workers),
+															('processes', 'process', benchmark_arguments.workers)):
+			run_times = [run_backend(os.path.join(benchmark_base, 'extract'), extract_backend, task_workers)
+							for _ in range(benchmark_arguments.runs)]
+			print('%-22s best %.2fs  median %.2fs' % (run_label, min(run_times), statistics.median(run_times)))
+
+if __name__ == '__main__':
+	main()
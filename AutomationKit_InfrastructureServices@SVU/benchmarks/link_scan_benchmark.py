@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# Benchmark of the streaming link scan of `WebUtility.get_link` (see `LinkScannerUtility`), against the
+# former read-the-whole-page-then-search, on a large page served by a local (throttled) `HTTP` server.
+# The link sits near the start of the page (the scan stops early), then at its very end (no early exit).
+# Prints the wall time and the peak memory (`TRACEMALLOC`) of each.
+# Run from the package directory: `python3 benchmarks/link_scan_benchmark.py [--page-mib N] [--rate-mbps N]`.
+
+import argparse, http.server, logging, os, re, statistics, sys, threading, time, tracemalloc
+
+# The benchmark imports the `HELPERS` package from the package directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import helpers.BuildConfig.Cache.CacheConfig
+import helpers.Utilities.WebUtility, helpers.Utilities.HttpSessionUtility
+from urllib.request import Request
+
+LINK_PATTERN = 'apache-tomcat-(\\d+\\.\\d+\\.\\d+)\\.tar\\.gz'
+PACKAGE_LINK = '<a href="apache-tomcat-8.5.99.tar.gz">apache-tomcat-8.5.99.tar.gz</a>\n'
+FILLER_LINE  = '<a href="notes/release-notes.html">Release Notes</a> <span>Lorem ipsum dolor sit amet.</span>\n'
+
+def build_page(page_bytes, link_offset):
+	filler_text = FILLER_LINE * (page_bytes // len(FILLER_LINE))
+	return (filler_text[:link_offset] + PACKAGE_LINK + filler_text[link_offset:]).encode('UTF-8')
+
+def serve_pages(pages, rate_bytes):
+	# Serves the pages (by path) at (about) `RATE_BYTES` per second, like a remote download page would.
+	class PageHandler(http.server.BaseHTTPRequestHandler):
+		protocol_version = 'HTTP/1.1'
+
+		def log_message(self, *args):
+			pass
+
+		def do_GET(self):
+			page_body = pages[self.path]
+			self.send_response(200)
+			self.send_header('Content-Type', 'text/html; charset=UTF-8')
+			self.send_header('Content-Length', str(len(page_body)))
+			self.end_headers()
+			send_start = time.perf_counter()
+			try:
+				for chunk_start in range(0, len(page_body), 64 * 1024):
+					self.wfile.write(page_body[chunk_start:chunk_start + 64 * 1024])
+					time.sleep(max(0.0, (chunk_start + 64 * 1024) / rate_bytes - (time.perf_counter() - send_start)))
+			except (BrokenPipeError, ConnectionResetError):
+				# The scan closed the connection once it found the link.
+				self.close_connection = True
+
+	page_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+	page_server.daemon_threads = True
+	threading.Thread(target=page_server.serve_forever, daemon=True).start()
+	return page_server
+
+def whole_page_search(target_url, link_pattern):
+	# `GET_LINK` before the link scanner: read and decode the whole page, then search it.
+	response_object = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(Request(target_url))
+	try:
+		content_body = response_object.read().decode('UTF-8')
+	finally:
+		response_object.close()
+	return re.search(link_pattern, content_body)
+
+def measure(scan_function, target_url, runs):
+	run_times, peak_bytes = [], 0
+	for _ in range(runs):
+		tracemalloc.start()
+		run_start    = time.perf_counter()
+		match_result = scan_function(target_url, LINK_PATTERN)
+		run_times.append(time.perf_counter() - run_start)
+		peak_bytes   = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+		tracemalloc.stop()
+		if match_result is None or match_result.group(1) != '8.5.99':
+			raise SystemExit('No Link Found at: {' + target_url + '}')
+	return statistics.median(run_times), peak_bytes
+
+def main():
+	argument_parser = argparse.ArgumentParser()
+	argument_parser.add_argument('--page-mib', type=int, default=20)
+	argument_parser.add_argument('--rate-mbps', type=float, default=50.0)
+	argument_parser.add_argument('--runs', type=int, default=3)
+	benchmark_arguments = argument_parser.parse_args()
+
+	logging.disable(logging.CRITICAL)
+	# Every run fetches the page (no `304` off the response cache).
+	helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED = False
+
+	page_bytes  = benchmark_arguments.page_mib * 1024 * 1024
+	pages       = {'/early.html': build_page(page_bytes, 3 * 1024), '/late.html': build_page(page_bytes, page_bytes)}
+	page_server = serve_pages(pages, benchmark_arguments.rate_mbps * 1024 * 1024)
+	try:
+		print('page: ' + str(benchmark_arguments.page_mib) + ' MiB at ' + str(benchmark_arguments.rate_mbps) +
+				' MB/s, median of ' + str(benchmark_arguments.runs) + ' runs')
+		for page_path, page_label in (('/early.html', 'link at 3 KiB'), ('/late.html', 'link at the end')):
+			target_url = 'http://127.0.0.1:' + str(page_server.server_address[1]) + page_path
+			for scan_label, scan_function in (('whole page', whole_page_search),
+												('link scanner', helpers.Utilities.WebUtility.get_link)):
+				run_seconds, peak_bytes = measure(scan_function, target_url, benchmark_arguments.runs)
+				print('%-16s %-13s %7.3fs  peak %6.1f MiB' % (page_label, scan_label, run_seconds, peak_bytes / (1024 * 1024)))
+	finally:
+		page_server.shutdown()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,34 @@
+# Content-Addressed `ARTIFACT` cache options.
+# Every downloaded `TAR` package is kept once in the cache, keyed by its `SHA-256` digest,
+# along with an index that maps the download URL to that digest.
+# Point the below directory to a shared (for eg., NFS) location, to let a fleet of nodes
+# share a single copy of each package.
+ARTIFACT_CACHE_ENABLED   = True
+ARTIFACT_CACHE_DIRECTORY = '/home/vagrant/downloads/MW_AUTOMATE/ArtifactCache/'
+
+# Upper bound (in bytes) for the cache size.
+# The Least Recently Used packages are evicted once the bound is crossed.
+ARTIFACT_CACHE_MAX_SIZE  = 2 * 1024 * 1024 * 1024
+
+# Conditional `HTTP` revalidation options for the version-discovery (index) pages.
+# The body of each page is kept along with its `ETag` / `Last-Modified` validators,
+# and is served from the below directory when the server answers `304 Not Modified`.
+RESPONSE_CACHE_ENABLED   = True
+RESPONSE_CACHE_DIRECTORY = '/home/vagrant/downloads/MW_AUTOMATE/ResponseCache/'
+
+# Registry of the packages verified against their published checksums.
+# Later stages (and runs) look the verified digests up here, instead of hashing the packages again.
+VERIFIED_DIGESTS_FILE    = '/home/vagrant/downloads/MW_AUTOMATE/VerifiedDigests.json'
+
+# Latest-version resolution cache options.
+# The package URI resolved for each component (by scraping its download pages) is kept
+# in the below file for `RESOLUTION_CACHE_TTL` seconds, so the warm runs skip the scrapes.
+# `RESOLUTION_CACHE_REFRESH` forces the re-resolution (set by the `--refresh` option of the build scripts).
+RESOLUTION_CACHE_ENABLED = True
+RESOLUTION_CACHE_FILE    = '/home/vagrant/downloads/MW_AUTOMATE/ResolutionCache.json'
+RESOLUTION_CACHE_TTL     = 6 * 60 * 60
+RESOLUTION_CACHE_REFRESH = False
+
+# Mirror history (time-to-first-byte samples and throughput of each host), used to rank
+# the mirrors of the package downloads (see `IOConfig.MIRROR_SELECTION_ENABLED`).
+MIRROR_HISTORY_FILE      = '/home/vagrant/downloads/MW_AUTOMATE/MirrorHistory.json'
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Perform Package-level setup operations.
+# Currently, kept blank. Put Package Initialization code as required.
\ No newline at end of file
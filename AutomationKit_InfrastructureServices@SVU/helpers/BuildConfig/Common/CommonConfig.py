@@ -1,14 +1,85 @@
-# `TAR` download base option.
-# The below setting holds the base directory to all the `TAR` package downloads.
-# Change this configuration option below, to store the `TAR` package(s) to your desired location.
-TAR_DOWNLOAD_BASE = '/home/vagrant/downloads/MW_AUTOMATE/TarPackages/'
-
-# Specify the value for successive `RETRIES`.
-# Change this value if necessary for your `ENVIRONMENT`.
-TASK_RETRIES     = 3
-
-######################## SUBPROCESS OUT FILE MODE ########################
-# This flag is common for any of the builds.
-# This flag specifies the write-to-file mode, for capturing each of the
-# `SUBPROCESS`' build-time output.
+# `TAR` download base option.
+# The below setting holds the base directory to all the `TAR` package downloads.
+# Change this configuration option below, to store the `TAR` package(s) to your desired location.
+TAR_DOWNLOAD_BASE = '/home/vagrant/downloads/MW_AUTOMATE/TarPackages/'
+
+# Specify the value for successive `RETRIES`.
+# Change this value if necessary for your `ENVIRONMENT`.
+TASK_RETRIES     = 3
+
+# Back-off between the `RETRIES` (in seconds).
+# The n-th retry waits a random delay (the "full jitter") of up to
+# `RETRY_BASE_DELAY * RETRY_MULTIPLIER ** (n - 1)`, at most `RETRY_MAX_DELAY`, so that the
+# retries of a fleet of nodes don't hit a struggling host in lockstep. A `Retry-After` from
+# the host (or its open circuit, see `IOConfig.CIRCUIT_*`) is waited out first, unless it
+# is beyond `RETRY_MAX_DELAY`, in which case the download fails straight away.
+RETRY_BASE_DELAY = 1
+RETRY_MULTIPLIER = 2
+RETRY_MAX_DELAY  = 60
+
+# Download engine used by the `DOWNLOAD_MANAGER`.
+# 'thread'  : One DownloaderThread task per component, doing blocking I/O on the task executor.
+# 'asyncio' : All the components resolved and fetched in a single thread, over non-blocking sockets.
+DOWNLOAD_ENGINE            = 'thread'
+
+# Maximum number of worker threads of the task executor, i.e., of the DownloaderThread /
+# UntarPackageThread tasks run at a time by the `DOWNLOAD_MANAGER` / `UNTAR_MANAGER`.
+TASK_MAX_WORKERS           = 4
+
+# Maximum number of components in flight at a time, for the 'asyncio' engine.
+ASYNC_DOWNLOAD_CONCURRENCY = 8
+
+# Offline (air-gapped) provisioning options.
+# Point the below option to a bundle written by `ExportBundle.py`, to satisfy the
+# `DOWNLOAD_MANAGER` entirely from the bundle, without any network call.
+OFFLINE_BUNDLE             = None
+
+# Verify the `SHA-256` digest of each package imported from the bundle, against its manifest.
+# Left off, the import is a plain (zero-copy) sequential read of the bundle.
+OFFLINE_BUNDLE_VERIFY      = False
+
+# Deadline options (in seconds, `NONE` for no bound).
+# The whole workflow (downloads and extractions, retries included) must complete within
+# `WORKFLOW_DEADLINE`, and each attempt of a component within `COMPONENT_TIME_BUDGET`
+# (and within the workflow deadline). An exceeded budget counts as a failed attempt, and is
+# retried. The managers wait `JOIN_GRACE_PERIOD` more for a thread past its budget, and then
+# give up on it.
+WORKFLOW_DEADLINE          = 60 * 60
+COMPONENT_TIME_BUDGET      = 15 * 60
+JOIN_GRACE_PERIOD          = 5
+
+# Fail-Fast policy.
+# Once a component fails for good (on its last attempt), its siblings still in flight (the
+# other downloads / extractions of the manager, or the other stages of the pipeline) are
+# cancelled right away, and their partial files removed, instead of the run failing only
+# once their transfers complete. Left off, the siblings are run to completion.
+FAIL_FAST                  = True
+
+# Build workflow options (for the `HTTPD` build).
+# 'pipeline' runs each component's download -> extract -> copy / build chain as soon as its
+# own inputs are ready (the total time is that of the critical path), 'phased' downloads
+# every component, then extracts every component, then builds (the total time is the sum
+# of the slowest component of each phase).
+BUILD_WORKFLOW             = 'pipeline'
+
+# Maximum number of pipeline stages run at a time, for the 'pipeline' workflow.
+PIPELINE_MAX_WORKERS       = 8
+
+# Checkpointed (resumable) build options, for the 'pipeline' workflow.
+# Each completed stage is recorded in a journal (one per build id, under the below directory),
+# along with its result, the fingerprint of its inputs and the artifacts it left on-disk.
+# A rerun of the build id resumes at the first stage not recorded, or invalidated (its inputs
+# changed, or its artifacts are gone). The journal is discarded once the build completes.
+# The build id is the `BUILD_TARGET` of the environment, unless `WORKFLOW_BUILD_ID` is set (by
+# the `--build-id` option of the build scripts). `WORKFLOW_JOURNAL_FRESH` (the `--fresh` option)
+# discards the journal, and runs every stage.
+WORKFLOW_JOURNAL_ENABLED   = True
+WORKFLOW_JOURNAL_DIRECTORY = '/home/vagrant/downloads/MW_AUTOMATE/WorkflowJournal/'
+WORKFLOW_BUILD_ID          = None
+WORKFLOW_JOURNAL_FRESH     = False
+
+######################## SUBPROCESS OUT FILE MODE ########################
+# This flag is common for any of the builds.
+# This flag specifies the write-to-file mode, for capturing each of the
+# `SUBPROCESS`' build-time output.
 SUBPROCESS_OUT_FILE_MODE = 'w'
\ No newline at end of file
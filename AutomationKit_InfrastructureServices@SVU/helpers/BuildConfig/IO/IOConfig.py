@@ -1,3 +1,79 @@
-# Get the "*.tar.gz" response for the `TAR` package download as chunks,
-# of below size limit.
-CHUNK = 16 * 1024
\ No newline at end of file
+# Get the "*.tar.gz" response for the `TAR` package download as chunks,
+# of below size limit.
+CHUNK = 16 * 1024
+
+# Network timeouts (in seconds), for every request.
+# A connection (and its `TLS` handshake) must complete within `CONNECT_TIMEOUT`, and
+# each read must return within `READ_TIMEOUT`. A stalled socket then fails (and is
+# retried by the `DOWNLOAD_MANAGER`) instead of hanging the build.
+# Both are further capped by the time budget of the component (see `CommonConfig`).
+CONNECT_TIMEOUT               = 10
+READ_TIMEOUT                  = 30
+
+# Pooled `HTTP` session options.
+# Connections are kept alive and reused for the successive requests to the same host.
+# Turn the pool off to fall back to a fresh `URLLIB` connection per request.
+POOL_ENABLED                  = True
+
+# Maximum number of connections (idle and in-use) kept per `SCHEME / HOST / PORT`.
+POOL_MAX_CONNECTIONS_PER_HOST = 4
+
+# Interval (in seconds) a request waiting for a free connection checks its time budget (and
+# cancellation token) at. It gives up (`PoolExhaustedError`) once its `CONNECT_TIMEOUT` is spent.
+POOL_ACQUIRE_POLL_INTERVAL    = 0.5
+
+# Segmented (multi-connection) download options.
+# Packages at least this large (in bytes) are fetched over the component's `DOWNLOAD_SEGMENTS`
+# concurrent `Range` connections. Smaller packages aren't worth the extra round-trips.
+SEGMENTED_DOWNLOAD_MIN_SIZE   = 8 * 1024 * 1024
+
+# Streaming link scan options.
+# The version-discovery pages are scanned as they stream in. The below number of
+# (decoded) characters is carried over between the chunks, so that a link split
+# across two chunks is still found. It bounds the length of a scraped link.
+LINK_SCAN_OVERLAP             = 4096
+
+# Checksum verification options.
+# The checksum file published next to a package is looked up with each of the below
+# extensions, in order (for eg., "<PACKAGE>.sha512", then "<PACKAGE>.sha256").
+CHECKSUM_ALGORITHMS           = ['sha512', 'sha256']
+
+# Download buffer options.
+# The package downloads are read into one reusable buffer. The size of each read
+# adapts to the observed throughput, aiming at the below duration per read, and
+# ranges from `CHUNK` up to `MAX_CHUNK` bytes.
+MAX_CHUNK                     = 1024 * 1024
+CHUNK_TARGET_SECONDS          = 0.01
+
+# Preallocate the package file from the `Content-Length` (with `posix_fallocate`),
+# so that it is laid out contiguously, and a full disk fails the download upfront.
+PREALLOCATE_ENABLED           = True
+
+# Mirror selection options.
+# The packages of the components with `MIRROR_URLS` are opened on the best mirror (from the
+# time-to-first-byte and throughput history kept in `CacheConfig.MIRROR_HISTORY_FILE`).
+# When the first byte is overdue, up to `MIRROR_MAX_HEDGES` hedged requests go to the next-best
+# mirrors, and the first to answer wins. The deadline is the `MIRROR_HEDGE_PERCENTILE` of the
+# host's first byte samples (within the below bounds), or `MIRROR_HEDGE_DELAY` (in seconds) while
+# the host has fewer than `MIRROR_HEDGE_MIN_SAMPLES` samples.
+MIRROR_SELECTION_ENABLED      = True
+MIRROR_MAX_HEDGES             = 1
+MIRROR_HEDGE_DELAY            = 1.0
+MIRROR_HEDGE_PERCENTILE       = 90
+MIRROR_HEDGE_MIN_SAMPLES      = 3
+MIRROR_HEDGE_MIN_DELAY        = 0.05
+MIRROR_HEDGE_MAX_DELAY        = 5.0
+
+# Number of first byte samples kept per host, and the package size (in bytes)
+# the mirrors are ranked for (the first byte, plus the transfer at the recorded throughput).
+MIRROR_HISTORY_SAMPLES        = 20
+MIRROR_RANK_SIZE              = 8 * 1024 * 1024
+
+# Circuit breaker options, per upstream host.
+# After `CIRCUIT_FAILURE_THRESHOLD` consecutive failures (connection failures, timeouts, `429`
+# and `5xx` answers), the circuit of the host opens: its requests fail straight away, without
+# hitting it, for `CIRCUIT_RESET_TIMEOUT` seconds. A single probe request is then let through
+# (the others keep failing fast), which closes the circuit on success, and opens it again on failure.
+CIRCUIT_BREAKER_ENABLED       = True
+CIRCUIT_FAILURE_THRESHOLD     = 3
+CIRCUIT_RESET_TIMEOUT         = 30
\ No newline at end of file
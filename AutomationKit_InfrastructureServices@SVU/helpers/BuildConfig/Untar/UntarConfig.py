@@ -1,9 +1,60 @@
-# Default `TAR` package extensions.
-# Please change the below value to suit your corresponding environment requirement.
-TAR_EXTENSION = {'gz': '.tar.gz', 'bz2': '.tar.bz2'}
-
-# Store the `TAR` extracts in the below destination directory option.
-TAR_BASE_EXTRACT_DIRECTORY = '/home/vagrant/downloads/MW_AUTOMATE/TarExtractsCommon/'
-
-# Default `TAR` extraction directory.
-DEFAULT_TAR_PACKAGE_TYPE = 'Default/'
\ No newline at end of file
+# Default `TAR` package extensions.
+# Please change the below value to suit your corresponding environment requirement.
+TAR_EXTENSION = {'gz': '.tar.gz', 'bz2': '.tar.bz2'}
+
+# Store the `TAR` extracts in the below destination directory option.
+TAR_BASE_EXTRACT_DIRECTORY = '/home/vagrant/downloads/MW_AUTOMATE/TarExtractsCommon/'
+
+# Default `TAR` extraction directory.
+DEFAULT_TAR_PACKAGE_TYPE = 'Default/'
+
+# Streaming extraction options.
+# When enabled, each package is extracted while it is being downloaded (the download
+# stream is teed into `TARFILE` stream mode), and the `UNTAR_MANAGER` skips it.
+# The extraction thread may lag the download by (at most) the below number of chunks.
+STREAM_EXTRACT_ENABLED      = False
+STREAM_EXTRACT_QUEUE_CHUNKS = 256
+
+# Extraction backend of the `UNTAR_MANAGER`.
+# 'thread'  : Each package is extracted within its UntarPackageThread task. The per-member work of
+#             `TARFILE` (header parsing, path joining, chmod / utime calls) holds the GIL, hence the
+#             concurrent extractions barely overlap.
+# 'process' : Each package is extracted in a worker process (the task waits on it), which returns
+#             the manifest of the members it extracted. The workers are forked when the build starts,
+#             before its threads (see `UntarPackage.start_process_pool`), the extraction falls back
+#             to the threads otherwise.
+# 'auto'    : 'process' when there are several packages to extract and (at least) two free cores.
+EXTRACT_BACKEND             = 'auto'
+
+# Maximum number of extraction worker processes (`NONE` for as many as there are free cores).
+EXTRACT_PROCESS_MAX_WORKERS = None
+
+# Interval (in seconds) the tasks check their time budget (and cancellation token) at, while
+# waiting on their worker process.
+EXTRACT_PROCESS_POLL_INTERVAL = 0.1
+
+# Extraction engine, of the `UNTAR_MANAGER` tasks (and worker processes).
+# 'pipelined' : The package is decompressed in a thread of its own (by `ZLIB` / `BZ2`, or by an
+#               external `pigz` / `lbzip2` when on the PATH), handing the stream over to the member
+#               writes through a bounded queue of `EXTRACT_ENGINE_QUEUE_CHUNKS`, hence the
+#               decompression and the disk writes overlap.
+# 'tarfile'   : `TARFILE` decompresses, parses and writes the members, all in the one thread.
+# 'auto'      : 'pipelined' when there are (at least) two free cores, 'tarfile' otherwise (on a
+#               single core, the hand-over costs more than it overlaps).
+EXTRACT_ENGINE              = 'auto'
+EXTRACT_ENGINE_QUEUE_CHUNKS = 64
+EXTRACT_ENGINE_READ_CHUNK   = 256 * 1024
+
+# Decompressor of the 'pipelined' engine, for each compression.
+# 'auto' picks the fastest one available, by a probe (decompressing `EXTRACT_PROBE_BYTES` of
+# sample data with each) run once, before the first extraction.
+EXTRACT_DECOMPRESSOR        = {'gz': 'auto', 'bz2': 'auto'}
+EXTRACT_PROBE_BYTES         = 4 * 1024 * 1024
+
+# Install mode of the extracted binaries (`TOMCAT`, `JAVA`) into their binary locations (see `InstallUtility`).
+# 'direct' : The packages are extracted straight into the `INSTALL_STAGING_DIRECTORY_NAME` directory within
+#            their binary location (on the destination filesystem), and renamed into place.
+# 'copy'   : The packages are extracted under `TAR_BASE_EXTRACT_DIRECTORY`, and renamed into place when
+#            on the same filesystem (copied over, otherwise).
+INSTALL_MODE                   = 'direct'
+INSTALL_STAGING_DIRECTORY_NAME = '.staging'
\ No newline at end of file
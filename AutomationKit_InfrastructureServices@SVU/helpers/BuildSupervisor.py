@@ -21,6 +21,9 @@ import abc
 # Import the `BUILD` configurations module(s).
 import helpers.BuildConfig.Tomcat.TomcatConfig, helpers.BuildConfig.Java.JavaConfig, helpers.BuildConfig.Untar.UntarConfig
 
+# Import the common configurations module, which holds the workflow deadline.
+import helpers.BuildConfig.Common.CommonConfig
+
 # Import the `BUILD` configurations module(s) for `HTTPD`.
 import helpers.BuildConfig.Httpd.HttpdConfig, helpers.BuildConfig.Apr.AprConfig, helpers.BuildConfig.AprUtil.AprUtilConfig
 
@@ -56,11 +59,39 @@ import helpers.Utilities.ValidateRequirementsUtility
 # automated build.
 import helpers.TaskManager
 
+# Import the component registry, which resolves the components of the build
+# (and their `THREAD` workers) from their `ENVIRONMENT['DEPENDENCY']`.
+import helpers.ComponentRegistry
+
 # Import the `UNTAR_PACKAGE` module / library.
 # Below module contains the `THREAD` definition for untarring
 # the required packages.
 import helpers.UntarPackage
 
+# Import the offline bundles module, to export the packages for the air-gapped nodes.
+import helpers.Utilities.BundleUtility
+
+# Import the deadlines module, the workflow runs within `CommonConfig.WORKFLOW_DEADLINE`.
+import helpers.Utilities.DeadlineUtility
+
+# Import the pipeline module, to run the build as a dependency graph of stages.
+import helpers.Utilities.PipelineUtility
+
+# Import the workflow journal, to resume a failed build at its first incomplete stage.
+import helpers.Utilities.JournalUtility
+
+# Import the stage timings, the copies are traced (and the trace is written at the end of the run).
+import helpers.Utilities.TraceUtility
+
+# Import the member filters, the filter of a component is an input of its extraction stage.
+import helpers.Utilities.MemberFilterUtility
+
+# Import the install module, to move the extracted binaries into place (rather than copying them).
+import helpers.Utilities.InstallUtility
+
+# Import the `FUNCTOOLS` module, to bind the arguments of the pipeline stages.
+import functools
+
 # The below module is a Python built-in module
 # for `UNTARRING` of compressed files.
 import tarfile
@@ -117,6 +148,15 @@ class Automate(metaclass=abc.ABCMeta):
 		# Create the necessary environment before executing the download.
 		cls.build_environment = target_build_environment
 
+		# Resolve the components of the build, dependencies first.
+		# A cycle among the dependencies (or an unregistered one) fails the build right away.
+		cls.component_resolver = helpers.ComponentRegistry.ComponentResolver(target_build_environment)
+		cls.component_resolver.resolve()
+
+		# Start the extraction worker processes (If Selected, see `UntarConfig.EXTRACT_BACKEND`) now,
+		# while the build runs a single thread, as they are forked.
+		helpers.UntarPackage.start_process_pool(len(cls.component_resolver.build_order()))
+
 		# Get the target system's details and store it as a dictionary.
 		cls.target_platform_details =   {
 											'System'         : platform.uname().system,
@@ -129,6 +169,11 @@ class Automate(metaclass=abc.ABCMeta):
 		# Can be used as evidence, while auditing the `BUILD`.
 		cls.build_start_time  = time.ctime()
 
+		# The deadline of the whole workflow. The `DOWNLOAD_MANAGER` and the `UNTAR_MANAGER`
+		# (hence, their threads and retries) run within it.
+		cls.workflow_deadline = helpers.Utilities.DeadlineUtility.Deadline(
+									helpers.BuildConfig.Common.CommonConfig.WORKFLOW_DEADLINE)
+
 		# Logging a comment.
 		build_supervisor_logger.info('BUILD_ENVIROMENT: ' + str(cls.build_environment) + ', NODE_DETAILS: ' +
 										str(cls.target_platform_details) + ', BUILD_TIME: {' + cls.build_start_time + '}')
@@ -161,6 +206,48 @@ class Automate(metaclass=abc.ABCMeta):
 		`UNTAR_MANAGER` class to perform `UNTAR` operations.
 		"""
 
+	# Utility / Helper for getting the packages to be downloaded, along with their `THREAD` workers.
+	@classmethod
+	def get_required_binaries(cls):
+		"""
+		Returns the `REQUIRED_BINARIES` for the `BUILD`, i.e., the dictionary of
+		`COMPONENT -> {THREAD-NAME, THREAD-WORKER}` handed to the `DOWNLOAD_MANAGER`,
+		for the components resolved from the `ENVIRONMENT['DEPENDENCY']`.
+		"""
+		return cls.component_resolver.required_binaries()
+
+	# Utility / Helper for getting the packages to be extracted, along with their `THREAD` workers.
+	@classmethod
+	def get_tar_binaries(cls, tar_binaries):
+		"""
+		Returns the `TAR_BINARIES` handed to the `UNTAR_MANAGER`, for the `TAR` packages
+		returned by the `DOWNLOAD_MANAGER` (keyed by their `TAR` component names).
+		"""
+		return cls.component_resolver.tar_binaries(tar_binaries)
+
+	@classmethod
+	def export_bundle(cls, bundle_location):
+		"""
+		Resolve and download the packages for the `BUILD`, and write them to an
+		offline bundle (along with a manifest of their versions, URIs and digests).
+		The bundle lets the air-gapped nodes run the `BUILD` without any network call
+		(see `CommonConfig.OFFLINE_BUNDLE`).
+		"""
+		# Build a `DOWNLOAD_MANAGER` instance.
+		download_manager = helpers.TaskManager.DownloadManager(deadline=cls.workflow_deadline)
+		try:
+			download_manager.begin(cls.build_environment['BUILD_TARGET'], cls.get_required_binaries())
+
+			# Write the downloaded packages to the bundle.
+			return helpers.Utilities.BundleUtility.export_bundle(bundle_location, cls.build_environment['BUILD_TARGET'],
+																	download_manager.downloaded_components)
+		except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError, tarfile.TarError) as \
+				buildSupervisor_automate_exportBundle_error:
+			# Put logging below.
+			build_supervisor_logger.error('ERROR::BUILD_SUPERVISOR::EXPORT_BUNDLE_FAILED::' +
+									str(buildSupervisor_automate_exportBundle_error))
+			raise
+
 # Class to specialize the behavior of the Base Class for
 # `TOMCAT` setup. The below class implements the abstract
 # method(s) of the `AUTOMATE` class defined above.
@@ -176,31 +263,22 @@ class TomcatAutomate(Automate):
 				os.mkdir(destination_location)
 
 			# Logging a comment.
-			build_supervisor_logger.info('Performing *COPY* operation for `BINARY_PACKAGE`: {' + extracted_binary_name +
+			build_supervisor_logger.info('Performing *INSTALL* operation for `BINARY_PACKAGE`: {' + extracted_binary_name +
 											'} from `SOURCE_LOCATION`: {' + source_location + '} to `DESTINATION_LOCATION`: {' +
 												destination_location + '}')
 
-			# Using subprocess' *check_call* to use the system `COPY` command.
-			# shultil.copytree is having trouble copying symlinks.
-			# Will look into that later.
-			WHITE_SPACE_SEPERATOR = ' '
-
-			# As `OS` belongs to the `*NIX` family.
-			OS_COPY_DIRECTIVE = 'cp -Rp'
-
-			# Now run the copy command to perform the *COPY* operation.
-			# Both os.mkdir & COPY command can create onlt one-level of extra directories.
-			# If multiple level of additional directories have to be created, than they will
-			# fail and raise an exception.
-			# So, make sure you have the directory structure planned out before copying anything,
-			# and make calls to directory creation utilities (platform specific) or language enabled functions,
-			# iff multiple levels of directory setup are required (p.s. that might require code change).
-			cp_command = (OS_COPY_DIRECTIVE + WHITE_SPACE_SEPERATOR + os.path.join(source_location, extracted_binary_name) +
-								WHITE_SPACE_SEPERATOR + os.path.join(destination_location, extracted_version_identifier))
-			subprocess.check_call(cp_command, shell=True)
+			# The extracted binary is renamed into place when on the same filesystem (it's extracted into
+			# the `DESTINATION_LOCATION` itself, with `UntarConfig.INSTALL_MODE` set to 'direct').
+			# Otherwise, it's copied over with the system `COPY` command (shultil.copytree is having
+			# trouble copying symlinks), into a temporary directory renamed into place.
+			# Either way, the `DESTINATION_LOCATION` never holds a partial copy of the binary.
+			with helpers.Utilities.TraceUtility.span('copy', extracted_binary_name):
+				install_method = helpers.Utilities.InstallUtility.install_tree(
+										os.path.join(source_location, extracted_binary_name),
+											os.path.join(destination_location, extracted_version_identifier))
 
 			# Logging a comment.
-			build_supervisor_logger.info('Copy Operation Successful')
+			build_supervisor_logger.info('Install Operation Successful (by {' + install_method + '})')
 		except (subprocess.CalledProcessError, OSError) as copyBinary_error:
 			# Put logging below.
 			build_supervisor_logger.error('ERROR::BUILD_SUPERVISOR::COPY_BINARY_FAILED::' + str(copyBinary_error))
@@ -221,10 +299,10 @@ class TomcatAutomate(Automate):
 		# and to get its version and other related information. (In our case just the version).
 		for tar_extract_name in list(tar_extract_names.keys()):
 			if helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_COMPONENT_NAME in tar_extract_name:
-				tar_extract_path = (helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+				tar_extract_path = helpers.Utilities.InstallUtility.extract_directory(
 										helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
 			elif helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME in tar_extract_name:
-				tar_extract_path = (helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+				tar_extract_path = helpers.Utilities.InstallUtility.extract_directory(
 										helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
 			tar_extract_names[tar_extract_name] = os.listdir(tar_extract_path).pop()
 
@@ -267,19 +345,20 @@ class TomcatAutomate(Automate):
 		Initiate the workflow for the `AUTOMATED_BUILD`.
 		Workflow includes: { DOWNLOAD_PACKAGES, UNTAR_PACKAGES [, COPY_BINARY...] }
 		"""
+		# Extract the binaries straight into their binary locations (If Selected), hence they are
+		# renamed into place, rather than copied over (see `UntarConfig.INSTALL_MODE`).
+		if helpers.BuildConfig.Untar.UntarConfig.INSTALL_MODE == 'direct':
+			helpers.Utilities.InstallUtility.register_staging(
+				helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+					helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_BINARY_LOCATION)
+			helpers.Utilities.InstallUtility.register_staging(
+				helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+					helpers.BuildConfig.Java.JavaConfig.JAVA_BINARY_LOCATION)
+
 		# Build a `DOWNLOAD_MANAGER` instance.
-		download_manager = helpers.TaskManager.DownloadManager()
+		download_manager = helpers.TaskManager.DownloadManager(deadline=cls.workflow_deadline)
 		try:
-			REQUIRED_BINARIES = {
-				helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME      : {
-					'thread_name'  : helpers.BuildConfig.Java.JavaConfig.JAVA_DOWNLOADER_THREAD_NAME,
-					'thread_worker': helpers.DownloaderUtilities.TomcatUtils.DownloadJava.JavaDownloaderThread
-				},
-				helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_COMPONENT_NAME: {
-					'thread_name'  : helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_DOWNLOADER_THREAD_NAME,
-					'thread_worker': helpers.DownloaderUtilities.TomcatUtils.DownloadTomcat.TomcatDownloaderThread
-				}
-			}
+			REQUIRED_BINARIES = cls.get_required_binaries()
 
 			# Gets back a dictionary containing the downloaded file-names of the `TAR` packages.
 			# Packages to be downloaded are provided by the `REQUIRED_BINARIES` configuration.
@@ -295,26 +374,9 @@ class TomcatAutomate(Automate):
 			raise
 
 		# Build an `UNTAR_MANAGER` instance.
-		untar_manager = helpers.TaskManager.UntarManager()
+		untar_manager = helpers.TaskManager.UntarManager(deadline=cls.workflow_deadline)
 		try:
-			TAR_BINARIES = {
-				helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME      : {
-					'thread_name'  : helpers.BuildConfig.Java.JavaConfig.JAVA_UNTAR_THREAD_NAME,
-					'thread_worker': helpers.UntarPackage.UntarPackageThread,
-					'thread_args'  : {
-						'tar_file_name'    : tar_binaries[helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_COMPONENT_NAME],
-						'tar_package_type' : helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_PACKAGE_TYPE_LOCATION
-					}
-				},
-				helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_COMPONENT_NAME: {
-					'thread_name'  : helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_UNTAR_THREAD_NAME,
-					'thread_worker': helpers.UntarPackage.UntarPackageThread,
-					'thread_args'  : {
-						'tar_file_name'   : tar_binaries[helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_COMPONENT_NAME],
-						'tar_package_type': helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_PACKAGE_TYPE_LOCATION
-					}
-				}
-			}
+			TAR_BINARIES = cls.get_tar_binaries(tar_binaries)
 
 			# Begin Package untarring operation.
 			untar_manager.begin(TAR_BINARIES)
@@ -333,19 +395,22 @@ class TomcatAutomate(Automate):
 		# can copy the desired `TAR_EXTRACT` to the the standard location.
 		tar_extract_names, java_binary_version, tomcat_binary_version = cls.get_extracted_names()
 
+		# Keep them around, the extracted packages are moved out of the extract location by the install.
+		cls.installed_binaries = (tar_extract_names, java_binary_version, tomcat_binary_version)
+
 		# Copy the required binaries to the standard location.
 		# Please change the location value as per your
 		# standard enterprise requirement.
 		try:
 			# Copy the `TOMCAT` binary to the standard location.
-			cls._copy_binary(source_location=(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+			cls._copy_binary(source_location=helpers.Utilities.InstallUtility.extract_directory(
 									helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_PACKAGE_TYPE_LOCATION),
 							destination_location=helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_BINARY_LOCATION,
 				extracted_binary_name=tar_extract_names[helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_COMPONENT_NAME],
 						extracted_version_identifier=tomcat_binary_version)
 
 			# Copy the `JAVA` binary to the standard location.
-			cls._copy_binary(source_location=(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+			cls._copy_binary(source_location=helpers.Utilities.InstallUtility.extract_directory(
 									helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_PACKAGE_TYPE_LOCATION),
 							destination_location=helpers.BuildConfig.Java.JavaConfig.JAVA_BINARY_LOCATION,
 				extracted_binary_name=tar_extract_names[helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_COMPONENT_NAME],
@@ -366,11 +431,10 @@ class HttpdAutomate(Automate):
 	def _copy_binary(cls, source_location, destination_location, extracted_source_name,
 						extracted_httpd_source_package, dependency_build):
 		try:
-			# Construct the complete destination path.
-			if dependency_build == helpers.BuildConfig.Apr.AprConfig.ENVIRONMENT['BUILD_TARGET']:
-				destination_location += extracted_httpd_source_package + '/srclib/' + 'apr/'
-			elif dependency_build == helpers.BuildConfig.AprUtil.AprUtilConfig.ENVIRONMENT['BUILD_TARGET']:
-				destination_location += extracted_httpd_source_package + '/srclib/' + 'apr-util/'
+			# Construct the complete destination path, i.e., the srclib directory registered for the dependency.
+			destination_location += extracted_httpd_source_package + '/srclib/' + \
+										helpers.ComponentRegistry.COMPONENT_REGISTRY[
+											helpers.ComponentRegistry.registry_name_of(dependency_build)].srclib_directory
 
 			# Check to see if the destination location exists.
 			# If not, create it before initiating the copy.
@@ -399,7 +463,8 @@ class HttpdAutomate(Automate):
 			# iff multiple levels of directory setup are required (p.s. that might require code change).
 			cp_command = (OS_COPY_DIRECTIVE + WHITE_SPACE_SEPERATOR + os.path.join(source_location, (extracted_source_name + '/*')) +
 								WHITE_SPACE_SEPERATOR + destination_location)
-			subprocess.check_call(cp_command, shell=True)
+			with helpers.Utilities.TraceUtility.span('copy', extracted_source_name):
+				subprocess.check_call(cp_command, shell=True)
 
 			# Logging a comment.
 			build_supervisor_logger.info('Copy Operation Successful')
@@ -408,56 +473,317 @@ class HttpdAutomate(Automate):
 			build_supervisor_logger.error('ERROR::BUILD_SUPERVISOR::COPY_BINARY_FAILED::' + str(copyBinary_error))
 			raise
 
-	# Utility / Helper for getting the extracted binaries' names.
+		return destination_location
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _build_pcre(cls, pcre_source_name, pcre_binary_version):
+		"""
+		Configure, compile and install the extracted `PCRE` source.
+		Returns the (version specific) install location of `PCRE`.
+		"""
+		# Start the Build for `PCRE`.
+		# Starting this means that all other dependencies and downloads have been resolved (If any).
+		# Or else, this section of the code will fail.
+		helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.__init__(
+									helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+									helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_PACKAGE_TYPE_LOCATION +
+									pcre_source_name,
+									binary_build_for=helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME)
+
+		# Include the version number in the docs directory for better management of software.
+		helpers.BuildConfig.Pcre.PcreConfig.PCRE_DOCDIR['docdir_options'] += pcre_binary_version
+
+		# Have the modified option included in the options list.
+		helpers.BuildConfig.Pcre.PcreConfig.ENABLE_OPTIONS_FLAGS.append(
+													helpers.BuildConfig.Pcre.PcreConfig.PCRE_DOCDIR['docdir_options'])
+
+		# Include the version number in the install directory for better management of software.
+		helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION += pcre_binary_version
+
+		# Set the `PREFIX` for the install needed by the `CONFIGURE` Options line.
+		helpers.BuildConfig.Pcre.PcreConfig.INSTALL_TIME_OPTIONS['prefix_options'] += \
+															helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION
+
+		helpers.BuildConfig.Pcre.PcreConfig.INSTALL_TIME_OPTIONS['enable_options'] = \
+										' '.join(helpers.BuildConfig.Pcre.PcreConfig.ENABLE_OPTIONS_FLAGS)
+
+		# Prepare the final Options line.
+		CONFIGURE_OPTIONS_LINE = ' '.join(helpers.BuildConfig.Pcre.PcreConfig.INSTALL_TIME_OPTIONS.values())
+
+		# Initiate the Binary Build from Source.
+		helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.initiate_source_build(CONFIGURE_OPTIONS_LINE)
+
+		return helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _build_httpd(cls, httpd_source_name, httpd_binary_version, pcre_binary_location=None):
+		"""
+		Configure, compile and install the extracted `HTTPD` source, against the
+		installed `PCRE` (and the `APR` / `APR-UTIL` sources copied under its srclib).
+		The `PCRE_BINARY_LOCATION` defaults to the one set while building `PCRE`, in this run.
+		Returns the (version specific) install location of `HTTPD`.
+		"""
+		# Start the Build for `HTTPD`.
+		# Starting this means that all other dependencies and downloads have been resolved (If any).
+		# Or else, this section of the code will fail.
+		helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.__init__(
+									helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+									helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_PACKAGE_TYPE_LOCATION +
+									httpd_source_name,
+									binary_build_for=helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME)
+
+		# Include the version number in the install directory for better management of software.
+		helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_BINARY_LOCATION += httpd_binary_version
+
+		# Set the `PREFIX` for the install needed by the `CONFIGURE` Options line.
+		helpers.BuildConfig.Httpd.HttpdConfig.INSTALL_TIME_OPTIONS['prefix_options'] += \
+															helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_BINARY_LOCATION
+
+		# Point `HTTPD` to the `PCRE`'s install location.
+		# The below `PCRE_BINARY_LOCATION` option contains the updated value
+		# (i.e., the version specific location) as per the change made while
+		# configuring the `PCRE` build.
+		# A resumed build (see `JournalUtility`) passes the location, as `PCRE` wasn't built in this run.
+		helpers.BuildConfig.Httpd.HttpdConfig.WITH_PCRE_POINTER['pcre_location'] += \
+									(pcre_binary_location or helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION)
+
+		# Add the following flag as `HTTPD` is having a hard time finding the installed `PCRE` package.
+		helpers.BuildConfig.Httpd.HttpdConfig.INSTALL_TIME_OPTIONS['enable_options'] += \
+													helpers.BuildConfig.Httpd.HttpdConfig.WITH_PCRE_POINTER['pcre_location']
+
+		# Prepare the final Options line.
+		CONFIGURE_OPTIONS_LINE = ' '.join(helpers.BuildConfig.Httpd.HttpdConfig.INSTALL_TIME_OPTIONS.values())
+
+		# Initiate the Binary Build from Source.
+		helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.initiate_source_build(CONFIGURE_OPTIONS_LINE)
+
+		return helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_BINARY_LOCATION
+
+	# <::PROTECTED_MEMBER_METHOD::>
 	@staticmethod
-	def get_extracted_names():
-		# Logging a comment.
-		build_supervisor_logger.info('Initiating Binary Name discovery')
+	def _extracted_name(tar_package_type):
+		"""
+		Returns a tuple of `(EXTRACTED SOURCE NAME, VERSION)` of the package extracted
+		under the `TAR_PACKAGE_TYPE` location.
+		"""
+		extracted_source_name = os.listdir(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+												tar_package_type).pop()
 
-		tar_extract_names = {helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_COMPONENT_NAME: None,
-								helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_COMPONENT_NAME: None,
-									helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_COMPONENT_NAME: None,
-										helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_COMPONENT_NAME: None}
+		match_result = re.search('\\d+\\.\\d+(\\.\\d+)?', extracted_source_name)
+		return extracted_source_name, (match_result.group(0) if match_result is not None else None)
 
-		HTTPD_BINARY_VERSION = PCRE_BINARY_VERSION = None
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _download_stage(cls, component, stage_results):
+		# Download the `TAR` package of the component, on its own `DOWNLOAD_MANAGER`.
+		download_manager = helpers.TaskManager.DownloadManager(deadline=cls.workflow_deadline)
+		return download_manager.begin(cls.build_environment['BUILD_TARGET'],
+										{component: cls.get_required_binaries()[component]})
 
-		# Iterate over each of the keys to identify the package type,
-		# and to get its version and related information. (In our case just the version).
-		for tar_extract_name in list(tar_extract_names.keys()):
-			if helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME in tar_extract_name:
-				tar_extract_path = (helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-										helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
-			elif helpers.BuildConfig.Apr.AprConfig.APR_COMPONENT_NAME in tar_extract_name:
-				tar_extract_path = (helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-										helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
-			elif helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_COMPONENT_NAME in tar_extract_name:
-				tar_extract_path = (helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-										helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
-			elif helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME in tar_extract_name:
-				tar_extract_path = (helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-										helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
-			tar_extract_names[tar_extract_name] = os.listdir(tar_extract_path).pop()
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _extract_stage(cls, component, stage_results):
+		# Extract the `TAR` package of the component, on its own `UNTAR_MANAGER`.
+		TAR_BINARIES = cls.get_tar_binaries(stage_results['DOWNLOAD::' + component])
 
-			# Meanwhile get the version number for each of the binaries
-			binary_version_identifier_pattern = '\d+\.\d+(\.\d+)?'
+		untar_manager = helpers.TaskManager.UntarManager(deadline=cls.workflow_deadline)
+		untar_manager.begin(TAR_BINARIES)
+		return cls._extracted_name(TAR_BINARIES[component]['thread_args']['tar_package_type'])
 
-			# Start pattern matching the version number in each of the binaries.
-			match_result = re.search(binary_version_identifier_pattern, tar_extract_names[tar_extract_name])
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _copy_source(cls, registry_name, dependent_name, tar_extract_names):
+		# Copy the extracted source of the (`SRCLIB`) component to the srclib directory of the
+		# extracted source of its dependent. The `TAR_EXTRACT_NAMES` are keyed by the registry names.
+		component = helpers.ComponentRegistry.COMPONENT_REGISTRY[registry_name]
+		return cls._copy_binary(source_location=(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+													component.tar_package_type),
+							destination_location=component.source_destination,
+							extracted_source_name=tar_extract_names[registry_name],
+							extracted_httpd_source_package=tar_extract_names[dependent_name],
+							dependency_build=component.build_target)
 
-			if match_result is not None:
-			 	if helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME in tar_extract_name:
-			 		HTTPD_BINARY_VERSION    = match_result.group(0)
-			 	elif helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME in tar_extract_name:
-			 		PCRE_BINARY_VERSION     = match_result.group(0)
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _build_source(cls, registry_name, extracted_names, binary_locations):
+		# Configure, compile and install the extracted source of the (`SOURCE`) component, with its
+		# `_BUILD_<REGISTRY NAME>` method, against the install locations of its (`SOURCE`) dependencies
+		# (for eg., `PCRE_BINARY_LOCATION` for `HTTPD`). The `BINARY_LOCATIONS` are keyed by the registry names.
+		source_build = getattr(cls, '_build_' + registry_name.lower(), None)
+		if source_build is None:
+			raise helpers.ComponentRegistry.ComponentRegistryError('No Source Build defined for the Component: {' +
+																	registry_name + '}')
+
+		dependency_locations = {dependency.lower() + '_binary_location': binary_locations[dependency]
+									for dependency in cls.component_resolver.dependency_graph()[registry_name]
+										if dependency in binary_locations}
+		return source_build(*extracted_names, **dependency_locations)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _copy_stage(cls, registry_name, dependent_name, stage_results):
+		# Copy the extracted source of the component to the srclib directory of its dependent.
+		return cls._copy_source(registry_name, dependent_name,
+								{name: stage_results['EXTRACT::' + helpers.ComponentRegistry.COMPONENT_REGISTRY[name].component_name][0]
+									for name in (registry_name, dependent_name)})
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _build_stage(cls, registry_name, stage_results):
+		# Build the extracted source of the component, once its dependencies are built (or copied).
+		binary_locations = {dependency: stage_results['BUILD::' + helpers.ComponentRegistry.COMPONENT_REGISTRY[dependency].component_name]
+								for dependency in cls.component_resolver.dependency_graph()[registry_name]
+									if helpers.ComponentRegistry.COMPONENT_REGISTRY[dependency].build_mode == 'source'}
+		return cls._build_source(registry_name,
+									stage_results['EXTRACT::' + helpers.ComponentRegistry.COMPONENT_REGISTRY[registry_name].component_name],
+									binary_locations)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _source_steps(cls):
+		"""
+		Returns the build steps of the source components, from their `BUILD_MODE` in the `ComponentRegistry`,
+		in the build order: a `('COPY', REGISTRY NAME, DEPENDENT NAME)` tuple for each dependent of a
+		`SRCLIB` component, and a `('BUILD', REGISTRY NAME, NONE)` tuple for a `SOURCE` component.
+		"""
+		source_steps = []
+		for registry_name in cls.component_resolver.dependency_graph():
+			build_mode = helpers.ComponentRegistry.COMPONENT_REGISTRY[registry_name].build_mode
+			if build_mode == 'srclib':
+				source_steps.extend(('COPY', registry_name, dependent_name)
+										for dependent_name in cls.component_resolver.dependents(registry_name))
+			elif build_mode == 'source':
+				source_steps.append(('BUILD', registry_name, None))
+		return source_steps
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _stage_name(cls, step_type, registry_name, dependent_name=None):
+		# The pipeline stage of a build step (for eg., `COPY::Apr-Main`). A component copied to
+		# several dependents gets a stage per dependent.
+		stage_name = step_type + '::' + helpers.ComponentRegistry.COMPONENT_REGISTRY[registry_name].component_name
+		if dependent_name is not None and len(cls.component_resolver.dependents(registry_name)) > 1:
+			stage_name += '::' + helpers.ComponentRegistry.COMPONENT_REGISTRY[dependent_name].component_name
+		return stage_name
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _workflow_journal(cls):
+		"""
+		Returns the workflow journal of the build id (see `CommonConfig.WORKFLOW_JOURNAL_ENABLED`), or `NONE`.
+		"""
+		if not helpers.BuildConfig.Common.CommonConfig.WORKFLOW_JOURNAL_ENABLED:
+			return None
+
+		build_id = helpers.BuildConfig.Common.CommonConfig.WORKFLOW_BUILD_ID or cls.build_environment['BUILD_TARGET']
+		workflow_journal = helpers.Utilities.JournalUtility.WorkflowJournal(
+								os.path.join(helpers.BuildConfig.Common.CommonConfig.WORKFLOW_JOURNAL_DIRECTORY,
+												re.sub('[^\\w.-]', '_', build_id) + '.json'))
+
+		# Start afresh (If Asked).
+		if helpers.BuildConfig.Common.CommonConfig.WORKFLOW_JOURNAL_FRESH:
+			workflow_journal.discard()
+		return workflow_journal
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@classmethod
+	def _run_build_pipeline(cls):
+		"""
+		Run the workflow as a pipeline of per-component stages, each started as soon as the
+		stages it requires are done. The stages follow the components of the build, and their
+		`BUILD_MODE` in the `ComponentRegistry`:
+			DOWNLOAD::<COMPONENT> -> EXTRACT::<COMPONENT>, for each component.
+			COPY::<SRCLIB>        <- EXTRACT::<SRCLIB>, EXTRACT::<DEPENDENT> (the srclib must exist).
+			BUILD::<SOURCE>       <- EXTRACT::<SOURCE>, and the COPY / BUILD stages of its dependencies.
+		For eg., BUILD::HTTPD <- COPY::APR, COPY::APR-UTIL, BUILD::PCRE (configure needs PCRE installed),
+		hence `PCRE` is built while the `HTTPD` package is still downloading.
+		The completed stages are journaled, so that a rerun of a failed build resumes at its first
+		incomplete stage (see `CommonConfig.WORKFLOW_JOURNAL_ENABLED`).
+		"""
+		component_registry = helpers.ComponentRegistry.COMPONENT_REGISTRY
+		dependency_graph   = cls.component_resolver.dependency_graph()
+
+		workflow_journal = cls._workflow_journal()
+		build_pipeline   = helpers.Utilities.PipelineUtility.PipelineScheduler(
+								helpers.BuildConfig.Common.CommonConfig.PIPELINE_MAX_WORKERS, pipeline_name='HttpdPipeline',
+									fail_fast=helpers.BuildConfig.Common.CommonConfig.FAIL_FAST, journal=workflow_journal)
+
+		for component in cls.get_required_binaries():
+			tar_package_type = helpers.ComponentRegistry.component_for(component).tar_package_type
+
+			# The downloaded package (under `TAR_DOWNLOAD_BASE`), and the extracted source are the
+			# artifacts of the download, and of the extraction.
+			build_pipeline.add_stage('DOWNLOAD::' + component, functools.partial(cls._download_stage, component),
+										inputs=(component, helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE),
+				artifacts=lambda tar_binaries: [helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + os.path.basename(tar_file_name)
+													for tar_file_name in tar_binaries.values()])
+			build_pipeline.add_stage('EXTRACT::' + component, functools.partial(cls._extract_stage, component),
+										requires=('DOWNLOAD::' + component,),
+										inputs=(tar_package_type, helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY,
+												repr(helpers.Utilities.MemberFilterUtility.filter_for(tar_package_type))),
+				artifacts=lambda extracted_name, tar_package_type=tar_package_type: [
+								helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY + tar_package_type + extracted_name[0]])
+
+		# The configure options are fingerprinted as the stages are added, i.e., before the
+		# builds add the version specific locations to them.
+		for step_type, registry_name, dependent_name in cls._source_steps():
+			component = component_registry[registry_name]
+			if step_type == 'COPY':
+				build_pipeline.add_stage(cls._stage_name(step_type, registry_name, dependent_name),
+											functools.partial(cls._copy_stage, registry_name, dependent_name),
+											requires=('EXTRACT::' + component.component_name,
+														'EXTRACT::' + component_registry[dependent_name].component_name),
+											inputs=component.source_destination,
+											artifacts=lambda destination_location: [destination_location])
+				continue
+
+			# A dependency is copied (or built) before the component is, the others are extracted.
+			dependency_stages = tuple(cls._stage_name('COPY', dependency, registry_name)
+										if component_registry[dependency].build_mode == 'srclib' else
+											('BUILD::' if component_registry[dependency].build_mode == 'source' else 'EXTRACT::') +
+												component_registry[dependency].component_name
+										for dependency in dependency_graph[registry_name])
+			build_pipeline.add_stage(cls._stage_name(step_type, registry_name),
+										functools.partial(cls._build_stage, registry_name),
+										requires=('EXTRACT::' + component.component_name,) + dependency_stages,
+										inputs=component.build_inputs,
+										artifacts=lambda binary_location: [binary_location])
+
+		build_pipeline.run()
+
+		# The build completed, hence its next run starts afresh.
+		if workflow_journal is not None:
+			if workflow_journal.resumed_stages:
+				# Logging a comment.
+				build_supervisor_logger.info('Resumed the Build, skipping the journaled Stages: {' +
+												', '.join(workflow_journal.resumed_stages) + '}')
+			workflow_journal.discard()
+
+	# Utility / Helper for getting the extracted binaries' names.
+	@classmethod
+	def get_extracted_names(cls):
+		"""
+		Returns a tuple of `(TAR_EXTRACT_NAMES, BINARY_VERSIONS)`, i.e., the names of the extracted sources
+		and their versions, for each component of the build (keyed by their registry names).
+		"""
+		# Logging a comment.
+		build_supervisor_logger.info('Initiating Binary Name discovery')
+
+		tar_extract_names, binary_versions = {}, {}
+		for registry_name in cls.component_resolver.dependency_graph():
+			tar_extract_names[registry_name], binary_versions[registry_name] = cls._extracted_name(
+								helpers.ComponentRegistry.COMPONENT_REGISTRY[registry_name].tar_package_type)
 
 		# Logging a comment.
 		build_supervisor_logger.info('Package Names have been successfully extracted')
 
 		# Logging a comment.
-		build_supervisor_logger.info('Extracted VERSIONS => HTTPD: {' + HTTPD_BINARY_VERSION + '}' +
-										', PCRE: {' + PCRE_BINARY_VERSION + '}')
+		build_supervisor_logger.info('Extracted VERSIONS => ' + ', '.join(registry_name + ': {' + str(binary_version) + '}'
+																		for registry_name, binary_version in binary_versions.items()))
 
-		return tar_extract_names , HTTPD_BINARY_VERSION, PCRE_BINARY_VERSION
+		return tar_extract_names, binary_versions
 
 	# Since the below method doesn't actually require an instance
 	# to operate, it can be labelled as a `CLASS_METHOD`.
@@ -483,27 +809,26 @@ class HttpdAutomate(Automate):
 									str(buildSupervisor_httpdAutomate_initiateBuildWorkflow_validateRequirementsUtility_error))
 			raise
 
+		# Run the per-component pipeline, instead of the download / extract / build phases (If Enabled).
+		if helpers.BuildConfig.Common.CommonConfig.BUILD_WORKFLOW == 'pipeline':
+			try:
+				cls._run_build_pipeline()
+
+				# Logging a comment.
+				build_supervisor_logger.info('`HTTPD` Build Pipeline Successful')
+			except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, tarfile.TarError,
+						subprocess.CalledProcessError, IOError, OSError) as \
+							buildSupervisor_httpdAutomate_initiateBuildWorkflow_buildPipeline_error:
+				# Put logging below.
+				build_supervisor_logger.error('ERROR::BUILD_SUPERVISOR::INITIATE_BUILD_WORKFLOW::BUILD_PIPELINE_FAILED::' +
+										str(buildSupervisor_httpdAutomate_initiateBuildWorkflow_buildPipeline_error))
+				raise
+			return
+
 		# Build a `DOWNLOAD_MANAGER` instance.
-		download_manager = helpers.TaskManager.DownloadManager()
+		download_manager = helpers.TaskManager.DownloadManager(deadline=cls.workflow_deadline)
 		try:
-			REQUIRED_BINARIES = {
-				helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME       : {
-					'thread_name'  : helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_DOWNLOADER_THREAD_NAME,
-					'thread_worker': helpers.DownloaderUtilities.HttpdUtils.DownloadHttpd.HttpdDownloaderThread
-				},
-				helpers.BuildConfig.Apr.AprConfig.APR_COMPONENT_NAME             : {
-					'thread_name'  : helpers.BuildConfig.Apr.AprConfig.APR_DOWNLOADER_THREAD_NAME,
-					'thread_worker': helpers.DownloaderUtilities.HttpdUtils.DownloadApr.AprDownloaderThread
-				},
-				helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_COMPONENT_NAME: {
-					'thread_name'  : helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_DOWNLOADER_THREAD_NAME,
-					'thread_worker': helpers.DownloaderUtilities.HttpdUtils.DownloadAprUtil.AprUtilDownloaderThread
-				},
-				helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME          : {
-					'thread_name'  : helpers.BuildConfig.Pcre.PcreConfig.PCRE_DOWNLOADER_THREAD_NAME,
-					'thread_worker': helpers.DownloaderUtilities.HttpdUtils.DownloadPcre.PcreDownloaderThread
-				}
-			}
+			REQUIRED_BINARIES = cls.get_required_binaries()
 
 			# Gets back a dictionary containing the downloaded file-names of the `TAR` packages.
 			# Packages to be downloaded are provided by the `REQUIRED_BINARIES` configuration.
@@ -519,42 +844,9 @@ class HttpdAutomate(Automate):
 			raise
 
 		# Build an `UNTAR_MANAGER` instance.
-		untar_manager = helpers.TaskManager.UntarManager()
+		untar_manager = helpers.TaskManager.UntarManager(deadline=cls.workflow_deadline)
 		try:
-			TAR_BINARIES = {
-				helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME       : {
-					'thread_name'  : helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_UNTAR_THREAD_NAME,
-					'thread_worker': helpers.UntarPackage.UntarPackageThread,
-					'thread_args'  : {
-						'tar_file_name'    : tar_binaries[helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_COMPONENT_NAME],
-						'tar_package_type' : helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_PACKAGE_TYPE_LOCATION
-					}
-				},
-				helpers.BuildConfig.Apr.AprConfig.APR_COMPONENT_NAME             : {
-					'thread_name'  : helpers.BuildConfig.Apr.AprConfig.APR_UNTAR_THREAD_NAME,
-					'thread_worker': helpers.UntarPackage.UntarPackageThread,
-					'thread_args'  : {
-						'tar_file_name'   : tar_binaries[helpers.BuildConfig.Apr.AprConfig.APR_TAR_COMPONENT_NAME],
-						'tar_package_type': helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_PACKAGE_TYPE_LOCATION
-					}
-				},
-				helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_COMPONENT_NAME: {
-					'thread_name'  : helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_UNTAR_THREAD_NAME,
-					'thread_worker': helpers.UntarPackage.UntarPackageThread,
-					'thread_args'  : {
-						'tar_file_name'   : tar_binaries[helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_COMPONENT_NAME],
-						'tar_package_type': helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_PACKAGE_TYPE_LOCATION
-					}
-				},
-				helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME          : {
-					'thread_name'  : helpers.BuildConfig.Pcre.PcreConfig.PCRE_UNTAR_THREAD_NAME,
-					'thread_worker': helpers.UntarPackage.UntarPackageThread,
-					'thread_args'  : {
-						'tar_file_name'   : tar_binaries[helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_COMPONENT_NAME],
-						'tar_package_type': helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_PACKAGE_TYPE_LOCATION
-					}
-				},
-			}
+			TAR_BINARIES = cls.get_tar_binaries(tar_binaries)
 
 			# Begin Package untarring operation.
 			untar_manager.begin(TAR_BINARIES)
@@ -573,105 +865,35 @@ class HttpdAutomate(Automate):
 		# can copy the desired `TAR_EXTRACT` to the the desired location.
 		# Also the version numbers would be used while configuring and installing the
 		# compiled Source for `HTTPD` and `PCRE`.
-		tar_extract_names, httpd_binary_version, pcre_binary_version = cls.get_extracted_names()
+		tar_extract_names, binary_versions = cls.get_extracted_names()
+		source_steps = cls._source_steps()
 
-		# Copy the required sources to the desired location.
+		# Copy the required sources to the desired location (for eg., the `APR` and `APR-UTIL`
+		# sources to the HTTPD's srclib directory location).
 		# Please change the location value as per your
 		# standard enterprise requirement.
 		try:
-			# Copy the `APR` source to the HTTPD's srclib directory location.
-			cls._copy_binary(source_location=(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-									helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_PACKAGE_TYPE_LOCATION),
-							destination_location=helpers.BuildConfig.Apr.AprConfig.APR_SOURCE_PACKAGE_DESTINATION_LOCATION,
-				extracted_source_name=tar_extract_names[helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_COMPONENT_NAME],
-			extracted_httpd_source_package=tar_extract_names[helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_COMPONENT_NAME],
-			dependency_build=helpers.BuildConfig.Apr.AprConfig.ENVIRONMENT['BUILD_TARGET'])
-
-			# Copy the `APR-UTIL` source to the HTTPD's srclib directory location.
-			cls._copy_binary(source_location=(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-									helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_PACKAGE_TYPE_LOCATION),
-				destination_location=helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_SOURCE_PACKAGE_DESTINATION_LOCATION,
-			extracted_source_name=tar_extract_names[helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_COMPONENT_NAME],
-			extracted_httpd_source_package=tar_extract_names[helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_COMPONENT_NAME],
-			dependency_build=helpers.BuildConfig.AprUtil.AprUtilConfig.ENVIRONMENT['BUILD_TARGET'])
+			for step_type, registry_name, dependent_name in source_steps:
+				if step_type == 'COPY':
+					cls._copy_source(registry_name, dependent_name, tar_extract_names)
 		except OSError as buildSupervisor_httpdAutomate_initiateBuildWorkflow_copyBinary_error:
 			# Put logging below.
 			build_supervisor_logger.error('ERROR::BUILD_SUPERVISOR::INITIATE_BUILD_WORKFLOW::COPY_BINARY_FAILED::' +
 						str(buildSupervisor_httpdAutomate_initiateBuildWorkflow_copyBinary_error))
 			raise
 
-		# Start building the Source Packages to install them.
+		# Start building the Source Packages to install them (for eg., `PCRE`, then `HTTPD`),
+		# dependencies first.
 		# The Build process includes Configuring, Compiling and
 		# finally Installing the packages to the designated targets.
 		try:
-			################################################## BUILD PHASE I #################################################
-
-			# Start the Build for `PCRE`.
-			# Starting this means that all other dependencies and downloads have been resolved (If any).
-			# Or else, this section of the code will fail.
-			helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.__init__(
-										helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-										helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_PACKAGE_TYPE_LOCATION +
-										tar_extract_names[helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_COMPONENT_NAME],
-										binary_build_for=helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME)
-
-			# Include the version number in the docs directory for better management of software.
-			helpers.BuildConfig.Pcre.PcreConfig.PCRE_DOCDIR['docdir_options'] += pcre_binary_version
-
-			# Have the modified option included in the options list.
-			helpers.BuildConfig.Pcre.PcreConfig.ENABLE_OPTIONS_FLAGS.append(
-														helpers.BuildConfig.Pcre.PcreConfig.PCRE_DOCDIR['docdir_options'])
-
-			# Include the version number in the install directory for better management of software.
-			helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION += pcre_binary_version
-
-			# Set the `PREFIX` for the install needed by the `CONFIGURE` Options line.
-			helpers.BuildConfig.Pcre.PcreConfig.INSTALL_TIME_OPTIONS['prefix_options'] += \
-																helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION
-
-			helpers.BuildConfig.Pcre.PcreConfig.INSTALL_TIME_OPTIONS['enable_options'] = \
-											' '.join(helpers.BuildConfig.Pcre.PcreConfig.ENABLE_OPTIONS_FLAGS)
-
-			# Prepare the final Options line.
-			CONFIGURE_OPTIONS_LINE = ' '.join(helpers.BuildConfig.Pcre.PcreConfig.INSTALL_TIME_OPTIONS.values())
-
-			# Initiate the Binary Build from Source.
-			helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.initiate_source_build(CONFIGURE_OPTIONS_LINE)
-
-			################################################# BUILD PHASE II ################################################
-
-			# Start the Build for `HTTPD`.
-			# Starting this means that all other dependencies and downloads have been resolved (If any).
-			# Or else, this section of the code will fail.
-			helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.__init__(
-										helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-										helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_PACKAGE_TYPE_LOCATION +
-										tar_extract_names[helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_COMPONENT_NAME],
-										binary_build_for=helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME)
-
-			# Include the version number in the install directory for better management of software.
-			helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_BINARY_LOCATION += httpd_binary_version
-
-			# Set the `PREFIX` for the install needed by the `CONFIGURE` Options line.
-			helpers.BuildConfig.Httpd.HttpdConfig.INSTALL_TIME_OPTIONS['prefix_options'] += \
-																helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_BINARY_LOCATION
-
-			# Point `HTTPD` to the `PCRE`'s install location.
-			# The below `PCRE_BINARY_LOCATION` option contains the updated value
-			# (i.e., the version specific location) as per the change made while
-			# configuring the `PCRE` build.
-			helpers.BuildConfig.Httpd.HttpdConfig.WITH_PCRE_POINTER['pcre_location'] += \
-																	helpers.BuildConfig.Pcre.PcreConfig.PCRE_BINARY_LOCATION
-
-			# Add the following flag as `HTTPD` is having a hard time finding the installed `PCRE` package.
-			helpers.BuildConfig.Httpd.HttpdConfig.INSTALL_TIME_OPTIONS['enable_options'] += \
-														helpers.BuildConfig.Httpd.HttpdConfig.WITH_PCRE_POINTER['pcre_location']
-
-			# Prepare the final Options line.
-			CONFIGURE_OPTIONS_LINE = ' '.join(helpers.BuildConfig.Httpd.HttpdConfig.INSTALL_TIME_OPTIONS.values())
-
-			# Initiate the Binary Build from Source.
-			helpers.Utilities.BinaryBuildUtility.HttpdBuildFromSource.initiate_source_build(CONFIGURE_OPTIONS_LINE)
+			binary_locations = {}
+			for step_type, registry_name, _ in source_steps:
+				if step_type == 'BUILD':
+					binary_locations[registry_name] = cls._build_source(registry_name,
+																		(tar_extract_names[registry_name],
+																			binary_versions[registry_name]),
+																		binary_locations)
 		except (OSError, subprocess.CalledProcessError) as \
 						buildSupervisor_httpdAutomate_initiateBuildWorkflow_binaryBuildUtility_error:
 				# Put logging below.
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+
+# This module houses the registry of the components the builds are made of, and
+# the resolver of their dependencies.
+# Each component is registered under the name its dependents list it by, in their
+# `ENVIRONMENT['DEPENDENCY']` (for eg., `HTTPD` lists `['APR', 'APRUtil', 'PCRE']`).
+# The resolver builds the dependency graph of a build from these declarations,
+# and hands out the `REQUIRED_BINARIES` / `TAR_BINARIES` of its components to the
+# `DOWNLOAD_MANAGER` / `UNTAR_MANAGER`, and the download recipes to the `ASYNCIO`
+# download engine. The `BUILD_MODE` of a source component tells the build supervisor
+# how its dependents use it (copied under their srclib, or built and installed first).
+# Hence a new component only needs its configurations module, its DownloaderThread
+# and an entry below.
+
+###########################################
+# `IMPORT` Section.
+# Make all the necessary `IMPORTS` below.
+###########################################
+
+# Import the `BUILD` configurations module(s).
+import helpers.BuildConfig.Tomcat.TomcatConfig, helpers.BuildConfig.Java.JavaConfig
+
+# Import the `BUILD` configurations module(s) for `HTTPD`.
+import helpers.BuildConfig.Httpd.HttpdConfig, helpers.BuildConfig.Apr.AprConfig, helpers.BuildConfig.AprUtil.AprUtilConfig
+
+# Configuration options for the `PCRE` module / library.
+import helpers.BuildConfig.Pcre.PcreConfig
+
+# Import the `TOMCAT` and `JAVA` DownloaderThread modules.
+import helpers.DownloaderUtilities.TomcatUtils.DownloadJava, helpers.DownloaderUtilities.TomcatUtils.DownloadTomcat
+
+# Import the `HTTPD`, `APR`, `APR-UTIL` and `PCRE` DownloaderThread modules.
+import helpers.DownloaderUtilities.HttpdUtils.DownloadHttpd, helpers.DownloaderUtilities.HttpdUtils.DownloadApr
+import helpers.DownloaderUtilities.HttpdUtils.DownloadAprUtil, helpers.DownloaderUtilities.HttpdUtils.DownloadPcre
+
+# Import the UntarPackageThread module.
+import helpers.UntarPackage
+
+# Import the dependency graph helpers.
+import helpers.Utilities.DependencyUtility
+
+# Import the member filters, registered for the extraction of each component.
+import helpers.Utilities.MemberFilterUtility
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+COMPONENT_REGISTRY_LOGGER_NAME = '.ComponentRegistry'
+
+# Get the Logger Instance for the module.
+component_registry_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													COMPONENT_REGISTRY_LOGGER_NAME)
+
+#######################################################################
+
+class ComponentRegistryError(helpers.Utilities.DependencyUtility.DependencyError):
+	"""
+	Raised for an unregistered component (or build), or a cycle among the dependencies.
+	"""
+
+##############################################################
+# The section below contains the Class Definition for the
+# registered components.
+##############################################################
+
+class Component(object):
+	"""
+	The details of a registered component, as declared by its configurations module.
+	"""
+
+	def __init__(self, component_config, component_name, tar_component_name, tar_extract_component_name,
+					tar_package_type, downloader_thread_name, downloader_thread_worker, untar_thread_name,
+					extract_include=None, extract_exclude=None, download_url=None, resolution_hops=None,
+					request_headers=None, build_mode=None, srclib_directory=None, source_destination=None,
+					build_options=()):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.component_config           = component_config
+		self.component_name             = component_name
+		self.tar_component_name         = tar_component_name
+		self.tar_extract_component_name = tar_extract_component_name
+		self.tar_package_type           = tar_package_type
+		self.downloader_thread_name     = downloader_thread_name
+		self.downloader_thread_worker   = downloader_thread_worker
+		self.untar_thread_name          = untar_thread_name
+
+		# The glob patterns of the members to extract (see `MemberFilterUtility`).
+		self.extract_include            = extract_include
+		self.extract_exclude            = extract_exclude
+
+		# The resolution of the "*.tar.gz" package URI, as followed by the DownloaderThread: it
+		# starts at the `DOWNLOAD_URL`, and follows each `(PATTERN, PREFIX)` hop in turn (the page
+		# is scraped for the `PATTERN`, and the next URI is `PREFIX + MATCH`). The package is
+		# fetched with the `REQUEST_HEADERS` (If Any).
+		self.download_url               = download_url
+		self.resolution_hops            = list(resolution_hops or [])
+		self.request_headers            = dict(request_headers or {})
+
+		# How the extracted source is built (see `BUILD_MODES`): copied to the `SRCLIB_DIRECTORY` of
+		# the extracted source of its dependents (under the `SOURCE_DESTINATION`), or configured,
+		# compiled and installed (the `BUILD_OPTIONS` name the options of its configurations
+		# module, which the build depends on). `NONE` for the binary packages.
+		if build_mode not in BUILD_MODES:
+			raise ComponentRegistryError('Unknown Build Mode: {' + str(build_mode) + '} for the Component: {' +
+											component_name + '}')
+		self.build_mode                 = build_mode
+		self.srclib_directory           = srclib_directory
+		self.source_destination         = source_destination
+		self.build_options              = tuple(build_options)
+
+	@property
+	def build_target(self):
+		return self.component_config.ENVIRONMENT['BUILD_TARGET']
+
+	@property
+	def dependencies(self):
+		"""
+		Returns the names of the components it depends on, from its `ENVIRONMENT['DEPENDENCY']`.
+		"""
+		return list(self.component_config.ENVIRONMENT['DEPENDENCY'] or [])
+
+	@property
+	def build_inputs(self):
+		"""
+		Returns the current values of the `BUILD_OPTIONS` (for eg., to fingerprint the build).
+		"""
+		return tuple(getattr(self.component_config, build_option) for build_option in self.build_options)
+
+	@property
+	def download_recipe(self):
+		"""
+		Returns the recipe the `ASYNCIO` download engine resolves and fetches the component
+		with, or `NONE` (the engine then runs its DownloaderThread logic instead). The download
+		options (segments, checksum, mirrors) are the ones of its configurations module.
+		"""
+		if self.download_url is None:
+			return None
+		return {
+			'url'     : self.download_url,
+			'hops'    : self.resolution_hops,
+			'headers' : self.request_headers,
+			'segments': getattr(self.component_config, 'DOWNLOAD_SEGMENTS', 1),
+			'verify'  : getattr(self.component_config, 'VERIFY_CHECKSUM', False),
+			'extract' : self.tar_package_type,
+			'mirrors' : getattr(self.component_config, 'MIRROR_URLS', None)
+		}
+
+# The build modes of the source components: 'srclib' (copied under the srclib of the extracted
+# source of its dependents) and 'source' (configured, compiled and installed).
+BUILD_MODES = (None, 'srclib', 'source')
+
+# The registered components, by the name they are listed under in the `ENVIRONMENT['DEPENDENCY']`.
+COMPONENT_REGISTRY = {}
+
+# Utility / Helper function - 0.
+def register(registry_name, component):
+	"""
+	Register the `COMPONENT` under the `REGISTRY_NAME`, along with its member filter (If Any).
+	"""
+	COMPONENT_REGISTRY[registry_name] = component
+	helpers.Utilities.MemberFilterUtility.register(component.tar_package_type, component.extract_include,
+													component.extract_exclude)
+
+register('JAVA', Component(helpers.BuildConfig.Java.JavaConfig,
+							helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME,
+							helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_COMPONENT_NAME,
+							helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_COMPONENT_NAME,
+							helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+							helpers.BuildConfig.Java.JavaConfig.JAVA_DOWNLOADER_THREAD_NAME,
+							helpers.DownloaderUtilities.TomcatUtils.DownloadJava.JavaDownloaderThread,
+							helpers.BuildConfig.Java.JavaConfig.JAVA_UNTAR_THREAD_NAME,
+							extract_include=helpers.BuildConfig.Java.JavaConfig.JAVA_EXTRACT_INCLUDE,
+							extract_exclude=helpers.BuildConfig.Java.JavaConfig.JAVA_EXTRACT_EXCLUDE,
+							download_url=helpers.BuildConfig.Java.JavaConfig.DOWNLOADS_URL,
+							resolution_hops=[(helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_PATTERN,
+												helpers.BuildConfig.Java.JavaConfig.BASE_URL),
+											(helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_TAR_PATTERN, '')],
+							# Accept the Oracle Agreement, to make the download link available.
+							request_headers={'Cookie': 'gpw_e24=http://www.oracle.com/;oraclelicense=accept-securebackup-cookie'}))
+
+register('TOMCAT', Component(helpers.BuildConfig.Tomcat.TomcatConfig,
+							helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_COMPONENT_NAME,
+							helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_COMPONENT_NAME,
+							helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_COMPONENT_NAME,
+							helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+							helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_DOWNLOADER_THREAD_NAME,
+							helpers.DownloaderUtilities.TomcatUtils.DownloadTomcat.TomcatDownloaderThread,
+							helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_UNTAR_THREAD_NAME,
+							extract_include=helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_EXTRACT_INCLUDE,
+							extract_exclude=helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_EXTRACT_EXCLUDE,
+							download_url=helpers.BuildConfig.Tomcat.TomcatConfig.VERSION_DOWNLOAD_URL,
+							resolution_hops=[(helpers.BuildConfig.Tomcat.TomcatConfig.VERSION_DOWNLOAD_PATTERN,
+												helpers.BuildConfig.Tomcat.TomcatConfig.ARCHIVE_URL)]))
+
+register('HTTPD', Component(helpers.BuildConfig.Httpd.HttpdConfig,
+							helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME,
+							helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_COMPONENT_NAME,
+							helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_COMPONENT_NAME,
+							helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+							helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_DOWNLOADER_THREAD_NAME,
+							helpers.DownloaderUtilities.HttpdUtils.DownloadHttpd.HttpdDownloaderThread,
+							helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_UNTAR_THREAD_NAME,
+							download_url=helpers.BuildConfig.Httpd.HttpdConfig.DOWNLOAD_URL,
+							resolution_hops=[(helpers.BuildConfig.Httpd.HttpdConfig.DOWNLOAD_PATTERN,
+												helpers.BuildConfig.Httpd.HttpdConfig.ARCHIVE_URL)],
+							build_mode='source',
+							build_options=('INSTALL_TIME_OPTIONS', 'WITH_PCRE_POINTER', 'HTTPD_BINARY_LOCATION')))
+
+register('APR', Component(helpers.BuildConfig.Apr.AprConfig,
+							helpers.BuildConfig.Apr.AprConfig.APR_COMPONENT_NAME,
+							helpers.BuildConfig.Apr.AprConfig.APR_TAR_COMPONENT_NAME,
+							helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_COMPONENT_NAME,
+							helpers.BuildConfig.Apr.AprConfig.APR_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+							helpers.BuildConfig.Apr.AprConfig.APR_DOWNLOADER_THREAD_NAME,
+							helpers.DownloaderUtilities.HttpdUtils.DownloadApr.AprDownloaderThread,
+							helpers.BuildConfig.Apr.AprConfig.APR_UNTAR_THREAD_NAME,
+							download_url=helpers.BuildConfig.Apr.AprConfig.DOWNLOAD_URL,
+							resolution_hops=[(helpers.BuildConfig.Apr.AprConfig.DOWNLOAD_PATTERN,
+												helpers.BuildConfig.Apr.AprConfig.ARCHIVE_URL)],
+							build_mode='srclib',
+							srclib_directory='apr/',
+							source_destination=helpers.BuildConfig.Apr.AprConfig.APR_SOURCE_PACKAGE_DESTINATION_LOCATION))
+
+register('APRUtil', Component(helpers.BuildConfig.AprUtil.AprUtilConfig,
+							helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_COMPONENT_NAME,
+							helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_COMPONENT_NAME,
+							helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_COMPONENT_NAME,
+							helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+							helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_DOWNLOADER_THREAD_NAME,
+							helpers.DownloaderUtilities.HttpdUtils.DownloadAprUtil.AprUtilDownloaderThread,
+							helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_UNTAR_THREAD_NAME,
+							download_url=helpers.BuildConfig.AprUtil.AprUtilConfig.DOWNLOAD_URL,
+							resolution_hops=[(helpers.BuildConfig.AprUtil.AprUtilConfig.DOWNLOAD_PATTERN,
+												helpers.BuildConfig.AprUtil.AprUtilConfig.ARCHIVE_URL)],
+							build_mode='srclib',
+							srclib_directory='apr-util/',
+							source_destination=helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_SOURCE_PACKAGE_DESTINATION_LOCATION))
+
+register('PCRE', Component(helpers.BuildConfig.Pcre.PcreConfig,
+							helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME,
+							helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_COMPONENT_NAME,
+							helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_COMPONENT_NAME,
+							helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_EXTRACT_PACKAGE_TYPE_LOCATION,
+							helpers.BuildConfig.Pcre.PcreConfig.PCRE_DOWNLOADER_THREAD_NAME,
+							helpers.DownloaderUtilities.HttpdUtils.DownloadPcre.PcreDownloaderThread,
+							helpers.BuildConfig.Pcre.PcreConfig.PCRE_UNTAR_THREAD_NAME,
+							download_url=helpers.BuildConfig.Pcre.PcreConfig.DOWNLOAD_URL,
+							build_mode='source',
+							build_options=('INSTALL_TIME_OPTIONS', 'ENABLE_OPTIONS_FLAGS', 'PCRE_DOCDIR', 'PCRE_BINARY_LOCATION')))
+
+# Utility / Helper function - 1.
+def registry_name_of(build_target):
+	"""
+	Returns the registry name of the component built for the `BUILD_TARGET` (for eg., `__HTTPD__`).
+	"""
+	for registry_name, component in COMPONENT_REGISTRY.items():
+		if component.build_target == build_target:
+			return registry_name
+	raise ComponentRegistryError('No Component registered for the Build Target: {' + str(build_target) + '}')
+
+# Utility / Helper function - 2.
+def component_for(component_name):
+	"""
+	Returns the registered component named `COMPONENT_NAME` (for eg., `Apr-Main`), or `NONE`.
+	"""
+	return next((component for component in COMPONENT_REGISTRY.values() if component.component_name == component_name), None)
+
+##############################################################
+# The section below contains the Class Definition for the
+# dependency resolver.
+##############################################################
+
+class ComponentResolver(object):
+	"""
+	Resolves the components of the build for a `BUILD_ENVIRONMENT` (the `ENVIRONMENT` of
+	its configurations module): the build target and, transitively, its dependencies.
+	"""
+
+	def __init__(self, build_environment):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.build_environment = build_environment
+		self.registry_name     = registry_name_of(build_environment['BUILD_TARGET'])
+
+	def resolve(self):
+		"""
+		Resolve (and validate) the dependency graph of the build upfront.
+		Returns the components of the build, each after all of its dependencies.
+		"""
+		build_order = self.build_order()
+
+		# Logging a comment
+		component_registry_logger.info('Resolved the Components for the Build Target: {' + self.build_environment['BUILD_TARGET'] +
+										'} => ' + ' -> '.join(component.component_name for component in build_order) +
+										' (Parallel Width: {' + str(self.parallel_width()) + '})')
+		return build_order
+
+	def dependency_graph(self):
+		"""
+		Returns the dictionary of `REGISTRY NAME -> REGISTRY NAMES OF ITS DEPENDENCIES`, for
+		the build target and its dependencies, dependencies first. A component listing itself
+		(for eg., `TOMCAT`, which lists the components of its build) is not a dependency.
+		"""
+		dependency_graph = {}
+		visited_names    = set()
+
+		def visit(registry_name):
+			# A component is added after its dependencies (in the order they are listed).
+			# A cycle is left in the graph, for the `TOPOLOGICAL_ORDER` to report.
+			if registry_name in visited_names:
+				return
+			if registry_name not in COMPONENT_REGISTRY:
+				raise ComponentRegistryError('Unregistered Component: {' + registry_name + '}')
+			visited_names.add(registry_name)
+
+			component_dependencies = [dependency for dependency in COMPONENT_REGISTRY[registry_name].dependencies
+											if dependency != registry_name]
+			for dependency in component_dependencies:
+				visit(dependency)
+			dependency_graph[registry_name] = component_dependencies
+
+		visit(self.registry_name)
+		return dependency_graph
+
+	def dependents(self, registry_name):
+		"""
+		Returns the registry names of the components of the build, that depend on `REGISTRY_NAME`.
+		"""
+		return [dependent_name for dependent_name, dependencies in self.dependency_graph().items()
+					if registry_name in dependencies]
+
+	def build_order(self):
+		"""
+		Returns the components of the build, each after all of its dependencies.
+		Raises `ComponentRegistryError` for a cycle among the dependencies.
+		"""
+		try:
+			return [COMPONENT_REGISTRY[registry_name]
+						for registry_name in helpers.Utilities.DependencyUtility.topological_order(self.dependency_graph(),
+																									node_label='Component')]
+		except ComponentRegistryError:
+			raise
+		except helpers.Utilities.DependencyUtility.DependencyError as componentRegistry_buildOrder_error:
+			raise ComponentRegistryError(str(componentRegistry_buildOrder_error)) from componentRegistry_buildOrder_error
+
+	def parallel_width(self):
+		"""
+		Returns the maximum number of components of the build, that can be built at the same time.
+		"""
+		return helpers.Utilities.DependencyUtility.parallel_width(self.dependency_graph())
+
+	def required_binaries(self):
+		"""
+		Returns the `REQUIRED_BINARIES` handed to the `DOWNLOAD_MANAGER`, i.e., the dictionary
+		of `COMPONENT -> {THREAD-NAME, THREAD-WORKER}`, in the build order.
+		"""
+		return {
+			component.component_name: {
+				'thread_name'  : component.downloader_thread_name,
+				'thread_worker': component.downloader_thread_worker
+			}
+			for component in self.build_order()
+		}
+
+	def tar_binaries(self, tar_binaries):
+		"""
+		Returns the `TAR_BINARIES` handed to the `UNTAR_MANAGER`, for the `TAR` packages
+		returned by the `DOWNLOAD_MANAGER` (keyed by their `TAR` component names).
+		"""
+		return {
+			component.component_name: {
+				'thread_name'  : component.untar_thread_name,
+				'thread_worker': helpers.UntarPackage.UntarPackageThread,
+				'thread_args'  : {
+					'tar_file_name'   : tar_binaries[component.tar_component_name],
+					'tar_package_type': component.tar_package_type
+				}
+			}
+			for component in self.build_order() if component.tar_component_name in tar_binaries
+		}
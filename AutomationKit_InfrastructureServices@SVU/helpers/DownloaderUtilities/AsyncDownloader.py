@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+
+# This module houses the `ASYNCIO` download engine, an alternative to the
+# per-component DownloaderThread classes.
+# Every component is resolved and fetched by a coroutine, all of them running
+# in a single thread over non-blocking sockets. A semaphore bounds the number
+# of components in flight, and the engine can be cancelled cooperatively.
+# The DownloaderThread classes stay as the compatibility backend (and run any
+# component the engine has no recipe for).
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Get the component registry, which declares the resolution recipes of the components.
+import helpers.ComponentRegistry
+
+# Get the `ASYNCIO` Web Utility Module for the non-blocking web operations.
+import helpers.Utilities.AsyncWebUtility
+
+# Get the Resolver Utility Module, to skip the hops while the resolution is cached.
+import helpers.Utilities.ResolverUtility
+
+# Import the deadlines, each component runs within its time budget.
+import helpers.Utilities.DeadlineUtility
+
+# Import the stage timings, each component is traced.
+import helpers.Utilities.TraceUtility
+
+# Import the cancellation tokens, the engine is cancelled along with its `DOWNLOAD_MANAGER`.
+import helpers.Utilities.CancellationUtility
+
+# Import the `ASYNCIO` module.
+import asyncio
+
+# Import the `THREADING` module, to cancel the engine from another thread.
+import threading
+
+# Import the `TIME` module to time the resolutions.
+import time
+
+# Currently making use of `URLLIB` for the `REQUEST` / `ERROR` objects.
+from urllib.request import Request
+from urllib.error   import URLError, HTTPError, ContentTooShortError
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+ASYNC_DOWNLOADER_LOGGER_NAME = '.AsyncDownloader'
+
+# Get the Logger Instance for the module.
+async_downloader_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												ASYNC_DOWNLOADER_LOGGER_NAME)
+
+#######################################################################
+
+# Utility / Helper function - 0.
+def download_recipes():
+	"""
+	Returns the resolution recipes, per component, as declared in the `ComponentRegistry`
+	(see `Component.download_recipe`), i.e., the ones the DownloaderThread classes follow.
+	A recipe starts at `URL`, and follows each `(PATTERN, PREFIX)` hop in turn:
+	the page is scraped for the `PATTERN`, and the next URL is `PREFIX + MATCH`.
+	The last URL is the "*.tar.gz" package, fetched with the `HEADERS` (If Any) over
+	its `SEGMENTS`, verified against its published checksum with `VERIFY`, and extracted
+	to the `EXTRACT` directory (with `UntarConfig.STREAM_EXTRACT_ENABLED`). The package
+	is raced across the `MIRRORS` (If Any), see `MirrorUtility`.
+	"""
+	return {component.component_name: component.download_recipe
+				for component in helpers.ComponentRegistry.COMPONENT_REGISTRY.values()
+				if component.download_recipe is not None}
+
+class DownloadCancelledError(helpers.Utilities.CancellationUtility.TaskCancelledError):
+	"""
+	Raised by the engine once it has been cancelled. It isn't retried by
+	the `DOWNLOAD_MANAGER`.
+	"""
+
+##############################################################
+# The section below contains the Class Definitions for the
+# download results and the `ASYNCIO` download engine.
+##############################################################
+
+class AsyncDownloadResult(object):
+	"""
+	Outcome of a component download. Exposes the same attributes as the
+	DownloaderThread classes, so the `DOWNLOAD_MANAGER` treats both alike.
+	"""
+
+	def __init__(self, name):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.name              = name
+		self.download_complete = False
+		self.tar_file_name     = None
+		self.tar_url           = None
+
+	def getName(self):
+		return self.name
+
+class AsyncDownloadEngine(object):
+	"""
+	Resolve and fetch the components concurrently, within a single thread.
+	At most `MAX_CONCURRENCY` components are in flight at a time.
+	"""
+
+	def __init__(self, max_concurrency, recipes=None):
+		"""
+		The `INITIALIZE` method for the class.
+		The `RECIPES` default to the ones of the registered components (see `download_recipes`).
+		"""
+		self.max_concurrency = max_concurrency
+		self.recipes         = recipes if recipes is not None else download_recipes()
+
+		# The running event loop and its tasks, for the cancellation. <::PROTECTED_ATTRIBUTE::>
+		self._event_loop      = None
+		self._component_tasks = []
+		self._cancelled       = threading.Event()
+
+		# The cancellation token of the components (also checked by the DownloaderThread
+		# logic run for them), and the fail-fast policy of the run. <::PROTECTED_ATTRIBUTE::>
+		self._cancellation_token = None
+		self._fail_fast          = False
+
+	def run(self, required_binaries, components, exception_stacktrace_queue, deadline=None, cancellation_token=None,
+				fail_fast=False):
+		"""
+		Download the given components (keys of `REQUIRED_BINARIES`) and return a
+		dictionary of `COMPONENT -> RESULT`. The failures are put in the
+		`EXCEPTION_STACKTRACE_QUEUE`, as the DownloaderThread classes do.
+		Each component gets its time budget, within the workflow `DEADLINE` (If Any).
+		The engine is cancelled along with the `CANCELLATION_TOKEN` (If Any). With `FAIL_FAST`,
+		a failed component cancels the others, and the failure is reported as usual.
+		"""
+		download_results = {component: AsyncDownloadResult(required_binaries[component]['thread_name'])
+								for component in components}
+
+		# The token of this run, cancelled along with the `CANCELLATION_TOKEN` (If Any). It's held weakly
+		# by the `CANCELLATION_TOKEN`, hence the engine is let go once the run returns.
+		run_token = helpers.Utilities.CancellationUtility.CancellationToken(parent=cancellation_token,
+																			label=self.__class__.__name__ + 'Run')
+		run_token.on_cancel(lambda cancel_reason: self._cancelled.set())
+		self._fail_fast          = fail_fast
+		self._cancellation_token = helpers.Utilities.CancellationUtility.CancellationToken(parent=run_token,
+																							label=self.__class__.__name__)
+		self._cancellation_token.on_cancel(self._on_cancel)
+		if self._cancelled.is_set():
+			self._cancellation_token.cancel('Download Engine Cancelled')
+
+		asyncio.run(self._run_all(required_binaries, download_results, exception_stacktrace_queue, deadline))
+
+		if self._cancelled.is_set():
+			raise DownloadCancelledError('Download Engine Cancelled')
+		return download_results
+
+	def cancel(self):
+		"""
+		Cancel the in-flight downloads. Safe to call from any thread.
+		The cancelled downloads leave no partial file behind.
+		"""
+		self._cancelled.set()
+		if self._cancellation_token is not None:
+			self._cancellation_token.cancel('Download Engine Cancelled')
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _on_cancel(self, cancel_reason):
+		# Cancel the tasks on the event loop (If Running, else once it is up).
+		event_loop = self._event_loop
+		if event_loop is not None:
+			event_loop.call_soon_threadsafe(self._cancel_tasks)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _cancel_tasks(self):
+		for component_task in self._component_tasks:
+			component_task.cancel()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	async def _run_all(self, required_binaries, download_results, exception_stacktrace_queue, deadline):
+		self._event_loop = asyncio.get_running_loop()
+		concurrency_semaphore = asyncio.Semaphore(self.max_concurrency)
+
+		self._component_tasks = [asyncio.ensure_future(self._download(component, required_binaries[component],
+															download_results[component], concurrency_semaphore,
+															exception_stacktrace_queue, deadline))
+									for component in download_results]
+
+		# A cancellation requested before the loop came up.
+		if self._cancellation_token.cancelled():
+			self._cancel_tasks()
+
+		# Wait for all the components, whether they completed, failed or got cancelled.
+		await asyncio.gather(*self._component_tasks, return_exceptions=True)
+		self._event_loop = None
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	async def _download(self, component, required_binary, download_result, concurrency_semaphore,
+							exception_stacktrace_queue, deadline):
+		async with concurrency_semaphore:
+			# The time budget starts once the component is in flight. The task runs within
+			# its own copy of the context, hence the budget is bound to this component only.
+			helpers.Utilities.DeadlineUtility.bind(helpers.Utilities.DeadlineUtility.component_budget(component, deadline))
+
+			# Likewise, the spans recorded by the task are for the component, and its loops
+			# check the cancellation token of the engine.
+			helpers.Utilities.TraceUtility.bind_component(component)
+			helpers.Utilities.CancellationUtility.bind(self._cancellation_token)
+
+			recipe = self.recipes.get(component)
+			if recipe is None:
+				# No recipe for the component, run its DownloaderThread logic in the executor instead.
+				with helpers.Utilities.TraceUtility.span('download'):
+					await self._run_thread_worker(required_binary, download_result, exception_stacktrace_queue)
+
+				# Fail fast: the other components are cancelled, instead of waited for.
+				if self._fail_fast and not download_result.download_complete:
+					self._cancellation_token.cancel('{' + component + '} Failed on its Last Attempt')
+				return
+
+			# Logging a comment
+			async_downloader_logger.info('Starting Async Download for Component: {' + component + '}')
+
+			try:
+				with helpers.Utilities.TraceUtility.span('download'):
+					download_result.tar_file_name = await self._resolve_and_fetch(component, recipe, download_result)
+			except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as \
+					asyncDownloader_download_error:
+				# Put logging below.
+				async_downloader_logger.error(component + ' Download Failed: ' + str(asyncDownloader_download_error))
+				# Drop the cached resolution, in case the package is gone from the repository.
+				await asyncio.get_running_loop().run_in_executor(None,
+							helpers.Utilities.ResolverUtility.shared_resolution_cache.discard_stale,
+							component, asyncDownloader_download_error)
+				# Put the exception object in the Exception Queue to enable
+				# the TaskManager (or DownloadManager) to take care
+				# of the exception.
+				exception_stacktrace_queue.put(asyncDownloader_download_error)
+
+				# Fail fast: the other components are cancelled, instead of waited for.
+				if self._fail_fast:
+					self._cancellation_token.cancel('{' + component + '} Failed on its Last Attempt')
+			except (asyncio.CancelledError, helpers.Utilities.CancellationUtility.TaskCancelledError):
+				# Logging a comment
+				async_downloader_logger.warning('Async Download Cancelled for Component: {' + component + '}')
+				raise
+			else:
+				# Notify Download Complete.
+				download_result.download_complete = True
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	async def _resolve_and_fetch(self, component, recipe, download_result):
+		# The resolution is served from the cache while it is fresh, skipping the hops.
+		# The resolution inputs match the ones of the DownloaderThread classes,
+		# hence both the engines share the cached resolutions.
+		event_loop        = asyncio.get_running_loop()
+		resolution_cache  = helpers.Utilities.ResolverUtility.shared_resolution_cache
+		resolution_inputs = [recipe['url']] + [hop_item for recipe_hop in recipe['hops'] for hop_item in recipe_hop]
+		target_url        = None
+		resolve_start     = time.monotonic_ns()
+		if recipe['hops']:
+			target_url = await event_loop.run_in_executor(None, resolution_cache.lookup, component, resolution_inputs)
+		resolved_from_cache = target_url is not None
+
+		if target_url is None:
+			# Follow the resolution hops, to the "*.tar.gz" package URI.
+			target_url = recipe['url']
+			for link_pattern, url_prefix in recipe['hops']:
+				match_result = await helpers.Utilities.AsyncWebUtility.get_link(target_url, link_pattern)
+
+				# Check the match for `PATTERN::NOT::FOUND`.
+				# We need to update the URI configurations.
+				if match_result is None:
+					raise IOError('Pattern: {' + link_pattern + '} not found at URI: {' + target_url + '}')
+
+				# Logging a comment
+				async_downloader_logger.info('Found URI Pattern: {' + match_result.group(0) + '} from Referrer URI {' +
+												target_url + '}')
+				target_url = url_prefix + match_result.group(0)
+
+			if recipe['hops']:
+				await event_loop.run_in_executor(None, resolution_cache.record, component, resolution_inputs, target_url)
+
+		# Record the resolution (the hops, or the cache lookup) as a span of the component.
+		helpers.Utilities.TraceUtility.shared_trace_recorder.record('resolve', resolve_start, time.monotonic_ns(),
+																	span_args={'cached': resolved_from_cache})
+
+		# Logging a comment
+		async_downloader_logger.info('Tar Download URI constructed: {' + target_url + '} for Component: {' + component + '}')
+
+		# Prepare the request to download the file.
+		tar_request_object      = Request(target_url, headers=recipe['headers'])
+		download_result.tar_url = target_url
+		return await helpers.Utilities.AsyncWebUtility.download_tar_binary(target_url, tar_request_object,
+																				download_segments=recipe.get('segments', 1),
+																					verify_checksum=recipe.get('verify', False),
+																						extract_package_type=recipe.get('extract'),
+																							mirror_urls=recipe.get('mirrors'))
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	async def _run_thread_worker(required_binary, download_result, exception_stacktrace_queue):
+		# The DownloaderThread's `RUN` method is invoked directly (no new thread is started),
+		# its outcome is then copied over to the result.
+		downloader_thread = required_binary['thread_worker'](name=required_binary['thread_name'],
+																args=(exception_stacktrace_queue,),
+																	kwargs={'deadline': helpers.Utilities.DeadlineUtility.current()})
+		# The `RUN` method goes along with the context of the task (for eg., its cancellation token).
+		await asyncio.get_running_loop().run_in_executor(None, helpers.Utilities.DeadlineUtility.propagate(downloader_thread.run))
+		download_result.tar_file_name     = downloader_thread.tar_file_name
+		download_result.tar_url           = downloader_thread.tar_url
+		download_result.download_complete = downloader_thread.download_complete
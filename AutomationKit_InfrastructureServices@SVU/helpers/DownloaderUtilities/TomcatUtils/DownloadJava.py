@@ -17,6 +17,12 @@ import helpers.BuildConfig.Java.JavaConfig
 # Get the Web Utility Module for easing out the web related operations.
 import helpers.Utilities.WebUtility
 
+# Get the Deadline Utility Module, to run the download within its time budget.
+import helpers.Utilities.DeadlineUtility
+
+# Get the Resolver Utility Module, to skip the scrapes while the resolution is cached.
+import helpers.Utilities.ResolverUtility
+
 # Currently making use of `URLLIB`.
 # Need to make the port to `URLLIB3`.
 # Need to plan the code in such a way that it
@@ -73,7 +79,10 @@ class JavaDownloaderThread(threading.Thread):
 							daemon=daemon)
 		self.download_complete          = False
 		self.tar_file_name              = None
+		self.tar_url                    = None
 		self.exception_stacktrace_queue = args[0]
+		# The time budget of the download (If Any), set by the `DOWNLOAD_MANAGER`.
+		self.deadline                   = (kwargs or {}).get('deadline')
 
 	# Defines the `RUN` method logic below.
 	# This method is executed when the `THREAD` starts.
@@ -83,65 +92,96 @@ class JavaDownloaderThread(threading.Thread):
 		the returned URI response for the Standard Oracle Download Page and then downloading
 		the package for local / shared installation.
 		"""
-		try:
-			# Make the match test for the intended pattern within the URI returned resource.
-			match_result     = helpers.Utilities.WebUtility.get_link(helpers.BuildConfig.Java.JavaConfig.DOWNLOADS_URL,
-													helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_PATTERN)
-
-			# Pretty Self Explanatory.
-			# Check the match for `PATTERN::NOT::FOUND`.
-			if match_result is None:
-				# Enable logging here and abort.
-				# We need to update the URI configurations.
-				raise IOError
-
-			# Logging a comment
-			download_java_logger.info('Found URI Pattern: {' + match_result.group(0) + '} from Referrer URI {' +
-																		helpers.BuildConfig.Java.JavaConfig.DOWNLOADS_URL + '}')
-			# Get the `TAR::DOWNLOADS` page to download the "*.tar.gz" link.
-			DOWNLOAD_TAR_URL = helpers.BuildConfig.Java.JavaConfig.BASE_URL + match_result.group(0)
-
-			# Logging a comment
-			download_java_logger.info('Tar Download Referrer URI Ready: {' + DOWNLOAD_TAR_URL + '}')
-
-			# Make the match test for the intended pattern within the URI returned resource.
-			match_result     = helpers.Utilities.WebUtility.get_link(DOWNLOAD_TAR_URL,
-											helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_TAR_PATTERN)
+		# Bind the time budget, the network calls below cap their timeouts with it.
+		helpers.Utilities.DeadlineUtility.bind(self.deadline)
 
-			# Again check the match for `PATTERN::NOT::FOUND`.
-			if match_result is None:
-				# Enable logging here and abort.
-				# We need to update the URI configurations.
-				raise IOError
+		try:
+			# Resolve the "*.tar.gz" package URI (two scrapes).
+			# The resolution is served from the cache while it is fresh, skipping the scrapes.
+			# The inputs list the `(PATTERN, PREFIX)` of each scrape, the "*.tar.gz" link being absolute.
+			TAR_URL          = helpers.Utilities.ResolverUtility.shared_resolution_cache.resolve(helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME,
+									(helpers.BuildConfig.Java.JavaConfig.DOWNLOADS_URL, helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_PATTERN,
+										helpers.BuildConfig.Java.JavaConfig.BASE_URL, helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_TAR_PATTERN, ''), self.resolve_tar_url)
 
 			# Logging a comment
-			download_java_logger.info('Tar Download URI found: {' + match_result.group(0) + '}')
+			download_java_logger.info('Tar Download URI found: {' + TAR_URL + '}')
 
 			# Prepare the request to download the file.
 			# Also, add the necessary headers and cookie information to
 			# accept the Oracle Agreement and make the download
 			# link available.
-			tar_request_object  = Request(match_result.group(0))
+			tar_request_object  = Request(TAR_URL)
 			tar_request_object.add_header('Cookie',
 											'gpw_e24=http://www.oracle.com/;oraclelicense=accept-securebackup-cookie')
-			url_tar_file_name   = match_result.group(0)
+			url_tar_file_name   = TAR_URL
 
 			# Logging a comment
 			download_java_logger.info('{Request Prepared} Handing Off the Request Object to the *WebUtility* Service')
 
+			# Note the package URI (for eg., for the offline bundle manifest).
+			self.tar_url        = url_tar_file_name
+
 			# Invoke the Download action.
 			# Pass in the URI file-name to use as the download's base-name and
 			# the `REQUEST` object to initiate the request.
 			# Provide the `TAR` file-name to the DownloadManager Module.
-			self.tar_file_name  = helpers.Utilities.WebUtility.download_tar_binary(url_tar_file_name, tar_request_object)
+			self.tar_file_name  = helpers.Utilities.WebUtility.download_tar_binary(url_tar_file_name, tar_request_object,
+									download_segments=helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_SEGMENTS,
+									verify_checksum=helpers.BuildConfig.Java.JavaConfig.VERIFY_CHECKSUM,
+									extract_package_type=helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_EXTRACT_PACKAGE_TYPE_LOCATION)
 		except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as \
 				downloadJava_javaDownloaderThread_error:
 			# Put logging below.
 			download_java_logger.error('Java Download Failed: ' + str(downloadJava_javaDownloaderThread_error))
+			# Drop the cached resolution, in case the package is gone from the repository.
+			helpers.Utilities.ResolverUtility.shared_resolution_cache.discard_stale(helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME,
+																downloadJava_javaDownloaderThread_error)
 			# Put the exception object in the Exception Queue to enable
 			# the TaskManager (or DownloadManager) to take care
 			# of the exception.
 			self.exception_stacktrace_queue.put(downloadJava_javaDownloaderThread_error)
 		else:
 			# Notify Download Complete.
-			self.download_complete = True
\ No newline at end of file
+			self.download_complete = True
+
+	# Scrapes the Download Pages for the latest "*.tar.gz" package URI.
+	# Only invoked when the resolution cache has no fresh entry for the component.
+	def resolve_tar_url(self):
+		"""
+		Resolve the latest `JAVA` "*.tar.gz" package URI, by extracting the link to the
+		`TAR::DOWNLOADS` page from the Standard Oracle Download Page, and then the
+		"*.tar.gz" link from the `TAR::DOWNLOADS` page.
+		"""
+		# Make the match test for the intended pattern within the URI returned resource.
+		match_result     = helpers.Utilities.WebUtility.get_link(helpers.BuildConfig.Java.JavaConfig.DOWNLOADS_URL,
+												helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_PATTERN)
+
+		# Pretty Self Explanatory.
+		# Check the match for `PATTERN::NOT::FOUND`.
+		if match_result is None:
+			# Enable logging here and abort.
+			# We need to update the URI configurations.
+			raise IOError
+
+		# Logging a comment
+		download_java_logger.info('Found URI Pattern: {' + match_result.group(0) + '} from Referrer URI {' +
+																	helpers.BuildConfig.Java.JavaConfig.DOWNLOADS_URL + '}')
+		# Get the `TAR::DOWNLOADS` page to download the "*.tar.gz" link.
+		DOWNLOAD_TAR_URL = helpers.BuildConfig.Java.JavaConfig.BASE_URL + match_result.group(0)
+
+		# Logging a comment
+		download_java_logger.info('Tar Download Referrer URI Ready: {' + DOWNLOAD_TAR_URL + '}')
+
+		# Make the match test for the intended pattern within the URI returned resource.
+		match_result     = helpers.Utilities.WebUtility.get_link(DOWNLOAD_TAR_URL,
+										helpers.BuildConfig.Java.JavaConfig.DOWNLOAD_TAR_PATTERN)
+
+		# Again check the match for `PATTERN::NOT::FOUND`.
+		if match_result is None:
+			# Enable logging here and abort.
+			# We need to update the URI configurations.
+			raise IOError
+
+		# Logging a comment
+		download_java_logger.info('Tar Download URI resolved: {' + match_result.group(0) + '}')
+		return match_result.group(0)
\ No newline at end of file
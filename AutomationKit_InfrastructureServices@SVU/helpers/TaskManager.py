@@ -1,460 +1,697 @@
-#!/usr/bin/env python3
-
-# Author: Dipankar Achinta (@tweeting_dipa) [2017]
-
-###########################################
-# `IMPORT` Section.
-# Make all the necessary `IMPORTS` below.
-###########################################
-
-# Import the `BUILD` configurations module(s).
-import helpers.BuildConfig.Common.CommonConfig, helpers.BuildConfig.Tomcat.TomcatConfig, helpers.BuildConfig.Java.JavaConfig
-
-# Import the `BUILD` configurations module(s) for `HTTPD`.
-import helpers.BuildConfig.Httpd.HttpdConfig, helpers.BuildConfig.Apr.AprConfig, helpers.BuildConfig.AprUtil.AprUtilConfig
-
-# Configuration options for the `PCRE` module / library.
-import helpers.BuildConfig.Pcre.PcreConfig
-
-# Import the `ABC` module to work with `ABSTRACT` classes / methods.
-import abc
-
-# Import the `THREADING` library.
-import threading
-
-# Import the `TIME` module to perform time-manipulation operations.
-import time
-
-# Below `IMPORT` deals with errors during Network Communication(s).
-from urllib.error import URLError, HTTPError, ContentTooShortError
-
-# The below module is a Python built-in module
-# for `UNTARRING` of compressed files.
-import tarfile
-
-# Import the `QUEUE` module to make use of the
-# queue data-structure. In our program implementation,
-# the queue data-structure is used as a medium for passing
-# exception messages between the spawned threads and the
-# `DOWNLOAD_MANAGER | UNTAR_MANAGER` processes.
-import queue
-
-############# Configure the Logger options on this module #############
-
-import logging
-import helpers.Utilities.LoggerUtility
-import helpers.BuildConfig.Logger.LoggerConfig
-
-# The Logger name starts with a `PERIOD` (.), as it acts as
-# a seperator between the Local Logger name and the Application
-# wide Logger name.
-TASK_MANAGER_LOGGER_NAME = '.TaskManager'
-
-# Get the Logger Instance for the module.
-task_manager_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME + TASK_MANAGER_LOGGER_NAME)
-
-#######################################################################
-
-###########################################################
-# Task Manager Model for resolving dependent tasks,
-# required by the target software for the `AUTOMATED`
-# software build.
-###########################################################
-
-class TaskManager(object):
-	"""
-	Class blueprint for creating task agent(s) for the build. These instances / agents will
-	handle the entire dependency tasks and tasks specific to the target software for the
-	automated build. The `TASK_MANAGER` makes use of `THREAD`s, which allow for concurrent tasks
-	to be performed, which when done sequentially takes a lot of time.
-	"""
-
-	def __init__(self):
-		"""
-		The `INITIALIZE` method for the class.
-		"""
-		# Capture the `TASK` start time.
-		# Can be used as evidence, while auditing the `BUILD`.
-		self.task_start_time  = time.ctime()
-
-		# Specify the number of retries, in case of failures. <::PROTECTED_ATTRIBUTE::>
-		self._allowed_retries = helpers.BuildConfig.Common.CommonConfig.TASK_RETRIES
-
-		# Set the current `RETRY` count. <::PROTECTED_ATTRIBUTE::>
-		self._current_retry_count = 0
-
-		# Set the success flag to `FALSE` initially for each task.
-		self.task_successful = False
-
-		# Set the `INITIAL_RUN` status.
-		# Provides help in the identification of failed threads.
-		self.initial_run = True
-
-		# Helps us accumulate the failed threads and perform a retry on them.
-		self.failed_thread_list = []
-
-		# Logging a comment
-		task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Initialization Information: START_TIME: {' +
-						self.task_start_time + '}')
-
-	def begin(self, support_binaries):
-		"""
-		The `BEGIN` method takes care of the tasks to be performed for each build.
-		This method employs each task as a sub-classable Threaded entity and is executed 
-		by `THREAD`s spawned to make the tasks complete for the specific build(s).
-
-		PARAMETER:=> 	[BUILD_FOR] <OPTIONAL> = Target Build's Details.
-						SUPPORT_BINARIES       = A dictionary object consisting of the pre-build requisites.
-
-		`REQUIRED_BINARIES` is a nested dictionary. It contains the `THREAD-NAME` and
-		`THREAD-WORKER` logic that is to be simultaneously executed.
-		"""
-		pass
-
-	def allow_retry(self):
-		"""
-		Keep track of the number of retries done by the `TASK_MANAGER` instance.
-		Retries is by default set to 3 (`THREE`).
-		Can be changed by altering the value in the corresponding `CONFIG`
-		file.
-		"""
-		if self.current_retry_count <= self.retries_allowed():
-			# Increment the `RETRY_COUNT` attribute, via. an attribute `SETTER`.
-			self.current_retry_count = 1
-			return True
-		return False
-
-	# Use a `PROPERTY` setter and getter to access the protected member.
-	@property
-	def current_retry_count(self):
-		"""
-		Returns the `CURRENT` retry count for the specific `TASK_MANAGER`.
-		"""
-		return self._current_retry_count
-
-	@current_retry_count.setter
-	def current_retry_count(self, retry_increment_by):
-		# Perform the actual increment for the `RETRY_COUNT` attribute.
-		self._current_retry_count += retry_increment_by
-
-	def retries_allowed(self):
-		"""
-		Returns the specified maximum `RETRY` value allowed by the
-		`TASK_MANAGER` for the `BUILD`.
-		"""
-		return self._allowed_retries
-
-###########################################
-# Download Manager Model for downloading
-# dependencies and target software for the
-# `AUTOMATED` software build.
-###########################################
-
-class DownloadManager(TaskManager):
-	"""
-	Class blueprint for creating download agent(s) for the build. These instances / agents will
-	handle the entire dependency downloads and target software download for the automated
-	build. To make the downloads more time efficient, we are using the `THREADING` module
-	that the Python Standard Library provides. This allows us for concurrent simultaneous
-	downloads, which when done sequentially takes a lot of time.
-	"""
-
-	def begin(self, build_for, required_binaries):
-		"""
-		The `BEGIN` method takes care of the `TAR` package downloads.
-		Puts them under the `CONFIGURED` or `DEFAULT` directory accordingly.
-
-		PARAMETER:=> 	BUILD_FOR         = Target software for which the automated build is being performed.
-						REQUIRED_BINARIES = A dictionary object consisting of dependent tasks and other details.
-
-		`REQUIRED_BINARIES` is a nested dictionary. It contains the `THREAD-NAME` and
-		`THREAD-WORKER` logic that is to be simultaneously executed.
-		"""
-
-		# Keeps a handle to the newly spawned threads.
-		# Makes it easy for the caller to inspect the
-		# threads and also for accessing their state
-		# post execution.
-		thread_for = {}
-
-		while not self.task_successful and self.allow_retry():
-			try:
-				# Instantiate the `QUEUE` exception stacktrace object for the spawned threads.
-				exception_stacktrace_queue = queue.Queue()
-
-				# Logging a comment
-				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiating Downloader Threads...')
-
-				for component in list(required_binaries.keys()):
-					if self.initial_run or component in self.failed_thread_list:
-						downloader_thread = \
-								required_binaries[component]['thread_worker'](name=required_binaries[component]['thread_name'],
-																				args=(exception_stacktrace_queue,))
-						thread_for[component] = downloader_thread
-
-						# Logging a comment
-						task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiated Downloader Thread: {' +
-														downloader_thread.getName() + '}')
-
-						# Start the `THREAD`.
-						downloader_thread.start()
-
-				# The below method makes the main thread (or process) to block
-				# until the minion `THREAD`s complete their tasks.
-				# This would in turn block the `BEGIN` method from returning
-				# back to the caller.
-				the_main_thread = threading.main_thread()
-
-				for active_thread in threading.enumerate():
-					# If we `JOIN` the main thread of execution,
-					# it will introduce a deadlock. Hence, that
-					# needs to be skipped.
-					if active_thread is the_main_thread:
-						continue
-
-					# `JOIN` all the other active threads.
-					# It will block the main thread from exiting, i.e.,
-					# it waits for the chilren threads to finish their
-					# execution.
-					active_thread.join()
-
-				# Check the Exception Stack and re-raise the exception (If Any).
-				# The below statement is reached only after the threads finish
-				# their work either normally or abnormally.
-				if not exception_stacktrace_queue.empty():
-					# Get the first exception element and raise the same.
-					# Once, the exception is raised (if any), the exception
-					# handler will handle the overall exceptions raised by the
-					# spawned threads by checking their status flags.
-					raise exception_stacktrace_queue.get()
-
-			except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as \
-					taskManager_downloadManager_error:
-				# Put logging below.
-				task_manager_logger.error('[Class: {' + str(self.__class__) + '}] Download Operation Failed: ' +
-												str(taskManager_downloadManager_error))
-
-				# Delete the exception stacktrace queue
-				# before continuing with the next iteration of
-				# trials. This stacktrace object just lets us
-				# identify whether any exception(s) occurred in any of
-				# the spawned threads. Once we confirm that an exception
-				# has occurred, we check the status of all the threads
-				# spawned by the `DOWNLOAD_MANAGER` process and put them
-				# up for retry only if that particular thread failed during
-				# its execution.
-				del exception_stacktrace_queue
-
-				# It's past its `INITIAL_RUN` now.
-				# Mark it as `FALSE`.
-				self.initial_run = False
-
-				# Iterate over the spawned `THREAD` list dictionary.
-				# Check for each `THREAD`'s completion status.
-				# If completion status is `UNSET` (or False), add it to the
-				# failed thread list.
-				for component in list(thread_for.keys()):
-					if not thread_for[component].download_complete:
-						# Logging a comment
-						task_manager_logger.critical('[Class: {' + str(self.__class__) +
-												'}] Downloader Thread Failed for Component: {' +
-														component + '}')
-
-						# We don't want to re-add the component, if it is
-						# already present in the below list.
-						# Otherwise, it would spawn multiple `THREAD`s for
-						# the same component.
-						# The below check is an alternative to having cleared
-						# the list before each failed iteration.
-						if component not in self.failed_thread_list:
-							self.failed_thread_list.append(component)
-
-				# Check if the `DOWNLOAD` operation succeeded after the specified number of retries (If any).
-				# Raise the error if it failed for more than the specified value of `RETRY`.
-				if self.current_retry_count > self.retries_allowed():
-					# Logging a comment
-					task_manager_logger.critical('[Class: {' + str(self.__class__) + '}] Maximum Retries Exceeded. Please \
-													run a Diagnostic for probable issues.')
-					raise
-
-				# Logging a comment
-				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Current Download Retry Count: {' +
-												str(self.current_retry_count) + '}')
-			else:
-				# Get the `END_TIME` for the `DOWNLOAD` activity,
-				# for traceback / logging purposes.
-				# This is noted only for successful downloads.
-				self.task_end_time = time.ctime()
-
-				# Set the `DOWNLOAD` success flag to `TRUE.`
-				self.task_successful = True
-
-				# Logging a comment
-				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Download Successfully Completed')
-
-				# Return below dictionary, iff `BUILD` is for `TOMCAT`.
-				if build_for == helpers.BuildConfig.Tomcat.TomcatConfig.ENVIRONMENT['BUILD_TARGET']:
-					# Return the `TAR` package names.
-					# These would be used by the `UNTAR` module
-					# to extract the files to the local / shared filesystem(s).
-					return {helpers.BuildConfig.Java.JavaConfig.JAVA_TAR_COMPONENT_NAME:
-										thread_for[helpers.BuildConfig.Java.JavaConfig.JAVA_COMPONENT_NAME].tar_file_name,
-								helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_TAR_COMPONENT_NAME:
-										thread_for[helpers.BuildConfig.Tomcat.TomcatConfig.TOMCAT_COMPONENT_NAME].tar_file_name}
-				elif build_for == helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT['BUILD_TARGET']:
-					# Return the `TAR` package names.
-					# These would be used by the `UNTAR` module
-					# to extract the files to the local / shared filesystem(s).
-					return {helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_TAR_COMPONENT_NAME:
-									thread_for[helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME].tar_file_name,
-								helpers.BuildConfig.Apr.AprConfig.APR_TAR_COMPONENT_NAME:
-									thread_for[helpers.BuildConfig.Apr.AprConfig.APR_COMPONENT_NAME].tar_file_name,
-								helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_TAR_COMPONENT_NAME:
-									thread_for[helpers.BuildConfig.AprUtil.AprUtilConfig.APR_UTIL_COMPONENT_NAME].tar_file_name,
-								helpers.BuildConfig.Pcre.PcreConfig.PCRE_TAR_COMPONENT_NAME:
-									thread_for[helpers.BuildConfig.Pcre.PcreConfig.PCRE_COMPONENT_NAME].tar_file_name}
-
-###########################################
-# Untar Manager Model for extracting
-# dependencies and target software for the
-# `AUTOMATED` software build.
-###########################################
-
-class UntarManager(TaskManager):
-	"""
-	Class blueprint for creating `UNTAR` agent(s) for the build. These instances / agents will
-	handle the entire dependency and target software extraction for the automated
-	build. To make the extractions more time efficient, we are using the `THREADING` module
-	that the Python Standard Library provides. This allows us for concurrent simultaneous
-	extraction, which when done sequentially takes a lot of time.
-	"""
-
-	def begin(self, tar_binaries):
-		"""
-		The `BEGIN` method takes care of the `TAR` package extractions.
-		Puts them under the `CONFIGURED` or `DEFAULT` directory accordingly.
-
-		PARAMETER:=> TAR_BINARIES = A dictionary object consisting of dependent task rules and other details.
-
-		`TAR_BINARIES` is a dictionary. It contains the `THREAD-NAME` and
-		`THREAD-WORKER` logic that is to be simultaneously executed.
-		"""
-		# Keeps a handle to the newly spawned threads.
-		# Makes it easy for the caller to inspect the
-		# threads and also for accessing their state
-		# post execution.
-		thread_for = {}
-
-		while not self.task_successful and self.allow_retry():
-			try:
-				# Instantiate the `QUEUE` exception stacktrace object for the spawned threads.
-				exception_stacktrace_queue = queue.Queue()
-
-				# Logging a comment
-				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiating Extraction Threads...')
-
-				for component in list(tar_binaries.keys()):
-					if self.initial_run or component in self.failed_thread_list:
-						untar_thread = \
-								tar_binaries[component]['thread_worker'](name=tar_binaries[component]['thread_name'],
-														args=(tar_binaries[component]['thread_args']['tar_file_name'],
-																exception_stacktrace_queue,
-																	tar_binaries[component]['thread_args']['tar_package_type'],))
-						thread_for[component] = untar_thread
-
-						# Logging a comment
-						task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiated Extraction Thread: {' +
-														untar_thread.getName() + '}')
-
-						# Start the `THREAD`.
-						untar_thread.start()
-
-				# The below method makes the main thread (or process) to block
-				# until the minion `THREAD`s complete their tasks.
-				# This would in turn block the `BEGIN` method from returning
-				# back to the caller.
-				the_main_thread = threading.main_thread()
-
-				for active_thread in threading.enumerate():
-					# If we `JOIN` the main thread of execution,
-					# it will introduce a deadlock. Hence, that
-					# needs to be skipped.
-					if active_thread is the_main_thread:
-						continue
-
-					# `JOIN` all the other active threads.
-					# It will block the main thread from exiting, i.e.,
-					# it waits for the chilren threads to finish their
-					# execution.
-					active_thread.join()
-
-				# Check the Exception Stack and re-raise the exception (If Any).
-				# The below statement is reached only after the threads finish
-				# their work either normally or abnormally.
-				if not exception_stacktrace_queue.empty():
-					# Get the first exception element and raise the same.
-					# Once, the exception is raised (if any), the exception
-					# handler will handle the overall exceptions raised by the
-					# spawned threads by checking their status flags.
-					raise exception_stacktrace_queue.get()
-
-			except (tarfile.TarError, IOError, OSError) as taskManager_untarManager_error:
-				# Put logging below.
-				task_manager_logger.error('[Class: {' + str(self.__class__) + '}] Extraction Operation Failed: ' +
-												str(taskManager_untarManager_error))
-
-				# Delete the exception stacktrace queue
-				# before continuing with the next iteration of
-				# trials. This stacktrace object just lets us
-				# identify whether any exception(s) occurred in any of
-				# the spawned threads. Once we confirm that an exception
-				# has occurred, we check the status of all the threads
-				# spawned by the `UNTAR_MANAGER` process and put them
-				# up for retry only if that particular thread failed during
-				# its execution.
-				del exception_stacktrace_queue
-
-				# It's past its `INITIAL_RUN` now.
-				# Mark it as `FALSE`.
-				self.initial_run = False
-
-				# Iterate over the spawned `THREAD` list dictionary.
-				# Check for each `THREAD`'s completion status.
-				# If completion status is `UNSET` (or False), add it to the
-				# failed thread list.
-				for component in list(thread_for.keys()):
-					if not thread_for[component].untar_complete:
-						# Logging a comment
-						task_manager_logger.critical('[Class: {' + str(self.__class__) +
-												'}] Extraction Thread Failed for Component: {' +
-															component + '}')
-
-						# We don't want to re-add the component, if it is
-						# already present in the below list.
-						# Otherwise, it would spawn multiple `THREAD`s for
-						# the same component.
-						if component not in self.failed_thread_list:
-							self.failed_thread_list.append(component)
-
-				# Check if the `EXTRACTION` operation succeeded after the specified number of retries (If any).
-				# Raise the error if it failed for more than the specified value of `RETRY`.
-				if self.current_retry_count > self.retries_allowed():
-					# Logging a comment
-					task_manager_logger.critical('[Class: {' + str(self.__class__) + '}] Maximum Retries Exceeded. Please \
-														run a Diagnostic for probable issues.')
-					raise
-
-				# Logging a comment
-				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Current Extraction Retry Count: {' +
-												str(self.current_retry_count) + '}')
-			else:
-				# Get the `END_TIME` for the `UNTAR` activity,
-				# for traceback / logging purposes.
-				# This is noted only for successful extractions.
-				self.task_end_time = time.ctime()
-
-				# Set the `UNTAR` success flag to `TRUE.`
-				self.task_successful = True
-
-				# Logging a comment
+#!/usr/bin/env python3
+
+# Author: Dipankar Achinta (@tweeting_dipa) [2017]
+
+###########################################
+# `IMPORT` Section.
+# Make all the necessary `IMPORTS` below.
+###########################################
+
+# Import the `BUILD` configurations module(s).
+import helpers.BuildConfig.Common.CommonConfig, helpers.BuildConfig.Tomcat.TomcatConfig, helpers.BuildConfig.Java.JavaConfig
+
+# Import the `BUILD` configurations module(s) for `HTTPD`.
+import helpers.BuildConfig.Httpd.HttpdConfig, helpers.BuildConfig.Apr.AprConfig, helpers.BuildConfig.AprUtil.AprUtilConfig
+
+# Configuration options for the `PCRE` module / library.
+import helpers.BuildConfig.Pcre.PcreConfig
+
+# Import the Content-Addressed `ARTIFACT` cache, to report its hits / misses
+# once the downloads are done.
+import helpers.Utilities.ArtifactCacheUtility
+
+# Import the pooled `HTTP` session layer, to report its connection reuse.
+import helpers.Utilities.HttpSessionUtility
+
+# Import the `ASYNCIO` download engine, the alternative to the DownloaderThread classes.
+import helpers.DownloaderUtilities.AsyncDownloader
+
+# Import the component registry, for the `TAR` component names of the components.
+import helpers.ComponentRegistry
+
+# Import the offline bundles, to satisfy the downloads on the air-gapped nodes.
+import helpers.Utilities.BundleUtility
+
+# Import the deadlines, to bound the threads with their time budgets.
+import helpers.Utilities.DeadlineUtility
+
+# Import the retry policy, to back off between the retries.
+import helpers.Utilities.RetryUtility
+
+# Import the stage timings, each task is traced for its component.
+import helpers.Utilities.TraceUtility
+
+# Import the cancellation tokens, to stop the tasks mid-transfer (for eg., failing fast).
+import helpers.Utilities.CancellationUtility
+
+# Import the `UNTAR` module, for the pool of extraction worker processes.
+import helpers.UntarPackage
+
+# Import the extraction engines, to probe their decompressors.
+import helpers.Utilities.ExtractEngineUtility
+
+# Import the daemon thread executor, the tasks left behind don't hold up the exit of the build.
+import helpers.Utilities.ExecutorUtility
+
+# Import the `ABC` module to work with `ABSTRACT` classes / methods.
+import abc
+
+# Import the `TIME` module to perform time-manipulation operations.
+import time
+
+# Import the `CONCURRENT.FUTURES` module, to await the tasks.
+import concurrent.futures
+
+# Import the `MATH` module to round up the executor waves.
+import math
+
+# Below `IMPORT` deals with errors during Network Communication(s).
+from urllib.error import URLError, HTTPError, ContentTooShortError
+
+# The below module is a Python built-in module
+# for `UNTARRING` of compressed files.
+import tarfile
+
+# Import the `QUEUE` module to make use of the
+# queue data-structure. In our program implementation,
+# the queue data-structure is used as a medium for passing
+# exception messages between the spawned threads and the
+# `DOWNLOAD_MANAGER | UNTAR_MANAGER` processes.
+import queue
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+TASK_MANAGER_LOGGER_NAME = '.TaskManager'
+
+# Get the Logger Instance for the module.
+task_manager_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME + TASK_MANAGER_LOGGER_NAME)
+
+#######################################################################
+
+###########################################################
+# Task Manager Model for resolving dependent tasks,
+# required by the target software for the `AUTOMATED`
+# software build.
+###########################################################
+
+class TaskManager(object):
+	"""
+	Class blueprint for creating task agent(s) for the build. These instances / agents will
+	handle the entire dependency tasks and tasks specific to the target software for the
+	automated build. The `TASK_MANAGER` makes use of `THREAD`s, which allow for concurrent tasks
+	to be performed, which when done sequentially takes a lot of time.
+	"""
+
+	# The stage the tasks are traced as.
+	task_stage = 'task'
+
+	# The attribute of the tasks, that tells whether they completed.
+	task_complete_attribute = 'task_complete'
+
+	def __init__(self, deadline=None):
+		"""
+		The `INITIALIZE` method for the class.
+
+		PARAMETER:=> 	DEADLINE <OPTIONAL> = The workflow deadline, the tasks (and their retries) run within.
+		"""
+		# Capture the `TASK` start time.
+		# Can be used as evidence, while auditing the `BUILD`.
+		self.task_start_time  = time.ctime()
+
+		# Specify the number of retries, in case of failures. <::PROTECTED_ATTRIBUTE::>
+		self._allowed_retries = helpers.BuildConfig.Common.CommonConfig.TASK_RETRIES
+
+		# Set the current `RETRY` count. <::PROTECTED_ATTRIBUTE::>
+		self._current_retry_count = 0
+
+		# The back-off between the retries. <::PROTECTED_ATTRIBUTE::>
+		self._retry_policy = helpers.Utilities.RetryUtility.RetryPolicy(helpers.BuildConfig.Common.CommonConfig.RETRY_BASE_DELAY,
+																		helpers.BuildConfig.Common.CommonConfig.RETRY_MULTIPLIER,
+																		helpers.BuildConfig.Common.CommonConfig.RETRY_MAX_DELAY)
+
+		# Set the success flag to `FALSE` initially for each task.
+		self.task_successful = False
+
+		# Set the `INITIAL_RUN` status.
+		# Provides help in the identification of failed threads.
+		self.initial_run = True
+
+		# Helps us accumulate the failed threads and perform a retry on them.
+		self.failed_thread_list = []
+
+		# The workflow deadline (If Any). Each thread gets a time budget within it.
+		self.deadline = deadline
+
+		# The cancellation token of the tasks, within the one of the caller (If Any),
+		# for eg., the pipeline the manager runs a stage of.
+		self.cancellation_token = helpers.Utilities.CancellationUtility.CancellationToken(
+										parent=helpers.Utilities.CancellationUtility.current(),
+											label=self.__class__.__name__)
+
+		# Logging a comment
+		task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Initialization Information: START_TIME: {' +
+						self.task_start_time + '}')
+
+	def begin(self, support_binaries):
+		"""
+		The `BEGIN` method takes care of the tasks to be performed for each build.
+		This method employs each task as a sub-classable Threaded entity and is executed 
+		by `THREAD`s spawned to make the tasks complete for the specific build(s).
+
+		PARAMETER:=> 	[BUILD_FOR] <OPTIONAL> = Target Build's Details.
+						SUPPORT_BINARIES       = A dictionary object consisting of the pre-build requisites.
+
+		`REQUIRED_BINARIES` is a nested dictionary. It contains the `THREAD-NAME` and
+		`THREAD-WORKER` logic that is to be simultaneously executed.
+		"""
+		pass
+
+	def allow_retry(self):
+		"""
+		Keep track of the number of retries done by the `TASK_MANAGER` instance.
+		Retries is by default set to 3 (`THREE`).
+		Can be changed by altering the value in the corresponding `CONFIG`
+		file.
+		"""
+		if self.current_retry_count <= self.retries_allowed():
+			# Increment the `RETRY_COUNT` attribute, via. an attribute `SETTER`.
+			self.current_retry_count = 1
+			return True
+		return False
+
+	# Use a `PROPERTY` setter and getter to access the protected member.
+	@property
+	def current_retry_count(self):
+		"""
+		Returns the `CURRENT` retry count for the specific `TASK_MANAGER`.
+		"""
+		return self._current_retry_count
+
+	@current_retry_count.setter
+	def current_retry_count(self, retry_increment_by):
+		# Perform the actual increment for the `RETRY_COUNT` attribute.
+		self._current_retry_count += retry_increment_by
+
+	def retries_allowed(self):
+		"""
+		Returns the specified maximum `RETRY` value allowed by the
+		`TASK_MANAGER` for the `BUILD`.
+		"""
+		return self._allowed_retries
+
+	def deadline_expired(self):
+		"""
+		Tells whether the workflow deadline (If Any) has passed, in which case
+		there is no time left for a retry.
+		"""
+		return self.deadline is not None and self.deadline.expired()
+
+	def final_attempt(self):
+		"""
+		Tells whether a task failing now is not retried: the retries are exhausted,
+		or the workflow deadline has passed.
+		"""
+		return self.current_retry_count > self.retries_allowed() or self.deadline_expired()
+
+	def retry_delay(self, task_errors):
+		"""
+		Returns the seconds to back off before the next retry, from the `RETRY_POLICY` and
+		the longest `Retry-After` among the `TASK_ERRORS` (If Any).
+		Returns `NONE` when the retry should fail fast instead: a host asked for more than
+		`RETRY_MAX_DELAY`, or the delay would run past the workflow deadline.
+		"""
+		retry_after = max([retry_after for retry_after in map(helpers.Utilities.RetryUtility.retry_after_of, task_errors)
+								if retry_after is not None], default=None)
+		retry_delay = self._retry_policy.delay(self.current_retry_count, retry_after)
+		if retry_delay is None or (self.deadline is not None and self.deadline.remaining() is not None and
+									retry_delay >= self.deadline.remaining()):
+			return None
+		return retry_delay
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	def _drain_errors(exception_stacktrace_queue):
+		# The errors left in the exception stacktrace queue (besides the one raised).
+		queued_errors = []
+		while not exception_stacktrace_queue.empty():
+			queued_errors.append(exception_stacktrace_queue.get())
+		return queued_errors
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _run_tasks(self, task_for, exception_stacktrace_queue):
+		# Run the tasks (the `RUN` method of the thread objects) on a bounded executor of
+		# `TASK_MAX_WORKERS` threads, and handle them in the order they complete.
+		# Only these tasks are awaited (not the other threads of the process), for as long as
+		# their time budgets last (plus the `JOIN_GRACE_PERIOD`). A task still running past it
+		# is left behind (it gives up at its next budget check) and reported as a
+		# `DeadlineExceededError`, so that its component is put up for retry instead of
+		# hanging the build. The workers are daemon threads, hence a task left behind doesn't
+		# hold up the exit of the build either.
+		task_executor = helpers.Utilities.ExecutorUtility.DaemonThreadPoolExecutor(
+							max_workers=helpers.BuildConfig.Common.CommonConfig.TASK_MAX_WORKERS,
+								thread_name_prefix=self.__class__.__name__)
+		task_futures  = {task_executor.submit(self._run_task, component, task_for[component]): component
+							for component in task_for}
+		try:
+			for task_future in concurrent.futures.as_completed(task_futures, timeout=self._await_timeout(len(task_futures))):
+				component = task_futures[task_future]
+				try:
+					# Re-raise what the task didn't handle itself (If Any).
+					task_future.result()
+				except (helpers.Utilities.CancellationUtility.TaskCancelledError, concurrent.futures.CancelledError):
+					# Logging a comment
+					task_manager_logger.warning('[Class: {' + str(self.__class__) + '}] Task Cancelled: {' +
+													task_for[component].getName() + '}')
+					continue
+
+				# Logging a comment
+				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Task Finished: {' +
+												task_for[component].getName() + '}')
+
+				# Fail fast: a task failing on its last attempt fails the manager anyway, hence
+				# its siblings are cancelled instead of waited for.
+				if helpers.BuildConfig.Common.CommonConfig.FAIL_FAST and self.final_attempt() and \
+						not getattr(task_for[component], self.task_complete_attribute):
+					self.cancellation_token.cancel('{' + task_for[component].getName() + '} Failed on its Last Attempt')
+					for sibling_future in task_futures:
+						sibling_future.cancel()
+		except concurrent.futures.TimeoutError:
+			for task_future, component in task_futures.items():
+				if task_future.done():
+					continue
+
+				# Logging a comment
+				task_manager_logger.error('[Class: {' + str(self.__class__) + '}] Task Overran its Time Budget: {' +
+												task_for[component].getName() + '}')
+				exception_stacktrace_queue.put(helpers.Utilities.DeadlineUtility.DeadlineExceededError(
+													'Time Budget exceeded for: {' + task_for[component].getName() + '}'))
+		finally:
+			# Drop the tasks that didn't start, and don't wait for the ones left behind.
+			for task_future in task_futures:
+				task_future.cancel()
+			task_executor.shutdown(wait=False)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _run_task(self, component, task):
+		# The time budget starts once the task runs (not while it waits for a worker).
+		task.deadline = helpers.Utilities.DeadlineUtility.component_budget(component, self.deadline)
+
+		# The download / extraction loops of the task check the cancellation token between the chunks.
+		helpers.Utilities.CancellationUtility.bind(self.cancellation_token)
+		self.cancellation_token.check()
+
+		# The spans recorded by the task (for eg., its connect / first byte) are for the component.
+		helpers.Utilities.TraceUtility.bind_component(component)
+		with helpers.Utilities.TraceUtility.span(self.task_stage, attempt=self.current_retry_count):
+			task.run()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _await_timeout(self, task_count):
+		# The tasks run in waves of `TASK_MAX_WORKERS`, each wave within `COMPONENT_TIME_BUDGET`,
+		# and all of them within the workflow deadline (If Any).
+		await_timeout = helpers.BuildConfig.Common.CommonConfig.COMPONENT_TIME_BUDGET
+		if await_timeout is not None:
+			await_timeout *= math.ceil(task_count / helpers.BuildConfig.Common.CommonConfig.TASK_MAX_WORKERS)
+		if self.deadline is not None and self.deadline.remaining() is not None:
+			await_timeout = self.deadline.remaining() if await_timeout is None else min(await_timeout, self.deadline.remaining())
+		return None if await_timeout is None else await_timeout + helpers.BuildConfig.Common.CommonConfig.JOIN_GRACE_PERIOD
+
+###########################################
+# Download Manager Model for downloading
+# dependencies and target software for the
+# `AUTOMATED` software build.
+###########################################
+
+class DownloadManager(TaskManager):
+	"""
+	Class blueprint for creating download agent(s) for the build. These instances / agents will
+	handle the entire dependency downloads and target software download for the automated
+	build. To make the downloads more time efficient, we are using the `THREADING` module
+	that the Python Standard Library provides. This allows us for concurrent simultaneous
+	downloads, which when done sequentially takes a lot of time.
+	"""
+
+	# The stage the tasks are traced as.
+	task_stage = 'download'
+
+	# The attribute of the tasks, that tells whether they completed.
+	task_complete_attribute = 'download_complete'
+
+	def begin(self, build_for, required_binaries):
+		"""
+		The `BEGIN` method takes care of the `TAR` package downloads.
+		Puts them under the `CONFIGURED` or `DEFAULT` directory accordingly.
+
+		PARAMETER:=> 	BUILD_FOR         = Target software for which the automated build is being performed.
+						REQUIRED_BINARIES = A dictionary object consisting of dependent tasks and other details.
+
+		`REQUIRED_BINARIES` is a nested dictionary. It contains the `THREAD-NAME` and
+		`THREAD-WORKER` logic that is to be simultaneously executed.
+		"""
+
+		# Keeps a handle to the newly spawned threads.
+		# Makes it easy for the caller to inspect the
+		# threads and also for accessing their state
+		# post execution.
+		thread_for = {}
+
+		while not self.task_successful and self.allow_retry():
+			try:
+				# Instantiate the `QUEUE` exception stacktrace object for the spawned threads.
+				exception_stacktrace_queue = queue.Queue()
+
+				if helpers.BuildConfig.Common.CommonConfig.OFFLINE_BUNDLE:
+					# Logging a comment
+					task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Importing from the Offline Bundle: {' +
+												helpers.BuildConfig.Common.CommonConfig.OFFLINE_BUNDLE + '}')
+
+					# Satisfy the (failed) components from the bundle, without any network call.
+					# The bundled packages stand in for the threads.
+					thread_for.update(helpers.Utilities.BundleUtility.import_bundle(
+											helpers.BuildConfig.Common.CommonConfig.OFFLINE_BUNDLE, required_binaries,
+												[component for component in list(required_binaries.keys())
+													if self.initial_run or component in self.failed_thread_list]))
+				elif helpers.BuildConfig.Common.CommonConfig.DOWNLOAD_ENGINE == 'asyncio':
+					# Logging a comment
+					task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Starting the Async Download Engine...')
+
+					# Resolve and fetch the (failed) components within this thread.
+					# The engine returns result objects, that stand in for the threads.
+					# The engine is cancelled along with the manager, and fails fast on the last attempt.
+					download_engine = helpers.DownloaderUtilities.AsyncDownloader.AsyncDownloadEngine(
+											helpers.BuildConfig.Common.CommonConfig.ASYNC_DOWNLOAD_CONCURRENCY)
+					thread_for.update(download_engine.run(required_binaries,
+												[component for component in list(required_binaries.keys())
+													if self.initial_run or component in self.failed_thread_list],
+												exception_stacktrace_queue, deadline=self.deadline,
+												cancellation_token=self.cancellation_token,
+												fail_fast=helpers.BuildConfig.Common.CommonConfig.FAIL_FAST and self.final_attempt()))
+				else:
+					# Logging a comment
+					task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiating Downloader Threads...')
+
+					# The tasks of this round.
+					task_for = {}
+
+					for component in list(required_binaries.keys()):
+						if self.initial_run or component in self.failed_thread_list:
+							downloader_thread = \
+									required_binaries[component]['thread_worker'](name=required_binaries[component]['thread_name'],
+																					args=(exception_stacktrace_queue,))
+							thread_for[component] = task_for[component] = downloader_thread
+
+							# Logging a comment
+							task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiated Downloader Thread: {' +
+															downloader_thread.getName() + '}')
+
+					# The below method makes the main thread (or process) to block
+					# until the tasks complete (or overrun their time budgets).
+					# This would in turn block the `BEGIN` method from returning
+					# back to the caller.
+					self._run_tasks(task_for, exception_stacktrace_queue)
+
+				# Check the Exception Stack and re-raise the exception (If Any).
+				# The below statement is reached only after the threads finish
+				# their work either normally or abnormally.
+				if not exception_stacktrace_queue.empty():
+					# Get the first exception element and raise the same.
+					# Once, the exception is raised (if any), the exception
+					# handler will handle the overall exceptions raised by the
+					# spawned threads by checking their status flags.
+					raise exception_stacktrace_queue.get()
+
+				# A round cancelled from outside (for eg., by the pipeline failing fast) didn't complete.
+				self.cancellation_token.check()
+
+			except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as \
+					taskManager_downloadManager_error:
+				# Put logging below.
+				task_manager_logger.error('[Class: {' + str(self.__class__) + '}] Download Operation Failed: ' +
+												str(taskManager_downloadManager_error))
+
+				# Collect all the failures of the round, for their `Retry-After` (If Any).
+				download_errors = [taskManager_downloadManager_error] + self._drain_errors(exception_stacktrace_queue)
+
+				# Delete the exception stacktrace queue
+				# before continuing with the next iteration of
+				# trials. This stacktrace object just lets us
+				# identify whether any exception(s) occurred in any of
+				# the spawned threads. Once we confirm that an exception
+				# has occurred, we check the status of all the threads
+				# spawned by the `DOWNLOAD_MANAGER` process and put them
+				# up for retry only if that particular thread failed during
+				# its execution.
+				del exception_stacktrace_queue
+
+				# It's past its `INITIAL_RUN` now.
+				# Mark it as `FALSE`.
+				self.initial_run = False
+
+				# Iterate over the spawned `THREAD` list dictionary.
+				# Check for each `THREAD`'s completion status.
+				# If completion status is `UNSET` (or False), add it to the
+				# failed thread list.
+				for component in list(thread_for.keys()):
+					if not thread_for[component].download_complete:
+						# Logging a comment
+						task_manager_logger.critical('[Class: {' + str(self.__class__) +
+												'}] Downloader Thread Failed for Component: {' +
+														component + '}')
+
+						# We don't want to re-add the component, if it is
+						# already present in the below list.
+						# Otherwise, it would spawn multiple `THREAD`s for
+						# the same component.
+						# The below check is an alternative to having cleared
+						# the list before each failed iteration.
+						if component not in self.failed_thread_list:
+							self.failed_thread_list.append(component)
+
+				# Check if the `DOWNLOAD` operation succeeded after the specified number of retries (If any).
+				# Raise the error if it failed for more than the specified value of `RETRY`,
+				# or if the workflow deadline has passed.
+				if self.current_retry_count > self.retries_allowed() or self.deadline_expired():
+					# Logging a comment
+					task_manager_logger.critical('[Class: {' + str(self.__class__) + '}] Maximum Retries Exceeded. Please \
+													run a Diagnostic for probable issues.')
+					raise
+
+				# Back off before the retry, so that the retries don't hammer a struggling host.
+				# Fail fast instead, if a host is down for longer than is worth waiting.
+				retry_delay = self.retry_delay(download_errors)
+				if retry_delay is None:
+					# Logging a comment
+					task_manager_logger.critical('[Class: {' + str(self.__class__) + '}] Upstream Host Unavailable for \
+													longer than the Retry Back-Off allows. Failing Fast.')
+					raise
+
+				# Logging a comment
+				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Current Download Retry Count: {' +
+												str(self.current_retry_count) + '}. Backing off for {' +
+													str(round(retry_delay, 3)) + '}s')
+
+				# The back-off is cut short by a cancellation.
+				self.cancellation_token.wait(retry_delay)
+				self.cancellation_token.check()
+			else:
+				# Get the `END_TIME` for the `DOWNLOAD` activity,
+				# for traceback / logging purposes.
+				# This is noted only for successful downloads.
+				self.task_end_time = time.ctime()
+
+				# Set the `DOWNLOAD` success flag to `TRUE.`
+				self.task_successful = True
+
+				# Keep a handle to the downloaded components (for eg., to export them to an offline bundle).
+				self.downloaded_components = thread_for
+
+				# Logging a comment
+				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Download Successfully Completed')
+
+				# Report the `ARTIFACT` cache hits / misses for the downloads.
+				helpers.Utilities.ArtifactCacheUtility.shared_artifact_cache.log_report()
+
+				# Report the connections opened / reused by the downloads.
+				helpers.Utilities.HttpSessionUtility.shared_session.log_report()
+
+				# Return the `TAR` package names, keyed by their `TAR` component names
+				# (for eg., `Httpd_Tar`), for the components of the `BUILD`.
+				# These would be used by the `UNTAR` module
+				# to extract the files to the local / shared filesystem(s).
+				return {helpers.ComponentRegistry.component_for(component).tar_component_name: thread_for[component].tar_file_name
+							for component in thread_for if helpers.ComponentRegistry.component_for(component) is not None}
+
+###########################################
+# Untar Manager Model for extracting
+# dependencies and target software for the
+# `AUTOMATED` software build.
+###########################################
+
+class UntarManager(TaskManager):
+	"""
+	Class blueprint for creating `UNTAR` agent(s) for the build. These instances / agents will
+	handle the entire dependency and target software extraction for the automated
+	build. To make the extractions more time efficient, we are using the `THREADING` module
+	that the Python Standard Library provides. This allows us for concurrent simultaneous
+	extraction, which when done sequentially takes a lot of time.
+	"""
+
+	# The stage the tasks are traced as.
+	task_stage = 'extract'
+
+	# The attribute of the tasks, that tells whether they completed.
+	task_complete_attribute = 'untar_complete'
+
+	def __init__(self, deadline=None):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		super().__init__(deadline=deadline)
+
+		# The manifests of the extracted members (a list of `(MEMBER NAME, SIZE)`), by component.
+		self.member_manifests = {}
+
+	def begin(self, tar_binaries):
+		"""
+		The `BEGIN` method takes care of the `TAR` package extractions.
+		Puts them under the `CONFIGURED` or `DEFAULT` directory accordingly.
+
+		PARAMETER:=> TAR_BINARIES = A dictionary object consisting of dependent task rules and other details.
+
+		`TAR_BINARIES` is a dictionary. It contains the `THREAD-NAME` and
+		`THREAD-WORKER` logic that is to be simultaneously executed.
+		"""
+		# Keeps a handle to the newly spawned threads.
+		# Makes it easy for the caller to inspect the
+		# threads and also for accessing their state
+		# post execution.
+		thread_for = {}
+
+		# Pick the decompressors of the extraction engine upfront (once, see `UntarConfig.EXTRACT_DECOMPRESSOR`).
+		if helpers.Utilities.ExtractEngineUtility.engine_name() == 'pipelined':
+			helpers.Utilities.ExtractEngineUtility.probe_decompressors()
+
+		while not self.task_successful and self.allow_retry():
+			try:
+				# Instantiate the `QUEUE` exception stacktrace object for the spawned threads.
+				exception_stacktrace_queue = queue.Queue()
+
+				# Logging a comment
+				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiating Extraction Threads...')
+
+				# The tasks of this round.
+				task_for = {}
+
+				# Extract the packages in worker processes, rather than within the threads (If Selected).
+				process_pool = helpers.UntarPackage.extract_process_pool(
+									len([component for component in list(tar_binaries.keys())
+											if self.initial_run or component in self.failed_thread_list]))
+
+				for component in list(tar_binaries.keys()):
+					if self.initial_run or component in self.failed_thread_list:
+						untar_thread = \
+								tar_binaries[component]['thread_worker'](name=tar_binaries[component]['thread_name'],
+														args=(tar_binaries[component]['thread_args']['tar_file_name'],
+																exception_stacktrace_queue,
+																	tar_binaries[component]['thread_args']['tar_package_type'],),
+															kwargs={'process_pool': process_pool})
+						thread_for[component] = task_for[component] = untar_thread
+
+						# Logging a comment
+						task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Instantiated Extraction Thread: {' +
+														untar_thread.getName() + '}')
+
+				# The below method makes the main thread (or process) to block
+				# until the tasks complete (or overrun their time budgets).
+				# This would in turn block the `BEGIN` method from returning
+				# back to the caller.
+				try:
+					self._run_tasks(task_for, exception_stacktrace_queue)
+				finally:
+					# The workers of the tasks left behind (If Any) are not waited for.
+					helpers.UntarPackage.release_process_pool(process_pool)
+
+				self.member_manifests.update({component: untar_thread.member_manifest
+												for component, untar_thread in task_for.items() if untar_thread.untar_complete})
+
+				# Check the Exception Stack and re-raise the exception (If Any).
+				# The below statement is reached only after the threads finish
+				# their work either normally or abnormally.
+				if not exception_stacktrace_queue.empty():
+					# Get the first exception element and raise the same.
+					# Once, the exception is raised (if any), the exception
+					# handler will handle the overall exceptions raised by the
+					# spawned threads by checking their status flags.
+					raise exception_stacktrace_queue.get()
+
+				# A round cancelled from outside (for eg., by the pipeline failing fast) didn't complete.
+				self.cancellation_token.check()
+
+			except (tarfile.TarError, IOError, OSError) as taskManager_untarManager_error:
+				# Put logging below.
+				task_manager_logger.error('[Class: {' + str(self.__class__) + '}] Extraction Operation Failed: ' +
+												str(taskManager_untarManager_error))
+
+				# Delete the exception stacktrace queue
+				# before continuing with the next iteration of
+				# trials. This stacktrace object just lets us
+				# identify whether any exception(s) occurred in any of
+				# the spawned threads. Once we confirm that an exception
+				# has occurred, we check the status of all the threads
+				# spawned by the `UNTAR_MANAGER` process and put them
+				# up for retry only if that particular thread failed during
+				# its execution.
+				del exception_stacktrace_queue
+
+				# It's past its `INITIAL_RUN` now.
+				# Mark it as `FALSE`.
+				self.initial_run = False
+
+				# Iterate over the spawned `THREAD` list dictionary.
+				# Check for each `THREAD`'s completion status.
+				# If completion status is `UNSET` (or False), add it to the
+				# failed thread list.
+				for component in list(thread_for.keys()):
+					if not thread_for[component].untar_complete:
+						# Logging a comment
+						task_manager_logger.critical('[Class: {' + str(self.__class__) +
+												'}] Extraction Thread Failed for Component: {' +
+															component + '}')
+
+						# We don't want to re-add the component, if it is
+						# already present in the below list.
+						# Otherwise, it would spawn multiple `THREAD`s for
+						# the same component.
+						if component not in self.failed_thread_list:
+							self.failed_thread_list.append(component)
+
+				# Check if the `EXTRACTION` operation succeeded after the specified number of retries (If any).
+				# Raise the error if it failed for more than the specified value of `RETRY`,
+				# or if the workflow deadline has passed.
+				if self.current_retry_count > self.retries_allowed() or self.deadline_expired():
+					# Logging a comment
+					task_manager_logger.critical('[Class: {' + str(self.__class__) + '}] Maximum Retries Exceeded. Please \
+														run a Diagnostic for probable issues.')
+					raise
+
+				# Logging a comment
+				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Current Extraction Retry Count: {' +
+												str(self.current_retry_count) + '}')
+			else:
+				# Get the `END_TIME` for the `UNTAR` activity,
+				# for traceback / logging purposes.
+				# This is noted only for successful extractions.
+				self.task_end_time = time.ctime()
+
+				# Set the `UNTAR` success flag to `TRUE.`
+				self.task_successful = True
+
+				# Logging a comment
 				task_manager_logger.info('[Class: {' + str(self.__class__) + '}] Extraction Successfully Completed')
\ No newline at end of file
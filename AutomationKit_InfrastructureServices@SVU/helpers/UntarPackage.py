@@ -1,148 +1,362 @@
-#!/usr/bin/env python3
-
-#####################################
-# `IMPORT` Section.
-# Make all the necessary imports here.
-#####################################
-
-# The below module is a Python built-in module
-# for `UNTARRING` of compressed files.
-import tarfile
-
-# Perform `OS` level operations using the below built-in Standard Python Module.
-import os
-
-# Import the `THREADING` module to make use of Python Threads.
-import threading
-
-# Import the `TAR` configurations module for the `AUTOMATE_BUILD` application.
-# Also import the common / shared configuration module.
-import helpers.BuildConfig.Untar.UntarConfig, helpers.BuildConfig.Common.CommonConfig
-
-# Import the `QUEUE` module to make use of the
-# queue data-structure. In our program implementation,
-# the queue data-structure is used as a medium for passing
-# exception messages between the spawned threads and the
-# `DOWNLOAD_MANAGER` process.
-import queue
-
-############# Configure the Logger options on this module #############
-
-import logging
-import helpers.Utilities.LoggerUtility
-import helpers.BuildConfig.Logger.LoggerConfig
-
-# The Logger name starts with a `PERIOD` (.), as it acts as
-# a seperator between the Local Logger name and the Application
-# wide Logger name.
-UNTAR_PACKAGE_LOGGER_NAME = '.UntarPackage'
-
-# Get the Logger Instance for the module.
-untar_package_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME + UNTAR_PACKAGE_LOGGER_NAME)
-
-#######################################################################
-
-###############################################################
-# The section below contains the `THREAD` definition,
-# that helps out in the process of `EXTRACTING` the downloaded
-# "*.tar.gz" packages for targeted application environments.
-###############################################################
-
-# Class Definition for the UntarPackage `THREAD`.
-# Inherits properties from the `THREADING` Module.
-# The default location to extract `TAR` packages is set to `DEFAULT/` folder.
-class UntarPackageThread(threading.Thread):
-	# Initialize the `THREAD` with sub-class specific
-	# information.
-	# Pass on the rest to the super-class initializer method.
-	def __init__(self, group=None, target=None, name=None,
-					args=(), kwargs=None, *, daemon=None):
-		super().__init__(group=group, target=target, name=name,
-							daemon=daemon)
-		self.tar_file_name    = args[0]
-		self.exception_stacktrace_queue = args[1]
-		self.tar_package_type = args[2] if len(args) == 3 else helpers.BuildConfig.Untar.UntarConfig.DEFAULT_TAR_PACKAGE_TYPE
-		self.untar_complete   = False
-
-	# Defines the `RUN` method logic below.
-	# This method is executed when the `THREAD` starts.
-	def run(self):
-		"""
-		Untar `TAR` packages for installation and configuration purposes.
-		This Python Module makes use of the Sandard Python Built-in Library
-		for handling `TAR` files in a platform-independent and uniform manner.
-		"""
-		try:
-			# Strip `PATH` components from the argument passed in.
-			# Should only contain the `FILE-NAME` to promote code uniformity.
-			tar_file_name = os.path.basename(self.tar_file_name)
-			# Construct the default `TAR` package storage location.
-			TAR_FILE_LOCATION = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + tar_file_name
-			if TAR_FILE_LOCATION.endswith(helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION['gz']) or \
-				TAR_FILE_LOCATION.endswith(helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION['bz2']):
-				try:
-					# Open the `TAR` file as a Python Object.
-					tar_file = tarfile.open(TAR_FILE_LOCATION)
-
-					# Logging a comment
-					untar_package_logger.info('Tar File has been opened for extraction, from Tar Repository: {' +
-												TAR_FILE_LOCATION + '}')
-					# Logging a comment
-					untar_package_logger.info('Checking Extract Base Directory Path: {' +
-												helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
-													'}. Creating if doesn\'t exists...')
-
-					# Check to see if the `TAR` extract directory exists.
-					# If not, create it and re-direct all the `TAR` extracts to the newly created directory.
-					if not os.path.exists(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY):
-						os.mkdir(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY)
-						# Logging a comment
-						untar_package_logger.info('Created Extract Base Directory Path: {' +
-												helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY + '}')
-
-					# Contruct the Final Directory Path.
-					TAR_FINAL_EXTRACT_DIRECTORY = helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY + \
-												self.tar_package_type
-
-					# Logging a comment
-					untar_package_logger.info('Checking Extract Target Directory Path: {' + 
-								TAR_FINAL_EXTRACT_DIRECTORY + '}. Creating if doesn\'t exists...')
-
-					# Check to see if `TAR` package specific directory exists.
-					if not os.path.exists(TAR_FINAL_EXTRACT_DIRECTORY):
-						os.mkdir(TAR_FINAL_EXTRACT_DIRECTORY)
-						# Logging a comment
-						untar_package_logger.info('Created Extract Target Directory Path: {' + TAR_FINAL_EXTRACT_DIRECTORY + '}')
-
-					# Logging a comment
-					untar_package_logger.info('Untarring Package to Extract Target Directory: {' +
-													TAR_FINAL_EXTRACT_DIRECTORY + '}')
-
-					# Extract the `TAR` package to the specified destination directory.
-					tar_file.extractall(path=TAR_FINAL_EXTRACT_DIRECTORY)
-
-					# Put application level logging below.
-					# Logging a comment
-					untar_package_logger.info('Extracted {' + tar_file_name + '} to {' + TAR_FINAL_EXTRACT_DIRECTORY + '}')
-				finally:
-					# Close the `TAR` stream object.
-					tar_file.close()
-			else:
-				# Put application level logging below.
-				# Logging a comment
-				untar_package_logger.error('Extraction Operation Failed:: Not a {' +
-												helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION +
-													'} file as per the input\'s file extension -> {' + tar_file_name + '}')
-				# Raise an exception to notify that the incorrect file
-				# was passed in for extraction.
-				raise IOError
-		except (tarfile.TarError, IOError, OSError) as untarPackage_untarPackageThread_error:
-			# Put logging below.
-			untar_package_logger.error('Package Extraction Failed: ' + str(untarPackage_untarPackageThread_error))
-			# Put the exception object in the Exception Queue to enable
-			# the TaskManager (or UntarManager) to take care
-			# of the exception.
-			self.exception_stacktrace_queue.put(untarPackage_untarPackageThread_error)
-		else:
-			# Notify `UNTAR` completion.
-			self.untar_complete = True
\ No newline at end of file
+#!/usr/bin/env python3
+
+#####################################
+# `IMPORT` Section.
+# Make all the necessary imports here.
+#####################################
+
+# The below module is a Python built-in module
+# for `UNTARRING` of compressed files.
+import tarfile
+
+# Perform `OS` level operations using the below built-in Standard Python Module.
+import os
+
+# Import the `SHUTIL` module, to drop the members of a cancelled extraction.
+import shutil
+
+# Import the `THREADING` module to make use of Python Threads.
+import threading
+
+# Import the `CONCURRENT.FUTURES` and `MULTIPROCESSING` modules, for the extraction worker processes.
+import concurrent.futures, multiprocessing
+
+# Import the `FUNCTOOLS` module, to bind the clean-up of an abandoned worker process.
+import functools
+
+# Import the `TAR` configurations module for the `AUTOMATE_BUILD` application.
+# Also import the common / shared configuration module.
+import helpers.BuildConfig.Untar.UntarConfig, helpers.BuildConfig.Common.CommonConfig
+
+# Import the streaming extraction module, to skip the packages extracted while downloading.
+import helpers.Utilities.StreamExtractUtility
+
+# Import the extraction engines, to extract the packages with (see `UntarConfig.EXTRACT_ENGINE`).
+import helpers.Utilities.ExtractEngineUtility
+
+# Import the member filters, the members of a package filtered out are never extracted.
+import helpers.Utilities.MemberFilterUtility
+
+# Import the install module, the binaries may be extracted straight into their install location.
+import helpers.Utilities.InstallUtility
+
+# Import the deadlines, to run the extraction within its time budget.
+import helpers.Utilities.DeadlineUtility
+
+# Import the cancellation tokens, to stop the extraction member by member.
+import helpers.Utilities.CancellationUtility
+
+# Import the `QUEUE` module to make use of the
+# queue data-structure. In our program implementation,
+# the queue data-structure is used as a medium for passing
+# exception messages between the spawned threads and the
+# `DOWNLOAD_MANAGER` process.
+import queue
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+UNTAR_PACKAGE_LOGGER_NAME = '.UntarPackage'
+
+# Get the Logger Instance for the module.
+untar_package_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME + UNTAR_PACKAGE_LOGGER_NAME)
+
+#######################################################################
+
+# The extraction worker processes started upfront, shared by the rounds of the `UNTAR_MANAGER`
+# (see `start_process_pool`). <::PROTECTED_ATTRIBUTE::>
+_process_pool = None
+
+###############################################################
+# The section below contains the `THREAD` definition,
+# that helps out in the process of `EXTRACTING` the downloaded
+# "*.tar.gz" packages for targeted application environments.
+###############################################################
+
+# Class Definition for the UntarPackage `THREAD`.
+# Inherits properties from the `THREADING` Module.
+# The default location to extract `TAR` packages is set to `DEFAULT/` folder.
+class UntarPackageThread(threading.Thread):
+	# Initialize the `THREAD` with sub-class specific
+	# information.
+	# Pass on the rest to the super-class initializer method.
+	def __init__(self, group=None, target=None, name=None,
+					args=(), kwargs=None, *, daemon=None):
+		super().__init__(group=group, target=target, name=name,
+							daemon=daemon)
+		self.tar_file_name    = args[0]
+		self.exception_stacktrace_queue = args[1]
+		self.tar_package_type = args[2] if len(args) == 3 else helpers.BuildConfig.Untar.UntarConfig.DEFAULT_TAR_PACKAGE_TYPE
+		self.untar_complete   = False
+		# The time budget of the extraction (If Any), set by the `UNTAR_MANAGER`.
+		self.deadline         = (kwargs or {}).get('deadline')
+		# The pool of worker processes to extract in (If Any, see `UntarConfig.EXTRACT_BACKEND`).
+		self.process_pool     = (kwargs or {}).get('process_pool')
+		# The manifest of the extracted members, a list of `(MEMBER NAME, SIZE)`.
+		self.member_manifest  = []
+		# The member filter of the package type (If Any, see `MemberFilterUtility`).
+		self.member_filter    = helpers.Utilities.MemberFilterUtility.filter_for(self.tar_package_type)
+
+	# Defines the `RUN` method logic below.
+	# This method is executed when the `THREAD` starts.
+	def run(self):
+		"""
+		Untar `TAR` packages for installation and configuration purposes.
+		This Python Module makes use of the Sandard Python Built-in Library
+		for handling `TAR` files in a platform-independent and uniform manner.
+		"""
+		# Bind the time budget, the extraction is checked against it member by member.
+		helpers.Utilities.DeadlineUtility.bind(self.deadline)
+
+		try:
+			# Strip `PATH` components from the argument passed in.
+			# Should only contain the `FILE-NAME` to promote code uniformity.
+			tar_file_name = os.path.basename(self.tar_file_name)
+			# Construct the default `TAR` package storage location.
+			TAR_FILE_LOCATION = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + tar_file_name
+
+			# The package may already have been extracted while it was being downloaded.
+			if helpers.Utilities.StreamExtractUtility.is_extracted(tar_file_name, self.tar_package_type):
+				# Logging a comment
+				untar_package_logger.info('Package {' + tar_file_name + '} already Extracted while Streaming. Skipping Extraction')
+			elif TAR_FILE_LOCATION.endswith(helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION['gz']) or \
+				TAR_FILE_LOCATION.endswith(helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION['bz2']):
+				# Logging a comment
+				untar_package_logger.info('Extracting Tar File from Tar Repository: {' + TAR_FILE_LOCATION + '}')
+				# Logging a comment
+				untar_package_logger.info('Checking Extract Base Directory Path: {' +
+											helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY +
+												'}. Creating if doesn\'t exists...')
+
+				# Check to see if the `TAR` extract directory exists.
+				# If not, create it and re-direct all the `TAR` extracts to the newly created directory.
+				if not os.path.exists(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY):
+					os.mkdir(helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY)
+					# Logging a comment
+					untar_package_logger.info('Created Extract Base Directory Path: {' +
+											helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY + '}')
+
+				# Contruct the Final Directory Path.
+				# It's the staging directory within the install location, for the binaries installed
+				# directly (see `UntarConfig.INSTALL_MODE`).
+				TAR_FINAL_EXTRACT_DIRECTORY = helpers.Utilities.InstallUtility.extract_directory(self.tar_package_type)
+
+				# Logging a comment
+				untar_package_logger.info('Checking Extract Target Directory Path: {' + 
+							TAR_FINAL_EXTRACT_DIRECTORY + '}. Creating if doesn\'t exists...')
+
+				# Check to see if `TAR` package specific directory exists.
+				if not os.path.exists(TAR_FINAL_EXTRACT_DIRECTORY):
+					os.makedirs(TAR_FINAL_EXTRACT_DIRECTORY)
+					# Logging a comment
+					untar_package_logger.info('Created Extract Target Directory Path: {' + TAR_FINAL_EXTRACT_DIRECTORY + '}')
+
+				# Logging a comment
+				untar_package_logger.info('Untarring Package to Extract Target Directory: {' +
+												TAR_FINAL_EXTRACT_DIRECTORY + '}')
+
+				# Extract the `TAR` package to the specified destination directory, by the configured engine.
+				# The time budget is checked before each member, so that an overrun
+				# extraction fails (and is retried) instead of holding up the build.
+				# A cancelled extraction isn't retried, hence the members it extracted are dropped.
+				# The members filtered out (If Any) are skipped, rather than extracted.
+				if self.process_pool is not None:
+					self.member_manifest, extract_report = self._extract_in_process(TAR_FILE_LOCATION, TAR_FINAL_EXTRACT_DIRECTORY)
+				else:
+					extracted_members = []
+					try:
+						self.member_manifest, extract_report = helpers.Utilities.ExtractEngineUtility.extract(
+																	TAR_FILE_LOCATION, TAR_FINAL_EXTRACT_DIRECTORY,
+																		lambda tar_file: _budgeted_members(tar_file, extracted_members,
+																											self.member_filter))
+					except helpers.Utilities.CancellationUtility.TaskCancelledError:
+						_remove_members(TAR_FINAL_EXTRACT_DIRECTORY, extracted_members)
+						raise
+
+				# Put application level logging below.
+				# Logging a comment
+				untar_package_logger.info('Extracted {' + tar_file_name + '} to {' + TAR_FINAL_EXTRACT_DIRECTORY + '} (' +
+											str(len(self.member_manifest)) + ' Members, ' +
+												str(extract_report['skipped_members']) + ' Filtered Out, ' +
+												helpers.Utilities.ExtractEngineUtility.describe(extract_report) + ')')
+			else:
+				# Put application level logging below.
+				# Logging a comment
+				untar_package_logger.error('Extraction Operation Failed:: Not a {' +
+												helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION +
+													'} file as per the input\'s file extension -> {' + tar_file_name + '}')
+				# Raise an exception to notify that the incorrect file
+				# was passed in for extraction.
+				raise IOError
+		except (tarfile.TarError, IOError, OSError) as untarPackage_untarPackageThread_error:
+			# Put logging below.
+			untar_package_logger.error('Package Extraction Failed: ' + str(untarPackage_untarPackageThread_error))
+			# Put the exception object in the Exception Queue to enable
+			# the TaskManager (or UntarManager) to take care
+			# of the exception.
+			self.exception_stacktrace_queue.put(untarPackage_untarPackageThread_error)
+		else:
+			# Notify `UNTAR` completion.
+			self.untar_complete = True
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _extract_in_process(self, tar_file_location, extract_directory):
+		# Extract the package in a worker process, and wait on it. The worker checks the time budget
+		# before each member (the monotonic clock is shared by the processes), while this task
+		# checks its cancellation token (and the budget) every `EXTRACT_PROCESS_POLL_INTERVAL`.
+		extract_future = self.process_pool.submit(extract_package, tar_file_location, extract_directory, self.deadline,
+													self.member_filter)
+		while True:
+			try:
+				return extract_future.result(timeout=helpers.BuildConfig.Untar.UntarConfig.EXTRACT_PROCESS_POLL_INTERVAL)
+			except concurrent.futures.TimeoutError:
+				pass
+
+			try:
+				helpers.Utilities.DeadlineUtility.check()
+				helpers.Utilities.CancellationUtility.check()
+			except (helpers.Utilities.DeadlineUtility.DeadlineExceededError,
+						helpers.Utilities.CancellationUtility.TaskCancelledError):
+				# A running worker can't be interrupted, hence the members it extracts are
+				# dropped once it completes.
+				if not extract_future.cancel():
+					extract_future.add_done_callback(functools.partial(_drop_abandoned_extract, extract_directory))
+				raise
+
+# Utility / Helper function - 0.
+def _budgeted_members(tar_file, extracted_members, member_filter=None):
+	"""
+	Yields the members of the `TAR` package (accepted by the `MEMBER_FILTER`, If Any), checking
+	the bound time budget (and the cancellation token) before each. The names yielded are noted
+	in `EXTRACTED_MEMBERS`.
+	"""
+	for tar_member in (member_filter.select(tar_file) if member_filter is not None else tar_file):
+		helpers.Utilities.DeadlineUtility.check()
+		helpers.Utilities.CancellationUtility.check()
+		extracted_members.append(tar_member.name)
+		yield tar_member
+
+# Utility / Helper function - 1.
+def _remove_members(extract_directory, member_names):
+	"""
+	Remove the top-level entries (under the `EXTRACT_DIRECTORY`) of the members extracted so far.
+	"""
+	for top_level_name in {os.path.normpath(member_name).split(os.sep)[0] for member_name in member_names}:
+		# Never step outside of the extract directory.
+		if top_level_name in ('', os.curdir, os.pardir):
+			continue
+		member_location = os.path.join(extract_directory, top_level_name)
+		if os.path.isdir(member_location) and not os.path.islink(member_location):
+			shutil.rmtree(member_location, ignore_errors=True)
+		elif os.path.lexists(member_location):
+			os.remove(member_location)
+
+# Utility / Helper function - 2.
+def extract_package(tar_file_location, extract_directory, deadline=None, member_filter=None):
+	"""
+	Extract the `TAR` package at the `TAR_FILE_LOCATION` to the `EXTRACT_DIRECTORY`, within the
+	`DEADLINE` (If Any), skipping the members filtered out by the `MEMBER_FILTER` (If Any). Returns a tuple of `(MEMBER MANIFEST, EXTRACT REPORT)` (see `ExtractEngineUtility.extract`).
+	Runs in the extraction worker processes, hence it doesn't log (the Logger handlers of the workers
+	are copies of those of the build process, writing to the same log file).
+	"""
+	# The cancellation token (If Any) is checked by the waiting task instead.
+	helpers.Utilities.DeadlineUtility.bind(deadline)
+	helpers.Utilities.CancellationUtility.bind(None)
+	return helpers.Utilities.ExtractEngineUtility.extract(tar_file_location, extract_directory,
+															lambda tar_file: _budgeted_members(tar_file, [], member_filter))
+
+# Utility / Helper function - 3.
+def _drop_abandoned_extract(extract_directory, extract_future):
+	"""
+	Remove the members extracted by a worker process the task gave up on, once it completes.
+	"""
+	if not extract_future.cancelled() and extract_future.exception() is None:
+		_remove_members(extract_directory, [member_name for member_name, _ in extract_future.result()[0]])
+
+# Utility / Helper function - 4.
+def _process_workers(package_count):
+	"""
+	Returns the number of extraction worker processes for the `PACKAGE_COUNT` packages, or `0` to
+	extract within the threads (see `UntarConfig.EXTRACT_BACKEND`).
+	"""
+	extract_backend = helpers.BuildConfig.Untar.UntarConfig.EXTRACT_BACKEND
+	process_workers = min(package_count, helpers.Utilities.ExtractEngineUtility.free_cores())
+	if helpers.BuildConfig.Untar.UntarConfig.EXTRACT_PROCESS_MAX_WORKERS is not None:
+		process_workers = min(process_workers, helpers.BuildConfig.Untar.UntarConfig.EXTRACT_PROCESS_MAX_WORKERS)
+
+	if extract_backend == 'thread' or (extract_backend == 'auto' and process_workers < 2) or package_count == 0:
+		return 0
+	return max(process_workers, 1)
+
+# Utility / Helper function - 5.
+def _fork_process_pool(process_workers):
+	"""
+	Returns a pool of `PROCESS_WORKERS` extraction worker processes, all of them forked right away,
+	or `NONE` when other threads are running.
+	The workers are forked, as a spawned (or forkserver) worker would re-run the (unguarded) build
+	script. A worker forked while other threads run could inherit a lock one of them held at the
+	time (for eg., a Logger lock, or the import lock), and hang on it. Hence the workers are only
+	forked while this process runs a single thread, and never again afterwards.
+	"""
+	if threading.active_count() > 1:
+		# Logging a comment
+		untar_package_logger.warning('Extracting within the Threads: {' + str(threading.active_count() - 1) +
+										'} other Threads are running, the Worker Processes can\'t be forked safely')
+		return None
+
+	# Pick the decompressors of the extraction engine first, hence the workers inherit the result.
+	if helpers.Utilities.ExtractEngineUtility.engine_name() == 'pipelined':
+		helpers.Utilities.ExtractEngineUtility.probe_decompressors()
+
+	process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=process_workers,
+															mp_context=multiprocessing.get_context('fork'))
+	# With the `FORK` start method, the pool forks all of its workers on the first call
+	# (before it starts its own management thread).
+	process_pool.submit(os.getpid).result()
+
+	# Logging a comment
+	untar_package_logger.info('Started {' + str(process_workers) + '} Extraction Worker Processes')
+	return process_pool
+
+# Utility / Helper function - 6.
+def start_process_pool(package_count):
+	"""
+	Start the extraction worker processes for the `PACKAGE_COUNT` packages of the build upfront
+	(If Selected), to be shared by the rounds of the `UNTAR_MANAGER`. Call it while the build
+	runs a single thread (for eg., before the `DOWNLOAD_MANAGER` starts).
+	"""
+	global _process_pool
+	process_workers = _process_workers(package_count)
+	if _process_pool is None and process_workers:
+		_process_pool = _fork_process_pool(process_workers)
+
+# Utility / Helper function - 7.
+def extract_process_pool(package_count):
+	"""
+	Returns a pool of extraction worker processes for the `PACKAGE_COUNT` packages, or `NONE` to
+	extract within the threads (see `UntarConfig.EXTRACT_BACKEND`). That's the pool started upfront
+	(If Any), or a pool of its own (only while no other threads run, see `_fork_process_pool`).
+	Hand it back to `release_process_pool` once the packages are extracted.
+	"""
+	process_workers = _process_workers(package_count)
+	if not process_workers:
+		return None
+
+	# Logging a comment
+	untar_package_logger.info('Extracting {' + str(package_count) + '} Packages in Worker Processes')
+	return _process_pool if _process_pool is not None else _fork_process_pool(process_workers)
+
+# Utility / Helper function - 8.
+def release_process_pool(process_pool):
+	"""
+	Shut the `PROCESS_POOL` down, unless it's the pool started upfront. The workers of the tasks
+	left behind (If Any) are not waited for.
+	"""
+	if process_pool is not None and process_pool is not _process_pool:
+		process_pool.shutdown(wait=False, cancel_futures=True)
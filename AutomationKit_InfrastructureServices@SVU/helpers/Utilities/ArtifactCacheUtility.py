@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+
+# This module houses the Content-Addressed `ARTIFACT` cache for the
+# downloaded "*.tar.gz" / "*.tar.bz2" packages.
+# Packages are stored once, as blobs named after their `SHA-256` digest,
+# and an index maps each download URL to the digest of the package it served.
+# The cache directory can be shared between nodes, so that provisioning a
+# fleet from the same cache costs a single download per package.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the cache configurations module.
+import helpers.BuildConfig.Cache.CacheConfig
+
+# Import the `HASHLIB` module to compute the package digests.
+import hashlib
+
+# Import the `JSON` module to persist the cache index on-disk.
+import json
+
+# Import the `OS` and `SHUTIL` modules for the file-system operations.
+import os, shutil
+
+# Import the `THREADING` module, as the cache is shared between the downloader threads.
+import threading
+
+# Import the `TIME` module to keep track of the last access of each package.
+import time
+
+# Import the `CONTEXTLIB` module to build the locking context managers.
+import contextlib
+
+# File locks keep the index consistent when the cache directory is shared
+# between several nodes (or processes).
+# `FCNTL` is only available on the `*NIX` family, hence the fallback to
+# the in-process lock alone.
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+ARTIFACT_CACHE_UTILITY_LOGGER_NAME = '.ArtifactCacheUtility'
+
+# Get the Logger Instance for the module.
+artifact_cache_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													ARTIFACT_CACHE_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Size of the chunks read while hashing / copying the packages.
+HASH_CHUNK = 1024 * 1024
+
+# Utility / Helper function - 0.
+def file_digest(file_location, algorithm='sha256'):
+	"""
+	Compute the digest (`SHA-256` by default) of the file at the given location.
+	"""
+	digest = hashlib.new(algorithm)
+	with open(file_location, 'rb') as file_object:
+		for file_chunk in iter(lambda: file_object.read(HASH_CHUNK), b''):
+			digest.update(file_chunk)
+	return digest.hexdigest()
+
+##############################################################
+# The section below contains the Class Definition for the
+# Content-Addressed `ARTIFACT` cache.
+##############################################################
+
+class ArtifactCache(object):
+	"""
+	Content-Addressed store for the downloaded `TAR` packages. The blobs are kept
+	under `<CACHE_DIRECTORY>/blobs/<first-two-digest-characters>/<digest>` and the
+	`URL -> DIGEST` index is kept in `<CACHE_DIRECTORY>/index.json`.
+	The cache is bounded in size and evicts the Least Recently Used blobs first.
+	"""
+
+	def __init__(self, cache_directory, max_size):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.cache_directory = cache_directory
+		self.blob_directory  = os.path.join(cache_directory, 'blobs')
+		self.index_file      = os.path.join(cache_directory, 'index.json')
+		self.lock_directory  = os.path.join(cache_directory, 'locks')
+		self.max_size        = max_size
+
+		# Statistics for the hit / miss report.
+		self.hits          = 0
+		self.misses        = 0
+		self.stored        = 0
+		self.evicted       = 0
+		self.bytes_served  = 0
+
+		# Guards the index and the statistics within the process. <::PROTECTED_ATTRIBUTE::>
+		self._lock = threading.Lock()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _blob_location(self, digest):
+		return os.path.join(self.blob_directory, digest[:2], digest)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _load_index(self):
+		try:
+			with open(self.index_file, 'r') as index_object:
+				return json.load(index_object)
+		except (IOError, OSError, ValueError):
+			# A missing (or unreadable) index means an empty cache.
+			return {'urls': {}, 'blobs': {}}
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _save_index(self, index):
+		# Write to a temporary file and rename it over the index,
+		# so that readers never see a partially written index.
+		temporary_index_file = self.index_file + '.' + str(os.getpid()) + '.tmp'
+		with open(temporary_index_file, 'w') as index_object:
+			json.dump(index, index_object, indent=1, sort_keys=True)
+		os.replace(temporary_index_file, self.index_file)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@contextlib.contextmanager
+	def _file_lock(self, lock_file_location):
+		os.makedirs(os.path.dirname(lock_file_location), exist_ok=True)
+		with open(lock_file_location, 'a') as lock_object:
+			if fcntl is not None:
+				fcntl.flock(lock_object, fcntl.LOCK_EX)
+			try:
+				yield
+			finally:
+				if fcntl is not None:
+					fcntl.flock(lock_object, fcntl.LOCK_UN)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@contextlib.contextmanager
+	def _locked_index(self):
+		# Serialize the index updates between the threads of this process
+		# and (through the file lock) between the processes / nodes sharing the cache.
+		with self._lock, self._file_lock(os.path.join(self.lock_directory, 'index.lock')):
+			index = self._load_index()
+			yield index
+			self._save_index(index)
+
+	@contextlib.contextmanager
+	def download_lock(self, url):
+		"""
+		Hold an exclusive lock for the given URL, while its package is being fetched.
+		Nodes that share the cache directory wait on this lock and are then served
+		from the cache, instead of downloading the same package again.
+		"""
+		url_digest = hashlib.sha256(url.encode('UTF-8')).hexdigest()
+		with self._file_lock(os.path.join(self.lock_directory, url_digest + '.lock')):
+			yield
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	def _materialize(source_location, destination_location):
+		# Hard-link the file when both locations are on the same file-system,
+		# else fall back to a copy. Both go through a temporary file and a rename,
+		# so the destination is never left half written.
+		# A destination already linked to the source needs no work (a rename
+		# between two links of the same file is a no-op and would leave the
+		# temporary file behind).
+		if os.path.exists(destination_location) and os.path.samefile(source_location, destination_location):
+			return
+		temporary_location = destination_location + '.' + str(os.getpid()) + '.tmp'
+		if os.path.exists(temporary_location):
+			os.remove(temporary_location)
+		try:
+			os.link(source_location, temporary_location)
+		except OSError:
+			shutil.copyfile(source_location, temporary_location)
+		os.replace(temporary_location, destination_location)
+
+	def fetch(self, url, destination_location):
+		"""
+		Place the package cached for the URL at the destination location.
+		Returns the `SHA-256` digest of the package on a cache hit, `NONE` otherwise.
+		"""
+		with self._locked_index() as index:
+			digest = index['urls'].get(url)
+			blob_entry = index['blobs'].get(digest) if digest else None
+			blob_location = self._blob_location(digest) if digest else None
+
+			# The blob must still be present, and of the recorded size.
+			if blob_entry is None or not os.path.exists(blob_location) or \
+					os.path.getsize(blob_location) != blob_entry['size']:
+				if digest is not None:
+					# Drop the stale entries.
+					index['urls'].pop(url, None)
+					index['blobs'].pop(digest, None)
+				self.misses += 1
+
+				# Logging a comment
+				artifact_cache_utility_logger.info('Artifact Cache MISS for URI: {' + url + '}')
+				return None
+
+			blob_entry['last_access'] = time.time()
+			self._materialize(blob_location, destination_location)
+			self.hits         += 1
+			self.bytes_served += blob_entry['size']
+
+		# Logging a comment
+		artifact_cache_utility_logger.info('Artifact Cache HIT for URI: {' + url + '}, DIGEST: {' + digest + '}')
+		return digest
+
+	def store(self, url, source_location, digest=None):
+		"""
+		Add the package at the source location to the cache and index it under the URL.
+		Pass in the `SHA-256` digest if it is already known (for eg., computed while
+		downloading), to save a read pass over the file.
+		"""
+		if digest is None:
+			digest = file_digest(source_location)
+		blob_size = os.path.getsize(source_location)
+
+		# A package larger than the whole cache is never kept.
+		if blob_size > self.max_size:
+			# Logging a comment
+			artifact_cache_utility_logger.warning('Package: {' + source_location + '} exceeds the Artifact Cache size. Not cached')
+			return digest
+
+		blob_location = self._blob_location(digest)
+		with self._locked_index() as index:
+			if not os.path.exists(blob_location):
+				os.makedirs(os.path.dirname(blob_location), exist_ok=True)
+				self._materialize(source_location, blob_location)
+			index['urls'][url] = digest
+			index['blobs'][digest] = {'size': blob_size, 'last_access': time.time(),
+										'name': os.path.basename(source_location)}
+			self.stored += 1
+			self._evict(index, keep_digest=digest)
+
+		# Logging a comment
+		artifact_cache_utility_logger.info('Artifact Cache STORE for URI: {' + url + '}, DIGEST: {' + digest + '}')
+		return digest
+
+	def discard(self, url):
+		"""
+		Drop the URL (and the blob it references) from the cache.
+		"""
+		with self._locked_index() as index:
+			digest = index['urls'].pop(url, None)
+			if digest is not None and digest in index['blobs']:
+				index['blobs'].pop(digest)
+				self._remove_blob(digest)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _remove_blob(self, digest):
+		try:
+			os.remove(self._blob_location(digest))
+		except OSError:
+			pass
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _evict(self, index, keep_digest):
+		# Evict the Least Recently Used blobs until the cache fits within its bound.
+		total_size = sum(blob_entry['size'] for blob_entry in index['blobs'].values())
+		for digest, blob_entry in sorted(index['blobs'].items(), key=lambda item: item[1]['last_access']):
+			if total_size <= self.max_size:
+				break
+			if digest == keep_digest:
+				continue
+			index['blobs'].pop(digest)
+			for url in [url for url, url_digest in index['urls'].items() if url_digest == digest]:
+				index['urls'].pop(url)
+			self._remove_blob(digest)
+			total_size   -= blob_entry['size']
+			self.evicted += 1
+
+			# Logging a comment
+			artifact_cache_utility_logger.info('Artifact Cache EVICT for DIGEST: {' + digest + '}')
+
+	def report(self):
+		"""
+		Returns the hit / miss report for the cache.
+		"""
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				'hits'        : self.hits,
+				'misses'      : self.misses,
+				'hit_ratio'   : (float(self.hits) / lookups) if lookups else 0.0,
+				'stored'      : self.stored,
+				'evicted'     : self.evicted,
+				'bytes_served': self.bytes_served
+			}
+
+	def log_report(self):
+		"""
+		Write the hit / miss report to the application log.
+		"""
+		cache_report = self.report()
+
+		# Logging a comment
+		artifact_cache_utility_logger.info('Artifact Cache Report: HITS: {' + str(cache_report['hits']) + '}, MISSES: {' +
+									str(cache_report['misses']) + '}, HIT_RATIO: {' + '{:.2f}'.format(cache_report['hit_ratio']) +
+									'}, STORED: {' + str(cache_report['stored']) + '}, EVICTED: {' + str(cache_report['evicted']) +
+									'}, BYTES_SERVED: {' + str(cache_report['bytes_served']) + '}')
+
+# The cache instance shared by all the downloader threads.
+shared_artifact_cache = ArtifactCache(helpers.BuildConfig.Cache.CacheConfig.ARTIFACT_CACHE_DIRECTORY,
+										helpers.BuildConfig.Cache.CacheConfig.ARTIFACT_CACHE_MAX_SIZE)
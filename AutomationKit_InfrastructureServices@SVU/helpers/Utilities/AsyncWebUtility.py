@@ -0,0 +1,867 @@
+#!/usr/bin/env python3
+
+# This module holds the `ASYNCIO` counterparts of the `WebUtility` helpers,
+# used by the `ASYNCIO` download engine.
+# Requests are sent over non-blocking sockets (`asyncio.open_connection`),
+# so a single thread can resolve and fetch any number of packages at once.
+# The helpers raise the same `URLError` / `HTTPError` / `ContentTooShortError`
+# errors as their blocking counterparts, so the `DOWNLOAD_MANAGER` retry logic
+# applies unchanged.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO, common and cache configurations modules.
+import helpers.BuildConfig.IO.IOConfig, helpers.BuildConfig.Common.CommonConfig, helpers.BuildConfig.Cache.CacheConfig
+
+# Import the Content-Addressed `ARTIFACT` cache and the response cache.
+import helpers.Utilities.ArtifactCacheUtility, helpers.Utilities.ResponseCacheUtility
+
+# Import the streaming link scanner, used to scrape the version-discovery pages.
+import helpers.Utilities.LinkScannerUtility
+
+# Import the integrity checks, to verify the packages against their published checksums.
+import helpers.Utilities.ChecksumUtility
+
+# Import the streaming extraction module, to extract the packages once downloaded.
+import helpers.Utilities.StreamExtractUtility
+
+# Import the mirror selection, to race the mirrors of a package.
+import helpers.Utilities.MirrorUtility
+
+# Import the deadlines, which cap the connect / read timeouts of the requests.
+import helpers.Utilities.DeadlineUtility
+
+# Import the cancellation tokens, checked between the chunks like the deadlines.
+import helpers.Utilities.CancellationUtility
+
+# Import the circuit breakers, to fail fast on the hosts that are down.
+import helpers.Utilities.RetryUtility
+
+# Import the stage timings, the connects and the first bytes are traced.
+import helpers.Utilities.TraceUtility
+
+# Import the blocking `WebUtility` helpers, for the partial file (resume) helpers, the
+# segmented downloads and as the fallback for the schemes (for eg., `FTP`) the `ASYNCIO`
+# client doesn't speak.
+import helpers.Utilities.WebUtility
+
+# Import the buffer helpers, to preallocate the packages.
+import helpers.Utilities.BufferUtility
+
+# Import the `ASYNCIO` module for the non-blocking sockets.
+import asyncio
+
+# Import the `CONTEXTVARS` module, the blocking helpers run in the executor within the
+# context of the task (for eg., its deadline and traced component).
+import contextvars
+
+# Import the `HTTP.CLIENT` module to parse the response headers.
+import http.client
+
+# Import the `EMAIL.PARSER` module, which backs the `HTTP.CLIENT` header parsing.
+import email.parser
+
+# Import the `SSL` module for the `HTTPS` connections.
+import ssl
+
+# Import the `IO` module to hold the (short) error bodies in memory.
+import io
+
+# Import the `RE`, `OS` and `TIME` modules.
+import re, os, time
+
+# Currently making use of `URLLIB` for the `REQUEST` / `ERROR` objects.
+from urllib.request import Request, getproxies
+from urllib.error   import URLError, HTTPError, ContentTooShortError
+from urllib.parse   import urljoin, urlsplit
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+ASYNC_WEB_UTILITY_LOGGER_NAME = '.AsyncWebUtility'
+
+# Get the Logger Instance for the module.
+async_web_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												ASYNC_WEB_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# `HTTP` status codes that are followed as redirects.
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Maximum number of redirects followed for a single request (same as `URLLIB`).
+MAX_REDIRECTIONS = 10
+
+# Unread error bodies are kept up to the below size.
+MAX_ERROR_BODY_SIZE = 64 * 1024
+
+# `User-Agent` sent when the caller didn't set one (same as `URLLIB`).
+DEFAULT_USER_AGENT = 'Python-urllib/3'
+
+# `TLS` settings shared by the `HTTPS` connections.
+_ssl_context = ssl.create_default_context()
+
+##############################################################
+# The section below contains the Class Definition for the
+# non-blocking response.
+##############################################################
+
+class AsyncResponse(object):
+	"""
+	Response to a request sent over an `ASYNCIO` stream. The body is read with
+	`await response.read(amt)`, for `Content-Length`, chunked and
+	close-delimited bodies alike. One connection serves one request.
+	"""
+
+	def __init__(self, stream_reader, stream_writer, url, status, reason, headers, has_body, read_timeout=None):
+		"""
+		The `INITIALIZE` method for the class.
+		Each read of the body must return within `READ_TIMEOUT` seconds (If Set).
+		"""
+		self.url     = url
+		self.status  = status
+		self.code    = status
+		self.reason  = reason
+		self.headers = headers
+
+		# <::PROTECTED_ATTRIBUTE::>
+		self._reader = stream_reader
+		self._writer = stream_writer
+
+		# Body framing state. <::PROTECTED_ATTRIBUTE::>
+		self._chunked         = has_body and 'chunked' in headers.get('Transfer-Encoding', '').lower()
+		content_length        = headers.get('Content-Length')
+		self._remaining       = (int(content_length) if content_length and not self._chunked else None) if has_body else 0
+		self._chunk_remaining = 0
+		self._eof             = not has_body
+		self._read_timeout    = read_timeout
+
+	def getcode(self):
+		return self.status
+
+	def geturl(self):
+		return self.url
+
+	def info(self):
+		return self.headers
+
+	async def read(self, amt=-1):
+		"""
+		Returns up to `AMT` bytes of the body (all of it, for a negative `AMT`).
+		An empty bytes object marks the end of the body.
+		"""
+		if amt is None or amt < 0:
+			body_chunks = []
+			while True:
+				body_chunk = await self.read(helpers.BuildConfig.IO.IOConfig.CHUNK)
+				if not body_chunk:
+					return b''.join(body_chunks)
+				body_chunks.append(body_chunk)
+
+		if self._eof:
+			return b''
+		try:
+			return await asyncio.wait_for(self._read_body(amt), self._read_timeout)
+		except asyncio.TimeoutError:
+			# The transfer stalled. Report it as a short read, which the `DOWNLOAD_MANAGER` retries.
+			raise ContentTooShortError('Retrieval stalled: no data for {' + str(round(self._read_timeout, 3)) + '} seconds', None)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	async def _read_body(self, amt):
+		try:
+			if self._chunked:
+				return await self._read_chunked(amt)
+			if self._remaining is None:
+				# A close-delimited body.
+				body_chunk = await self._reader.read(amt)
+				self._eof  = not body_chunk
+				return body_chunk
+
+			body_chunk = await self._reader.read(min(amt, self._remaining))
+			if not body_chunk:
+				raise ContentTooShortError('Retrieval incomplete: ' + str(self._remaining) + ' more bytes expected', None)
+			self._remaining -= len(body_chunk)
+			self._eof        = not self._remaining
+			return body_chunk
+		except (asyncio.IncompleteReadError, ValueError, ConnectionError) as asyncWebUtility_read_error:
+			# The connection dropped mid-transfer (or the framing is garbled).
+			# Report it as a short read, which the `DOWNLOAD_MANAGER` retries.
+			raise ContentTooShortError('Retrieval incomplete: ' + str(asyncWebUtility_read_error), None)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	async def _read_chunked(self, amt):
+		if not self._chunk_remaining:
+			chunk_size_line       = await self._reader.readuntil(b'\r\n')
+			self._chunk_remaining = int(chunk_size_line.split(b';', 1)[0].strip(), 16)
+			if not self._chunk_remaining:
+				# The last chunk. Skip the trailers (If Any).
+				while await self._reader.readuntil(b'\r\n') != b'\r\n':
+					pass
+				self._eof = True
+				return b''
+
+		body_chunk = await self._reader.readexactly(min(amt, self._chunk_remaining))
+		self._chunk_remaining -= len(body_chunk)
+		if not self._chunk_remaining:
+			# Every chunk ends with a `CRLF`.
+			await self._reader.readexactly(2)
+		return body_chunk
+
+	def close(self):
+		"""
+		Close the connection (the engine doesn't keep connections alive).
+		"""
+		if self._writer is not None:
+			self._writer.close()
+			self._writer = None
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, exc_traceback):
+		self.close()
+
+#################################################################
+# The section below contains the utility functions (coroutines),
+# that help out in the process of downloading the latest
+# "*.tar.gz" package(s).
+#################################################################
+
+# Utility Function - 0
+def is_supported(request_object):
+	"""
+	Tells whether the request can be sent by the `ASYNCIO` client.
+	Other schemes (for eg., `FTP`) and proxied setups go through the blocking helpers.
+	"""
+	return request_object.type in ('http', 'https') and request_object.type not in getproxies()
+
+# Utility Function - 1
+async def urlopen(request_object, timeout=None):
+	"""
+	Non-Blocking counterpart of `URLLIB`'s `urlopen`, for `REQUEST` objects or URLs.
+	Redirects are followed (keeping the request headers), non `2xx` answers raise
+	`HTTPError` and socket failures raise `URLError`.
+	The connections are bounded by `IOConfig.CONNECT_TIMEOUT`, and the reads by the
+	`TIMEOUT` (`IOConfig.READ_TIMEOUT` by default). Both are capped with what is left
+	of the deadline bound to the calling task (If Any).
+	While the circuit of the host is open, `CircuitOpenError` is raised straight away.
+	"""
+	if not isinstance(request_object, Request):
+		request_object = Request(request_object)
+
+	circuit_breaker = helpers.Utilities.RetryUtility.shared_circuit_breaker
+	circuit_breaker.before_request(request_object.full_url)
+	try:
+		async_response = await _open(request_object, timeout)
+	except (URLError, HTTPError, OSError, asyncio.TimeoutError) as asyncWebUtility_urlopen_error:
+		circuit_breaker.record_outcome(request_object.full_url, asyncWebUtility_urlopen_error)
+		raise
+	circuit_breaker.record_outcome(request_object.full_url)
+	return async_response
+
+# Utility Function - 2
+async def _open(request_object, timeout):
+	"""
+	Send the request, following the redirects.
+	"""
+	connect_timeout = helpers.Utilities.DeadlineUtility.request_timeout(helpers.BuildConfig.IO.IOConfig.CONNECT_TIMEOUT)
+	read_timeout    = helpers.Utilities.DeadlineUtility.request_timeout(helpers.BuildConfig.IO.IOConfig.READ_TIMEOUT
+																			if timeout is None else timeout)
+
+	for _ in range(MAX_REDIRECTIONS + 1):
+		async_response = await _send(request_object, connect_timeout, read_timeout)
+		if async_response.status not in REDIRECT_CODES or 'Location' not in async_response.headers:
+			break
+
+		# Follow the redirect, keeping the request headers (for eg., the cookies required by Oracle).
+		redirect_url = urljoin(request_object.full_url, async_response.headers['Location'])
+		async_response.close()
+
+		# Logging a comment
+		async_web_utility_logger.info('Following Redirect from URI: {' + request_object.full_url + '} to URI: {' +
+										redirect_url + '}')
+
+		redirect_method = request_object.get_method()
+		if async_response.status == 303 or (async_response.status in (301, 302) and redirect_method == 'POST'):
+			redirect_method = 'GET'
+		request_object = Request(redirect_url, headers=dict(request_object.header_items()), method=redirect_method)
+	else:
+		raise await _http_error(request_object, async_response, 'Too many redirections')
+
+	# Mirror `URLLIB`: anything other than a `2xx` answer is an `HTTP_ERROR`.
+	if not 200 <= async_response.status < 300:
+		raise await _http_error(request_object, async_response, async_response.reason)
+	return async_response
+
+# Utility Function - 3
+async def _http_error(request_object, async_response, error_message):
+	"""
+	Build the `HTTP_ERROR` for a response, keeping (the start of) its body in memory.
+	"""
+	try:
+		error_body = io.BytesIO(await async_response.read(MAX_ERROR_BODY_SIZE))
+	except ContentTooShortError:
+		error_body = io.BytesIO()
+	finally:
+		async_response.close()
+	return HTTPError(request_object.full_url, async_response.status, error_message, async_response.headers, error_body)
+
+# Utility Function - 4
+async def _send(request_object, connect_timeout, read_timeout):
+	"""
+	Send a single request over a fresh connection, and parse the status line and headers.
+	"""
+	url_parts = urlsplit(request_object.full_url)
+	scheme    = url_parts.scheme
+	host      = url_parts.hostname
+	port      = url_parts.port or (443 if scheme == 'https' else 80)
+
+	request_headers = dict(request_object.header_items())
+	request_headers.setdefault('User-agent', DEFAULT_USER_AGENT)
+	request_headers['Host']            = url_parts.netloc.rsplit('@', 1)[-1]
+	request_headers['Connection']      = 'close'
+	request_headers['Accept-Encoding'] = 'identity'
+	if request_object.data is not None:
+		request_headers['Content-Length'] = str(len(request_object.data))
+
+	request_head = request_object.get_method() + ' ' + (request_object.selector or '/') + ' HTTP/1.1\r\n' + \
+					''.join(header_name + ': ' + str(header_value) + '\r\n'
+								for header_name, header_value in request_headers.items()) + '\r\n'
+
+	stream_writer = None
+	try:
+		with helpers.Utilities.TraceUtility.span('connect', host=host):
+			stream_reader, stream_writer = await asyncio.wait_for(
+												asyncio.open_connection(host, port, ssl=_ssl_context if scheme == 'https' else None),
+												connect_timeout)
+		first_byte_start = time.monotonic_ns()
+		stream_writer.write(request_head.encode('ISO-8859-1') + (request_object.data or b''))
+		await stream_writer.drain()
+
+		# Parse the status line, skipping the interim (`1xx`) responses.
+		while True:
+			status_line = (await asyncio.wait_for(stream_reader.readuntil(b'\r\n'), read_timeout)).decode('ISO-8859-1')
+			http_version, status, reason = (status_line.rstrip('\r\n').split(' ', 2) + [''])[:3]
+			if not http_version.startswith('HTTP/'):
+				raise http.client.BadStatusLine(status_line)
+			status = int(status)
+
+			header_lines = []
+			while True:
+				header_line = await asyncio.wait_for(stream_reader.readuntil(b'\r\n'), read_timeout)
+				if header_line == b'\r\n':
+					break
+				header_lines.append(header_line)
+			if status >= 200 or status == 101:
+				break
+
+		# The response head is in, record the time to the first byte.
+		helpers.Utilities.TraceUtility.shared_trace_recorder.record('first_byte', first_byte_start, time.monotonic_ns(),
+																	span_args={'url': request_object.full_url})
+
+		response_headers = email.parser.BytesParser(_class=http.client.HTTPMessage).parsebytes(b''.join(header_lines) + b'\r\n')
+		has_body = request_object.get_method() != 'HEAD' and status not in (204, 304) and not 100 <= status < 200
+		return AsyncResponse(stream_reader, stream_writer, request_object.full_url, status, reason.strip(),
+								response_headers, has_body, read_timeout)
+	except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+				http.client.HTTPException, ValueError) as asyncWebUtility_send_error:
+		if stream_writer is not None:
+			stream_writer.close()
+		raise URLError(asyncWebUtility_send_error)
+	except asyncio.CancelledError:
+		# For eg., a raced mirror request that lost.
+		if stream_writer is not None:
+			stream_writer.close()
+		raise
+
+# Utility Function - 5
+async def get_link(target_url, link_pattern):
+	"""
+	Non-Blocking counterpart of `WebUtility.get_link`.
+	The page is scanned as it streams in, and the pages are revalidated
+	against the same persistent response cache.
+	"""
+
+	# The name of the function for logging purposes.
+	_function_name = get_link.__name__
+
+	try:
+		response_cache = helpers.Utilities.ResponseCacheUtility.shared_response_cache
+
+		request_object = Request(target_url)
+		if helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED:
+			# Make the request conditional on the cached validators (If Any).
+			for header_name, header_value in response_cache.conditional_headers(target_url).items():
+				request_object.add_header(header_name, header_value)
+
+		try:
+			async_response = await urlopen(request_object)
+		except HTTPError as asyncWebUtility_get_link_http_error:
+			# A `304 Not Modified` is served from the response cache.
+			# Anything else is a genuine failure.
+			if asyncWebUtility_get_link_http_error.code != 304:
+				raise
+
+			cached_entry = response_cache.load(target_url)
+			if cached_entry is not None:
+				content_body, body_complete = cached_entry
+				match_result = re.search(link_pattern, content_body)
+
+				# Only the start of the page may have been stored, and the pattern may lie further down.
+				if match_result is not None or body_complete:
+					return match_result
+
+			# The cached body vanished underneath us (or falls short of the pattern), fetch the page afresh.
+			response_cache.discard(target_url)
+			async_response = await urlopen(Request(target_url))
+
+		# Logging a comment
+		async_web_utility_logger.info('[Function: {' + _function_name + '}] Request sent to URI: {' + target_url + '}')
+
+		link_scanner = helpers.Utilities.LinkScannerUtility.LinkScanner(link_pattern,
+							keep_prefix=helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED)
+		try:
+			# Stop reading (and drop the connection) as soon as the link is found.
+			while True:
+				response_chunk = await async_response.read(helpers.BuildConfig.IO.IOConfig.CHUNK)
+				if link_scanner.feed(response_chunk, final=not response_chunk) is not None or not response_chunk:
+					break
+
+			if helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED:
+				response_cache.save(target_url, async_response.headers, link_scanner.prefix, complete=not response_chunk)
+		finally:
+			async_response.close()
+
+		# Logging a comment
+		async_web_utility_logger.info('[Function: {' + _function_name + '}] Response Received from URI: {' + target_url + '}')
+	except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as asyncWebUtility_get_link_error:
+		# Put logging below.
+		async_web_utility_logger.error('[Function: {' + _function_name + '}] URI Request Failed: ' + str(asyncWebUtility_get_link_error))
+		raise
+	else:
+		# The below returns either the matched string within
+		# the content of the response, or it would return `NONE`
+		# meaning it couldn't locate the pattern.
+		return link_scanner.match_result
+
+# Utility Function - 6
+async def download_tar_binary(url_tar_file_name, tar_request_object, download_segments=1, verify_checksum=False,
+								extract_package_type=None, mirror_urls=None):
+	"""
+	Non-Blocking counterpart of `WebUtility.download_tar_binary`.
+	The `ARTIFACT` cache is consulted first (its file operations run in the
+	default executor), and a package fetched over the network is added to it.
+	With `VERIFY_CHECKSUM`, the package is verified against its published checksum.
+	With `EXTRACT_PACKAGE_TYPE` (and `UntarConfig.STREAM_EXTRACT_ENABLED`), the package
+	is extracted once downloaded, in the executor, overlapping the other downloads
+	(feeding the extractor chunk by chunk would block the event loop).
+	With `MIRROR_URLS`, the package is fetched from the mirror that answers first.
+	Like its counterpart, a partial download is resumed, and the large packages are
+	fetched over `DOWNLOAD_SEGMENTS` connections (in the executor).
+	"""
+
+	# The name of the function for logging purposes.
+	_function_name = download_tar_binary.__name__
+
+	event_loop = asyncio.get_running_loop()
+
+	# The blocking helpers cater to the requests the `ASYNCIO` client doesn't.
+	if not is_supported(tar_request_object):
+		# Logging a comment
+		async_web_utility_logger.info('[Function: {' + _function_name + '}] Scheme not supported by the Async Engine, ' +
+										'handing off URI: {' + tar_request_object.full_url + '} to the *WebUtility* Service')
+		return await event_loop.run_in_executor(None, lambda: helpers.Utilities.WebUtility.download_tar_binary(
+													url_tar_file_name, tar_request_object, download_segments=download_segments,
+													verify_checksum=verify_checksum,
+													extract_package_type=extract_package_type, mirror_urls=mirror_urls))
+
+	try:
+		os.makedirs(helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE, exist_ok=True)
+
+		tar_file_name     = os.path.basename(url_tar_file_name)
+		tar_file_location = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + tar_file_name
+
+		# Fetch the published checksum ahead of the package (the checksum files are tiny,
+		# hence fetched over the blocking session, in the executor).
+		expected_checksum = await event_loop.run_in_executor(None, contextvars.copy_context().run,
+																helpers.Utilities.ChecksumUtility.fetch_expected_checksum,
+																tar_request_object) if verify_checksum else None
+
+		if not helpers.BuildConfig.Cache.CacheConfig.ARTIFACT_CACHE_ENABLED:
+			tar_digest = await _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+															mirror_urls)
+		else:
+			artifact_cache = helpers.Utilities.ArtifactCacheUtility.shared_artifact_cache
+
+			# Only one node (or task) fetches a given URI at a time. The file lock
+			# is taken (and released) in the executor, as it blocks.
+			download_lock = artifact_cache.download_lock(tar_request_object.full_url)
+			await event_loop.run_in_executor(None, download_lock.__enter__)
+			try:
+				tar_digest = await event_loop.run_in_executor(None, artifact_cache.fetch, tar_request_object.full_url,
+																tar_file_location)
+				if tar_digest is not None and (expected_checksum is None or await event_loop.run_in_executor(None,
+						helpers.Utilities.WebUtility._verify_cached_tar, tar_request_object, tar_file_location, tar_digest,
+						expected_checksum)):
+					# Logging a comment
+					async_web_utility_logger.info('[Function: {' + _function_name + '}] Tar served from the Artifact Cache to Location: {' +
+													tar_file_location + '}')
+
+					# Nothing new to record for the package.
+					expected_checksum = None
+				else:
+					tar_digest = await _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+															mirror_urls)
+					await event_loop.run_in_executor(None, artifact_cache.store, tar_request_object.full_url, tar_file_location,
+															tar_digest)
+			finally:
+				await event_loop.run_in_executor(None, download_lock.__exit__, None, None, None)
+
+		# Record the verified digests, for the later stages.
+		if expected_checksum is not None:
+			await event_loop.run_in_executor(None, helpers.Utilities.ChecksumUtility.shared_digest_registry.record,
+												tar_digest, tar_file_name, tar_request_object.full_url, *expected_checksum)
+
+		# Extract the package (If Enabled).
+		tar_extractor = await event_loop.run_in_executor(None,
+								helpers.Utilities.StreamExtractUtility.StreamingExtractor.for_package, tar_file_name,
+								extract_package_type)
+		if tar_extractor is not None:
+			await event_loop.run_in_executor(None, contextvars.copy_context().run, tar_extractor.finish, tar_file_location)
+
+		# Logging a comment
+		async_web_utility_logger.info('[Function: {' + _function_name + '}] Tar successfully Downloaded to Location: {' +
+										tar_file_location + '}')
+
+		# Return the `TAR` file-name.
+		return tar_file_name
+	except (URLError, HTTPError, ContentTooShortError, IOError, OSError) as asyncWebUtility_download_tar_binary_error:
+		# Put logging below.
+		async_web_utility_logger.error('[Function: {' + _function_name + '}] Tar Download Failed: ' +
+										str(asyncWebUtility_download_tar_binary_error))
+		raise
+
+# Utility Function - 7
+async def _fetch_tar_binary(tar_request_object, tar_file_location, download_segments=1, expected_checksum=None,
+								mirror_urls=None):
+	"""
+	Non-Blocking counterpart of `WebUtility._fetch_tar_binary`: stream the package for
+	the request to the on-disk location (through a "<TAR>.part" file), and return its
+	`SHA-256` digest. The package is verified against the `EXPECTED_CHECKSUM` (If Any)
+	in the same pass.
+	The partial file (and its validators) is shared with the blocking helpers: a retry
+	resumes the transfer with a `Range` request, and a fresh transfer of a large package
+	is fetched over `DOWNLOAD_SEGMENTS` connections (by the blocking helper, in the executor).
+	The file operations (the writes, and the digests along with them) run in the default
+	executor, hence never stall the other transfers on the event loop.
+	A cancelled or mismatching transfer leaves no partial file behind.
+	"""
+
+	# The name of the function for logging purposes.
+	_function_name = _fetch_tar_binary.__name__
+
+	event_loop             = asyncio.get_running_loop()
+	part_file_location     = tar_file_location + helpers.Utilities.WebUtility.PART_FILE_EXTENSION
+	part_metadata_location = part_file_location + '.json'
+
+	# Check for a partial download (of the same URI) left behind by an earlier attempt.
+	# A partial file still marked as preallocated can't be resumed from.
+	part_metadata = await event_loop.run_in_executor(None, helpers.Utilities.WebUtility._load_part_metadata,
+														part_metadata_location)
+	if part_metadata is None or part_metadata.get('url') != tar_request_object.full_url or \
+			part_metadata.get('preallocated') or not os.path.exists(part_file_location):
+		part_metadata = None
+	resume_offset = os.path.getsize(part_file_location) if part_metadata is not None else 0
+
+	# Large packages may be fetched over several connections at once.
+	# A partial single-connection download is resumed instead.
+	if download_segments > 1 and not resume_offset:
+		tar_digest = await event_loop.run_in_executor(None, contextvars.copy_context().run,
+														helpers.Utilities.WebUtility._fetch_tar_binary_segmented,
+														tar_request_object, tar_file_location, download_segments,
+														expected_checksum)
+		if tar_digest is not None:
+			return tar_digest
+
+	# Copy the request (and its headers) and ask for the remainder only, from the mirror the partial bytes came from.
+	source_url           = part_metadata.get('source_url', tar_request_object.full_url) if resume_offset else tar_request_object.full_url
+	range_request_object = Request(source_url, headers=dict(tar_request_object.header_items()))
+	if resume_offset:
+		range_request_object.add_header('Range', 'bytes=' + str(resume_offset) + '-')
+
+		# Only resume if the package is still the one the partial bytes came from.
+		if part_metadata.get('etag') and not part_metadata['etag'].startswith('W/'):
+			range_request_object.add_header('If-Range', part_metadata['etag'])
+		elif part_metadata.get('last_modified'):
+			range_request_object.add_header('If-Range', part_metadata['last_modified'])
+
+	try:
+		# Get the response from the supplied link (or from the first mirror to answer).
+		if resume_offset or not mirror_urls:
+			async_response = await urlopen(range_request_object)
+		else:
+			async_response, range_request_object = await _urlopen_hedged(range_request_object, mirror_urls)
+	except HTTPError as asyncWebUtility_fetch_tar_binary_error:
+		# `416 Range Not Satisfiable`: the partial file doesn't fit the package anymore. Start over.
+		if asyncWebUtility_fetch_tar_binary_error.code != 416 or not resume_offset:
+			raise
+		asyncWebUtility_fetch_tar_binary_error.close()
+		helpers.Utilities.WebUtility._remove_part_files(tar_file_location)
+		return await _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+										mirror_urls)
+
+	tar_object    = None
+	pending_write = None
+	try:
+		tar_digests = helpers.Utilities.ChecksumUtility.StreamDigests.for_checksum(expected_checksum)
+
+		if resume_offset and async_response.status == 206 and \
+				async_response.headers.get('Content-Range', '').startswith('bytes ' + str(resume_offset) + '-'):
+			# Logging a comment
+			async_web_utility_logger.info('[Function: {' + _function_name + '}] Resuming Tar Download at Byte Offset: {' +
+											str(resume_offset) + '} for Location: {' + tar_file_location + '}')
+
+			# Seed the digest with the bytes downloaded earlier.
+			await event_loop.run_in_executor(None, _seed_digests, part_file_location, tar_digests)
+			tar_file_mode = 'r+b'
+		elif async_response.status == 206:
+			# A partial body that doesn't pick up at the resume offset (or wasn't asked for).
+			if not resume_offset:
+				raise URLError('Unexpected Partial Content (Content-Range: {' +
+								str(async_response.headers.get('Content-Range')) + '}) for a Full Download of: {' +
+									range_request_object.full_url + '}')
+
+			# Logging a comment
+			async_web_utility_logger.warning('[Function: {' + _function_name + '}] Server answered the Range request from ' +
+												'Byte Offset: {' + str(resume_offset) + '} with Content-Range: {' +
+												str(async_response.headers.get('Content-Range')) + '}. Restarting Tar ' +
+												'Download without a Range for Location: {' + tar_file_location + '}')
+			async_response.close()
+			helpers.Utilities.WebUtility._remove_part_files(tar_file_location)
+			return await _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+											mirror_urls)
+		else:
+			if resume_offset:
+				# Logging a comment
+				async_web_utility_logger.info('[Function: {' + _function_name + '}] Server ignored the Range request. ' +
+												'Restarting Tar Download for Location: {' + tar_file_location + '}')
+			resume_offset = 0
+			tar_file_mode = 'wb'
+
+			# Record the validators of the package, for a later resume.
+			part_metadata = {
+				'url'          : tar_request_object.full_url,
+				'source_url'   : range_request_object.full_url,
+				'etag'         : async_response.headers.get('ETag'),
+				'last_modified': async_response.headers.get('Last-Modified')
+			}
+			await event_loop.run_in_executor(None, helpers.Utilities.WebUtility._save_part_metadata, part_metadata_location,
+												part_metadata)
+
+		# The expected size of the complete package (If Known).
+		expected_length = async_response.headers.get('Content-Length')
+		expected_length = (int(expected_length) + resume_offset) if expected_length else None
+		preallocated    = helpers.BuildConfig.IO.IOConfig.PREALLOCATE_ENABLED and expected_length is not None
+
+		# The partial file is opened for update (not for append), as the preallocated
+		# space lies past the end of the downloaded bytes.
+		tar_object = await event_loop.run_in_executor(None, _open_part_file, part_file_location, tar_file_mode,
+														resume_offset, part_metadata_location,
+														part_metadata if preallocated else None, expected_length)
+
+		def write_chunk(tar_chunk):
+			# Write the response chunk to the "target on-disk file", and digest it.
+			tar_object.write(tar_chunk)
+			tar_digests.update(tar_chunk)
+
+		transfer_start, transferred_bytes = time.perf_counter(), 0
+		while True:
+			# Read the "*.tar.gz" response in chunks.
+			# A transfer trickling in past the time budget is given up (and resumed by the retry).
+			helpers.Utilities.DeadlineUtility.check()
+			helpers.Utilities.CancellationUtility.check()
+			tar_chunk = await async_response.read(helpers.BuildConfig.IO.IOConfig.CHUNK)
+			if not tar_chunk:
+				break
+			# The write is shielded, so that a cancelled task still waits for it (below)
+			# before the partial file is trimmed and closed.
+			pending_write = event_loop.run_in_executor(None, write_chunk, tar_chunk)
+			await asyncio.shield(pending_write)
+			transferred_bytes += len(tar_chunk)
+
+		# Record the throughput of the mirror, for the later rankings.
+		if mirror_urls:
+			helpers.Utilities.MirrorUtility.shared_mirror_selector.record_throughput(range_request_object.full_url,
+																						transferred_bytes,
+																						time.perf_counter() - transfer_start)
+			await event_loop.run_in_executor(None, helpers.Utilities.MirrorUtility.shared_mirror_selector.flush)
+		if expected_length is not None and resume_offset + transferred_bytes < expected_length:
+			raise ContentTooShortError('Retrieval incomplete: got only ' + str(resume_offset + transferred_bytes) +
+										' out of ' + str(expected_length) + ' bytes', None)
+	except (asyncio.CancelledError, helpers.Utilities.CancellationUtility.TaskCancelledError):
+		# The transfer isn't retried (hence resumed), drop its partial file.
+		await _close_part_file(event_loop, tar_object, pending_write, part_metadata_location, part_metadata)
+		helpers.Utilities.WebUtility._remove_part_files(tar_file_location)
+		raise
+	except BaseException:
+		# A truncated transfer keeps its partial file, to be resumed by the next retry.
+		await _close_part_file(event_loop, tar_object, pending_write, part_metadata_location, part_metadata)
+		raise
+	finally:
+		async_response.close()
+	await _close_part_file(event_loop, tar_object, pending_write, part_metadata_location, part_metadata)
+
+	# Verify the package before moving it in place. A mismatching package
+	# can't be resumed from, hence the next retry starts over.
+	if expected_checksum is not None:
+		try:
+			helpers.Utilities.ChecksumUtility.verify(expected_checksum, tar_digests.hexdigest(expected_checksum[0]),
+														os.path.basename(tar_file_location))
+		except helpers.Utilities.ChecksumUtility.ChecksumMismatchError:
+			helpers.Utilities.WebUtility._remove_part_files(tar_file_location)
+			raise
+
+	# The package is complete, move it in place.
+	os.replace(part_file_location, tar_file_location)
+	helpers.Utilities.WebUtility._remove_part_files(tar_file_location)
+	return tar_digests.hexdigest('sha256')
+
+# Utility Function - 8
+def _seed_digests(part_file_location, tar_digests):
+	"""
+	Feed the bytes of a partial download to the `TAR_DIGESTS` (runs in the executor).
+	"""
+	with open(part_file_location, 'rb') as part_object:
+		for part_chunk in iter(lambda: part_object.read(helpers.Utilities.ArtifactCacheUtility.HASH_CHUNK), b''):
+			tar_digests.update(part_chunk)
+
+# Utility Function - 9
+def _open_part_file(part_file_location, tar_file_mode, resume_offset, part_metadata_location, part_metadata,
+						expected_length):
+	"""
+	Open the partial file at the `RESUME_OFFSET` (runs in the executor). With the `PART_METADATA`,
+	the rest of the package is preallocated, and the partial file is marked as such until it
+	is trimmed back to the downloaded bytes (see `_close_part_file`).
+	"""
+	tar_object = open(part_file_location, tar_file_mode)
+	try:
+		tar_object.seek(resume_offset)
+		if part_metadata is not None:
+			helpers.Utilities.WebUtility._save_part_metadata(part_metadata_location, dict(part_metadata, preallocated=True))
+			helpers.Utilities.BufferUtility.preallocate(tar_object.fileno(), resume_offset, expected_length - resume_offset)
+	except BaseException:
+		tar_object.close()
+		raise
+	return tar_object
+
+# Utility Function - 10
+async def _close_part_file(event_loop, tar_object, pending_write, part_metadata_location, part_metadata):
+	"""
+	Wait for the `PENDING_WRITE` (If Any), then trim the preallocated space past the downloaded
+	bytes (so that the size of the partial file is the resume offset again) and close it.
+	"""
+	if tar_object is None or tar_object.closed:
+		return
+	if pending_write is not None:
+		await asyncio.wait([pending_write])
+
+	def close_part_file():
+		try:
+			tar_object.truncate()
+		finally:
+			tar_object.close()
+		if part_metadata is not None and os.path.exists(part_metadata_location):
+			helpers.Utilities.WebUtility._save_part_metadata(part_metadata_location, part_metadata)
+
+	await event_loop.run_in_executor(None, close_part_file)
+
+# Utility Function - 11
+async def _urlopen_hedged(tar_request_object, mirror_urls=None):
+	"""
+	Non-Blocking counterpart of `MirrorSelector.open_hedged`: open the package on the
+	best of the `MIRROR_URLS`, hedging it with the next-best one when the first byte
+	is overdue, and failing over on errors. The raced requests that lose are cancelled.
+	Returns a tuple of `(ASYNC_RESPONSE, REQUEST)` for the mirror that answered first.
+	"""
+	mirror_selector  = helpers.Utilities.MirrorUtility.shared_mirror_selector
+	pending_requests = mirror_selector.candidate_requests(tar_request_object, mirror_urls)
+	if len(pending_requests) == 1:
+		return await urlopen(tar_request_object), tar_request_object
+
+	running_tasks = {}
+	hedge_count   = 0
+	last_error    = None
+
+	async def timed_urlopen(candidate_request):
+		request_start = time.perf_counter()
+		try:
+			async_response = await urlopen(candidate_request)
+		except (URLError, HTTPError, IOError, OSError) as asyncWebUtility_urlopen_hedged_error:
+			if helpers.Utilities.MirrorUtility.is_host_failure(asyncWebUtility_urlopen_hedged_error):
+				mirror_selector.record_failure(candidate_request.full_url)
+			raise
+		mirror_selector.record_first_byte(candidate_request.full_url, time.perf_counter() - request_start)
+		return async_response
+
+	def launch():
+		candidate_request = pending_requests.pop(0)
+		running_tasks[asyncio.ensure_future(timed_urlopen(candidate_request))] = candidate_request
+		return candidate_request
+
+	try:
+		latest_request = launch()
+		while running_tasks:
+			hedge_timeout = mirror_selector.hedge_delay(latest_request.full_url) \
+								if pending_requests and hedge_count < helpers.BuildConfig.IO.IOConfig.MIRROR_MAX_HEDGES else None
+			done_tasks, _ = await asyncio.wait(running_tasks, timeout=hedge_timeout, return_when=asyncio.FIRST_COMPLETED)
+			if not done_tasks:
+				# Logging a comment
+				async_web_utility_logger.info('First Byte overdue from URI: {' + latest_request.full_url + '} after {' +
+												str(round(hedge_timeout, 3)) + '}s. Hedging with URI: {' +
+												pending_requests[0].full_url + '}')
+				hedge_count   += 1
+				latest_request = launch()
+				continue
+
+			race_winner = None
+			for done_task in done_tasks:
+				candidate_request = running_tasks.pop(done_task)
+				try:
+					async_response = done_task.result()
+				except (URLError, HTTPError, IOError, OSError) as asyncWebUtility_urlopen_hedged_error:
+					# Logging a comment
+					async_web_utility_logger.warning('Mirror Request Failed for URI: {' + candidate_request.full_url + '}: ' +
+														str(asyncWebUtility_urlopen_hedged_error))
+					last_error = asyncWebUtility_urlopen_hedged_error
+					continue
+				if race_winner is None:
+					race_winner = (async_response, candidate_request)
+				else:
+					async_response.close()
+
+			if race_winner is not None:
+				# Logging a comment
+				async_web_utility_logger.info('Mirror Selected for the Download: {' + race_winner[1].full_url + '}')
+				return race_winner
+
+			# Fail over to the next mirror.
+			if not running_tasks and pending_requests:
+				latest_request = launch()
+		raise last_error
+	finally:
+		# Cancel the raced requests that lost (or all of them, on cancellation).
+		for running_task in running_tasks:
+			running_task.cancel()
+		for race_outcome in await asyncio.gather(*running_tasks, return_exceptions=True):
+			if isinstance(race_outcome, AsyncResponse):
+				race_outcome.close()
+		await asyncio.get_running_loop().run_in_executor(None, mirror_selector.flush)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# This module houses the buffer helpers of the download loops.
+# The response is read into a single, reusable buffer (through a `MEMORYVIEW`),
+# instead of a fresh `BYTES` object per chunk, and the size of the reads follows
+# the observed throughput: small while the transfer trickles in, larger (hence
+# fewer system calls) once it runs fast.
+# The destination file is also preallocated from the `Content-Length`.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO configurations module, which holds the chunk options.
+import helpers.BuildConfig.IO.IOConfig
+
+# Import the `OS` and `ERRNO` modules for the file preallocation.
+import os, errno
+
+# Import the `TIME` module to measure the throughput.
+import time
+
+#######################################################################
+
+# Utility / Helper function - 0.
+def preallocate(file_descriptor, offset, length):
+	"""
+	Preallocate `LENGTH` bytes of the file from `OFFSET`, so that the file-system lays
+	it out contiguously, and a full disk shows up before the transfer (not midway).
+	Note that the file is extended to `OFFSET + LENGTH` bytes.
+	Returns `FALSE` when the platform (or the file-system) can't preallocate.
+	"""
+	if not hasattr(os, 'posix_fallocate') or length <= 0:
+		return False
+	try:
+		os.posix_fallocate(file_descriptor, offset, length)
+	except OSError as bufferUtility_preallocate_error:
+		if bufferUtility_preallocate_error.errno in (errno.ENOSPC, errno.EFBIG):
+			raise
+		return False
+	return True
+
+##############################################################
+# The section below contains the Class Definition for the
+# reusable, adaptive read buffer.
+##############################################################
+
+class AdaptiveBuffer(object):
+	"""
+	A reusable read buffer, sized between `IOConfig.CHUNK` and `IOConfig.MAX_CHUNK`.
+	Each read is sized for about `IOConfig.CHUNK_TARGET_SECONDS` worth of the
+	throughput observed so far (a power of two, for the aligned writes).
+	"""
+
+	def __init__(self):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.chunk_size = helpers.BuildConfig.IO.IOConfig.CHUNK
+
+		# <::PROTECTED_ATTRIBUTE::>
+		self._buffer_view = memoryview(bytearray(helpers.BuildConfig.IO.IOConfig.MAX_CHUNK))
+		self._throughput  = None
+
+	def readinto(self, response_object):
+		"""
+		Read the next chunk of the response into the buffer.
+		Returns a `MEMORYVIEW` of the bytes read (empty at the end of the response),
+		only valid until the next read.
+		"""
+		read_start = time.perf_counter()
+		read_size  = response_object.readinto(self._buffer_view[:self.chunk_size])
+		if read_size:
+			self._adapt(read_size, time.perf_counter() - read_start)
+		return self._buffer_view[:read_size or 0]
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _adapt(self, read_size, read_seconds):
+		# Exponentially weighted throughput (in bytes per second), so that a single
+		# slow (or fast) read doesn't swing the chunk size.
+		read_throughput  = read_size / max(read_seconds, 1e-6)
+		self._throughput = read_throughput if self._throughput is None else \
+								0.8 * self._throughput + 0.2 * read_throughput
+
+		chunk_size = helpers.BuildConfig.IO.IOConfig.CHUNK
+		while chunk_size < helpers.BuildConfig.IO.IOConfig.MAX_CHUNK and \
+				chunk_size * 2 <= self._throughput * helpers.BuildConfig.IO.IOConfig.CHUNK_TARGET_SECONDS:
+			chunk_size *= 2
+		self.chunk_size = chunk_size
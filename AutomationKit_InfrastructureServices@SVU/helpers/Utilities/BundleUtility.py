@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+# This module houses the offline bundles, for the air-gapped provisioning.
+# A bundle is a single, uncompressed `TAR` file holding the packages of a
+# component set (for eg., `HTTPD` + `APR` + `APR-UTIL` + `PCRE`), along with a
+# "MANIFEST.json" listing the version, URI, size and `SHA-256` digest of each.
+# The bundle is exported once, on a node that can reach the Internet, and the
+# `DOWNLOAD_MANAGER` of the air-gapped nodes is then satisfied from it alone.
+# As the bundle isn't compressed, every package lies as-is at a known offset,
+# and the import copies it with `sendfile` (zero-copy, in the kernel), in the
+# order of the bundle. Seeding many nodes from one (NFS) bundle is disk bound.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the common and IO configurations modules.
+import helpers.BuildConfig.Common.CommonConfig, helpers.BuildConfig.IO.IOConfig
+
+# Import the `ARTIFACT` cache module, for the file digest helper.
+import helpers.Utilities.ArtifactCacheUtility
+
+# Import the Resolver Utility Module, for the version carried by the package names.
+import helpers.Utilities.ResolverUtility
+
+# The below module is a Python built-in module
+# for handling the `TAR` files.
+import tarfile
+
+# Import the `JSON` module for the bundle manifest.
+import json
+
+# Import the `OS` module for the file-system (and zero-copy) operations.
+import os
+
+# Import the `MMAP` module, for the platforms without `sendfile`.
+import mmap
+
+# Import the `IO` and `TIME` modules, to build the manifest member.
+import io, time
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+BUNDLE_UTILITY_LOGGER_NAME = '.BundleUtility'
+
+# Get the Logger Instance for the module.
+bundle_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+											BUNDLE_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Layout of the bundle.
+BUNDLE_MANIFEST_NAME   = 'MANIFEST.json'
+BUNDLE_PACKAGES_PREFIX = 'packages/'
+BUNDLE_FORMAT_VERSION  = 1
+
+class BundleError(IOError):
+	"""
+	Raised for a bundle that is unreadable, or misses a requested component.
+	"""
+
+##############################################################
+# The section below contains the Class Definition for the
+# bundled package results.
+##############################################################
+
+class BundledPackage(object):
+	"""
+	Outcome of a component imported from the bundle. Exposes the same attributes
+	as the DownloaderThread classes, so the `DOWNLOAD_MANAGER` treats both alike.
+	"""
+
+	def __init__(self, name, tar_file_name, tar_url):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.name              = name
+		self.tar_file_name     = tar_file_name
+		self.tar_url           = tar_url
+		self.download_complete = False
+
+	def getName(self):
+		return self.name
+
+# Utility / Helper function - 0.
+def export_bundle(bundle_location, build_target, downloaded_components):
+	"""
+	Write the bundle for the downloaded components (a dictionary of
+	`COMPONENT -> DOWNLOADER_THREAD`, as kept by the `DOWNLOAD_MANAGER`).
+	The bundle is written aside, and moved in place once complete.
+	"""
+	bundle_manifest = {'format'      : BUNDLE_FORMAT_VERSION,
+						'build_target': build_target,
+						'created_at'  : time.time(),
+						'packages'    : {}}
+
+	part_bundle_location = bundle_location + '.part'
+	try:
+		with tarfile.open(part_bundle_location, 'w', format=tarfile.PAX_FORMAT) as bundle_object:
+			for component, downloaded_component in sorted(downloaded_components.items()):
+				tar_file_location = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + downloaded_component.tar_file_name
+				bundle_manifest['packages'][component] = {
+					'tar_file_name': downloaded_component.tar_file_name,
+					'url'          : downloaded_component.tar_url,
+					'version'      : helpers.Utilities.ResolverUtility.version_of(downloaded_component.tar_file_name),
+					'size'         : os.path.getsize(tar_file_location),
+					'sha256'       : helpers.Utilities.ArtifactCacheUtility.file_digest(tar_file_location)
+				}
+				bundle_object.add(tar_file_location, arcname=BUNDLE_PACKAGES_PREFIX + downloaded_component.tar_file_name)
+
+				# Logging a comment
+				bundle_utility_logger.info('Bundled Component: {' + component + '}, Package: {' +
+											downloaded_component.tar_file_name + '}')
+
+			# The manifest goes last, once all the digests are known.
+			manifest_bytes = json.dumps(bundle_manifest, indent=1, sort_keys=True).encode('UTF-8')
+			manifest_info  = tarfile.TarInfo(BUNDLE_MANIFEST_NAME)
+			manifest_info.size  = len(manifest_bytes)
+			manifest_info.mtime = int(bundle_manifest['created_at'])
+			bundle_object.addfile(manifest_info, io.BytesIO(manifest_bytes))
+		os.replace(part_bundle_location, bundle_location)
+	except BaseException:
+		if os.path.exists(part_bundle_location):
+			os.remove(part_bundle_location)
+		raise
+
+	# Logging a comment
+	bundle_utility_logger.info('Offline Bundle written to Location: {' + bundle_location + '} with {' +
+								str(len(bundle_manifest['packages'])) + '} Packages')
+	return bundle_manifest
+
+# Utility / Helper function - 1.
+def read_manifest(bundle_location):
+	"""
+	Returns a tuple of `(MANIFEST, MEMBERS)` for the bundle, where `MEMBERS` maps
+	each member name to its `TARINFO` (which holds the offset of its data).
+	Only the member headers are read, the packages are skipped over.
+	"""
+	try:
+		with tarfile.open(bundle_location, 'r:') as bundle_object:
+			bundle_members = {bundle_member.name: bundle_member for bundle_member in bundle_object.getmembers()}
+			if BUNDLE_MANIFEST_NAME not in bundle_members:
+				raise BundleError('No Manifest found in the Offline Bundle: {' + bundle_location + '}')
+			bundle_manifest = json.loads(bundle_object.extractfile(bundle_members[BUNDLE_MANIFEST_NAME]).read().decode('UTF-8'))
+	except (tarfile.TarError, ValueError) as bundleUtility_read_manifest_error:
+		raise BundleError('Unreadable Offline Bundle: {' + bundle_location + '}: ' + str(bundleUtility_read_manifest_error))
+
+	if bundle_manifest.get('format') != BUNDLE_FORMAT_VERSION:
+		raise BundleError('Unsupported Offline Bundle format: {' + str(bundle_manifest.get('format')) + '}')
+	return bundle_manifest, bundle_members
+
+# Utility / Helper function - 2.
+def _copy_range(source_descriptor, target_descriptor, data_offset, data_size):
+	"""
+	Copy `DATA_SIZE` bytes, starting at `DATA_OFFSET` of the source, to the target.
+	Makes use of `sendfile` (the bytes never enter the user-space), else of a
+	memory map of the source.
+	"""
+	if hasattr(os, 'sendfile'):
+		copied_size = 0
+		while copied_size < data_size:
+			sent_size = os.sendfile(target_descriptor, source_descriptor, data_offset + copied_size, data_size - copied_size)
+			if not sent_size:
+				raise BundleError('Offline Bundle truncated at Byte Offset: {' + str(data_offset + copied_size) + '}')
+			copied_size += sent_size
+		return
+
+	with mmap.mmap(source_descriptor, 0, access=mmap.ACCESS_READ) as source_map:
+		source_view = memoryview(source_map)
+		try:
+			copy_offset = data_offset
+			while copy_offset < data_offset + data_size:
+				copy_end     = min(copy_offset + helpers.BuildConfig.IO.IOConfig.CHUNK * 64, data_offset + data_size)
+				copy_offset += os.write(target_descriptor, source_view[copy_offset:copy_end])
+		finally:
+			source_view.release()
+
+# Utility / Helper function - 3.
+def import_bundle(bundle_location, required_binaries, components):
+	"""
+	Satisfy the downloads of the given components (keys of `REQUIRED_BINARIES`)
+	from the bundle, without any network call. The packages are copied to the
+	`TAR` download base, in the order they lie in the bundle.
+	Returns a dictionary of `COMPONENT -> BUNDLED_PACKAGE`.
+	"""
+	bundle_manifest, bundle_members = read_manifest(bundle_location)
+
+	# Logging a comment
+	bundle_utility_logger.info('Importing Components: {' + ', '.join(components) + '} from the Offline Bundle: {' +
+								bundle_location + '}, Build Target: {' + str(bundle_manifest.get('build_target')) + '}')
+
+	bundled_packages = {}
+	for component in components:
+		package_entry = bundle_manifest['packages'].get(component)
+		if package_entry is None or BUNDLE_PACKAGES_PREFIX + package_entry['tar_file_name'] not in bundle_members:
+			raise BundleError('Component: {' + component + '} missing from the Offline Bundle: {' + bundle_location + '}')
+		bundled_packages[component] = BundledPackage(required_binaries[component]['thread_name'],
+														package_entry['tar_file_name'], package_entry['url'])
+
+	os.makedirs(helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE, exist_ok=True)
+
+	source_descriptor = os.open(bundle_location, os.O_RDONLY)
+	try:
+		# The packages are read front to back.
+		if hasattr(os, 'posix_fadvise'):
+			os.posix_fadvise(source_descriptor, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+		for component in sorted(bundled_packages, key=lambda component: bundle_members[BUNDLE_PACKAGES_PREFIX +
+										bundled_packages[component].tar_file_name].offset_data):
+			bundled_package   = bundled_packages[component]
+			package_entry     = bundle_manifest['packages'][component]
+			bundle_member     = bundle_members[BUNDLE_PACKAGES_PREFIX + bundled_package.tar_file_name]
+			tar_file_location = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + bundled_package.tar_file_name
+
+			# Copy the package aside, and move it in place once complete.
+			part_file_location = tar_file_location + '.part'
+			target_descriptor  = os.open(part_file_location, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+			try:
+				_copy_range(source_descriptor, target_descriptor, bundle_member.offset_data, bundle_member.size)
+			finally:
+				os.close(target_descriptor)
+
+			if bundle_member.size != package_entry['size'] or (helpers.BuildConfig.Common.CommonConfig.OFFLINE_BUNDLE_VERIFY and
+					helpers.Utilities.ArtifactCacheUtility.file_digest(part_file_location) != package_entry['sha256']):
+				os.remove(part_file_location)
+				raise BundleError('Package: {' + bundled_package.tar_file_name + '} of the Offline Bundle does not match its Manifest')
+			os.replace(part_file_location, tar_file_location)
+			bundled_package.download_complete = True
+
+			# Logging a comment
+			bundle_utility_logger.info('Imported Component: {' + component + '}, Version: {' + str(package_entry['version']) +
+										'} to Location: {' + tar_file_location + '}')
+	finally:
+		os.close(source_descriptor)
+
+	return bundled_packages
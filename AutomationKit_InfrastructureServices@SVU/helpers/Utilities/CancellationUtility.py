@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# This module houses the cooperative cancellation of the build tasks.
+# Each `DOWNLOAD_MANAGER` / `UNTAR_MANAGER` (and each pipeline run) holds a cancellation
+# token, bound to its threads (or `ASYNCIO` tasks) like the deadlines. The download
+# and extraction loops check it between the chunks (or members), hence a cancelled
+# task winds down within a chunk: it drops its partial files and raises
+# `TaskCancelledError`, which the managers don't retry.
+# With `CommonConfig.FAIL_FAST`, a component failing for good (on its last attempt)
+# cancels its siblings, instead of waiting for their transfers to complete.
+# A token is cancelled along with its parent (for eg., the managers of the pipeline
+# stages, along with the pipeline). The parent holds its child tokens weakly, hence a
+# finished child (for eg., the manager of a completed stage) isn't kept alive by it.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `CONTEXTVARS` module. The bound token follows the threads
+# and the `ASYNCIO` tasks alike.
+import contextvars
+
+# Import the `THREADING` module, as the tokens are cancelled from other threads.
+import threading
+
+# Import the `WEAKREF` module, the child tokens are held weakly by their parent.
+import weakref
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+CANCELLATION_UTILITY_LOGGER_NAME = '.CancellationUtility'
+
+# Get the Logger Instance for the module.
+cancellation_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													CANCELLATION_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# The token bound to the current thread (or task). <::PROTECTED_ATTRIBUTE::>
+_current_token = contextvars.ContextVar('cancellation_token', default=None)
+
+class TaskCancelledError(Exception):
+	"""
+	Raised by a task once its cancellation token is cancelled. Unlike the download /
+	extraction errors, it isn't retried by the managers.
+	"""
+
+##############################################################
+# The section below contains the Class Definition for the
+# cancellation token.
+##############################################################
+
+class CancellationToken(object):
+	"""
+	A flag, set once, telling the tasks holding the token to give up.
+	A token is cancelled along with its `PARENT` (If Any).
+	"""
+
+	def __init__(self, parent=None, label='Task'):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.label  = label
+		self.reason = None
+
+		# The cancellation flag, and the callbacks run once it is set. <::PROTECTED_ATTRIBUTE::>
+		self._cancelled = threading.Event()
+		self._callbacks = []
+		self._lock      = threading.Lock()
+
+		# The tokens within this one. A child gone (no longer referenced) drops out of the set,
+		# rather than holding a callback here. <::PROTECTED_ATTRIBUTE::>
+		self._children  = weakref.WeakSet()
+
+		if parent is not None:
+			parent._adopt(self)
+
+	def cancel(self, reason='Cancelled'):
+		"""
+		Cancel the token (and the tokens within it). Safe to call from any thread, and more than once.
+		"""
+		with self._lock:
+			if self._cancelled.is_set():
+				return
+			self.reason = reason
+			self._cancelled.set()
+			cancel_callbacks, self._callbacks = self._callbacks, []
+			child_tokens = list(self._children)
+			self._children.clear()
+
+		# Logging a comment
+		cancellation_utility_logger.warning('Cancelling {' + self.label + '}: ' + reason)
+
+		for cancel_callback in cancel_callbacks:
+			cancel_callback(reason)
+		for child_token in child_tokens:
+			child_token.cancel(reason)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _adopt(self, child_token):
+		# Cancel the `CHILD_TOKEN` along with this one (right away, if it already is).
+		with self._lock:
+			if not self._cancelled.is_set():
+				self._children.add(child_token)
+				return
+		child_token.cancel(self.reason)
+
+	def on_cancel(self, cancel_callback):
+		"""
+		Call the `CANCEL_CALLBACK` with the reason, once the token is cancelled
+		(right away, if it already is).
+		"""
+		with self._lock:
+			if not self._cancelled.is_set():
+				self._callbacks.append(cancel_callback)
+				return
+		cancel_callback(self.reason)
+
+	def cancelled(self):
+		return self._cancelled.is_set()
+
+	def check(self):
+		"""
+		Raise `TaskCancelledError` once the token is cancelled.
+		"""
+		if self._cancelled.is_set():
+			raise TaskCancelledError('{' + self.label + '} Cancelled: ' + str(self.reason))
+
+	def wait(self, seconds):
+		"""
+		Sleep for `SECONDS` (for eg., the back-off before a retry), waking up as soon
+		as the token is cancelled. Returns whether it was cancelled.
+		"""
+		return self._cancelled.wait(seconds)
+
+# Utility / Helper function - 0.
+def bind(cancellation_token):
+	"""
+	Bind the token to the current thread (or `ASYNCIO` task).
+	"""
+	_current_token.set(cancellation_token)
+
+# Utility / Helper function - 1.
+def current():
+	"""
+	Returns the token bound to the current thread (or task), or `NONE`.
+	"""
+	return _current_token.get()
+
+# Utility / Helper function - 2.
+def check():
+	"""
+	Raise `TaskCancelledError` once the bound token (If Any) is cancelled.
+	"""
+	cancellation_token = _current_token.get()
+	if cancellation_token is not None:
+		cancellation_token.check()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+# This module houses the integrity checks for the downloaded packages.
+# The checksum files published next to the packages (for eg., the Apache
+# "*.tar.gz.sha512" / "*.tar.gz.sha256" files) are fetched ahead of the package,
+# the package digests are computed while it streams in, and a mismatching
+# package is rejected before it is moved in place.
+# The verified digests are kept in a registry, for the later stages (and runs)
+# to rely upon without hashing the package again.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO and cache configurations modules.
+import helpers.BuildConfig.IO.IOConfig, helpers.BuildConfig.Cache.CacheConfig
+
+# Import the pooled `HTTP` session layer, to fetch the checksum files.
+import helpers.Utilities.HttpSessionUtility
+
+# Import the `ARTIFACT` cache module, for the file digest helper.
+import helpers.Utilities.ArtifactCacheUtility
+
+# Import the stage timings, the checksum fetch and the verification are traced.
+import helpers.Utilities.TraceUtility
+
+# Import the `HASHLIB` module to compute the package digests.
+import hashlib
+
+# Import the `JSON` module to persist the registry on-disk.
+import json
+
+# Import the `OS` module for the file-system operations.
+import os
+
+# Import the `THREADING` module, as the registry is shared between the downloader threads.
+import threading
+
+# Import the `TIME` module to note when a package was verified.
+import time
+
+# The below module takes care of Regular Expression(s).
+import re
+
+# Currently making use of `URLLIB` for the `REQUEST` / `ERROR` objects.
+from urllib.request import Request
+from urllib.error   import HTTPError
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+CHECKSUM_UTILITY_LOGGER_NAME = '.ChecksumUtility'
+
+# Get the Logger Instance for the module.
+checksum_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												CHECKSUM_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Checksum files are small, anything larger isn't one.
+MAX_CHECKSUM_FILE_SIZE = 64 * 1024
+
+class ChecksumMismatchError(IOError):
+	"""
+	Raised when a package doesn't match its published checksum.
+	Being an `IOError`, the `DOWNLOAD_MANAGER` retries the package.
+	"""
+
+# Utility / Helper function - 0.
+def parse_checksum(checksum_text, algorithm):
+	"""
+	Returns the (lower-case) hex digest held by a checksum file, or `NONE`.
+	Handles the `sha512sum` layout ("<DIGEST> *<FILE>"), the `BSD` layout
+	("SHA512 (<FILE>) = <DIGEST>") and the `GnuPG --print-md` layout
+	("<FILE>: <DIGEST IN BLOCKS>"), the latter used by the older Apache releases.
+	"""
+	digest_length = hashlib.new(algorithm).digest_size * 2
+
+	# A hex run of the exact digest length.
+	digest_match = re.search(r'(?<![0-9A-Fa-f])[0-9A-Fa-f]{' + str(digest_length) + r'}(?![0-9A-Fa-f])', checksum_text)
+	if digest_match is not None:
+		return digest_match.group(0).lower()
+
+	# The digest grouped in blocks, following the file name.
+	grouped_digest = re.sub(r'\s+', '', checksum_text.split(':', 1)[-1])
+	if re.fullmatch(r'[0-9A-Fa-f]{' + str(digest_length) + r'}', grouped_digest):
+		return grouped_digest.lower()
+	return None
+
+# Utility / Helper function - 1.
+@helpers.Utilities.TraceUtility.traced('verify')
+def fetch_expected_checksum(tar_request_object):
+	"""
+	Fetch the checksum published for the package. The algorithms are tried in
+	the order of `IOConfig.CHECKSUM_ALGORITHMS` (strongest first).
+	Returns a tuple of `(ALGORITHM, HEX_DIGEST)`, or `NONE` when no checksum
+	file is published (the package is then left unverified).
+	"""
+	for algorithm in helpers.BuildConfig.IO.IOConfig.CHECKSUM_ALGORITHMS:
+		checksum_url = tar_request_object.full_url + '.' + algorithm
+		try:
+			checksum_response = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(
+									Request(checksum_url, headers=dict(tar_request_object.header_items())))
+		except HTTPError as checksumUtility_fetch_expected_checksum_error:
+			if checksumUtility_fetch_expected_checksum_error.code != 404:
+				raise
+			checksumUtility_fetch_expected_checksum_error.close()
+			continue
+
+		try:
+			checksum_text = checksum_response.read(MAX_CHECKSUM_FILE_SIZE).decode('UTF-8', 'replace')
+		finally:
+			checksum_response.close()
+
+		expected_digest = parse_checksum(checksum_text, algorithm)
+		if expected_digest is not None:
+			# Logging a comment
+			checksum_utility_logger.info('Found ' + algorithm.upper() + ' Checksum for URI: {' + tar_request_object.full_url + '}')
+			return algorithm, expected_digest
+
+		# Logging a comment
+		checksum_utility_logger.warning('Unreadable Checksum File at URI: {' + checksum_url + '}')
+
+	# Logging a comment
+	checksum_utility_logger.warning('No Checksum published for URI: {' + tar_request_object.full_url + '}. Package left unverified')
+	return None
+
+# Utility / Helper function - 2.
+@helpers.Utilities.TraceUtility.traced('verify')
+def verify(expected_checksum, actual_digest, tar_file_name):
+	"""
+	Compare the digest computed for the package to the published one.
+	Raises `ChecksumMismatchError` on a mismatch.
+	"""
+	algorithm, expected_digest = expected_checksum
+	if actual_digest != expected_digest:
+		raise ChecksumMismatchError('Checksum Mismatch for Package: {' + tar_file_name + '}, ' + algorithm.upper() +
+										' expected: {' + expected_digest + '}, got: {' + actual_digest + '}')
+
+	# Logging a comment
+	checksum_utility_logger.info('Checksum ' + algorithm.upper() + ' Verified for Package: {' + tar_file_name + '}')
+
+##############################################################
+# The section below contains the Class Definitions for the
+# streaming digests and the verified digests registry.
+##############################################################
+
+class StreamDigests(object):
+	"""
+	Computes several digests of a stream in a single pass.
+	"""
+
+	def __init__(self, algorithms):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		# <::PROTECTED_ATTRIBUTE::>
+		self._digests = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+
+	def update(self, stream_chunk):
+		for digest in self._digests.values():
+			digest.update(stream_chunk)
+
+	def hexdigest(self, algorithm):
+		return self._digests[algorithm].hexdigest()
+
+	@classmethod
+	def for_checksum(cls, expected_checksum):
+		"""
+		The `SHA-256` digest (which keys the `ARTIFACT` cache) along with the
+		algorithm of the published checksum (If Any).
+		"""
+		algorithms = ['sha256']
+		if expected_checksum is not None and expected_checksum[0] not in algorithms:
+			algorithms.append(expected_checksum[0])
+		return cls(algorithms)
+
+class VerifiedDigestRegistry(object):
+	"""
+	On-disk registry of the verified packages, keyed by their `SHA-256` digest.
+	Each entry holds the package name, its URI and the verified digests.
+	"""
+
+	def __init__(self, registry_file):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.registry_file = registry_file
+
+		# Guards the registry within the process. <::PROTECTED_ATTRIBUTE::>
+		self._lock = threading.Lock()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _load(self):
+		try:
+			with open(self.registry_file, 'r') as registry_object:
+				return json.load(registry_object)
+		except (IOError, OSError, ValueError):
+			return {}
+
+	def record(self, sha256_digest, tar_file_name, url, algorithm, digest):
+		"""
+		Record a verified package.
+		"""
+		with self._lock:
+			registry = self._load()
+			registry_entry = registry.setdefault(sha256_digest, {'digests': {}})
+			registry_entry['name']        = tar_file_name
+			registry_entry['url']         = url
+			registry_entry['verified_at'] = time.time()
+			registry_entry['digests'].update({'sha256': sha256_digest, algorithm: digest})
+
+			os.makedirs(os.path.dirname(self.registry_file), exist_ok=True)
+			temporary_registry_file = self.registry_file + '.' + str(os.getpid()) + '.tmp'
+			with open(temporary_registry_file, 'w') as registry_object:
+				json.dump(registry, registry_object, indent=1, sort_keys=True)
+			os.replace(temporary_registry_file, self.registry_file)
+
+	def lookup(self, sha256_digest):
+		"""
+		Returns the registry entry for the package digest, or `NONE`.
+		"""
+		with self._lock:
+			return self._load().get(sha256_digest)
+
+	def find(self, tar_file_name):
+		"""
+		Returns the latest registry entry recorded for the package name, or `NONE`.
+		Meant for the later stages (for eg., the extraction), which know the packages by name.
+		"""
+		with self._lock:
+			registry_entries = [registry_entry for registry_entry in self._load().values()
+									if registry_entry.get('name') == tar_file_name]
+		return max(registry_entries, key=lambda registry_entry: registry_entry['verified_at']) if registry_entries else None
+
+	def is_verified(self, tar_file_location, sha256_digest, expected_checksum):
+		"""
+		Tells whether the package (for eg., served from the `ARTIFACT` cache) matches
+		the published checksum. The registry spares the read pass over the package,
+		when the same digest was verified earlier.
+		"""
+		algorithm, expected_digest = expected_checksum
+		if algorithm == 'sha256':
+			return sha256_digest == expected_digest
+
+		registry_entry = self.lookup(sha256_digest)
+		if registry_entry is not None and algorithm in registry_entry['digests']:
+			return registry_entry['digests'][algorithm] == expected_digest
+		return helpers.Utilities.ArtifactCacheUtility.file_digest(tar_file_location, algorithm) == expected_digest
+
+# The registry instance shared by all the downloader threads.
+shared_digest_registry = VerifiedDigestRegistry(helpers.BuildConfig.Cache.CacheConfig.VERIFIED_DIGESTS_FILE)
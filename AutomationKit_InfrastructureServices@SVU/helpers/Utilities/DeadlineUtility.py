@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# This module houses the deadlines of the build workflow.
+# The workflow gets a deadline (`CommonConfig.WORKFLOW_DEADLINE`), and each
+# component attempt gets a time budget within it (`CommonConfig.COMPONENT_TIME_BUDGET`).
+# The `DOWNLOAD_MANAGER` / `UNTAR_MANAGER` bind the budget to each of their threads
+# (or `ASYNCIO` tasks), and the network helpers cap their connect / read timeouts
+# with what is left of it. An expired budget raises `DeadlineExceededError`, a
+# `TimeoutError` (hence an `OSError`), which the managers retry like any other
+# failed download, so a stalled socket turns into a fast retry instead of a hang.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the common configurations module, which holds the time budgets.
+import helpers.BuildConfig.Common.CommonConfig
+
+# Import the `CONTEXTVARS` module. The bound deadline follows the threads
+# and the `ASYNCIO` tasks alike.
+import contextvars
+
+# Import the `TIME` module for the monotonic clock.
+import time
+
+#######################################################################
+
+# The deadline bound to the current thread (or task). <::PROTECTED_ATTRIBUTE::>
+_current_deadline = contextvars.ContextVar('current_deadline', default=None)
+
+class DeadlineExceededError(TimeoutError):
+	"""
+	Raised once the time budget of a component (or the workflow deadline) is spent.
+	"""
+
+##############################################################
+# The section below contains the Class Definition for the
+# deadlines.
+##############################################################
+
+class Deadline(object):
+	"""
+	A point in time (on the monotonic clock) a piece of work has to be done by.
+	A deadline of `NONE` seconds never expires.
+	"""
+
+	def __init__(self, seconds=None, parent=None, label='Workflow'):
+		"""
+		The `INITIALIZE` method for the class.
+		A deadline never outlives its `PARENT` (If Any).
+		"""
+		self.label      = label
+		self.expires_at = time.monotonic() + seconds if seconds is not None else None
+		if parent is not None and parent.expires_at is not None:
+			self.expires_at = parent.expires_at if self.expires_at is None else min(self.expires_at, parent.expires_at)
+
+	def budget(self, seconds, label):
+		"""
+		Returns a deadline `SECONDS` from now, within this one.
+		"""
+		return Deadline(seconds, parent=self, label=label)
+
+	def remaining(self):
+		"""
+		Returns the seconds left (never below zero), or `NONE` for an unbounded deadline.
+		"""
+		return max(self.expires_at - time.monotonic(), 0) if self.expires_at is not None else None
+
+	def expired(self):
+		return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+	def check(self):
+		"""
+		Raise `DeadlineExceededError` once the deadline has passed.
+		"""
+		if self.expired():
+			raise DeadlineExceededError('Time Budget exceeded for: {' + self.label + '}')
+
+	def timeout(self, request_timeout):
+		"""
+		Returns the `REQUEST_TIMEOUT` capped with the seconds left.
+		"""
+		self.check()
+		remaining_seconds = self.remaining()
+		return request_timeout if remaining_seconds is None else min(request_timeout, remaining_seconds)
+
+# Utility / Helper function - 0.
+def component_budget(component, workflow_deadline=None):
+	"""
+	Returns the time budget (`COMPONENT_TIME_BUDGET`) of an attempt at the component,
+	within the `WORKFLOW_DEADLINE` (If Any).
+	"""
+	return Deadline(helpers.BuildConfig.Common.CommonConfig.COMPONENT_TIME_BUDGET, parent=workflow_deadline, label=component)
+
+# Utility / Helper function - 1.
+def bind(deadline):
+	"""
+	Bind the deadline to the current thread (or `ASYNCIO` task).
+	"""
+	_current_deadline.set(deadline)
+
+# Utility / Helper function - 2.
+def current():
+	"""
+	Returns the deadline bound to the current thread (or task), or `NONE`.
+	"""
+	return _current_deadline.get()
+
+# Utility / Helper function - 3.
+def check():
+	"""
+	Raise `DeadlineExceededError` once the bound deadline (If Any) has passed.
+	"""
+	deadline = _current_deadline.get()
+	if deadline is not None:
+		deadline.check()
+
+# Utility / Helper function - 4.
+def request_timeout(timeout):
+	"""
+	Returns the `TIMEOUT` (in seconds) for a connect / read, capped with what is left
+	of the bound deadline (If Any).
+	"""
+	deadline = _current_deadline.get()
+	return deadline.timeout(timeout) if deadline is not None else timeout
+
+# Utility / Helper function - 5.
+def propagate(function):
+	"""
+	Returns the `FUNCTION`, bound to the deadline of the caller, for the helper
+	threads it is handed to (for eg., the segment and mirror race workers).
+	The rest of the context of the caller (for eg., the traced component) goes along.
+	"""
+	caller_context = contextvars.copy_context()
+
+	def bound_function(*args, **kwargs):
+		# A context can't be entered by two threads at once, hence each call runs in a copy.
+		return caller_context.copy().run(function, *args, **kwargs)
+	return bound_function
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# This module houses the dependency graph helpers, shared by the component
+# resolver (`ComponentRegistry`) and the pipeline scheduler (`PipelineUtility`).
+# A graph is a dictionary of `NODE -> REQUIRED NODES`, in the order the nodes
+# were declared.
+
+#######################################################################
+
+class DependencyError(ValueError):
+	"""
+	Raised for a malformed dependency graph (an unknown requirement, or a cycle).
+	"""
+
+# Utility / Helper function - 0.
+def topological_order(dependency_graph, node_label='Node'):
+	"""
+	Returns the nodes of the `DEPENDENCY_GRAPH`, each after all of its requirements
+	(in the order the nodes were declared, otherwise). Raises `DependencyError` for an
+	unknown requirement, or a cycle. The `NODE_LABEL` names the nodes in the errors.
+	"""
+	for graph_node, required_nodes in dependency_graph.items():
+		for required_node in required_nodes:
+			if required_node not in dependency_graph:
+				raise DependencyError(node_label + ': {' + graph_node + '} requires an unknown ' + node_label + ': {' +
+										required_node + '}')
+
+	node_order = []
+	while len(node_order) < len(dependency_graph):
+		ready_nodes = [graph_node for graph_node, required_nodes in dependency_graph.items()
+							if graph_node not in node_order and all(required_node in node_order for required_node in required_nodes)]
+		if not ready_nodes:
+			raise DependencyError('Cycle among the ' + node_label + 's: {' +
+									', '.join(graph_node for graph_node in dependency_graph if graph_node not in node_order) + '}')
+		node_order.extend(ready_nodes)
+	return node_order
+
+# Utility / Helper function - 1.
+def parallel_width(dependency_graph):
+	"""
+	Returns the maximum number of nodes of the `DEPENDENCY_GRAPH` that can be in flight
+	at the same time, i.e., the largest set of nodes none of which (transitively)
+	requires another. By Dilworth's theorem, it is the number of nodes less the size of
+	a maximum matching of `NODE -> LATER NODE` (over the transitive closure).
+	"""
+	node_order = topological_order(dependency_graph)
+
+	# The nodes each node (transitively) requires.
+	required_closure = {}
+	for graph_node in node_order:
+		required_closure[graph_node] = set(dependency_graph[graph_node])
+		for required_node in dependency_graph[graph_node]:
+			required_closure[graph_node] |= required_closure[required_node]
+
+	# Augmenting path matching of each node to a later node that requires it.
+	matched_with = {}
+
+	def augment(graph_node, visited_nodes):
+		for later_node in node_order:
+			if graph_node not in required_closure[later_node] or later_node in visited_nodes:
+				continue
+			visited_nodes.add(later_node)
+			if later_node not in matched_with or augment(matched_with[later_node], visited_nodes):
+				matched_with[later_node] = graph_node
+				return True
+		return False
+
+	return len(node_order) - sum(1 for graph_node in node_order if augment(graph_node, set()))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+# This module houses the executor of the `DOWNLOAD_MANAGER` / `UNTAR_MANAGER` tasks.
+# The workers of `CONCURRENT.FUTURES.THREADPOOLEXECUTOR` aren't daemon threads, and are joined
+# at the interpreter exit. A task the managers leave behind (it overran its time budget, or its
+# siblings were cancelled) would then hold up the exit of the build until it returns, if ever.
+# The executor below runs the tasks on daemon threads instead, hence a task left behind is
+# abandoned along with the process (like the `THREADING.THREAD` tasks used to be).
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `CONCURRENT.FUTURES` module, for the executor interface and the futures.
+import concurrent.futures
+
+# Import the `THREADING` and `QUEUE` modules, the workers take the tasks off a queue.
+import threading, queue
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+EXECUTOR_UTILITY_LOGGER_NAME = '.ExecutorUtility'
+
+# Get the Logger Instance for the module.
+executor_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												EXECUTOR_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+##############################################################
+# The section below contains the Class Definition for the
+# daemon thread pool executor.
+##############################################################
+
+class DaemonThreadPoolExecutor(concurrent.futures.Executor):
+	"""
+	Runs the submitted calls on (up to) `MAX_WORKERS` daemon threads, started as needed.
+	`SHUTDOWN(WAIT=FALSE)` lets the calls in flight run on, without the interpreter waiting for them.
+	"""
+
+	def __init__(self, max_workers, thread_name_prefix='DaemonWorker'):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.max_workers        = max_workers
+		self.thread_name_prefix = thread_name_prefix
+
+		# The calls waiting for a worker, and the workers started. <::PROTECTED_ATTRIBUTE::>
+		self._work_queue   = queue.SimpleQueue()
+		self._workers      = []
+		self._idle_workers = threading.Semaphore(0)
+		self._shutdown     = False
+		self._lock         = threading.Lock()
+
+	def submit(self, call_function, *args, **kwargs):
+		"""
+		Schedule `CALL_FUNCTION(*ARGS, **KWARGS)`, and return its future.
+		"""
+		with self._lock:
+			if self._shutdown:
+				raise RuntimeError('Cannot schedule new calls after shutdown')
+			call_future = concurrent.futures.Future()
+			self._work_queue.put((call_future, call_function, args, kwargs))
+
+			# Start another worker, unless an idle one takes the call.
+			if not self._idle_workers.acquire(blocking=False) and len(self._workers) < self.max_workers:
+				worker_thread = threading.Thread(target=self._work, daemon=True,
+													name=self.thread_name_prefix + '_' + str(len(self._workers)))
+				self._workers.append(worker_thread)
+				worker_thread.start()
+		return call_future
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _work(self):
+		while True:
+			work_item = self._work_queue.get()
+			if work_item is None:
+				return
+			call_future, call_function, args, kwargs = work_item
+
+			# A call cancelled while it waited is skipped.
+			if call_future.set_running_or_notify_cancel():
+				try:
+					call_future.set_result(call_function(*args, **kwargs))
+				except BaseException as executorUtility_work_error:
+					call_future.set_exception(executorUtility_work_error)
+			del work_item, call_future
+			self._idle_workers.release()
+
+	def shutdown(self, wait=True, *, cancel_futures=False):
+		"""
+		Stop the workers once they are done with the calls queued so far. With `WAIT`, block until
+		they are, otherwise the calls in flight are left to complete on their own.
+		"""
+		with self._lock:
+			self._shutdown = True
+			if cancel_futures:
+				while True:
+					try:
+						work_item = self._work_queue.get_nowait()
+					except queue.Empty:
+						break
+					if work_item is not None:
+						work_item[0].cancel()
+			for _ in self._workers:
+				self._work_queue.put(None)
+
+		if wait:
+			for worker_thread in self._workers:
+				worker_thread.join()
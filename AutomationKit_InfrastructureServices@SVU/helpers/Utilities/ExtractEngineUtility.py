@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+
+# This module houses the extraction engines of the `UNTAR_MANAGER` (see `UntarConfig.EXTRACT_ENGINE`).
+# The 'tarfile' engine decompresses, parses and writes the members all in the one thread.
+# The 'pipelined' engine decompresses the package in a thread of its own, by `ZLIB` / `BZ2`
+# (both release the GIL while decompressing) or by an external `pigz` / `lbzip2` process
+# (when on the PATH), and hands the decompressed stream over to `TARFILE` (in stream mode)
+# through a bounded queue. Hence the decompression of the next blocks overlaps the parsing
+# and the disk writes of the members. The decompressor of each compression is picked by a
+# probe, run once, and each extraction reports its throughput (in MB/s).
+# 'auto' is the 'pipelined' engine, given a spare core for the decompression.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `TAR` configurations module.
+import helpers.BuildConfig.Untar.UntarConfig
+
+# Import the chunk reader of the streaming extraction, the decompressed stream is read through it.
+import helpers.Utilities.StreamExtractUtility
+
+# The below module is a Python built-in module
+# for `UNTARRING` of compressed files.
+import tarfile
+
+# Import the `ZLIB`, `BZ2` and `GZIP` modules, for the built-in decompressors (and the probe sample).
+import zlib, bz2, gzip
+
+# Import the `SUBPROCESS` and `SHUTIL` modules, to run the external decompressors found on the PATH.
+import subprocess, shutil
+
+# Import the `CONTEXTLIB` module, to close the decompressed stream once the extraction stops.
+import contextlib
+
+# Import the `OS`, `RANDOM` and `TEMPFILE` modules, for the probe sample.
+import os, random, tempfile
+
+# Import the `THREADING` and `QUEUE` modules, the decompression runs in a thread of its own.
+import threading, queue
+
+# Import the `TIME` module, to time the extractions (and the probe).
+import time
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+EXTRACT_ENGINE_UTILITY_LOGGER_NAME = '.ExtractEngineUtility'
+
+# Get the Logger Instance for the module.
+extract_engine_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													EXTRACT_ENGINE_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Utility / Helper function - 0.
+def free_cores():
+	"""
+	Returns the number of cores available to the process, less the ones kept busy (the load average
+	of the last minute).
+	"""
+	try:
+		available_cores = len(os.sched_getaffinity(0))
+	except AttributeError:
+		available_cores = os.cpu_count() or 1
+	try:
+		busy_cores = int(round(os.getloadavg()[0]))
+	except (AttributeError, OSError):
+		busy_cores = 0
+	return max(available_cores - busy_cores, 0)
+
+# Utility / Helper function - 1.
+def _builtin_decompressor(decompressor_factory):
+	"""
+	Returns a function yielding the decompressed chunks of a package, by the (`ZLIB` / `BZ2`)
+	decompressor objects of the `DECOMPRESSOR_FACTORY`. A package of several concatenated
+	streams is decompressed stream after stream.
+	"""
+	def decompressed_chunks(tar_file_location):
+		with open(tar_file_location, 'rb') as tar_object:
+			decompressor, stream_started = decompressor_factory(), False
+			for compressed_chunk in iter(lambda: tar_object.read(helpers.BuildConfig.Untar.UntarConfig.EXTRACT_ENGINE_READ_CHUNK), b''):
+				while compressed_chunk:
+					stream_started = True
+					stream_chunk   = decompressor.decompress(compressed_chunk)
+					if stream_chunk:
+						yield stream_chunk
+					if not decompressor.eof:
+						break
+					compressed_chunk, decompressor, stream_started = decompressor.unused_data, decompressor_factory(), False
+			if stream_started and not decompressor.eof:
+				raise EOFError('Compressed stream ended before the end-of-stream marker')
+	return decompressed_chunks
+
+# Utility / Helper function - 2.
+def _external_decompressor(decompress_command):
+	"""
+	Returns a function yielding the decompressed chunks of a package, read from the output
+	of the external `DECOMPRESS_COMMAND` (for eg., `pigz -dc`).
+	"""
+	def decompressed_chunks(tar_file_location):
+		decompress_process = subprocess.Popen(decompress_command + [tar_file_location], stdout=subprocess.PIPE,
+												stderr=subprocess.DEVNULL)
+		try:
+			for stream_chunk in iter(lambda: decompress_process.stdout.read(helpers.BuildConfig.Untar.UntarConfig.EXTRACT_ENGINE_READ_CHUNK), b''):
+				yield stream_chunk
+			if decompress_process.wait() != 0:
+				raise OSError('{' + ' '.join(decompress_command) + '} exited with: {' + str(decompress_process.returncode) + '}')
+		finally:
+			# The extraction may stop early (for eg., cancelled), do not leave the process behind.
+			if decompress_process.poll() is None:
+				decompress_process.kill()
+			decompress_process.wait()
+			decompress_process.stdout.close()
+	return decompressed_chunks
+
+# The decompressors of each compression, by name. The external ones are used only when on the PATH.
+DECOMPRESSORS = {
+	'gz' : {'pigz'  : _external_decompressor(['pigz', '-dc']),
+			'zlib'  : _builtin_decompressor(lambda: zlib.decompressobj(16 + zlib.MAX_WBITS))},
+	'bz2': {'lbzip2': _external_decompressor(['lbzip2', '-dc']),
+			'bz2'   : _builtin_decompressor(bz2.BZ2Decompressor)}
+}
+EXTERNAL_DECOMPRESSORS = ('pigz', 'lbzip2')
+
+# The decompressor picked for each compression by the probe. <::PROTECTED_ATTRIBUTE::>
+_probed_decompressors = {}
+_probe_lock           = threading.Lock()
+
+# Utility / Helper function - 3.
+def available_decompressors(compression):
+	"""
+	Returns the names of the decompressors available for the `COMPRESSION` ('gz' / 'bz2').
+	"""
+	return [decompressor_name for decompressor_name in DECOMPRESSORS[compression]
+				if decompressor_name not in EXTERNAL_DECOMPRESSORS or shutil.which(decompressor_name) is not None]
+
+# Utility / Helper function - 4.
+def _probe_sample(compression, sample_bytes):
+	"""
+	Returns the location of a temporary package of `SAMPLE_BYTES` of (source code like) text, compressed.
+	"""
+	sample_random = random.Random(0)
+	sample_words  = [b'%x' % sample_random.getrandbits(24) for _ in range(4096)]
+	sample_block  = b' '.join(sample_random.choice(sample_words) for _ in range(64 * 1024))
+	sample_data   = (sample_block * (sample_bytes // len(sample_block) + 1))[:sample_bytes]
+
+	sample_handle, sample_location = tempfile.mkstemp(suffix='.' + compression)
+	with os.fdopen(sample_handle, 'wb') as sample_object:
+		sample_object.write(gzip.compress(sample_data) if compression == 'gz' else bz2.compress(sample_data))
+	return sample_location
+
+# Utility / Helper function - 5.
+def probe_decompressors():
+	"""
+	Pick the fastest available decompressor for each compression left to 'auto' (see
+	`UntarConfig.EXTRACT_DECOMPRESSOR`), by decompressing a sample package with each.
+	The probe runs once (per process), returns the dictionary of `COMPRESSION -> DECOMPRESSOR`.
+	"""
+	with _probe_lock:
+		for compression in DECOMPRESSORS:
+			if compression in _probed_decompressors or \
+					helpers.BuildConfig.Untar.UntarConfig.EXTRACT_DECOMPRESSOR.get(compression, 'auto') != 'auto':
+				continue
+
+			candidate_decompressors = available_decompressors(compression)
+			if len(candidate_decompressors) == 1:
+				_probed_decompressors[compression] = candidate_decompressors[0]
+				continue
+
+			sample_location = _probe_sample(compression, helpers.BuildConfig.Untar.UntarConfig.EXTRACT_PROBE_BYTES)
+			try:
+				decompress_throughput = {}
+				for decompressor_name in candidate_decompressors:
+					probe_start = time.perf_counter()
+					try:
+						for _ in DECOMPRESSORS[compression][decompressor_name](sample_location):
+							pass
+					except (OSError, EOFError, zlib.error) as extractEngineUtility_probeDecompressors_error:
+						# Put logging below.
+						extract_engine_utility_logger.warning('Decompressor: {' + decompressor_name + '} failed the Probe: ' +
+																str(extractEngineUtility_probeDecompressors_error))
+						continue
+					decompress_throughput[decompressor_name] = (helpers.BuildConfig.Untar.UntarConfig.EXTRACT_PROBE_BYTES /
+																	(1024 * 1024) / max(time.perf_counter() - probe_start, 1e-9))
+			finally:
+				os.remove(sample_location)
+
+			_probed_decompressors[compression] = (max(decompress_throughput, key=decompress_throughput.get)
+													if decompress_throughput else candidate_decompressors[-1])
+
+			# Logging a comment
+			extract_engine_utility_logger.info('Decompressor Probe ({' + compression + '}): ' +
+												', '.join(decompressor_name + ' ' + '%.1f' % throughput + ' MB/s'
+															for decompressor_name, throughput in decompress_throughput.items()) +
+													' => {' + _probed_decompressors[compression] + '}')
+		return dict(_probed_decompressors)
+
+# Utility / Helper function - 6.
+def decompressor_for(compression):
+	"""
+	Returns the name of the decompressor of the 'pipelined' engine, for the `COMPRESSION`.
+	"""
+	configured_decompressor = helpers.BuildConfig.Untar.UntarConfig.EXTRACT_DECOMPRESSOR.get(compression, 'auto')
+	if configured_decompressor != 'auto':
+		return configured_decompressor
+	return probe_decompressors()[compression]
+
+# Utility / Helper function - 7.
+def _compression_of(tar_file_location):
+	"""
+	Returns the compression ('gz' / 'bz2') of the package, by its extension, or `NONE`.
+	"""
+	for compression, tar_extension in helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION.items():
+		if tar_file_location.endswith(tar_extension) and compression in DECOMPRESSORS:
+			return compression
+	return None
+
+# Utility / Helper function - 8.
+def _noted_members(tar_members, extracted_members):
+	"""
+	Yields the `TAR_MEMBERS` (to extract), noting each in `EXTRACTED_MEMBERS`.
+	"""
+	for tar_member in tar_members:
+		extracted_members.append(tar_member)
+		yield tar_member
+
+# Utility / Helper function - 9.
+def _tarfile_engine(tar_file_location, extract_directory, select_members):
+	"""
+	Extract the package with `TARFILE` alone (decompression, parsing and writes in the one thread).
+	"""
+	extracted_members = []
+	with tarfile.open(tar_file_location) as tar_file:
+		tar_file.extractall(path=extract_directory, members=_noted_members(select_members(tar_file), extracted_members))
+		tar_members = tar_file.getmembers()
+	return extracted_members, len(tar_members), 'tarfile', sum(tar_member.size for tar_member in tar_members)
+
+# Utility / Helper function - 10.
+def _pipelined_engine(tar_file_location, extract_directory, select_members):
+	"""
+	Extract the package, decompressed in a thread of its own ahead of the member writes.
+	"""
+	compression = _compression_of(tar_file_location)
+	if compression is None:
+		return _tarfile_engine(tar_file_location, extract_directory, select_members)
+	decompressor_name = decompressor_for(compression)
+
+	chunk_queue      = queue.Queue(maxsize=helpers.BuildConfig.Untar.UntarConfig.EXTRACT_ENGINE_QUEUE_CHUNKS)
+	stop_decompress  = threading.Event()
+	decompress_state = {'error': None, 'bytes': 0}
+
+	def decompress():
+		try:
+			with contextlib.closing(DECOMPRESSORS[compression][decompressor_name](tar_file_location)) as stream_chunks:
+				for stream_chunk in stream_chunks:
+					if stop_decompress.is_set():
+						break
+					chunk_queue.put(stream_chunk)
+					decompress_state['bytes'] += len(stream_chunk)
+		except (OSError, EOFError, zlib.error) as extractEngineUtility_decompress_error:
+			decompress_state['error'] = extractEngineUtility_decompress_error
+		finally:
+			# The end of the stream.
+			chunk_queue.put(None)
+
+	decompress_thread = threading.Thread(target=decompress, name='Decompress::' + os.path.basename(tar_file_location),
+											daemon=True)
+	decompress_thread.start()
+	chunk_reader = helpers.Utilities.StreamExtractUtility.ChunkReader(chunk_queue)
+
+	def stop():
+		# Stop the decompression (If Still Running), and raise its error (If Any).
+		stop_decompress.set()
+		chunk_reader.drain()
+		decompress_thread.join()
+		if decompress_state['error'] is not None:
+			raise tarfile.ReadError('Decompression ({' + decompressor_name + '}) Failed: ' +
+										str(decompress_state['error'])) from decompress_state['error']
+
+	extracted_members = []
+	try:
+		with tarfile.open(fileobj=chunk_reader, mode='r|') as tar_file:
+			tar_file.extractall(path=extract_directory, members=_noted_members(select_members(tar_file), extracted_members))
+			tar_members = tar_file.getmembers()
+	except BaseException:
+		# A failed decompression is the cause of the extraction failing.
+		stop()
+		raise
+	stop()
+	return extracted_members, len(tar_members), decompressor_name, decompress_state['bytes']
+
+# The extraction engines, by name.
+EXTRACT_ENGINES = {'pipelined': _pipelined_engine, 'tarfile': _tarfile_engine}
+
+# Utility / Helper function - 11.
+def engine_name():
+	"""
+	Returns the name of the configured extraction engine. 'auto' is the 'pipelined' engine when there
+	are (at least) two free cores, hence the decompression runs on a core of its own, and the
+	'tarfile' engine otherwise (the hand-over costs more than it overlaps).
+	"""
+	if helpers.BuildConfig.Untar.UntarConfig.EXTRACT_ENGINE != 'auto':
+		return helpers.BuildConfig.Untar.UntarConfig.EXTRACT_ENGINE
+	return 'pipelined' if free_cores() >= 2 else 'tarfile'
+
+# Utility / Helper function - 12.
+def extract(tar_file_location, extract_directory, select_members=None):
+	"""
+	Extract the package at the `TAR_FILE_LOCATION` to the `EXTRACT_DIRECTORY`, by the configured engine.
+	`SELECT_MEMBERS` returns the members to extract, out of the (iterated) `TARFILE` object (all, by default).
+	Returns a tuple of `(MEMBER MANIFEST, EXTRACT REPORT)`, the manifest being a list of
+	`(MEMBER NAME, SIZE)` of the members extracted, and the report a dictionary of the extraction
+	throughput (and of the number of members left out by `SELECT_MEMBERS`).
+	"""
+	extract_engine = engine_name()
+	extract_start  = time.perf_counter()
+	extracted_members, member_count, decompressor_name, uncompressed_bytes = \
+		EXTRACT_ENGINES[extract_engine](tar_file_location, extract_directory, select_members or (lambda tar_file: tar_file))
+
+	return [(tar_member.name, tar_member.size) for tar_member in extracted_members], {
+				'engine'            : extract_engine,
+				'decompressor'      : decompressor_name,
+				'skipped_members'   : member_count - len(extracted_members),
+				'compressed_bytes'  : os.path.getsize(tar_file_location),
+				'uncompressed_bytes': uncompressed_bytes,
+				'seconds'           : time.perf_counter() - extract_start
+			}
+
+# Utility / Helper function - 13.
+def describe(extract_report):
+	"""
+	Returns the extract report as text (for eg., `zlib: 9.2 MB in 0.41s, 22.4 MB/s (118.3 MB/s uncompressed)`).
+	"""
+	extract_seconds = max(extract_report['seconds'], 1e-9)
+	return (extract_report['decompressor'] + ': ' + '%.1f' % (extract_report['compressed_bytes'] / (1024 * 1024)) + ' MB in ' +
+				'%.2f' % extract_report['seconds'] + 's, ' +
+					'%.1f' % (extract_report['compressed_bytes'] / (1024 * 1024) / extract_seconds) + ' MB/s (' +
+						'%.1f' % (extract_report['uncompressed_bytes'] / (1024 * 1024) / extract_seconds) + ' MB/s uncompressed)')
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+
+# This module houses the pooled `HTTP` session layer used by the `WebUtility`
+# helpers (and thus by every DownloaderThread).
+# Connections are kept alive (`HTTP/1.1` persistent connections) and pooled per
+# `SCHEME / HOST / PORT`, so the successive requests to the same host skip the
+# `DNS` lookup, the `TCP` handshake and the `TLS` handshake.
+# The session mirrors the behavior of `URLLIB`'s `urlopen` (redirects are followed,
+# non `2xx` answers raise `HTTPError`, socket failures raise `URLError`), so it can
+# be swapped in without changing the error handling of the callers.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO configurations module, which holds the pool (and timeout) options.
+import helpers.BuildConfig.IO.IOConfig
+
+# Import the deadlines, which cap the connect / read timeouts of the requests.
+import helpers.Utilities.DeadlineUtility
+
+# Import the circuit breakers, to fail fast on the hosts that are down.
+import helpers.Utilities.RetryUtility
+
+# Import the cancellation tokens, a request waiting for a pooled connection is cancellable.
+import helpers.Utilities.CancellationUtility
+
+# Import the stage timings, the connects and the first bytes are traced.
+import helpers.Utilities.TraceUtility
+
+# Import the `HTTP.CLIENT` module, which provides the persistent connections.
+import http.client
+
+# Import the `SSL` module for the `HTTPS` connections.
+import ssl
+
+# Import the `THREADING` module, as the pool is shared between the downloader threads.
+import threading
+
+# Import the `SOCKET` module for the default (global) socket timeout sentinel.
+import socket
+
+# Import the `TIME` module, to bound the wait for a pooled connection.
+import time
+
+# Import the `IO` module to hold the (short) error bodies in memory.
+import io
+
+# Currently making use of `URLLIB` for the `REQUEST` / `ERROR` objects,
+# and as the fallback for the schemes (for eg., `FTP`) and setups (for eg., proxies)
+# the pool doesn't cater to.
+from urllib.request import Request, urlopen as urllib_urlopen, getproxies
+from urllib.error   import URLError, HTTPError
+from urllib.parse   import urljoin, urlsplit
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+HTTP_SESSION_UTILITY_LOGGER_NAME = '.HttpSessionUtility'
+
+# Get the Logger Instance for the module.
+http_session_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													HTTP_SESSION_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# `HTTP` status codes that are followed as redirects.
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Maximum number of redirects followed for a single request (same as `URLLIB`).
+MAX_REDIRECTIONS = 10
+
+# Unread response bodies up to the below size are drained on close,
+# so that their connection can still be handed back to the pool.
+MAX_DRAIN_SIZE = 64 * 1024
+
+# `User-Agent` sent when the caller didn't set one (same as `URLLIB`).
+DEFAULT_USER_AGENT = 'Python-urllib/3'
+
+# Errors raised when a pooled (idle) connection was dropped by the server.
+# The request is then replayed once on a fresh connection.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+							ConnectionResetError, BrokenPipeError, ConnectionAbortedError)
+
+class PoolExhaustedError(URLError):
+	"""
+	Raised when no connection to the host is handed back to the pool within the connect
+	timeout of the request (all `POOL_MAX_CONNECTIONS_PER_HOST` of them stayed in use).
+	It doesn't count against the health of the host.
+	"""
+
+##############################################################
+# The section below contains the Class Definitions for the
+# connection pool, the pooled response and the session.
+##############################################################
+
+class ConnectionPool(object):
+	"""
+	Thread-Safe pool of persistent connections, keyed by `(SCHEME, HOST, PORT)`.
+	At most `MAX_CONNECTIONS_PER_HOST` connections (idle and in-use) are kept per key;
+	further requests for the same key wait for a connection to be handed back.
+	"""
+
+	def __init__(self, max_connections_per_host):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.max_connections_per_host = max_connections_per_host
+
+		# Idle connections and the count of all (idle + in-use) connections, per key.
+		self._idle_connections = {}
+		self._open_connections = {}
+		self._condition        = threading.Condition()
+
+		# Counters for the connection reuse report.
+		self.new_connections    = 0
+		self.reused_connections = 0
+
+		# `TLS` settings shared by the `HTTPS` connections.
+		self._ssl_context = ssl.create_default_context()
+
+	def acquire(self, scheme, host, port, timeout):
+		"""
+		Returns a tuple of `(CONNECTION, REUSED)` for the key, where `REUSED` tells
+		whether the connection came out of the pool.
+		While all the connections of the key are in use, the wait checks the bound time budget
+		(and the cancellation token) every `POOL_ACQUIRE_POLL_INTERVAL`, and raises
+		`PoolExhaustedError` once the `TIMEOUT` is spent.
+		"""
+		pool_key = (scheme, host, port)
+		wait_until = (None if timeout is None or timeout is socket._GLOBAL_DEFAULT_TIMEOUT
+						else time.monotonic() + timeout)
+		with self._condition:
+			while True:
+				idle_connections = self._idle_connections.get(pool_key)
+				if idle_connections:
+					connection = idle_connections.pop()
+					self.reused_connections += 1
+					connection.timeout = timeout
+					if connection.sock is not None:
+						connection.sock.settimeout(None if timeout is socket._GLOBAL_DEFAULT_TIMEOUT else timeout)
+					return connection, True
+				if self._open_connections.get(pool_key, 0) < self.max_connections_per_host:
+					self._open_connections[pool_key] = self._open_connections.get(pool_key, 0) + 1
+					self.new_connections += 1
+					break
+
+				helpers.Utilities.DeadlineUtility.check()
+				helpers.Utilities.CancellationUtility.check()
+				wait_seconds = helpers.BuildConfig.IO.IOConfig.POOL_ACQUIRE_POLL_INTERVAL
+				if wait_until is not None:
+					if time.monotonic() >= wait_until:
+						raise PoolExhaustedError('No Connection to Host: {' + host + ':' + str(port) + '} freed up within {' +
+													str(timeout) + '}s (all {' + str(self.max_connections_per_host) +
+														'} in use)')
+					wait_seconds = min(wait_seconds, wait_until - time.monotonic())
+				self._condition.wait(timeout=max(wait_seconds, 0))
+
+		# Build the connection outside of the lock. It connects lazily, on the first request.
+		if scheme == 'https':
+			connection = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+		else:
+			connection = http.client.HTTPConnection(host, port, timeout=timeout)
+		return connection, False
+
+	def release(self, scheme, host, port, connection):
+		"""
+		Hand a connection (with no pending response) back to the pool.
+		"""
+		with self._condition:
+			self._idle_connections.setdefault((scheme, host, port), []).append(connection)
+			self._condition.notify()
+
+	def discard(self, scheme, host, port, connection):
+		"""
+		Close a connection that can't be reused, and free its slot in the pool.
+		"""
+		connection.close()
+		with self._condition:
+			self._open_connections[(scheme, host, port)] -= 1
+			self._condition.notify()
+
+	def close(self):
+		"""
+		Close all the idle connections.
+		"""
+		with self._condition:
+			for pool_key, idle_connections in self._idle_connections.items():
+				for connection in idle_connections:
+					connection.close()
+					self._open_connections[pool_key] -= 1
+			self._idle_connections.clear()
+			self._condition.notify_all()
+
+	def report(self):
+		"""
+		Returns the connection reuse report for the pool.
+		"""
+		with self._condition:
+			return {'new_connections': self.new_connections, 'reused_connections': self.reused_connections}
+
+class PooledResponse(object):
+	"""
+	File-like wrapper over an `HTTP.CLIENT` response, that hands its connection back
+	to the pool once closed (when the body was fully read and the server allows
+	keep-alive), and closes it otherwise.
+	It provides the same accessors as the `URLLIB` response objects.
+	"""
+
+	def __init__(self, pool, pool_key, connection, response, url):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self._pool       = pool
+		self._pool_key   = pool_key
+		self._connection = connection
+		self._response   = response
+		self.url         = url
+		self.status      = response.status
+		self.code        = response.status
+		self.reason      = response.reason
+		self.headers     = response.headers
+		self.msg         = response.headers
+
+	def read(self, amt=None):
+		return self._response.read(amt)
+
+	def readinto(self, buffer_object):
+		return self._response.readinto(buffer_object)
+
+	def getcode(self):
+		return self.status
+
+	def geturl(self):
+		return self.url
+
+	def info(self):
+		return self.headers
+
+	def close(self):
+		if self._connection is None:
+			return
+		connection, self._connection = self._connection, None
+
+		# Drain small leftovers, so that the connection stays reusable.
+		if not self._response.isclosed() and self._response.length is not None and \
+				self._response.length <= MAX_DRAIN_SIZE:
+			try:
+				self._response.read()
+			except (http.client.HTTPException, OSError):
+				pass
+
+		if self._response.isclosed() and not self._response.will_close:
+			self._pool.release(*self._pool_key, connection=connection)
+		else:
+			self._response.close()
+			self._pool.discard(*self._pool_key, connection=connection)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, exc_traceback):
+		self.close()
+
+class HttpSession(object):
+	"""
+	Issue requests over the pooled persistent connections.
+	"""
+
+	def __init__(self, pool):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.pool = pool
+
+	def urlopen(self, request_object, timeout=None):
+		"""
+		Drop-In replacement for `URLLIB`'s `urlopen`, for `REQUEST` objects or URLs.
+		The connections are bounded by `IOConfig.CONNECT_TIMEOUT`, and the reads by the
+		`TIMEOUT` (`IOConfig.READ_TIMEOUT` by default). Both are capped with what is left
+		of the deadline bound to the calling thread (If Any).
+		While the circuit of the host is open, `CircuitOpenError` is raised straight away.
+		"""
+		if not isinstance(request_object, Request):
+			request_object = Request(request_object)
+
+		circuit_breaker = helpers.Utilities.RetryUtility.shared_circuit_breaker
+		circuit_breaker.before_request(request_object.full_url)
+		try:
+			response_object = self._open(request_object, timeout)
+		except PoolExhaustedError:
+			# The pool of this process is saturated, the host isn't at fault.
+			raise
+		except (URLError, HTTPError, OSError) as httpSessionUtility_urlopen_error:
+			circuit_breaker.record_outcome(request_object.full_url, httpSessionUtility_urlopen_error)
+			raise
+		circuit_breaker.record_outcome(request_object.full_url)
+		return response_object
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _open(self, request_object, timeout):
+		connect_timeout = helpers.Utilities.DeadlineUtility.request_timeout(helpers.BuildConfig.IO.IOConfig.CONNECT_TIMEOUT)
+		read_timeout    = helpers.Utilities.DeadlineUtility.request_timeout(helpers.BuildConfig.IO.IOConfig.READ_TIMEOUT
+																				if timeout is None else timeout)
+
+		# Schemes other than `HTTP(S)` and proxied setups are left to `URLLIB`,
+		# with a single timeout for the connection and the reads.
+		if not helpers.BuildConfig.IO.IOConfig.POOL_ENABLED or request_object.type not in ('http', 'https') or \
+				request_object.type in getproxies():
+			with helpers.Utilities.TraceUtility.span('first_byte', url=request_object.full_url):
+				return urllib_urlopen(request_object, timeout=read_timeout)
+
+		for _ in range(MAX_REDIRECTIONS + 1):
+			pooled_response = self._send(request_object, connect_timeout, read_timeout)
+			if pooled_response.status not in REDIRECT_CODES or 'Location' not in pooled_response.headers:
+				break
+
+			# Follow the redirect, keeping the request headers (for eg., the cookies required by Oracle).
+			redirect_url = urljoin(request_object.full_url, pooled_response.headers['Location'])
+			pooled_response.close()
+
+			# Logging a comment
+			http_session_utility_logger.info('Following Redirect from URI: {' + request_object.full_url + '} to URI: {' +
+												redirect_url + '}')
+
+			redirect_method = request_object.get_method()
+			if pooled_response.status == 303 or (pooled_response.status in (301, 302) and redirect_method == 'POST'):
+				redirect_method = 'GET'
+			request_object = Request(redirect_url, headers=dict(request_object.header_items()), method=redirect_method)
+		else:
+			raise self._http_error(request_object, pooled_response, 'Too many redirections')
+
+		# Mirror `URLLIB`: anything other than a `2xx` answer is an `HTTP_ERROR`.
+		if not 200 <= pooled_response.status < 300:
+			raise self._http_error(request_object, pooled_response, pooled_response.reason)
+		return pooled_response
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	def _http_error(request_object, pooled_response, error_message):
+		# Keep (the start of) the error body in memory and hand the connection back
+		# right away, so that an error nobody closes doesn't hold on to a pool slot.
+		error_body = io.BytesIO(pooled_response.read(MAX_DRAIN_SIZE))
+		pooled_response.close()
+		return HTTPError(request_object.full_url, pooled_response.status, error_message,
+							pooled_response.headers, error_body)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _send(self, request_object, connect_timeout, read_timeout):
+		url_parts = urlsplit(request_object.full_url)
+		scheme    = url_parts.scheme
+		host      = url_parts.hostname
+		port      = url_parts.port or (443 if scheme == 'https' else 80)
+		pool_key  = (scheme, host, port)
+
+		request_headers = dict(request_object.header_items())
+		request_headers.setdefault('User-agent', DEFAULT_USER_AGENT)
+
+		while True:
+			connection, reused = self.pool.acquire(scheme, host, port, connect_timeout)
+			try:
+				# Connect (and handshake) within the connect timeout, then switch to the read timeout.
+				if connection.sock is None:
+					with helpers.Utilities.TraceUtility.span('connect', host=host):
+						connection.connect()
+				connection.sock.settimeout(read_timeout)
+				with helpers.Utilities.TraceUtility.span('first_byte', url=request_object.full_url, reused=reused):
+					connection.request(request_object.get_method(), request_object.selector or '/',
+										body=request_object.data, headers=request_headers)
+					response = connection.getresponse()
+			except STALE_CONNECTION_ERRORS as httpSessionUtility_send_error:
+				self.pool.discard(scheme, host, port, connection)
+
+				# A pooled connection may have been closed by the server while idle.
+				# Replay the request on a fresh connection in that case.
+				if reused:
+					continue
+				raise URLError(httpSessionUtility_send_error)
+			except (http.client.HTTPException, OSError) as httpSessionUtility_send_error:
+				self.pool.discard(scheme, host, port, connection)
+				raise URLError(httpSessionUtility_send_error)
+			except BaseException:
+				# Anything else (for eg., an invalid header value, a cancelled task, or a `KEYBOARDINTERRUPT`)
+				# leaves the connection mid-request, it's closed, and its slot in the pool freed.
+				self.pool.discard(scheme, host, port, connection)
+				raise
+			return PooledResponse(self.pool, pool_key, connection, response, request_object.full_url)
+
+	def log_report(self):
+		"""
+		Write the connection reuse report to the application log.
+		"""
+		pool_report = self.pool.report()
+
+		# Logging a comment
+		http_session_utility_logger.info('HTTP Session Report: NEW_CONNECTIONS: {' + str(pool_report['new_connections']) +
+									'}, REUSED_CONNECTIONS: {' + str(pool_report['reused_connections']) + '}')
+
+# The session shared by all the downloader threads.
+shared_session = HttpSession(ConnectionPool(helpers.BuildConfig.IO.IOConfig.POOL_MAX_CONNECTIONS_PER_HOST))
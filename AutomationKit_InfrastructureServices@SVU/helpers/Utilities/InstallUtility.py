@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+# This module houses the installation of the extracted binaries (`TOMCAT`, `JAVA`) into their
+# binary locations (see `UntarConfig.INSTALL_MODE`).
+# With the 'direct' install mode, the packages are extracted straight into a staging directory
+# within their binary location (hence, on the destination filesystem), and the extracted tree is
+# renamed into place. Otherwise, the tree extracted under `TAR_BASE_EXTRACT_DIRECTORY` is renamed
+# into place when it's on the same filesystem, and copied over (into a temporary directory next
+# to the install location, then renamed into place) when it isn't.
+# Either way, the install location never holds a partial copy, and the bytes of the binaries are
+# written once (unless the install crosses filesystems).
+# A fresh install is a single rename. Replacing a tree already installed (for eg., a re-run of the
+# same version) takes two: the former tree is set aside, then the new one renamed in. In between,
+# the install location is missing (not partial) for a moment, and a crash there leaves the former
+# tree at `<INSTALL_LOCATION>.<PID>.replaced`.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `TAR` configurations module.
+import helpers.BuildConfig.Untar.UntarConfig
+
+# Perform `OS` level operations using the below built-in Standard Python Module.
+import os
+
+# Import the `SHUTIL` and `TEMPFILE` modules, for the temporary directories of the copies.
+import shutil, tempfile
+
+# Import the `SUBPROCESS` module to make use of the system `COPY` command
+# (`shutil.copytree` has trouble with the symlinks of the binaries).
+import subprocess
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+INSTALL_UTILITY_LOGGER_NAME = '.InstallUtility'
+
+# Get the Logger Instance for the module.
+install_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												INSTALL_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# The staging directories the packages are extracted to, by their package type (the `TAR` extract location).
+# <::PROTECTED_ATTRIBUTE::>
+_staging_directories = {}
+
+# Utility / Helper function - 0.
+def register_staging(tar_package_type, binary_location):
+	"""
+	Extract the packages of the `TAR_PACKAGE_TYPE` into a staging directory within the
+	`BINARY_LOCATION`, hence on the filesystem they are installed to.
+	A tree left there by an earlier (failed) build is dropped, as the extracted trees are
+	looked up by listing the staging directory.
+	"""
+	_staging_directories[tar_package_type] = os.path.join(binary_location,
+															helpers.BuildConfig.Untar.UntarConfig.INSTALL_STAGING_DIRECTORY_NAME, '')
+	if os.path.lexists(extract_directory(tar_package_type)):
+		# Logging a comment
+		install_utility_logger.info('Clearing Stale Staging Directory: {' + extract_directory(tar_package_type) + '}')
+		shutil.rmtree(extract_directory(tar_package_type), ignore_errors=True)
+
+# Utility / Helper function - 1.
+def extract_directory(tar_package_type):
+	"""
+	Returns the directory the packages of the `TAR_PACKAGE_TYPE` are extracted to: their staging
+	directory (If Registered), or their location under `TAR_BASE_EXTRACT_DIRECTORY`.
+	"""
+	return _staging_directories.get(tar_package_type, helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY) + \
+				tar_package_type
+
+# Utility / Helper function - 2.
+def same_filesystem(source_location, destination_directory):
+	"""
+	Returns whether the `SOURCE_LOCATION` can be renamed into the `DESTINATION_DIRECTORY`.
+	"""
+	return os.stat(source_location).st_dev == os.stat(destination_directory).st_dev
+
+# Utility / Helper function - 3.
+def _rename_into_place(incoming_tree, install_location):
+	"""
+	Rename the `INCOMING_TREE` to the `INSTALL_LOCATION`. A tree already installed there
+	(for eg., a re-run of the same version) is set aside first, and dropped once replaced
+	(or put back, when the rename fails). That replacement isn't atomic: the install location
+	is missing between the two renames.
+	"""
+	displaced_tree = None
+	if os.path.lexists(install_location):
+		displaced_tree = install_location + '.' + str(os.getpid()) + '.replaced'
+		os.rename(install_location, displaced_tree)
+	try:
+		os.rename(incoming_tree, install_location)
+	except OSError:
+		if displaced_tree is not None:
+			os.rename(displaced_tree, install_location)
+		raise
+	if displaced_tree is not None:
+		shutil.rmtree(displaced_tree, ignore_errors=True)
+
+# Utility / Helper function - 4.
+def install_tree(source_tree, install_location):
+	"""
+	Install the extracted `SOURCE_TREE` to the `INSTALL_LOCATION`: renamed into place when on the
+	same filesystem, or copied into a temporary directory next to it and renamed into place.
+	Returns the install method ('rename' or 'copy').
+	"""
+	install_location  = install_location.rstrip('/')
+	install_directory = os.path.dirname(install_location)
+	os.makedirs(install_directory, exist_ok=True)
+
+	if same_filesystem(source_tree, install_directory):
+		_rename_into_place(source_tree, install_location)
+		_drop_empty_parents(source_tree)
+
+		# Logging a comment
+		install_utility_logger.info('Installed {' + source_tree + '} to {' + install_location + '} by Rename')
+		return 'rename'
+
+	# The copy lands on the destination filesystem first, hence it's renamed into place (never copied in place).
+	copy_directory = tempfile.mkdtemp(prefix='.' + os.path.basename(install_location) + '.', dir=install_directory)
+	try:
+		subprocess.check_call(['cp', '-Rp', source_tree, os.path.join(copy_directory, 'tree')])
+		_rename_into_place(os.path.join(copy_directory, 'tree'), install_location)
+	finally:
+		shutil.rmtree(copy_directory, ignore_errors=True)
+
+	# Logging a comment
+	install_utility_logger.info('Installed {' + source_tree + '} to {' + install_location + '} by Copy (across filesystems)')
+	return 'copy'
+
+# Utility / Helper function - 5.
+def _drop_empty_parents(source_tree):
+	"""
+	Remove the staging directories (If Any) left empty by the rename of the `SOURCE_TREE`.
+	"""
+	extract_location = os.path.dirname(os.path.normpath(source_tree))
+	for staging_directory in set(_staging_directories.values()):
+		if os.path.dirname(extract_location) != os.path.normpath(staging_directory):
+			continue
+		for empty_directory in (extract_location, os.path.normpath(staging_directory)):
+			try:
+				os.rmdir(empty_directory)
+			except OSError:
+				# Not empty (for eg., another package type is staged there).
+				pass
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+# This module houses the workflow journal of the build pipelines (one per build id).
+# Each completed stage is recorded along with its result, the fingerprint of its inputs
+# (its own configuration, and the results of the stages it requires) and the artifacts
+# it left on-disk (the downloaded package, the extracted sources, the installed binaries).
+# A rerun of the build completes the recorded stages from the journal, and resumes at the
+# first stage not recorded, or invalidated (its inputs changed, or its artifacts are gone).
+# Hence, a build failing late (for eg., on the `make` of `HTTPD`) doesn't download, extract
+# and build its dependencies again on the retry.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `HASHLIB` module to fingerprint the stage inputs and results.
+import hashlib
+
+# Import the `JSON` module to persist the journal on-disk.
+import json
+
+# Import the `OS` module for the file-system operations.
+import os
+
+# Import the `THREADING` module, as the journal is shared by the pipeline threads.
+import threading
+
+# Import the `TIME` module to time-stamp the stages.
+import time
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+JOURNAL_UTILITY_LOGGER_NAME = '.JournalUtility'
+
+# Get the Logger Instance for the module.
+journal_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												JOURNAL_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Utility / Helper function - 0.
+def fingerprint(*fingerprint_values):
+	"""
+	Returns the `SHA-256` hex digest of the (`JSON` serializable) `FINGERPRINT_VALUES`.
+	"""
+	return hashlib.sha256(json.dumps(fingerprint_values, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+# Utility / Helper function - 1.
+def artifact_state(artifact_path):
+	"""
+	Returns the state of an artifact recorded in the journal: the size of a file, `-1` for
+	a directory, or `NONE` when the artifact is gone.
+	"""
+	if os.path.isdir(artifact_path):
+		return -1
+	try:
+		return os.path.getsize(artifact_path)
+	except OSError:
+		return None
+
+##############################################################
+# The section below contains the Class Definition for the
+# workflow journal.
+##############################################################
+
+class WorkflowJournal(object):
+	"""
+	On-disk journal of the completed stages of a build, in the `JOURNAL_FILE`.
+	"""
+
+	def __init__(self, journal_file):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.journal_file = journal_file
+
+		# Statistics for the resume report.
+		self.resumed_stages = []
+
+		# Guards the journal file within the process. <::PROTECTED_ATTRIBUTE::>
+		self._lock = threading.Lock()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _load(self):
+		try:
+			with open(self.journal_file, 'r') as journal_object:
+				return json.load(journal_object)
+		except (IOError, OSError, ValueError):
+			return {}
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _save(self, journal_entries):
+		os.makedirs(os.path.dirname(self.journal_file), exist_ok=True)
+		temporary_journal_file = self.journal_file + '.' + str(os.getpid()) + '.tmp'
+		with open(temporary_journal_file, 'w') as journal_object:
+			json.dump(journal_entries, journal_object, indent=1, sort_keys=True)
+		os.replace(temporary_journal_file, self.journal_file)
+
+	def lookup(self, stage_name, input_fingerprint):
+		"""
+		Returns the journal entry of the stage, or `NONE` when the stage isn't recorded, or is
+		invalidated (recorded for other inputs, or one of its artifacts is gone / changed).
+		"""
+		with self._lock:
+			journal_entry = self._load().get(stage_name)
+
+		if journal_entry is None:
+			return None
+		if journal_entry.get('input_fingerprint') != input_fingerprint:
+			# Logging a comment
+			journal_utility_logger.info('Journal Entry of Stage: {' + stage_name + '} invalidated, its Inputs changed')
+			return None
+		for artifact_path, recorded_state in journal_entry.get('artifacts', {}).items():
+			if artifact_state(artifact_path) != recorded_state:
+				# Logging a comment
+				journal_utility_logger.info('Journal Entry of Stage: {' + stage_name + '} invalidated, its Artifact: {' +
+												artifact_path + '} is gone, or changed')
+				return None
+
+		self.resumed_stages.append(stage_name)
+		return journal_entry
+
+	def record(self, stage_name, input_fingerprint, stage_result, artifact_paths=()):
+		"""
+		Record the completed stage, along with its result and the state of its artifacts.
+		Returns the journal entry.
+		"""
+		journal_entry = {'input_fingerprint' : input_fingerprint,
+							'output_fingerprint': fingerprint(stage_result),
+							'result'            : stage_result,
+							'artifacts'         : {artifact_path: artifact_state(artifact_path)
+														for artifact_path in artifact_paths},
+							'completed_at'      : time.time()}
+
+		with self._lock:
+			journal_entries = self._load()
+			journal_entries[stage_name] = journal_entry
+			self._save(journal_entries)
+		return journal_entry
+
+	def discard(self):
+		"""
+		Discard the journal (If Any), hence the next run of the build starts afresh.
+		"""
+		with self._lock:
+			try:
+				os.remove(self.journal_file)
+			except FileNotFoundError:
+				return
+
+		# Logging a comment
+		journal_utility_logger.info('Workflow Journal discarded: {' + self.journal_file + '}')
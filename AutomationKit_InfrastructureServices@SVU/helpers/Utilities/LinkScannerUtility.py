@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# This module houses the streaming link scanner used by the `get_link` helpers.
+# The page is decoded incrementally, chunk by chunk, and the pattern is searched
+# over a sliding window of the decoded text, so a link is found (and the
+# connection can be closed) without holding, or even receiving, the whole page.
+# The window keeps an overlap of the previous text, so that a match straddling
+# two chunks is still found.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO configurations module, which holds the scan options.
+import helpers.BuildConfig.IO.IOConfig
+
+# Import the `CODECS` module for the incremental decoder.
+import codecs
+
+# The below module takes care of Regular Expression(s).
+import re
+
+##############################################################
+# The section below contains the Class Definition for the
+# streaming link scanner.
+##############################################################
+
+class LinkScanner(object):
+	"""
+	Feed the page body in chunks, until a match for the pattern is returned.
+	Matches are limited to `LINK_SCAN_OVERLAP` characters, which is plenty
+	for the package links scraped by the downloaders. Within that limit, the match
+	is the one `RE.SEARCH` finds on the whole page, wherever the chunks are cut.
+	"""
+
+	def __init__(self, link_pattern, keep_prefix=False, overlap=None):
+		"""
+		The `INITIALIZE` method for the class.
+		With `KEEP_PREFIX`, the text scanned so far is kept (for the response cache).
+		"""
+		self.match_result = None
+		self.overlap      = helpers.BuildConfig.IO.IOConfig.LINK_SCAN_OVERLAP if overlap is None else overlap
+
+		# <::PROTECTED_ATTRIBUTE::>
+		self._link_pattern  = re.compile(link_pattern)
+		self._decoder       = codecs.getincrementaldecoder('UTF-8')()
+		self._scan_window   = ''
+		self._prefix_chunks = [] if keep_prefix else None
+
+	@property
+	def prefix(self):
+		"""
+		Returns the text scanned so far (only kept with `KEEP_PREFIX`).
+		"""
+		return ''.join(self._prefix_chunks) if self._prefix_chunks is not None else None
+
+	def feed(self, body_chunk, final=False):
+		"""
+		Scan the next chunk of the body. Pass `FINAL` (with the last, possibly
+		empty, chunk) once the body is exhausted.
+		Returns the match, or `NONE` while the pattern hasn't been found.
+		Raises `UnicodeDecodeError` for a body that isn't valid `UTF-8`.
+		"""
+		decoded_text = self._decoder.decode(body_chunk, final)
+		if self._prefix_chunks is not None:
+			self._prefix_chunks.append(decoded_text)
+		self._scan_window += decoded_text
+
+		match_result = self._link_pattern.search(self._scan_window)
+
+		# A match near the end of the window may still grow with the next chunk (for eg.,
+		# a version number cut in half, or a greedy `(.+)?` running on to a later link),
+		# hence it is only taken once `OVERLAP` characters follow it, or the body is exhausted.
+		if match_result is not None and (final or match_result.end() <= len(self._scan_window) - self.overlap):
+			self.match_result = match_result
+			return match_result
+		if final:
+			return None
+
+		# Slide the window, keeping the overlap (and a pending match) for the next chunk.
+		keep_from = len(self._scan_window) - self.overlap
+		if match_result is not None:
+			keep_from = min(keep_from, match_result.start())
+		if keep_from > 0:
+			self._scan_window = self._scan_window[keep_from:]
+		return None
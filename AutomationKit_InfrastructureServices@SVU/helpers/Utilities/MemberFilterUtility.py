@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+# This module houses the member filters of the extractions (see `EXTRACT_INCLUDE` / `EXTRACT_EXCLUDE`
+# in the component configurations, for eg., `TomcatConfig`).
+# The filters are registered by the `TAR` extract location of the component (its package type),
+# which both the `UNTAR_MANAGER` and the streaming extraction are handed. The members filtered out
+# are skipped during the extraction, hence they are never written (nor copied over to the binary
+# location afterwards).
+# The patterns are globs on the member paths, relative to the top-level directory of the package
+# (for eg., `webapps/docs` for `apache-tomcat-8.5.x/webapps/docs`). A pattern matching a directory
+# matches everything under it.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `FNMATCH` module, to match the member paths against the glob patterns.
+import fnmatch
+
+# Import the `POSIXPATH` module, the member paths are '/' separated whatever the platform.
+import posixpath
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+MEMBER_FILTER_UTILITY_LOGGER_NAME = '.MemberFilterUtility'
+
+# Get the Logger Instance for the module.
+member_filter_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													MEMBER_FILTER_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# The registered member filters, by the package type (the `TAR` extract location) of the component.
+# <::PROTECTED_ATTRIBUTE::>
+_member_filters = {}
+
+# Utility / Helper function - 0.
+def _path_parts(member_name):
+	"""
+	Returns the components of the member path, below the top-level directory of the package.
+	"""
+	return [path_part for path_part in posixpath.normpath(member_name).split('/') if path_part not in ('', '.')][1:]
+
+##############################################################
+# The section below contains the Class Definition for the
+# member filters.
+##############################################################
+
+class MemberFilter(object):
+	"""
+	Selects the members of a package to extract: those matched by an `INCLUDE` pattern (all of
+	them, when there are none) and by no `EXCLUDE` pattern.
+	"""
+
+	def __init__(self, include=None, exclude=None):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		# The patterns, split on the path separator. <::PROTECTED_ATTRIBUTE::>
+		self._include = [pattern.strip('/').split('/') for pattern in include or ()]
+		self._exclude = [pattern.strip('/').split('/') for pattern in exclude or ()]
+
+	def __repr__(self):
+		return ('MemberFilter(include=' + str(['/'.join(pattern) for pattern in self._include]) +
+					', exclude=' + str(['/'.join(pattern) for pattern in self._exclude]) + ')')
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	def _matches(path_parts, patterns):
+		# A pattern matches the path, or one of the directories leading to it.
+		return any(len(pattern) <= len(path_parts) and
+						all(fnmatch.fnmatchcase(path_part, pattern_part) for path_part, pattern_part in zip(path_parts, pattern))
+					for pattern in patterns)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	def _leads_to(path_parts, patterns):
+		# The path is a directory leading to what a pattern matches (kept, along with its permissions).
+		return any(len(path_parts) < len(pattern) and
+						all(fnmatch.fnmatchcase(path_part, pattern_part) for path_part, pattern_part in zip(path_parts, pattern))
+					for pattern in patterns)
+
+	def accepts(self, member_name):
+		"""
+		Returns whether the member named `MEMBER_NAME` is to be extracted.
+		"""
+		path_parts = _path_parts(member_name)
+
+		# The top-level directory of the package is always extracted.
+		if not path_parts:
+			return True
+		if self._matches(path_parts, self._exclude):
+			return False
+		return not self._include or self._matches(path_parts, self._include) or self._leads_to(path_parts, self._include)
+
+	def select(self, tar_members):
+		"""
+		Yields the members (`TARINFO` objects) to extract, out of the `TAR_MEMBERS`.
+		A hard link to a member filtered out is skipped along with it (there is nothing to link to).
+		"""
+		for tar_member in tar_members:
+			if not self.accepts(tar_member.name):
+				continue
+			if tar_member.islnk() and not self.accepts(tar_member.linkname):
+				# Logging a comment
+				member_filter_utility_logger.debug('Skipping Hard Link: {' + tar_member.name + '}, its Target: {' +
+													tar_member.linkname + '} is filtered out')
+				continue
+			yield tar_member
+
+# Utility / Helper function - 1.
+def register(tar_package_type, include=None, exclude=None):
+	"""
+	Register the member filter of the packages extracted to the `TAR_PACKAGE_TYPE` location
+	(a filter with no patterns isn't registered).
+	"""
+	if include or exclude:
+		_member_filters[tar_package_type] = MemberFilter(include, exclude)
+
+# Utility / Helper function - 2.
+def filter_for(tar_package_type):
+	"""
+	Returns the member filter of the packages extracted to the `TAR_PACKAGE_TYPE` location, or `NONE`.
+	"""
+	return _member_filters.get(tar_package_type)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+
+# This module houses the mirror selection for the package downloads.
+# The Apache packages are published under the same layout on several hosts
+# (for eg., the `dlcdn.apache.org` CDN and `archive.apache.org`), listed in the
+# `MIRROR_URLS` of each component. The time-to-first-byte and the throughput of
+# each host are kept on-disk, and the download starts on the best host. When the
+# first byte is overdue (a percentile of the host's own history), a hedged request
+# goes to the next-best host, and whichever answers first wins. The loser is closed.
+# A failed request fails over to the next host straight away.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO and cache configurations modules.
+import helpers.BuildConfig.IO.IOConfig, helpers.BuildConfig.Cache.CacheConfig
+
+# Import the deadlines, the raced requests run within the time budget of the caller.
+import helpers.Utilities.DeadlineUtility
+
+# Import the `CONCURRENT.FUTURES` module, the raced requests run in their own threads.
+import concurrent.futures
+
+# Import the `JSON` module to persist the mirror history on-disk.
+import json
+
+# Import the `OS` module for the file-system operations.
+import os
+
+# Import the `THREADING` module, as the history is shared between the downloader threads.
+import threading
+
+# Import the `TIME` module to measure the first byte and the throughput.
+import time
+
+# Currently making use of `URLLIB` for the `REQUEST` / `ERROR` objects.
+from urllib.request import Request
+from urllib.error   import URLError, HTTPError
+from urllib.parse   import urlsplit
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+MIRROR_UTILITY_LOGGER_NAME = '.MirrorUtility'
+
+# Get the Logger Instance for the module.
+mirror_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+											MIRROR_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Utility / Helper function - 0.
+def host_of(url):
+	"""
+	Returns the `SCHEME://HOST[:PORT]` the history of the URI is kept under.
+	"""
+	url_parts = urlsplit(url)
+	return url_parts.scheme + '://' + url_parts.netloc
+
+# Utility / Helper function - 1.
+def is_host_failure(request_error):
+	"""
+	Tells whether the error counts against the health of the host: a connection failure,
+	a timeout, a throttling (`429`) or a server error (`5xx`). A missing package (for eg.,
+	an old release gone from the CDN) doesn't.
+	"""
+	return not isinstance(request_error, HTTPError) or request_error.code >= 500 or request_error.code == 429
+
+##############################################################
+# The section below contains the Class Definition for the
+# mirror selector.
+##############################################################
+
+class MirrorSelector(object):
+	"""
+	Ranks the mirrors of a package from their on-disk history (time-to-first-byte
+	samples, throughput and consecutive failures), and races them with hedged requests.
+	"""
+
+	def __init__(self, history_file):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.history_file = history_file
+
+		# <::PROTECTED_ATTRIBUTE::>
+		self._history = None
+		self._dirty   = False
+		self._lock    = threading.Lock()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _host_entry(self, url):
+		# The history is loaded once, on first use. Callers hold the lock.
+		if self._history is None:
+			try:
+				with open(self.history_file, 'r') as history_object:
+					self._history = json.load(history_object)
+			except (IOError, OSError, ValueError):
+				self._history = {}
+		return self._history.setdefault(host_of(url), {'first_byte': [], 'throughput': None, 'failures': 0})
+
+	def flush(self):
+		"""
+		Persist the history (If Changed).
+		"""
+		with self._lock:
+			if not self._dirty:
+				return
+			os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+			temporary_history_file = self.history_file + '.' + str(os.getpid()) + '.tmp'
+			with open(temporary_history_file, 'w') as history_object:
+				json.dump(self._history, history_object, indent=1, sort_keys=True)
+			os.replace(temporary_history_file, self.history_file)
+			self._dirty = False
+
+	def record_first_byte(self, url, elapsed_seconds):
+		"""
+		Record the time-to-first-byte (the response headers) of a request to the host.
+		"""
+		with self._lock:
+			host_entry = self._host_entry(url)
+			host_entry['first_byte'] = (host_entry['first_byte'] +
+										[round(elapsed_seconds, 4)])[-helpers.BuildConfig.IO.IOConfig.MIRROR_HISTORY_SAMPLES:]
+			host_entry['failures']   = 0
+			self._dirty = True
+
+	def record_throughput(self, url, transferred_bytes, elapsed_seconds):
+		"""
+		Record the throughput (in bytes per second) of a transfer from the host.
+		"""
+		if transferred_bytes <= 0 or elapsed_seconds <= 0:
+			return
+		with self._lock:
+			host_entry = self._host_entry(url)
+			transfer_throughput      = transferred_bytes / elapsed_seconds
+			host_entry['throughput'] = transfer_throughput if host_entry['throughput'] is None else \
+											0.7 * host_entry['throughput'] + 0.3 * transfer_throughput
+			self._dirty = True
+
+	def record_failure(self, url):
+		"""
+		Record a failed request to the host. The host is ranked last until it answers again.
+		"""
+		with self._lock:
+			self._host_entry(url)['failures'] += 1
+			self._dirty = True
+
+	def estimate(self, url):
+		"""
+		Returns the estimated seconds to fetch `MIRROR_RANK_SIZE` bytes from the host
+		(the median first byte, plus the transfer at the recorded throughput), or `NONE`
+		for a host without history.
+		"""
+		with self._lock:
+			host_entry = self._host_entry(url)
+			if not host_entry['first_byte']:
+				return None
+			estimate_seconds = sorted(host_entry['first_byte'])[len(host_entry['first_byte']) // 2]
+			if host_entry['throughput']:
+				estimate_seconds += helpers.BuildConfig.IO.IOConfig.MIRROR_RANK_SIZE / host_entry['throughput']
+			return estimate_seconds
+
+	def hedge_delay(self, url):
+		"""
+		Returns how long to wait for the first byte from the host, before hedging:
+		the `MIRROR_HEDGE_PERCENTILE` of its first byte samples, within the
+		`MIRROR_HEDGE_MIN_DELAY` and `MIRROR_HEDGE_MAX_DELAY` bounds.
+		Without enough samples, `MIRROR_HEDGE_DELAY`.
+		"""
+		with self._lock:
+			first_byte_samples = sorted(self._host_entry(url)['first_byte'])
+		if len(first_byte_samples) < helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_MIN_SAMPLES:
+			return helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_DELAY
+
+		sample_index = min(len(first_byte_samples) - 1,
+							int(len(first_byte_samples) * helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_PERCENTILE / 100))
+		return min(max(first_byte_samples[sample_index], helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_MIN_DELAY),
+					helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_MAX_DELAY)
+
+	def candidate_requests(self, request_object, mirror_urls):
+		"""
+		Returns the requests for the package on each of the `MIRROR_URLS`, best first.
+		The package URI is expected under one of the mirrors (for eg., the `ARCHIVE_URL`),
+		else (or with `MIRROR_SELECTION_ENABLED` off) it is the only candidate.
+		The hosts without history come first (in the configured order), to be measured.
+		"""
+		target_url   = request_object.full_url
+		mirror_base  = next((mirror_url for mirror_url in mirror_urls or [] if target_url.startswith(mirror_url + '/')), None)
+		if mirror_base is None or not helpers.BuildConfig.IO.IOConfig.MIRROR_SELECTION_ENABLED:
+			return [request_object]
+
+		def rank_key(mirror_index):
+			mirror_url       = mirror_urls[mirror_index]
+			estimate_seconds = self.estimate(mirror_url)
+			with self._lock:
+				host_failures = self._host_entry(mirror_url)['failures']
+			return (host_failures, estimate_seconds is not None, estimate_seconds or 0, mirror_index)
+
+		request_headers = dict(request_object.header_items())
+		return [Request(mirror_urls[mirror_index] + target_url[len(mirror_base):], headers=request_headers)
+					for mirror_index in sorted(range(len(mirror_urls)), key=rank_key)]
+
+	def open_hedged(self, request_object, mirror_urls, urlopen_function):
+		"""
+		Open the package on the best mirror, hedging it (up to `MIRROR_MAX_HEDGES` times)
+		with the next-best one when the first byte is overdue. A failed request fails
+		over to the next mirror straight away.
+		Returns a tuple of `(RESPONSE, REQUEST)` for the mirror that answered first.
+		The raced requests that lose are closed.
+		"""
+		pending_requests = self.candidate_requests(request_object, mirror_urls)
+		if len(pending_requests) == 1:
+			return urlopen_function(request_object), request_object
+
+		race_executor   = concurrent.futures.ThreadPoolExecutor(max_workers=len(pending_requests),
+																	thread_name_prefix='MirrorRace')
+		running_futures = {}
+		hedge_count     = 0
+		last_error      = None
+
+		def timed_urlopen(candidate_request):
+			request_start = time.perf_counter()
+			try:
+				candidate_response = urlopen_function(candidate_request)
+			except (URLError, HTTPError, IOError, OSError) as mirrorUtility_open_hedged_error:
+				if is_host_failure(mirrorUtility_open_hedged_error):
+					self.record_failure(candidate_request.full_url)
+				raise
+			self.record_first_byte(candidate_request.full_url, time.perf_counter() - request_start)
+			return candidate_response
+
+		timed_urlopen = helpers.Utilities.DeadlineUtility.propagate(timed_urlopen)
+
+		def launch():
+			candidate_request = pending_requests.pop(0)
+			running_futures[race_executor.submit(timed_urlopen, candidate_request)] = candidate_request
+			return candidate_request
+
+		try:
+			latest_request = launch()
+			while running_futures:
+				hedge_timeout = self.hedge_delay(latest_request.full_url) \
+									if pending_requests and hedge_count < helpers.BuildConfig.IO.IOConfig.MIRROR_MAX_HEDGES else None
+				done_futures, _ = concurrent.futures.wait(running_futures, timeout=hedge_timeout,
+															return_when=concurrent.futures.FIRST_COMPLETED)
+				if not done_futures:
+					# Logging a comment
+					mirror_utility_logger.info('First Byte overdue from URI: {' + latest_request.full_url + '} after {' +
+												str(round(hedge_timeout, 3)) + '}s. Hedging with URI: {' +
+												pending_requests[0].full_url + '}')
+					hedge_count   += 1
+					latest_request = launch()
+					continue
+
+				race_winner = None
+				for done_future in done_futures:
+					candidate_request = running_futures.pop(done_future)
+					try:
+						candidate_response = done_future.result()
+					except (URLError, HTTPError, IOError, OSError) as mirrorUtility_open_hedged_error:
+						# Logging a comment
+						mirror_utility_logger.warning('Mirror Request Failed for URI: {' + candidate_request.full_url + '}: ' +
+														str(mirrorUtility_open_hedged_error))
+						last_error = mirrorUtility_open_hedged_error
+						continue
+					if race_winner is None:
+						race_winner = (candidate_response, candidate_request)
+					else:
+						candidate_response.close()
+
+				if race_winner is not None:
+					# Logging a comment
+					mirror_utility_logger.info('Mirror Selected for the Download: {' + race_winner[1].full_url + '}')
+					return race_winner
+
+				# Fail over to the next mirror.
+				if not running_futures and pending_requests:
+					latest_request = launch()
+			raise last_error
+		finally:
+			# The losers still running are closed as soon as they answer.
+			for running_future in running_futures:
+				running_future.add_done_callback(_close_response)
+			race_executor.shutdown(wait=False)
+			self.flush()
+
+# Utility / Helper function - 2.
+def _close_response(response_future):
+	"""
+	Close the response of a raced request that lost.
+	"""
+	if not response_future.cancelled() and response_future.exception() is None:
+		response_future.result().close()
+
+# The mirror selector instance shared by all the downloaders.
+shared_mirror_selector = MirrorSelector(helpers.BuildConfig.Cache.CacheConfig.MIRROR_HISTORY_FILE)
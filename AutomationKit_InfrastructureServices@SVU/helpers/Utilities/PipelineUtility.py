@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+
+# This module houses the dependency-graph (`DAG`) scheduler of the build pipelines.
+# A build is broken down into stages (for eg., the download, the extraction and the
+# build of each component), each with the stages it requires. A stage is started as
+# soon as all of its requirements are done, instead of waiting for the slowest
+# component of the previous phase. The total time is thus set by the critical path
+# of the graph, which is reported once the pipeline completes.
+# With a workflow journal (see `JournalUtility`), the stages recorded by an earlier run
+# (for the same inputs, and with their artifacts still on-disk) are completed from the
+# journal, instead of being run again.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the dependency graph helpers, to order the stages and size the executor.
+import helpers.Utilities.DependencyUtility
+
+# Import the stage timings, each stage is traced.
+import helpers.Utilities.TraceUtility
+
+# Import the cancellation tokens, to cancel the stages in flight once a stage failed.
+import helpers.Utilities.CancellationUtility
+
+# Import the workflow journal, to resume the pipeline at its first incomplete stage.
+import helpers.Utilities.JournalUtility
+
+# Import the `CONCURRENT.FUTURES` module, the stages run on a bounded executor.
+import concurrent.futures
+
+# Import the `TIME` module to time the stages.
+import time
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+PIPELINE_UTILITY_LOGGER_NAME = '.PipelineUtility'
+
+# Get the Logger Instance for the module.
+pipeline_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												PIPELINE_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+class PipelineError(helpers.Utilities.DependencyUtility.DependencyError):
+	"""
+	Raised for a malformed pipeline (an unknown requirement, or a cycle).
+	"""
+
+##############################################################
+# The section below contains the Class Definitions for the
+# pipeline stages and their scheduler.
+##############################################################
+
+class PipelineStage(object):
+	"""
+	A unit of work of the pipeline. The `STAGE_FUNCTION` is called with the dictionary of
+	`STAGE NAME -> RESULT` of the stages completed so far (its requirements among them).
+	The (`JSON` serializable) `INPUTS` and the `ARTIFACTS` (a function of the stage result,
+	returning the paths it left on-disk) are recorded in the workflow journal (If Any).
+	"""
+
+	def __init__(self, stage_name, stage_function, requires=(), inputs=None, artifacts=None):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.stage_name     = stage_name
+		self.stage_function = stage_function
+		self.requires       = tuple(requires)
+		self.artifacts      = artifacts
+
+		# The inputs are fingerprinted right away, as the configuration they are taken
+		# from may be changed by the stages run before this one.
+		self.inputs_fingerprint = helpers.Utilities.JournalUtility.fingerprint(inputs)
+		self.input_fingerprint  = None
+
+		# Timings (on the monotonic clock), once the stage ran.
+		self.start_time = None
+		self.end_time   = None
+
+	def elapsed(self):
+		return self.end_time - self.start_time
+
+class PipelineScheduler(object):
+	"""
+	Runs the stages on an executor of (up to) `MAX_WORKERS` threads, each as soon as its
+	requirements are done. A failed stage stops the pipeline from starting any other
+	stage: the stages in flight are waited for, and the (first) failure is re-raised.
+	With `FAIL_FAST`, the stages in flight are cancelled (see `CancellationUtility`) first.
+	With a `JOURNAL`, each completed stage is recorded, and the stages recorded by an earlier
+	run are completed from it.
+	"""
+
+	def __init__(self, max_workers, pipeline_name='Pipeline', fail_fast=False, journal=None):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.max_workers   = max_workers
+		self.pipeline_name = pipeline_name
+		self.fail_fast     = fail_fast
+		self.journal       = journal
+
+		# The cancellation token of the stages, within the one of the caller (If Any).
+		self.cancellation_token = helpers.Utilities.CancellationUtility.CancellationToken(
+										parent=helpers.Utilities.CancellationUtility.current(), label=pipeline_name)
+
+		# The stages, in the order they were added. <::PROTECTED_ATTRIBUTE::>
+		self._stages = {}
+
+	def add_stage(self, stage_name, stage_function, requires=(), inputs=None, artifacts=None):
+		"""
+		Add a stage, requiring the (already added or not) stages named in `REQUIRES`.
+		"""
+		self._stages[stage_name] = PipelineStage(stage_name, stage_function, requires, inputs, artifacts)
+
+	def topological_order(self):
+		"""
+		Returns the stage names, each after all of its requirements (in the order the
+		stages were added, otherwise). Raises `PipelineError` for an unknown requirement,
+		or a cycle.
+		"""
+		try:
+			return helpers.Utilities.DependencyUtility.topological_order(self.stage_graph(), node_label='Stage')
+		except helpers.Utilities.DependencyUtility.DependencyError as pipelineUtility_topologicalOrder_error:
+			raise PipelineError(str(pipelineUtility_topologicalOrder_error)) from pipelineUtility_topologicalOrder_error
+
+	def stage_graph(self):
+		"""
+		Returns the dictionary of `STAGE NAME -> REQUIRED STAGE NAMES`.
+		"""
+		return {stage_name: pipeline_stage.requires for stage_name, pipeline_stage in self._stages.items()}
+
+	def run(self):
+		"""
+		Run the pipeline. Returns the dictionary of `STAGE NAME -> RESULT`.
+		"""
+		# Validate the graph upfront, so that a malformed pipeline doesn't start at all.
+		self.topological_order()
+
+		stage_results   = {}
+		running_futures = {}
+
+		# The fingerprints of the stage results, for the inputs of the stages requiring them.
+		output_fingerprints = {}
+		pipeline_error  = None
+		pipeline_start  = time.monotonic()
+
+		# No more threads than the stages that can ever be in flight together.
+		stage_executor = concurrent.futures.ThreadPoolExecutor(
+							max_workers=min(self.max_workers,
+												max(helpers.Utilities.DependencyUtility.parallel_width(self.stage_graph()), 1)),
+								thread_name_prefix=self.pipeline_name)
+
+		def launch_ready_stages():
+			started_stages = {running_stage.stage_name for running_stage in running_futures.values()}
+			for stage_name, pipeline_stage in self._stages.items():
+				if stage_name in stage_results or stage_name in started_stages:
+					continue
+				if all(required_stage in stage_results for required_stage in pipeline_stage.requires):
+					pipeline_stage.input_fingerprint = helpers.Utilities.JournalUtility.fingerprint(
+															pipeline_stage.inputs_fingerprint,
+																[output_fingerprints[required_stage]
+																	for required_stage in pipeline_stage.requires])
+
+					# Complete the stage from the journal, if an earlier run recorded it (for the same inputs).
+					journal_entry = (self.journal.lookup(stage_name, pipeline_stage.input_fingerprint)
+										if self.journal is not None else None)
+					if journal_entry is not None:
+						# Logging a comment
+						pipeline_utility_logger.info('[' + self.pipeline_name + '] Stage Resumed from Journal: {' +
+														stage_name + '}')
+						stage_results[stage_name]       = journal_entry['result']
+						output_fingerprints[stage_name] = journal_entry['output_fingerprint']
+
+						# The stages requiring it might be ready now.
+						return launch_ready_stages()
+
+					# Logging a comment
+					pipeline_utility_logger.info('[' + self.pipeline_name + '] Starting Stage: {' + stage_name + '}')
+					running_futures[stage_executor.submit(self._run_stage, pipeline_stage, dict(stage_results),
+															self.cancellation_token)] = pipeline_stage
+
+		try:
+			launch_ready_stages()
+			while running_futures:
+				done_futures, _ = concurrent.futures.wait(running_futures, return_when=concurrent.futures.FIRST_COMPLETED)
+				for done_future in done_futures:
+					pipeline_stage = running_futures.pop(done_future)
+					try:
+						stage_result = done_future.result()
+					except helpers.Utilities.CancellationUtility.TaskCancelledError as pipelineUtility_run_error:
+						# Logging a comment
+						pipeline_utility_logger.warning('[' + self.pipeline_name + '] Stage Cancelled: {' + pipeline_stage.stage_name + '}')
+						if pipeline_error is None:
+							pipeline_error = pipelineUtility_run_error
+						continue
+					except Exception as pipelineUtility_run_error:
+						# Put logging below.
+						pipeline_utility_logger.error('[' + self.pipeline_name + '] Stage Failed: {' + pipeline_stage.stage_name +
+														'}: ' + str(pipelineUtility_run_error))
+						if pipeline_error is None:
+							pipeline_error = pipelineUtility_run_error
+
+						# Fail fast: cancel the stages in flight, instead of waiting for them.
+						if self.fail_fast:
+							self.cancellation_token.cancel('Stage {' + pipeline_stage.stage_name + '} Failed')
+						continue
+
+					stage_results[pipeline_stage.stage_name]       = stage_result
+					output_fingerprints[pipeline_stage.stage_name] = self._record_stage(pipeline_stage, stage_result)
+
+					# Logging a comment
+					pipeline_utility_logger.info('[' + self.pipeline_name + '] Stage Completed: {' + pipeline_stage.stage_name +
+													'} in {' + str(round(pipeline_stage.elapsed(), 3)) + '}s')
+
+				# Start the stages unblocked by the completed ones, unless the pipeline failed.
+				if pipeline_error is None:
+					launch_ready_stages()
+		finally:
+			stage_executor.shutdown(wait=False)
+
+		if pipeline_error is not None:
+			raise pipeline_error
+
+		# Logging a comment
+		pipeline_utility_logger.info('[' + self.pipeline_name + '] Pipeline Completed in {' +
+										str(round(time.monotonic() - pipeline_start, 3)) + '}s. Critical Path: ' +
+											' -> '.join(pipeline_stage.stage_name + ' (' + str(round(pipeline_stage.elapsed(), 3)) + 's)'
+														for pipeline_stage in self.critical_path()))
+		return stage_results
+
+	def critical_path(self):
+		"""
+		Returns the stages (that ran) on the critical path: from the stage that completed
+		last, back through the requirement that completed last, at each step. The stages
+		completed from the journal aren't on it.
+		"""
+		completed_stages = [pipeline_stage for pipeline_stage in self._stages.values() if pipeline_stage.end_time is not None]
+		if not completed_stages:
+			return []
+
+		critical_stages = [max(completed_stages, key=lambda pipeline_stage: pipeline_stage.end_time)]
+		while True:
+			required_stages = [self._stages[required_stage] for required_stage in critical_stages[0].requires
+									if self._stages[required_stage].end_time is not None]
+			if not required_stages:
+				return critical_stages
+			critical_stages.insert(0, max(required_stages, key=lambda pipeline_stage: pipeline_stage.end_time))
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _record_stage(self, pipeline_stage, stage_result):
+		# Record the completed stage in the journal (If Any). Returns the fingerprint of its result.
+		if self.journal is None:
+			return helpers.Utilities.JournalUtility.fingerprint(stage_result)
+
+		artifact_paths = pipeline_stage.artifacts(stage_result) if pipeline_stage.artifacts is not None else ()
+		try:
+			return self.journal.record(pipeline_stage.stage_name, pipeline_stage.input_fingerprint, stage_result,
+										artifact_paths)['output_fingerprint']
+		except (IOError, OSError) as pipelineUtility_recordStage_error:
+			# Put logging below. A journal that can't be written only costs the resume, not the build.
+			pipeline_utility_logger.warning('[' + self.pipeline_name + '] Could not journal the Stage: {' +
+												pipeline_stage.stage_name + '}: ' + str(pipelineUtility_recordStage_error))
+			return helpers.Utilities.JournalUtility.fingerprint(stage_result)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	@staticmethod
+	def _run_stage(pipeline_stage, stage_results, cancellation_token):
+		# The managers (and the builds) of the stage run within the token of the pipeline.
+		helpers.Utilities.CancellationUtility.bind(cancellation_token)
+		pipeline_stage.start_time = time.monotonic()
+		try:
+			with helpers.Utilities.TraceUtility.span(pipeline_stage.stage_name):
+				return pipeline_stage.stage_function(stage_results)
+		finally:
+			pipeline_stage.end_time = time.monotonic()
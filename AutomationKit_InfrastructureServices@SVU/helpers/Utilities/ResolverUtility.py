@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+# This module houses the persistent cache for the latest-version resolutions.
+# Resolving a component (scraping its download page, building the next URI,
+# and scraping again) only yields the URI of its "*.tar.gz" package, and is
+# pure latency in front of the download. The resolved package URI (and the
+# version it carries) is kept on-disk for `RESOLUTION_CACHE_TTL` seconds, so a
+# warm run goes straight to the package (or straight to the `ARTIFACT` cache).
+# `RESOLUTION_CACHE_REFRESH` (the `--refresh` option of the build scripts)
+# forces the re-resolution.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the cache configurations module.
+import helpers.BuildConfig.Cache.CacheConfig
+
+# Import the stage timings, the resolutions are traced.
+import helpers.Utilities.TraceUtility
+
+# Import the `JSON` module to persist the resolutions on-disk.
+import json
+
+# Import the `OS` module for the file-system operations.
+import os
+
+# Import the `THREADING` module, as the cache is shared between the downloader threads.
+import threading
+
+# Import the `TIME` module to expire the resolutions.
+import time
+
+# The below module takes care of Regular Expression(s).
+import re
+
+# Currently making use of `URLLIB` for the `ERROR` objects.
+from urllib.error import HTTPError
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+RESOLVER_UTILITY_LOGGER_NAME = '.ResolverUtility'
+
+# Get the Logger Instance for the module.
+resolver_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+												RESOLVER_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# The version carried by a package name, for eg., "8.5.15" in "apache-tomcat-8.5.15.tar.gz"
+# or "8u131" in "jdk-8u131-linux-x64.tar.gz".
+VERSION_PATTERN = r'\d+(?:[.u]\d+)+'
+
+# Utility / Helper function - 0.
+def version_of(tar_url):
+	"""
+	Returns the version carried by the package URI, or `NONE`.
+	"""
+	version_match = re.search(VERSION_PATTERN, tar_url.rsplit('/', 1)[-1])
+	return version_match.group(0) if version_match is not None else None
+
+##############################################################
+# The section below contains the Class Definition for the
+# persistent resolution cache.
+##############################################################
+
+class ResolutionCache(object):
+	"""
+	On-disk cache of the `COMPONENT -> RESOLVED PACKAGE URI` mappings.
+	Each entry also records the resolution inputs (the configured URIs and
+	patterns), so that a configuration change invalidates it.
+	"""
+
+	def __init__(self, cache_file):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.cache_file = cache_file
+
+		# Statistics for the resolution report.
+		self.hits   = 0
+		self.misses = 0
+
+		# Guards the cache file within the process. <::PROTECTED_ATTRIBUTE::>
+		self._lock = threading.Lock()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _load(self):
+		try:
+			with open(self.cache_file, 'r') as cache_object:
+				return json.load(cache_object)
+		except (IOError, OSError, ValueError):
+			return {}
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _save(self, resolutions):
+		os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+		temporary_cache_file = self.cache_file + '.' + str(os.getpid()) + '.tmp'
+		with open(temporary_cache_file, 'w') as cache_object:
+			json.dump(resolutions, cache_object, indent=1, sort_keys=True)
+		os.replace(temporary_cache_file, self.cache_file)
+
+	def lookup(self, component, resolution_inputs):
+		"""
+		Returns the cached package URI for the component, or `NONE` when there
+		isn't a fresh one (or the re-resolution is forced).
+		"""
+		if not helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_ENABLED or \
+				helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_REFRESH:
+			return None
+
+		with self._lock:
+			cache_entry = self._load().get(component)
+
+		if cache_entry is None or cache_entry.get('inputs') != list(resolution_inputs):
+			return None
+		if time.time() - cache_entry.get('resolved_at', 0) > helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_TTL:
+			return None
+
+		# Logging a comment
+		resolver_utility_logger.info('Resolution served from Cache for Component: {' + component + '}, Version: {' +
+										str(cache_entry.get('version')) + '}, URI: {' + cache_entry['tar_url'] + '}')
+		return cache_entry['tar_url']
+
+	def record(self, component, resolution_inputs, tar_url):
+		"""
+		Record the package URI resolved for the component.
+		"""
+		if not helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_ENABLED:
+			return
+
+		with self._lock:
+			resolutions = self._load()
+			resolutions[component] = {'inputs'     : list(resolution_inputs),
+										'tar_url'    : tar_url,
+										'version'    : version_of(tar_url),
+										'resolved_at': time.time()}
+			self._save(resolutions)
+
+	def invalidate(self, component):
+		"""
+		Drop the cached resolution for the component (If Any).
+		"""
+		with self._lock:
+			resolutions = self._load()
+			if resolutions.pop(component, None) is not None:
+				self._save(resolutions)
+
+				# Logging a comment
+				resolver_utility_logger.warning('Cached Resolution discarded for Component: {' + component + '}')
+
+	def resolve(self, component, resolution_inputs, resolve_function):
+		"""
+		Returns the package URI for the component: the cached one while it is fresh,
+		else the one returned by `RESOLVE_FUNCTION` (which is then recorded).
+		"""
+		with helpers.Utilities.TraceUtility.span('resolve', component) as span_args:
+			tar_url = self.lookup(component, resolution_inputs)
+			span_args['cached'] = tar_url is not None
+			if tar_url is not None:
+				self.hits += 1
+				return tar_url
+
+			self.misses += 1
+			tar_url = resolve_function()
+			self.record(component, resolution_inputs, tar_url)
+			return tar_url
+
+	def discard_stale(self, component, download_error):
+		"""
+		A package that is gone (`404` / `410`) means the cached resolution went stale
+		(for eg., the release moved out of the mirror). It is dropped, so that the
+		retry resolves the component again.
+		"""
+		if isinstance(download_error, HTTPError) and download_error.code in (404, 410):
+			self.invalidate(component)
+
+# The resolution cache instance shared by all the downloader threads.
+shared_resolution_cache = ResolutionCache(helpers.BuildConfig.Cache.CacheConfig.RESOLUTION_CACHE_FILE)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# This module houses the persistent response cache for the version-discovery
+# (index) pages scraped by the `WebUtility.get_link` helper.
+# Each page body is stored along with its `ETag` / `Last-Modified` validators,
+# so that the next request can be made conditional (`If-None-Match` /
+# `If-Modified-Since`) and the body is only transferred when the page changed.
+# As the pages are scanned as they stream in, only the part of the body read
+# before the link was found may be stored. Such entries are flagged incomplete.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the cache configurations module.
+import helpers.BuildConfig.Cache.CacheConfig
+
+# Import the `HASHLIB` module to derive the on-disk entry names from the URLs.
+import hashlib
+
+# Import the `JSON` module to persist the validators on-disk.
+import json
+
+# Import the `OS` module for the file-system operations.
+import os
+
+# Import the `THREADING` module, as the cache is shared between the downloader threads.
+import threading
+
+# Import the `TIME` module to note when a page was last fetched.
+import time
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+RESPONSE_CACHE_UTILITY_LOGGER_NAME = '.ResponseCacheUtility'
+
+# Get the Logger Instance for the module.
+response_cache_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													RESPONSE_CACHE_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+##############################################################
+# The section below contains the Class Definition for the
+# persistent (revalidating) response cache.
+##############################################################
+
+class ResponseCache(object):
+	"""
+	On-disk cache for the index pages. Every URL maps to two files under the
+	cache directory: `<URL-DIGEST>.json` holding the validators and
+	`<URL-DIGEST>.body` holding the decoded page body.
+	"""
+
+	def __init__(self, cache_directory):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.cache_directory = cache_directory
+
+		# Statistics for the revalidation report.
+		self.revalidated = 0
+		self.refreshed   = 0
+
+		# Guards the on-disk entries within the process. <::PROTECTED_ATTRIBUTE::>
+		self._lock = threading.Lock()
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _entry_location(self, url):
+		url_digest = hashlib.sha256(url.encode('UTF-8')).hexdigest()
+		return os.path.join(self.cache_directory, url_digest)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _load_validators(self, url):
+		try:
+			with open(self._entry_location(url) + '.json', 'r') as validators_object:
+				validators = json.load(validators_object)
+		except (IOError, OSError, ValueError):
+			return None
+
+		# The validators are only usable while the body is still around.
+		if validators.get('url') != url or not os.path.exists(self._entry_location(url) + '.body'):
+			return None
+		return validators
+
+	def conditional_headers(self, url):
+		"""
+		Returns the `If-None-Match` / `If-Modified-Since` headers to send for the URL.
+		An empty dictionary is returned for an uncached URL.
+		"""
+		with self._lock:
+			validators = self._load_validators(url)
+
+		request_headers = {}
+		if validators is not None:
+			if validators.get('etag'):
+				request_headers['If-None-Match'] = validators['etag']
+			if validators.get('last_modified'):
+				request_headers['If-Modified-Since'] = validators['last_modified']
+		return request_headers
+
+	def load(self, url):
+		"""
+		Returns a tuple of `(BODY, COMPLETE)` for the URL (served on a `304 Not Modified`),
+		or `NONE` when there isn't one. `COMPLETE` is `FALSE` when only the start of
+		the body was stored.
+		"""
+		with self._lock:
+			validators = self._load_validators(url)
+			if validators is None:
+				return None
+			with open(self._entry_location(url) + '.body', 'r', encoding='UTF-8') as body_object:
+				content_body = body_object.read()
+			self.revalidated += 1
+
+		# Logging a comment
+		response_cache_utility_logger.info('Response Cache REVALIDATED for URI: {' + url + '}')
+
+		# The entries stored before the prefix support hold full bodies.
+		return content_body, validators.get('complete', True)
+
+	def save(self, url, response_headers, content_body, complete=True):
+		"""
+		Store the body and the validators of a fresh (`200 OK`) response.
+		Pass `COMPLETE` as `FALSE` when the body is only the start of the page.
+		Responses carrying neither an `ETag` nor a `Last-Modified` header can't
+		be revalidated, hence are not stored.
+		"""
+		etag          = response_headers.get('ETag')
+		last_modified = response_headers.get('Last-Modified')
+		if not etag and not last_modified:
+			return
+
+		with self._lock:
+			os.makedirs(self.cache_directory, exist_ok=True)
+			entry_location = self._entry_location(url)
+
+			# Write the body first and the validators last (both via a rename), so a
+			# crash in between never leaves validators pointing to a stale body.
+			with open(entry_location + '.body.tmp', 'w', encoding='UTF-8') as body_object:
+				body_object.write(content_body)
+			os.replace(entry_location + '.body.tmp', entry_location + '.body')
+
+			with open(entry_location + '.json.tmp', 'w') as validators_object:
+				json.dump({'url': url, 'etag': etag, 'last_modified': last_modified, 'fetched_at': time.time(),
+							'complete': complete}, validators_object)
+			os.replace(entry_location + '.json.tmp', entry_location + '.json')
+			self.refreshed += 1
+
+		# Logging a comment
+		response_cache_utility_logger.info('Response Cache STORE for URI: {' + url + '}')
+
+	def discard(self, url):
+		"""
+		Drop the cached entry for the URL.
+		"""
+		with self._lock:
+			for entry_suffix in ('.json', '.body'):
+				try:
+					os.remove(self._entry_location(url) + entry_suffix)
+				except OSError:
+					pass
+
+# The cache instance shared by all the downloader threads.
+shared_response_cache = ResponseCache(helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_DIRECTORY)
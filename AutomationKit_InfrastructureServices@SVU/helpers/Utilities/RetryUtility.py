@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+# This module houses the retry policy of the `DOWNLOAD_MANAGER`, and the circuit
+# breakers of the upstream hosts.
+# The failed components are retried after an exponential back-off, with a random
+# jitter, so that the retries of a fleet of nodes don't hit a struggling host in
+# lockstep. A `Retry-After` from the host is waited out first.
+# Several components share a host (for eg., `APR` and `APR-UTIL` are both served
+# by `apr.apache.org`), hence the health of the hosts is tracked once, by the
+# requests themselves: after a run of consecutive failures, the circuit of the host
+# opens, and its requests fail straight away (without hitting it) for a cool-down.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO configurations module, which holds the circuit breaker options.
+import helpers.BuildConfig.IO.IOConfig
+
+# Import the mirror selection, for the host of a URI and the failures that count against it.
+import helpers.Utilities.MirrorUtility
+
+# Import the `RANDOM` module for the jitter.
+import random
+
+# Import the `THREADING` module, as the circuits are shared between the downloader threads.
+import threading
+
+# Import the `TIME` module for the monotonic clock.
+import time
+
+# Import the `EMAIL.UTILS` and `DATETIME` modules, to parse the `HTTP-date` form of `Retry-After`.
+import email.utils
+from datetime import datetime, timezone
+
+# Currently making use of `URLLIB` for the `ERROR` objects.
+from urllib.error import URLError, HTTPError
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+RETRY_UTILITY_LOGGER_NAME = '.RetryUtility'
+
+# Get the Logger Instance for the module.
+retry_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+											RETRY_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+class CircuitOpenError(URLError):
+	"""
+	Raised (instead of sending the request) while the circuit of the host is open.
+	`RETRY_AFTER` holds the seconds left until the requests to the host are let through again.
+	"""
+
+	def __init__(self, host, retry_after):
+		super().__init__('Circuit Open for Host: {' + host + '}, retry after {' + str(round(retry_after, 3)) + '}s')
+		self.retry_after = retry_after
+
+# Utility / Helper function - 0.
+def retry_after_of(request_error):
+	"""
+	Returns the seconds to wait before retrying the failed request, as asked for by the
+	host (the `Retry-After` header, in seconds or as an `HTTP-date`) or by its open
+	circuit, else `NONE`.
+	"""
+	if isinstance(request_error, CircuitOpenError):
+		return request_error.retry_after
+	if not isinstance(request_error, HTTPError) or request_error.headers is None:
+		return None
+
+	retry_after = request_error.headers.get('Retry-After')
+	if retry_after is None:
+		return None
+	retry_after = retry_after.strip()
+	if retry_after.isdigit():
+		return float(retry_after)
+
+	try:
+		retry_at = email.utils.parsedate_to_datetime(retry_after)
+	except (TypeError, ValueError):
+		return None
+	if retry_at.tzinfo is None:
+		retry_at = retry_at.replace(tzinfo=timezone.utc)
+	return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+##############################################################
+# The section below contains the Class Definitions for the
+# retry policy and the circuit breaker.
+##############################################################
+
+class RetryPolicy(object):
+	"""
+	Exponential back-off with "full jitter": the n-th retry waits a random delay of up to
+	`BASE_DELAY * MULTIPLIER ** (n - 1)` seconds (at most `MAX_DELAY`), and at least the
+	`Retry-After` asked for (If Any).
+	"""
+
+	def __init__(self, base_delay, multiplier, max_delay):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.base_delay = base_delay
+		self.multiplier = multiplier
+		self.max_delay  = max_delay
+
+	def delay(self, retry_count, retry_after=None):
+		"""
+		Returns the seconds to wait before the `RETRY_COUNT`-th retry, or `NONE` when the
+		`RETRY_AFTER` is beyond `MAX_DELAY` (the host is down for longer than is worth
+		waiting, hence the retry should fail fast instead).
+		"""
+		if retry_after is not None and retry_after > self.max_delay:
+			return None
+		backoff_ceiling = min(self.base_delay * self.multiplier ** max(retry_count - 1, 0), self.max_delay)
+		return max(random.uniform(0, backoff_ceiling), retry_after or 0)
+
+class CircuitBreaker(object):
+	"""
+	Tracks the consecutive failures per host. The circuit of a host opens after
+	`FAILURE_THRESHOLD` of them, and the requests to the host fail fast (with
+	`CircuitOpenError`) for `RESET_TIMEOUT` seconds. A single probe request is then
+	let through (the circuit is "half-open"), while the others keep failing fast:
+	an answer from the host closes the circuit, and a failure opens it again.
+	Hence a host that stays down gets a single request per `RESET_TIMEOUT`.
+	A probe with no outcome recorded (for eg., cancelled before it was sent) is
+	given up on after `RESET_TIMEOUT` seconds, and another one let through.
+	"""
+
+	def __init__(self, failure_threshold, reset_timeout):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		self.failure_threshold = failure_threshold
+		self.reset_timeout     = reset_timeout
+
+		# `HOST -> {FAILURES, OPENED_AT, PROBED_AT}`. <::PROTECTED_ATTRIBUTE::>
+		self._circuits = {}
+		self._lock     = threading.Lock()
+
+	def before_request(self, url):
+		"""
+		Raise `CircuitOpenError` while the circuit of the host is open (or while
+		another request probes it). Let the request through otherwise.
+		"""
+		if not helpers.BuildConfig.IO.IOConfig.CIRCUIT_BREAKER_ENABLED:
+			return
+		host = helpers.Utilities.MirrorUtility.host_of(url)
+		with self._lock:
+			host_circuit = self._circuits.get(host)
+			if host_circuit is None or host_circuit['opened_at'] is None:
+				return
+
+			retry_after = host_circuit['opened_at'] + self.reset_timeout - time.monotonic()
+			if retry_after <= 0:
+				# Half-Open: the cool-down is over, let a single request probe the host.
+				if host_circuit['probed_at'] is None or host_circuit['probed_at'] + self.reset_timeout <= time.monotonic():
+					host_circuit['probed_at'] = time.monotonic()
+
+					# Logging a comment
+					retry_utility_logger.info('Circuit Half-Open for Host: {' + host + '}. Probing it')
+					return
+				retry_after = host_circuit['probed_at'] + self.reset_timeout - time.monotonic()
+		raise CircuitOpenError(host, retry_after)
+
+	def record_success(self, url):
+		"""
+		Record an answer from the host (for eg., a `2xx` or a `404`). Closes its circuit.
+		"""
+		host = helpers.Utilities.MirrorUtility.host_of(url)
+		with self._lock:
+			host_circuit = self._circuits.pop(host, None)
+		if host_circuit is not None and host_circuit['opened_at'] is not None:
+			# Logging a comment
+			retry_utility_logger.info('Circuit Closed for Host: {' + host + '}')
+
+	def record_failure(self, url):
+		"""
+		Record a failed request to the host. Opens its circuit at `FAILURE_THRESHOLD`
+		consecutive failures (or at the first failure, once it has been open).
+		"""
+		host = helpers.Utilities.MirrorUtility.host_of(url)
+		with self._lock:
+			host_circuit = self._circuits.setdefault(host, {'failures': 0, 'opened_at': None, 'probed_at': None})
+			host_circuit['failures'] += 1
+			host_circuit['probed_at'] = None
+			if host_circuit['opened_at'] is None and host_circuit['failures'] < self.failure_threshold:
+				return
+			host_circuit['opened_at'] = time.monotonic()
+
+		# Logging a comment
+		retry_utility_logger.warning('Circuit Opened for Host: {' + host + '} after {' + str(host_circuit['failures']) +
+										'} consecutive Failures. Failing fast for {' + str(self.reset_timeout) + '}s')
+
+	def record_outcome(self, url, request_error=None):
+		"""
+		Record the outcome of a request to the host: a success without a `REQUEST_ERROR`,
+		else a failure if the error counts against the host (a `404` doesn't).
+		"""
+		if not helpers.BuildConfig.IO.IOConfig.CIRCUIT_BREAKER_ENABLED:
+			return
+		if request_error is None or not helpers.Utilities.MirrorUtility.is_host_failure(request_error):
+			self.record_success(url)
+		else:
+			self.record_failure(url)
+
+# The circuit breaker shared by all the downloaders.
+shared_circuit_breaker = CircuitBreaker(helpers.BuildConfig.IO.IOConfig.CIRCUIT_FAILURE_THRESHOLD,
+										helpers.BuildConfig.IO.IOConfig.CIRCUIT_RESET_TIMEOUT)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+# This module houses the segmented (multi-connection) download mode for the
+# large "*.tar.gz" packages (for eg., the `JDK` and `HTTPD` tarballs).
+# The package size is probed with a `HEAD` request, the byte range is split
+# into `N` segments, and the segments are fetched concurrently with `HTTP`
+# `Range` requests, straight into their offsets of a preallocated file.
+# The mode turns itself off for the servers that don't advertise `Accept-Ranges`.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO configurations module, which holds the segment options.
+import helpers.BuildConfig.IO.IOConfig
+
+# Import the pooled `HTTP` session layer, the segments share its connections.
+import helpers.Utilities.HttpSessionUtility
+
+# Import the deadlines, the segments run within the time budget of the caller.
+import helpers.Utilities.DeadlineUtility
+
+# Import the cancellation tokens, the segments are cancelled along with the caller
+# (and along with a failed sibling).
+import helpers.Utilities.CancellationUtility
+
+# Import the buffer helpers, to preallocate the packages.
+import helpers.Utilities.BufferUtility
+
+# Import the `OS` module for the positional (offset based) writes.
+import os
+
+# Import the `HTTP.CLIENT` module for the errors raised by a dropped connection.
+import http.client
+
+# Import the `CONCURRENT.FUTURES` module to fetch the segments concurrently.
+import concurrent.futures
+
+# Currently making use of `URLLIB` for the `REQUEST` / `ERROR` objects.
+from urllib.request import Request
+from urllib.error   import URLError, HTTPError, ContentTooShortError
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+SEGMENTED_DOWNLOAD_UTILITY_LOGGER_NAME = '.SegmentedDownloadUtility'
+
+# Get the Logger Instance for the module.
+segmented_download_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+														SEGMENTED_DOWNLOAD_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+class SegmentedDownloadError(IOError):
+	"""
+	Raised when the server doesn't honor the segment (`Range`) requests.
+	The caller falls back to the single connection download.
+	"""
+
+# Utility / Helper function - 0.
+def probe(tar_request_object):
+	"""
+	Send a `HEAD` request for the package. Returns a tuple of
+	`(CONTENT_LENGTH, ACCEPTS_RANGES, VALIDATOR)`, where the `VALIDATOR` is the
+	strong `ETag` (or the `Last-Modified` date) used to pin the segments to the
+	same version of the package.
+	"""
+	head_request_object = Request(tar_request_object.full_url, headers=dict(tar_request_object.header_items()),
+									method='HEAD')
+	head_response = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(head_request_object)
+	try:
+		response_headers = head_response.headers
+		content_length   = response_headers.get('Content-Length') if response_headers else None
+		accepts_ranges   = response_headers is not None and response_headers.get('Accept-Ranges', '').lower() == 'bytes'
+		validator        = response_headers.get('ETag') if response_headers else None
+		if not validator or validator.startswith('W/'):
+			validator = response_headers.get('Last-Modified') if response_headers else None
+		return (int(content_length) if content_length else None), accepts_ranges, validator
+	finally:
+		head_response.close()
+
+# Utility / Helper function - 1.
+def split_ranges(content_length, segment_count):
+	"""
+	Split `[0, CONTENT_LENGTH)` in (at most) `SEGMENT_COUNT` contiguous, inclusive byte ranges.
+	"""
+	segment_size = -(-content_length // segment_count)
+	return [(segment_start, min(segment_start + segment_size, content_length) - 1)
+				for segment_start in range(0, content_length, segment_size)]
+
+# Utility / Helper function - 2.
+def _fetch_segment(tar_request_object, file_descriptor, segment_start, segment_end, validator, segment_token):
+	"""
+	Fetch one byte range of the package and write it at its offset.
+	The segment gives up once the `SEGMENT_TOKEN` is cancelled (for eg., by a failed sibling).
+	"""
+	helpers.Utilities.CancellationUtility.bind(segment_token)
+
+	segment_request_object = Request(tar_request_object.full_url, headers=dict(tar_request_object.header_items()))
+	segment_request_object.add_header('Range', 'bytes=' + str(segment_start) + '-' + str(segment_end))
+	if validator:
+		segment_request_object.add_header('If-Range', validator)
+
+	segment_response = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(segment_request_object)
+	try:
+		# Anything but the exact range asked for means the server (or the package) changed underneath us.
+		content_range = segment_response.headers.get('Content-Range', '') if segment_response.headers else ''
+		if segment_response.getcode() != 206 or \
+				not content_range.startswith('bytes ' + str(segment_start) + '-' + str(segment_end) + '/'):
+			raise SegmentedDownloadError('Server did not honor the Range: {' + str(segment_start) + '-' +
+											str(segment_end) + '}')
+
+		write_offset = segment_start
+		while write_offset <= segment_end:
+			helpers.Utilities.DeadlineUtility.check()
+			helpers.Utilities.CancellationUtility.check()
+			try:
+				segment_chunk = segment_response.read(min(helpers.BuildConfig.IO.IOConfig.CHUNK, segment_end + 1 - write_offset))
+			except http.client.IncompleteRead as segmentedDownloadUtility_fetch_segment_error:
+				raise ContentTooShortError('Segment incomplete: ' + str(segmentedDownloadUtility_fetch_segment_error), None)
+			if not segment_chunk:
+				raise ContentTooShortError('Segment incomplete: got only ' + str(write_offset - segment_start) +
+												' out of ' + str(segment_end + 1 - segment_start) + ' bytes', None)
+			write_offset += os.pwrite(file_descriptor, segment_chunk, write_offset)
+	finally:
+		segment_response.close()
+
+# Utility / Helper function - 3.
+def download(tar_request_object, part_file_location, content_length, segment_count, validator):
+	"""
+	Fetch the package in `SEGMENT_COUNT` concurrent byte ranges, into a file
+	preallocated to `CONTENT_LENGTH` bytes.
+	The first failed segment cancels its siblings (within a chunk), and is then raised.
+	"""
+	segment_ranges = split_ranges(content_length, segment_count)
+
+	# The token of the segments, cancelled along with the caller's (If Any), or by the first failed segment.
+	segment_token  = helpers.Utilities.CancellationUtility.CancellationToken(
+						parent=helpers.Utilities.CancellationUtility.current(),
+						label='Segments of {' + os.path.basename(part_file_location) + '}')
+
+	# Logging a comment
+	segmented_download_utility_logger.info('Starting Segmented Download of {' + str(content_length) + '} bytes in {' +
+											str(len(segment_ranges)) + '} segments to Location: {' + part_file_location + '}')
+
+	with open(part_file_location, 'wb') as part_object:
+		file_descriptor = part_object.fileno()
+
+		# Preallocate the file, so that the concurrent writes never extend it
+		# (and the file-system can lay it out contiguously). Where it can't be
+		# preallocated, the file is extended (sparse) to its size instead.
+		if not helpers.Utilities.BufferUtility.preallocate(file_descriptor, 0, content_length):
+			part_object.truncate(content_length)
+
+		with concurrent.futures.ThreadPoolExecutor(max_workers=len(segment_ranges)) as segment_executor:
+			# The segments run within the time budget (and the cancellation token) of the caller.
+			segment_futures = [segment_executor.submit(helpers.Utilities.DeadlineUtility.propagate(_fetch_segment),
+														tar_request_object, file_descriptor,
+														segment_start, segment_end, validator, segment_token)
+									for segment_start, segment_end in segment_ranges]
+
+			# Surface the first failure (If Any). The siblings are cancelled first, hence
+			# the executor isn't left waiting for their transfers to complete.
+			try:
+				for segment_future in concurrent.futures.as_completed(segment_futures):
+					segment_future.result()
+			except BaseException as segmentedDownloadUtility_download_error:
+				segment_token.cancel('Sibling Segment Failed: ' + str(segmentedDownloadUtility_download_error))
+				raise
+
+	# Verify the assembled file.
+	if os.path.getsize(part_file_location) != content_length:
+		raise ContentTooShortError('Segmented download size mismatch for Location: {' + part_file_location + '}', None)
+
+	# Logging a comment
+	segmented_download_utility_logger.info('Segmented Download Completed to Location: {' + part_file_location + '}')
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+
+# This module houses the streaming extraction of the downloaded packages.
+# The download stream is teed into `TARFILE` in stream mode (`r|gz` / `r|bz2`),
+# running in its own thread, so the package is extracted while its bytes are
+# still arriving (and written to disk, for the `ARTIFACT` cache).
+# The members land in a staging directory, which is only moved in place once
+# the package is complete (and verified). The `UNTAR_MANAGER` then skips the
+# packages extracted this way, and extracts the others from disk as before.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the `TAR` and IO configurations modules.
+import helpers.BuildConfig.Untar.UntarConfig, helpers.BuildConfig.IO.IOConfig
+
+# Import the stage timings, the completion of the extraction is traced.
+import helpers.Utilities.TraceUtility
+
+# Import the cancellation tokens, the extraction of a package from disk is cancellable.
+import helpers.Utilities.CancellationUtility
+
+# Import the member filters, the members of a package filtered out are never extracted.
+import helpers.Utilities.MemberFilterUtility
+
+# Import the install module, the binaries may be extracted straight into their install location.
+import helpers.Utilities.InstallUtility
+
+# The below module is a Python built-in module
+# for `UNTARRING` of compressed files.
+import tarfile
+
+# Import the `OS` and `SHUTIL` modules for the file-system operations.
+import os, shutil
+
+# Import the `THREADING` module, the extraction runs in its own thread.
+import threading
+
+# Import the `QUEUE` module, to hand the chunks over to the extraction thread.
+import queue
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+STREAM_EXTRACT_UTILITY_LOGGER_NAME = '.StreamExtractUtility'
+
+# Get the Logger Instance for the module.
+stream_extract_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+													STREAM_EXTRACT_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# The packages extracted while streaming, as `(TAR_FILE_NAME, TAR_PACKAGE_TYPE)` tuples.
+# <::PROTECTED_ATTRIBUTE::>
+_extracted_packages      = set()
+_extracted_packages_lock = threading.Lock()
+
+# Utility / Helper function - 0.
+def is_extracted(tar_file_name, tar_package_type):
+	"""
+	Tells whether the package was already extracted (to the `TAR_PACKAGE_TYPE`
+	directory) while it was being downloaded.
+	"""
+	with _extracted_packages_lock:
+		return (os.path.basename(tar_file_name), tar_package_type) in _extracted_packages
+
+# Utility / Helper function - 1.
+def _stream_mode(tar_file_name):
+	"""
+	Returns the `TARFILE` stream mode for the package, or `NONE` for an unknown extension.
+	"""
+	for compression, tar_extension in helpers.BuildConfig.Untar.UntarConfig.TAR_EXTENSION.items():
+		if tar_file_name.endswith(tar_extension):
+			return 'r|' + compression
+	return None
+
+##############################################################
+# The section below contains the Class Definitions for the
+# chunk reader and the streaming extractor.
+##############################################################
+
+class ChunkReader(object):
+	"""
+	File-like object over the chunks fed to the extractor. A `NONE` chunk
+	marks the end of the stream. Shared with the pipelined extraction engine
+	(see `ExtractEngineUtility`).
+	"""
+
+	def __init__(self, chunk_queue):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		# <::PROTECTED_ATTRIBUTE::>
+		self._chunk_queue = chunk_queue
+		self._buffer      = bytearray()
+		self._eof         = False
+
+	def read(self, size=-1):
+		while (size < 0 or len(self._buffer) < size) and not self._eof:
+			stream_chunk = self._chunk_queue.get()
+			if stream_chunk is None:
+				self._eof = True
+				break
+			self._buffer += stream_chunk
+
+		size        = len(self._buffer) if size < 0 else min(size, len(self._buffer))
+		read_result = bytes(self._buffer[:size])
+		del self._buffer[:size]
+		return read_result
+
+	def drain(self):
+		"""
+		Consume the rest of the stream (for eg., the padding after the end of the
+		archive, or everything after a failure), so that the feeder never blocks.
+		"""
+		self._buffer = bytearray()
+		while not self._eof:
+			if self._chunk_queue.get() is None:
+				self._eof = True
+
+class StreamingExtractor(object):
+	"""
+	Extract a package from the chunks fed to it, while they are being downloaded.
+	`FINISH` moves the extracted package in place, `ABORT` drops it.
+	"""
+
+	def __init__(self, tar_file_name, tar_package_type, stream_mode):
+		"""
+		The `INITIALIZE` method for the class. Starts the extraction thread.
+		"""
+		self.tar_file_name    = tar_file_name
+		self.tar_package_type = tar_package_type
+		self.bytes_fed        = 0
+		# The member filter of the package type (If Any, see `MemberFilterUtility`).
+		self.member_filter    = helpers.Utilities.MemberFilterUtility.filter_for(tar_package_type)
+
+		# The final directory of the package, and the staging directory its members land in first
+		# (next to it, hence on the same filesystem).
+		self.extract_directory = helpers.Utilities.InstallUtility.extract_directory(tar_package_type)
+		self.staging_directory = os.path.join(os.path.dirname(self.extract_directory.rstrip('/')),
+												'.' + tar_package_type.strip('/') + '.streaming')
+
+		# <::PROTECTED_ATTRIBUTE::>
+		self._stream_mode      = stream_mode
+		self._chunk_queue      = queue.Queue(maxsize=helpers.BuildConfig.Untar.UntarConfig.STREAM_EXTRACT_QUEUE_CHUNKS)
+		self._extract_error    = None
+		self._extract_complete = False
+		self._closed           = False
+		self._extract_thread   = threading.Thread(target=self._extract, name='StreamExtract::' + tar_file_name, daemon=True)
+
+		shutil.rmtree(self.staging_directory, ignore_errors=True)
+		os.makedirs(self.staging_directory)
+		self._extract_thread.start()
+
+	@classmethod
+	def for_package(cls, tar_file_name, tar_package_type):
+		"""
+		Returns a started extractor for the package, or `NONE` when the streaming
+		extraction is turned off (or the package isn't a known `TAR` flavour).
+		"""
+		if tar_package_type is None or not helpers.BuildConfig.Untar.UntarConfig.STREAM_EXTRACT_ENABLED:
+			return None
+		stream_mode = _stream_mode(tar_file_name)
+		return cls(tar_file_name, tar_package_type, stream_mode) if stream_mode is not None else None
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _extract(self):
+		chunk_reader = ChunkReader(self._chunk_queue)
+		try:
+			with tarfile.open(fileobj=chunk_reader, mode=self._stream_mode) as tar_file:
+				tar_file.extractall(path=self.staging_directory,
+									members=self.member_filter.select(tar_file) if self.member_filter is not None else None)
+		except BaseException as streamExtractUtility_extract_error:
+			# Whatever stops the extraction (for eg., a `ZLIB.ERROR` or a `VALUEERROR` out of a
+			# corrupt stream) fails it, the `UNTAR_MANAGER` then extracts the package from disk.
+			self._extract_error = streamExtractUtility_extract_error
+		else:
+			self._extract_complete = True
+		finally:
+			chunk_reader.drain()
+
+	def feed(self, stream_chunk):
+		"""
+		Hand the next chunk of the package over to the extraction thread.
+		Blocks while the extraction lags `STREAM_EXTRACT_QUEUE_CHUNKS` behind.
+		"""
+		self._chunk_queue.put(stream_chunk)
+		self.bytes_fed += len(stream_chunk)
+
+	# <::PROTECTED_MEMBER_METHOD::>
+	def _close(self):
+		if not self._closed:
+			self._closed = True
+			self._chunk_queue.put(None)
+		self._extract_thread.join()
+
+	@helpers.Utilities.TraceUtility.traced('extract')
+	def finish(self, tar_file_location):
+		"""
+		Complete the extraction and move the package in place.
+		A package that wasn't streamed (for eg., served from the `ARTIFACT` cache,
+		or fetched in segments) is fed from disk instead.
+		Returns `FALSE` when the extraction failed, the `UNTAR_MANAGER` then extracts
+		the package from disk as before.
+		"""
+		if not self.bytes_fed and not self._closed:
+			try:
+				with open(tar_file_location, 'rb') as tar_object:
+					for tar_chunk in iter(lambda: tar_object.read(helpers.BuildConfig.IO.IOConfig.CHUNK), b''):
+						helpers.Utilities.CancellationUtility.check()
+						self.feed(tar_chunk)
+			except helpers.Utilities.CancellationUtility.TaskCancelledError:
+				# The caller may be gone (for eg., a cancelled `ASYNCIO` task), drop the extraction here.
+				self.abort()
+				raise
+		self._close()
+
+		# Only an extraction that ran to its end is moved in place.
+		if self._extract_error is not None or not self._extract_complete:
+			# Logging a comment
+			stream_extract_utility_logger.warning('Streaming Extraction Failed for Package: {' + self.tar_file_name + '}: ' +
+													repr(self._extract_error) + '. Left for the Untar Manager')
+			shutil.rmtree(self.staging_directory, ignore_errors=True)
+			return False
+
+		# Move the extracted members in place, replacing an earlier extraction of the same members.
+		os.makedirs(self.extract_directory, exist_ok=True)
+		for extracted_name in os.listdir(self.staging_directory):
+			extracted_location = os.path.join(self.extract_directory, extracted_name)
+			if os.path.isdir(extracted_location) and not os.path.islink(extracted_location):
+				shutil.rmtree(extracted_location)
+			elif os.path.lexists(extracted_location):
+				os.remove(extracted_location)
+			os.replace(os.path.join(self.staging_directory, extracted_name), extracted_location)
+		shutil.rmtree(self.staging_directory, ignore_errors=True)
+
+		with _extracted_packages_lock:
+			_extracted_packages.add((self.tar_file_name, self.tar_package_type))
+
+		# Logging a comment
+		stream_extract_utility_logger.info('Extracted {' + self.tar_file_name + '} to {' + self.extract_directory +
+											'} while Streaming')
+		return True
+
+	def abort(self):
+		"""
+		Stop the extraction and drop whatever was extracted (for eg., the download failed).
+		"""
+		self._close()
+		shutil.rmtree(self.staging_directory, ignore_errors=True)
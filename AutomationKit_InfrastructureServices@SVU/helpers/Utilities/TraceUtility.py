@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+# This module houses the stage timings of the build.
+# Each stage of each component (resolve, connect, first byte, download, verify,
+# extract, copy, configure, make, make install) is recorded as a span on the
+# monotonic clock (in nanoseconds), along with the thread (or `ASYNCIO` task) it
+# ran on. The spans are exported as Chrome trace-event JSON (load it in
+# `chrome://tracing` or https://ui.perfetto.dev) and summarised as a table in the
+# application log, at the end of the run.
+# The component of a span is bound to the thread (or task) running it, like the deadlines.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the Logger configurations module, which holds the trace options.
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# Import the `CONTEXTVARS` module. The bound component follows the threads
+# and the `ASYNCIO` tasks alike.
+import contextvars
+
+# Import the `CONTEXTLIB` and `FUNCTOOLS` modules for the span context manager and decorator.
+import contextlib, functools
+
+# Import the `ASYNCIO` module, to tell the tasks sharing an event loop thread apart.
+import asyncio
+
+# Import the `JSON` module to write the trace.
+import json
+
+# Import the `OS` module for the file-system operations.
+import os
+
+# Import the `THREADING` module, as the spans are recorded by all the threads.
+import threading
+
+# Import the `TIME` module for the monotonic clock.
+import time
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+TRACE_UTILITY_LOGGER_NAME = '.TraceUtility'
+
+# Get the Logger Instance for the module.
+trace_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME +
+											TRACE_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# The component bound to the current thread (or task). <::PROTECTED_ATTRIBUTE::>
+_current_component = contextvars.ContextVar('trace_component', default=None)
+
+# Utility / Helper function - 0.
+def bind_component(component):
+	"""
+	Bind the component to the current thread (or `ASYNCIO` task), for the spans recorded by it.
+	"""
+	_current_component.set(component)
+
+# Utility / Helper function - 1.
+def current_component():
+	"""
+	Returns the component bound to the current thread (or task), or `NONE`.
+	"""
+	return _current_component.get()
+
+# Utility / Helper function - 2.
+def _current_track():
+	"""
+	Returns a tuple of `(TRACK ID, TRACK NAME)` the spans of the current thread are recorded on.
+	The `ASYNCIO` tasks get a track each, as they overlap on the thread of the event loop.
+	"""
+	try:
+		current_task = asyncio.current_task()
+	except RuntimeError:
+		current_task = None
+	if current_task is not None:
+		return id(current_task), current_task.get_name()
+
+	current_thread = threading.current_thread()
+	return current_thread.ident, current_thread.name
+
+##############################################################
+# The section below contains the Class Definition for the
+# trace recorder.
+##############################################################
+
+class TraceRecorder(object):
+	"""
+	Records the spans of a run, and exports them.
+	"""
+
+	def __init__(self):
+		"""
+		The `INITIALIZE` method for the class.
+		"""
+		# The recorded spans, and the track names. <::PROTECTED_ATTRIBUTE::>
+		self._spans       = []
+		self._track_names = {}
+		self._lock        = threading.Lock()
+
+		# The origin of the trace timestamps.
+		self.origin_ns = time.monotonic_ns()
+
+	def reset(self):
+		"""
+		Drop the recorded spans, and restart the trace clock.
+		"""
+		with self._lock:
+			self._spans       = []
+			self._track_names = {}
+			self.origin_ns    = time.monotonic_ns()
+
+	def record(self, stage, start_ns, end_ns, component=None, span_args=None):
+		"""
+		Record a span of the `STAGE` between `START_NS` and `END_NS` (`TIME.MONOTONIC_NS`), for
+		the `COMPONENT` (the one bound to the current thread, by default).
+		"""
+		if not helpers.BuildConfig.Logger.LoggerConfig.TRACE_ENABLED:
+			return
+		track_id, track_name = _current_track()
+		with self._lock:
+			self._track_names[track_id] = track_name
+			self._spans.append({
+				'stage'    : stage,
+				'component': component if component is not None else _current_component.get(),
+				'track_id' : track_id,
+				'start_ns' : start_ns,
+				'end_ns'   : end_ns,
+				'args'     : span_args or {}
+			})
+
+	@contextlib.contextmanager
+	def span(self, stage, component=None, **span_args):
+		"""
+		Record the enclosed block as a span of the `STAGE`. A block that raises is recorded
+		as well, along with its error.
+		"""
+		start_ns = time.monotonic_ns()
+		try:
+			yield span_args
+		except BaseException as traceUtility_span_error:
+			span_args['error'] = type(traceUtility_span_error).__name__ + ': ' + str(traceUtility_span_error)
+			raise
+		finally:
+			self.record(stage, start_ns, time.monotonic_ns(), component, span_args)
+
+	def chrome_trace(self):
+		"""
+		Returns the spans as a Chrome trace-event document (complete `X` events, in microseconds).
+		"""
+		process_id = os.getpid()
+		with self._lock:
+			trace_events = [{
+				'name': (recorded_span['component'] + ' ' if recorded_span['component'] else '') + recorded_span['stage'],
+				'cat' : recorded_span['stage'],
+				'ph'  : 'X',
+				'ts'  : (recorded_span['start_ns'] - self.origin_ns) / 1000,
+				'dur' : (recorded_span['end_ns'] - recorded_span['start_ns']) / 1000,
+				'pid' : process_id,
+				'tid' : recorded_span['track_id'],
+				'args': dict(recorded_span['args'], component=recorded_span['component'])
+			} for recorded_span in self._spans]
+
+			trace_events.extend({'name': 'thread_name', 'ph': 'M', 'pid': process_id, 'tid': track_id,
+									'args': {'name': track_name}} for track_id, track_name in self._track_names.items())
+		return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+	def export_chrome_trace(self, trace_file):
+		"""
+		Write the Chrome trace-event JSON to the `TRACE_FILE`.
+		"""
+		os.makedirs(os.path.dirname(trace_file) or '.', exist_ok=True)
+		with open(trace_file, 'w') as trace_file_object:
+			json.dump(self.chrome_trace(), trace_file_object)
+
+	def summary(self):
+		"""
+		Returns the summary rows of `(COMPONENT, STAGE, COUNT, TOTAL SECONDS, MAX SECONDS)`,
+		in the order the stages were first recorded.
+		"""
+		summary_rows = {}
+		with self._lock:
+			for recorded_span in self._spans:
+				span_seconds = (recorded_span['end_ns'] - recorded_span['start_ns']) / 1e9
+				summary_row  = summary_rows.setdefault((recorded_span['component'] or '-', recorded_span['stage']), [0, 0.0, 0.0])
+				summary_row[0] += 1
+				summary_row[1] += span_seconds
+				summary_row[2]  = max(summary_row[2], span_seconds)
+		return [(component, stage, span_count, total_seconds, max_seconds)
+					for (component, stage), (span_count, total_seconds, max_seconds) in summary_rows.items()]
+
+	def summary_table(self):
+		"""
+		Returns the summary as a plain-text table. The spans nest (for eg., the `first_byte`
+		of a package within its `download`), hence the stage totals of a component overlap.
+		"""
+		table_rows = [('COMPONENT', 'STAGE', 'COUNT', 'TOTAL (s)', 'MAX (s)')] + \
+						[(component, stage, str(span_count), '%.3f' % total_seconds, '%.3f' % max_seconds)
+							for component, stage, span_count, total_seconds, max_seconds in self.summary()]
+		column_widths = [max(len(table_row[column_index]) for table_row in table_rows) for column_index in range(5)]
+		return '\n'.join('  '.join(table_cell.ljust(column_width) if column_index < 2 else table_cell.rjust(column_width)
+									for column_index, (table_cell, column_width) in enumerate(zip(table_row, column_widths)))
+							for table_row in table_rows)
+
+	def finish(self):
+		"""
+		Write the Chrome trace to `LoggerConfig.TRACE_FILENAME`, and the summary table to
+		the application log. Called at the end of the run.
+		"""
+		if not helpers.BuildConfig.Logger.LoggerConfig.TRACE_ENABLED:
+			return
+		try:
+			self.export_chrome_trace(helpers.BuildConfig.Logger.LoggerConfig.TRACE_FILENAME)
+		except (IOError, OSError) as traceUtility_finish_error:
+			# Put logging below.
+			trace_utility_logger.warning('Could not write the Build Trace: ' + str(traceUtility_finish_error))
+		else:
+			# Logging a comment
+			trace_utility_logger.info('Build Trace written to: {' + helpers.BuildConfig.Logger.LoggerConfig.TRACE_FILENAME + '}')
+
+		# Logging a comment
+		trace_utility_logger.info('Build Stage Timings:\n' + self.summary_table())
+
+# The trace recorder shared by the whole run.
+shared_trace_recorder = TraceRecorder()
+
+# Utility / Helper function - 3.
+def span(stage, component=None, **span_args):
+	"""
+	Record the enclosed block as a span of the `STAGE`, on the shared recorder.
+	"""
+	return shared_trace_recorder.span(stage, component, **span_args)
+
+# Utility / Helper function - 4.
+def traced(stage):
+	"""
+	Decorator recording each call of the function as a span of the `STAGE`, on the shared recorder.
+	"""
+	def trace_decorator(function):
+		@functools.wraps(function)
+		def traced_function(*args, **kwargs):
+			with shared_trace_recorder.span(stage):
+				return function(*args, **kwargs)
+		return traced_function
+	return trace_decorator
@@ -1,159 +1,635 @@
-#!/usr/bin/env python3
-
-# This module holds the essential tools for navigating the web
-# and perform operations such as downloading software packages.
-# This module provides the utility functions to parse web resources
-# and extract the URLs or links from them to get the desired resource
-# endpoints.
-
-##############################################################
-# Module Import Section.
-# Make all the necessary imports here.
-##############################################################
-
-# Import the IO configurations module.
-# This below module holds the configuration options
-# for IO related operations performed by the automation
-# software.
-# Also, imported the common configurations module.
-import helpers.BuildConfig.IO.IOConfig, helpers.BuildConfig.Common.CommonConfig
-
-# The below module takes care of Regular Expression(s)
-# within the Python Programming Environment.
-# Also, imported the `OS` module to take care of `OS-specific`
-# operations.
-import re, os
-
-# Currently making use of `URLLIB`.
-# Need to make the port to `URLLIB3`.
-# Need to plan the code in such a way that it
-# doesn't break when making the module upgrade
-# to `URLLIB3`.
-try:
-	from urllib.request import Request, urlopen
-	from urllib.error   import URLError, HTTPError, ContentTooShortError
-except ImportError:
-	# This is bound to fail in `PYTHON3` (As no module named `URLLIB2`).
-	# Still keeping this as a placeholder.
-	# This section needs to be modified when
-	# upgrading to `URLLIB3` specification.
-	from urllib2 import Request, urlopen
-
-############# Configure the Logger options on this module #############
-
-import logging
-import helpers.Utilities.LoggerUtility
-import helpers.BuildConfig.Logger.LoggerConfig
-
-# The Logger name starts with a `PERIOD` (.), as it acts as
-# a seperator between the Local Logger name and the Application
-# wide Logger name.
-WEB_UTILITY_LOGGER_NAME = '.WebUtility'
-
-# Get the Logger Instance for the module.
-web_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME + WEB_UTILITY_LOGGER_NAME)
-
-#######################################################################
-
-#################################################################
-# The section below contains the utility functions,
-# that help out in the process of downloading the latest
-# "*.tar.gz" package(s).
-#################################################################
-
-# Utility Function - 0
-def get_link(target_url, link_pattern):
-	"""
-	Helper function to extract links, necessary
-	to locate the correct package. This function
-	parses the URL response to extract and follow the links,
-	that lead to the "*.tar.gz" software package.
-	"""
-
-	# The name of the function for logging purposes.
-	# Change the function object reference, in case the function name is changed.
-	# The underscore in the beginning marks that this is an
-	# internal-use local variable.
-	_function_name = get_link.__name__
-
-	try:
-		request_object  = Request(target_url)
-		response_object = urlopen(request_object)
-
-		# Logging a comment
-		web_utility_logger.info('[Function: {' + _function_name + '}] Request sent to URI: {' + target_url + '}')
-
-		# Store the Response [or Content] from the URI.
-		content_body    = response_object.read().decode('UTF-8')
-
-		# Logging a comment
-		web_utility_logger.info('[Function: {' + _function_name + '}] Response Received from URI: {' + target_url + '}')
-	except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as webutility_get_link_error:
-		# Put logging below.
-		web_utility_logger.error('[Function: {' + _function_name + '}] URI Request Failed: ' + str(webutility_get_link_error))
-		raise
-	else:
-		# The below returns either the matched string within
-		# the content of the response, or it would return `NONE`
-		# meaning it couldn't locate the pattern.
-		match_result        = re.search(link_pattern, content_body)
-		return match_result
-	finally:
-		# Close the `SOCKET` stream object.
-		response_object.close()
-
-# Utility Function - 1
-def download_tar_binary(url_tar_file_name, tar_request_object):
-	"""
-	Get the "*.tar.gz" package from the requested URI. The chore of this 
-	utility function is to just download the `TAR` package and save it
-	to a file on-disk.
-	"""
-
-	# The name of the function for logging purposes.
-	# Change the function object reference, in case the function name is changed.
-	# The underscore in the beginning marks that this is an
-	# internal-use local variable.
-	_function_name = download_tar_binary.__name__
-
-	try:
-		# Get the URL response from the supplied link.
-		binary_response   = urlopen(tar_request_object)
-
-		# Logging a comment
-		web_utility_logger.info('[Function: {' + _function_name + '}] Checking Tar Download Base Directory Path: {' +
-								helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + '}. Creating if doesn\'t exists...')
-
-		# Check if the `TAR` base downloads directory exists.
-		if not os.path.exists(helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE):
-			os.mkdir(helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE)
-			# Logging a comment
-			web_utility_logger.info('[Function: {' + _function_name + '}] Created Tar Download Base Directory Path: {' +
-											helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + '}')
-
-		tar_file_name     = os.path.basename(url_tar_file_name)
-		tar_file_location = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + tar_file_name
-		# Start the "*.tar.gz" (compressed) binary download.
-		with open(tar_file_location, 'wb') as tar_object:
-			while True:
-				# Read the "*.tar.gz" response in chunks
-				tar_chunk = binary_response.read(helpers.BuildConfig.IO.IOConfig.CHUNK)
-				if not tar_chunk:
-					break
-				# Write the response chunk to the "target on-disk file".
-				tar_object.write(tar_chunk)
-
-		# Logging a comment
-		web_utility_logger.info('[Function: {' + _function_name + '}] Tar successfully Downloaded to Location: {' +
-									tar_file_location + '}')
-
-		# Return the `TAR` file-name.
-		return tar_file_name
-	except (URLError, HTTPError, ContentTooShortError, IOError, OSError) as webUtility_download_tar_binary_error:
-		# Put logging below.
-		web_utility_logger.error('[Function: {' + _function_name + '}] Tar Download Failed: ' +
-									str(webUtility_download_tar_binary_error))
-		raise
-	finally:
-		# Close the `SOCKET` stream object.
-		binary_response.close()
\ No newline at end of file
+#!/usr/bin/env python3
+
+# This module holds the essential tools for navigating the web
+# and perform operations such as downloading software packages.
+# This module provides the utility functions to parse web resources
+# and extract the URLs or links from them to get the desired resource
+# endpoints.
+
+##############################################################
+# Module Import Section.
+# Make all the necessary imports here.
+##############################################################
+
+# Import the IO configurations module.
+# This below module holds the configuration options
+# for IO related operations performed by the automation
+# software.
+# Also, imported the common configurations module.
+import helpers.BuildConfig.IO.IOConfig, helpers.BuildConfig.Common.CommonConfig
+
+# Import the cache configurations module and the Content-Addressed
+# `ARTIFACT` cache, which is consulted before any package download.
+import helpers.BuildConfig.Cache.CacheConfig, helpers.Utilities.ArtifactCacheUtility
+
+# Import the response cache, used to revalidate the version-discovery pages.
+import helpers.Utilities.ResponseCacheUtility
+
+# Import the pooled `HTTP` session layer.
+# All the requests go through its keep-alive connections.
+import helpers.Utilities.HttpSessionUtility
+
+# Import the segmented (multi-connection) download mode, used for the large packages.
+import helpers.Utilities.SegmentedDownloadUtility
+
+# Import the streaming link scanner, used to scrape the version-discovery pages.
+import helpers.Utilities.LinkScannerUtility
+
+# Import the integrity checks, to verify the packages against their published checksums.
+import helpers.Utilities.ChecksumUtility
+
+# Import the streaming extraction module, to extract the packages while they download.
+import helpers.Utilities.StreamExtractUtility
+
+# Import the buffer helpers, for the reusable (adaptive) read buffer and the file preallocation.
+import helpers.Utilities.BufferUtility
+
+# Import the mirror selection, to race the mirrors of a package.
+import helpers.Utilities.MirrorUtility
+
+# Import the deadlines, to give up on a transfer once the time budget is spent.
+import helpers.Utilities.DeadlineUtility
+
+# Import the cancellation tokens, to give up on a transfer once it is cancelled.
+import helpers.Utilities.CancellationUtility
+
+# Import the stage timings, the verification of the cached packages is traced.
+import helpers.Utilities.TraceUtility
+
+# Import the `JSON` module to record the validators of the partial downloads.
+import json
+
+# Import the `HTTP.CLIENT` module for the errors raised by a dropped connection.
+import http.client
+
+# Import the `TIME` module to measure the throughput of the mirrors.
+import time
+
+# The below module takes care of Regular Expression(s)
+# within the Python Programming Environment.
+# Also, imported the `OS` module to take care of `OS-specific`
+# operations.
+import re, os
+
+# Currently making use of `URLLIB`.
+# Need to make the port to `URLLIB3`.
+# Need to plan the code in such a way that it
+# doesn't break when making the module upgrade
+# to `URLLIB3`.
+try:
+	from urllib.request import Request
+	from urllib.error   import URLError, HTTPError, ContentTooShortError
+except ImportError:
+	# This is bound to fail in `PYTHON3` (As no module named `URLLIB2`).
+	# Still keeping this as a placeholder.
+	# This section needs to be modified when
+	# upgrading to `URLLIB3` specification.
+	from urllib2 import Request
+
+############# Configure the Logger options on this module #############
+
+import logging
+import helpers.Utilities.LoggerUtility
+import helpers.BuildConfig.Logger.LoggerConfig
+
+# The Logger name starts with a `PERIOD` (.), as it acts as
+# a seperator between the Local Logger name and the Application
+# wide Logger name.
+WEB_UTILITY_LOGGER_NAME = '.WebUtility'
+
+# Get the Logger Instance for the module.
+web_utility_logger = logging.getLogger(helpers.BuildConfig.Logger.LoggerConfig.APP_LOGGER_NAME + WEB_UTILITY_LOGGER_NAME)
+
+#######################################################################
+
+# Extension of the partial downloads, kept across the retries for resuming.
+PART_FILE_EXTENSION = '.part'
+
+#################################################################
+# The section below contains the utility functions,
+# that help out in the process of downloading the latest
+# "*.tar.gz" package(s).
+#################################################################
+
+# Utility Function - 0
+def get_link(target_url, link_pattern):
+	"""
+	Helper function to extract links, necessary
+	to locate the correct package. This function
+	parses the URL response to extract and follow the links,
+	that lead to the "*.tar.gz" software package.
+	The page is scanned as it streams in, and the connection is closed as
+	soon as the link is found.
+	The pages are revalidated against the persistent response cache,
+	so an unchanged page costs a round trip without a body transfer.
+	"""
+
+	# The name of the function for logging purposes.
+	# Change the function object reference, in case the function name is changed.
+	# The underscore in the beginning marks that this is an
+	# internal-use local variable.
+	_function_name = get_link.__name__
+
+	try:
+		response_cache = helpers.Utilities.ResponseCacheUtility.shared_response_cache
+
+		request_object = Request(target_url)
+		if helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED:
+			# Make the request conditional on the cached validators (If Any).
+			for header_name, header_value in response_cache.conditional_headers(target_url).items():
+				request_object.add_header(header_name, header_value)
+
+		try:
+			response_object = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(request_object)
+		except HTTPError as webutility_get_link_http_error:
+			# `URLLIB` reports a `304 Not Modified` as an `HTTP_ERROR`.
+			# Anything else is a genuine failure.
+			if webutility_get_link_http_error.code != 304:
+				raise
+			webutility_get_link_http_error.close()
+
+			cached_entry = response_cache.load(target_url)
+			if cached_entry is not None:
+				content_body, body_complete = cached_entry
+				match_result = re.search(link_pattern, content_body)
+
+				# Only the start of the page may have been stored, and the pattern
+				# may lie further down (for eg., the `APR-UTIL` link on the `APR` page).
+				if match_result is not None or body_complete:
+					# Logging a comment
+					web_utility_logger.info('[Function: {' + _function_name + '}] Response Not Modified, served from the Response Cache for URI: {' +
+												target_url + '}')
+					return match_result
+
+			# The cached body vanished underneath us (or falls short of the pattern), fetch the page afresh.
+			response_cache.discard(target_url)
+			response_object = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(Request(target_url))
+
+		# Logging a comment
+		web_utility_logger.info('[Function: {' + _function_name + '}] Request sent to URI: {' + target_url + '}')
+
+		match_result = _scan_link(target_url, response_object, link_pattern)
+
+		# Logging a comment
+		web_utility_logger.info('[Function: {' + _function_name + '}] Response Received from URI: {' + target_url + '}')
+	except (URLError, HTTPError, ContentTooShortError, UnicodeDecodeError, IOError, OSError) as webutility_get_link_error:
+		# Put logging below.
+		web_utility_logger.error('[Function: {' + _function_name + '}] URI Request Failed: ' + str(webutility_get_link_error))
+		raise
+	else:
+		# The below returns either the matched string within
+		# the content of the response, or it would return `NONE`
+		# meaning it couldn't locate the pattern.
+		return match_result
+
+# Utility Function - 1
+def _scan_link(target_url, response_object, link_pattern):
+	"""
+	Read the response in chunks, through the streaming link scanner, and stop
+	(closing the connection) as soon as the pattern is found.
+	The part of the page read so far is stored in the response cache.
+	"""
+	link_scanner = helpers.Utilities.LinkScannerUtility.LinkScanner(link_pattern,
+						keep_prefix=helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED)
+	try:
+		while True:
+			helpers.Utilities.DeadlineUtility.check()
+			helpers.Utilities.CancellationUtility.check()
+			response_chunk = response_object.read(helpers.BuildConfig.IO.IOConfig.CHUNK)
+			if link_scanner.feed(response_chunk, final=not response_chunk) is not None or not response_chunk:
+				break
+
+		if helpers.BuildConfig.Cache.CacheConfig.RESPONSE_CACHE_ENABLED:
+			helpers.Utilities.ResponseCacheUtility.shared_response_cache.save(target_url, response_object.headers,
+																				link_scanner.prefix, complete=not response_chunk)
+	finally:
+		# Close the `SOCKET` stream object.
+		# An unread remainder of the page is dropped along with the connection.
+		response_object.close()
+	return link_scanner.match_result
+
+# Utility Function - 2
+def download_tar_binary(url_tar_file_name, tar_request_object, download_segments=1, verify_checksum=False,
+							extract_package_type=None, mirror_urls=None):
+	"""
+	Get the "*.tar.gz" package from the requested URI. The chore of this 
+	utility function is to just download the `TAR` package and save it
+	to a file on-disk.
+	The Content-Addressed `ARTIFACT` cache is consulted first, and a package
+	fetched over the network is added to the cache for the later runs.
+	With `DOWNLOAD_SEGMENTS` above one, large packages are fetched over
+	as many concurrent connections (if the server supports ranges).
+	With `VERIFY_CHECKSUM`, the package is verified against the checksum file
+	published next to it, while it streams in. A mismatch raises
+	`ChecksumMismatchError` (an `IOError`, hence retried by the `DOWNLOAD_MANAGER`).
+	With `EXTRACT_PACKAGE_TYPE` (and `UntarConfig.STREAM_EXTRACT_ENABLED`), the package
+	is also extracted to that directory while it streams in.
+	With `MIRROR_URLS` (the hosts publishing the package under the same layout), the
+	package is fetched from the mirror that answers first (see `MirrorUtility`).
+	The package is still cached, and its checksum fetched, under the requested URI.
+	"""
+
+	# The name of the function for logging purposes.
+	# Change the function object reference, in case the function name is changed.
+	# The underscore in the beginning marks that this is an
+	# internal-use local variable.
+	_function_name = download_tar_binary.__name__
+
+	# The extractor fed with the package (If Any).
+	tar_extractor = None
+
+	try:
+		# Logging a comment
+		web_utility_logger.info('[Function: {' + _function_name + '}] Checking Tar Download Base Directory Path: {' +
+								helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + '}. Creating if doesn\'t exists...')
+
+		# Check if the `TAR` base downloads directory exists.
+		if not os.path.exists(helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE):
+			os.mkdir(helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE)
+			# Logging a comment
+			web_utility_logger.info('[Function: {' + _function_name + '}] Created Tar Download Base Directory Path: {' +
+											helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + '}')
+
+		tar_file_name     = os.path.basename(url_tar_file_name)
+		tar_file_location = helpers.BuildConfig.Common.CommonConfig.TAR_DOWNLOAD_BASE + tar_file_name
+
+		# Fetch the published checksum ahead of the package, so that the package
+		# is verified while it streams in.
+		expected_checksum = helpers.Utilities.ChecksumUtility.fetch_expected_checksum(tar_request_object) \
+								if verify_checksum else None
+
+		# Extract the package while it streams in (If Enabled).
+		tar_extractor = helpers.Utilities.StreamExtractUtility.StreamingExtractor.for_package(tar_file_name,
+																								extract_package_type)
+
+		if not helpers.BuildConfig.Cache.CacheConfig.ARTIFACT_CACHE_ENABLED:
+			tar_digest = _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+											tar_extractor, mirror_urls)
+		else:
+			artifact_cache = helpers.Utilities.ArtifactCacheUtility.shared_artifact_cache
+
+			# Only one node (or thread) fetches a given URI at a time.
+			# The others wait here and are then served from the cache.
+			with artifact_cache.download_lock(tar_request_object.full_url):
+				tar_digest = artifact_cache.fetch(tar_request_object.full_url, tar_file_location)
+				if tar_digest is not None and (expected_checksum is None or _verify_cached_tar(tar_request_object,
+																		tar_file_location, tar_digest, expected_checksum)):
+					# Logging a comment
+					web_utility_logger.info('[Function: {' + _function_name + '}] Tar served from the Artifact Cache to Location: {' +
+												tar_file_location + '}')
+
+					# Nothing new to record for the package.
+					expected_checksum = None
+				else:
+					tar_digest = _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+													tar_extractor, mirror_urls)
+					artifact_cache.store(tar_request_object.full_url, tar_file_location, tar_digest)
+
+		# Record the verified digests, for the later stages.
+		if expected_checksum is not None:
+			helpers.Utilities.ChecksumUtility.shared_digest_registry.record(tar_digest, tar_file_name, tar_request_object.full_url,
+																				*expected_checksum)
+
+		# Complete the extraction, now that the package is complete (and verified).
+		# A package that wasn't streamed (for eg., served from the cache) is extracted from disk here.
+		if tar_extractor is not None:
+			tar_extractor.finish(tar_file_location)
+
+		# Logging a comment
+		web_utility_logger.info('[Function: {' + _function_name + '}] Tar successfully Downloaded to Location: {' +
+									tar_file_location + '}')
+
+		# Return the `TAR` file-name.
+		return tar_file_name
+	except (URLError, HTTPError, ContentTooShortError, IOError, OSError) as webUtility_download_tar_binary_error:
+		# Put logging below.
+		web_utility_logger.error('[Function: {' + _function_name + '}] Tar Download Failed: ' +
+									str(webUtility_download_tar_binary_error))
+
+		# Drop the partial extraction (If Any).
+		if tar_extractor is not None:
+			tar_extractor.abort()
+		raise
+	except helpers.Utilities.CancellationUtility.TaskCancelledError:
+		# Logging a comment
+		web_utility_logger.warning('[Function: {' + _function_name + '}] Tar Download Cancelled for URI: {' +
+									tar_request_object.full_url + '}')
+
+		# Drop the partial extraction (If Any).
+		if tar_extractor is not None:
+			tar_extractor.abort()
+		raise
+
+# Utility Function - 3
+def _fetch_tar_binary(tar_request_object, tar_file_location, download_segments=1, expected_checksum=None,
+						tar_extractor=None, mirror_urls=None):
+	"""
+	Stream the package for the request to the on-disk location.
+	The bytes land in a "<TAR>.part" file first, which is kept across the
+	`DOWNLOAD_MANAGER` retries. A retry resumes the transfer with an `HTTP`
+	`Range` request (validated with `If-Range`), and only starts over when
+	the server ignores the range or the package changed upstream.
+	The `SHA-256` digest is computed on the fly (it keys the `ARTIFACT` cache)
+	and returned to the caller. The digest for the `EXPECTED_CHECKSUM` (If Any)
+	is computed in the same pass, and a mismatching package is dropped
+	(along with its partial file) before it is moved in place.
+	The chunks are also fed to the `TAR_EXTRACTOR` (If Any), as they arrive.
+	A fresh transfer is raced across the `MIRROR_URLS` (If Any), while a resumed
+	one goes back to the mirror the partial bytes came from.
+	"""
+
+	# The name of the function for logging purposes.
+	_function_name = _fetch_tar_binary.__name__
+
+	part_file_location     = tar_file_location + PART_FILE_EXTENSION
+	part_metadata_location = part_file_location + '.json'
+
+	# Check for a partial download (of the same URI) left behind by an earlier attempt.
+	# A partial file still marked as preallocated was never trimmed to its downloaded
+	# bytes (for eg., the process was killed), hence can't be resumed from.
+	part_metadata = _load_part_metadata(part_metadata_location)
+	if part_metadata is None or part_metadata.get('url') != tar_request_object.full_url or \
+			part_metadata.get('preallocated') or not os.path.exists(part_file_location):
+		part_metadata = None
+	resume_offset = os.path.getsize(part_file_location) if part_metadata is not None else 0
+
+	# Large packages may be fetched over several connections at once.
+	# A partial single-connection download is resumed instead.
+	if download_segments > 1 and not resume_offset:
+		tar_digest = _fetch_tar_binary_segmented(tar_request_object, tar_file_location, download_segments,
+													expected_checksum)
+		if tar_digest is not None:
+			return tar_digest
+
+	# Copy the request (and its headers, for eg., the Oracle cookies) and ask for the remainder only,
+	# from the mirror the partial bytes came from.
+	source_url           = part_metadata.get('source_url', tar_request_object.full_url) if resume_offset else tar_request_object.full_url
+	range_request_object = Request(source_url, headers=dict(tar_request_object.header_items()))
+	if resume_offset:
+		range_request_object.add_header('Range', 'bytes=' + str(resume_offset) + '-')
+
+		# Only resume if the package is still the one the partial bytes came from.
+		# A weak `ETag` can't validate a range, hence the `Last-Modified` fallback.
+		if part_metadata.get('etag') and not part_metadata['etag'].startswith('W/'):
+			range_request_object.add_header('If-Range', part_metadata['etag'])
+		elif part_metadata.get('last_modified'):
+			range_request_object.add_header('If-Range', part_metadata['last_modified'])
+
+	try:
+		# Get the URL response from the supplied link (or from the first mirror to answer).
+		if resume_offset or not mirror_urls:
+			binary_response = helpers.Utilities.HttpSessionUtility.shared_session.urlopen(range_request_object)
+		else:
+			binary_response, range_request_object = helpers.Utilities.MirrorUtility.shared_mirror_selector.open_hedged(
+														range_request_object, mirror_urls,
+														helpers.Utilities.HttpSessionUtility.shared_session.urlopen)
+	except HTTPError as webUtility_fetch_tar_binary_error:
+		# `416 Range Not Satisfiable`: the partial file doesn't fit the package anymore.
+		# Drop it and start over.
+		if webUtility_fetch_tar_binary_error.code != 416 or not resume_offset:
+			raise
+		webUtility_fetch_tar_binary_error.close()
+		_remove_part_files(tar_file_location)
+		return _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+									tar_extractor, mirror_urls)
+
+	try:
+		tar_digests = helpers.Utilities.ChecksumUtility.StreamDigests.for_checksum(expected_checksum)
+
+		if resume_offset and binary_response.getcode() == 206 and \
+				binary_response.headers.get('Content-Range', '').startswith('bytes ' + str(resume_offset) + '-'):
+			# Logging a comment
+			web_utility_logger.info('[Function: {' + _function_name + '}] Resuming Tar Download at Byte Offset: {' +
+										str(resume_offset) + '} for Location: {' + tar_file_location + '}')
+
+			# Seed the digest (and the extractor) with the bytes downloaded earlier.
+			with open(part_file_location, 'rb') as part_object:
+				for part_chunk in iter(lambda: part_object.read(helpers.BuildConfig.IO.IOConfig.CHUNK), b''):
+					tar_digests.update(part_chunk)
+					if tar_extractor is not None:
+						tar_extractor.feed(part_chunk)
+			tar_file_mode = 'r+b'
+		elif binary_response.getcode() == 206:
+			# A partial body that doesn't pick up at the resume offset (or wasn't asked for).
+			# Only a `200` (the server ignored the range) restarts the download in place, as
+			# this body would otherwise pass for the complete package.
+			if not resume_offset:
+				raise URLError('Unexpected Partial Content (Content-Range: {' +
+								str(binary_response.headers.get('Content-Range')) + '}) for a Full Download of: {' +
+									range_request_object.full_url + '}')
+
+			# Logging a comment
+			web_utility_logger.warning('[Function: {' + _function_name + '}] Server answered the Range request from Byte Offset: {' +
+										str(resume_offset) + '} with Content-Range: {' +
+											str(binary_response.headers.get('Content-Range')) + '}. Restarting Tar Download ' +
+												'without a Range for Location: {' + tar_file_location + '}')
+			binary_response.close()
+			_remove_part_files(tar_file_location)
+			return _fetch_tar_binary(tar_request_object, tar_file_location, download_segments, expected_checksum,
+										tar_extractor, mirror_urls)
+		else:
+			if resume_offset:
+				# Logging a comment
+				web_utility_logger.info('[Function: {' + _function_name + '}] Server ignored the Range request. ' +
+											'Restarting Tar Download for Location: {' + tar_file_location + '}')
+			resume_offset = 0
+			tar_file_mode = 'wb'
+
+			# Record the validators of the package, for a later resume.
+			part_metadata = {
+				'url'          : tar_request_object.full_url,
+				'source_url'   : range_request_object.full_url,
+				'etag'         : binary_response.headers.get('ETag') if binary_response.headers else None,
+				'last_modified': binary_response.headers.get('Last-Modified') if binary_response.headers else None
+			}
+			_save_part_metadata(part_metadata_location, part_metadata)
+
+		# The expected size of the complete package (If Known).
+		expected_length = binary_response.headers.get('Content-Length') if binary_response.headers else None
+		expected_length = (int(expected_length) + resume_offset) if expected_length else None
+
+		# Start the "*.tar.gz" (compressed) binary download.
+		# The partial file is opened for update (not for append), as the
+		# preallocated space lies past the end of the downloaded bytes.
+		with open(part_file_location, tar_file_mode) as tar_object:
+			tar_object.seek(resume_offset)
+
+			# Preallocate the rest of the package. The partial file is marked as such
+			# until it is trimmed back to the downloaded bytes (below).
+			if helpers.BuildConfig.IO.IOConfig.PREALLOCATE_ENABLED and expected_length is not None:
+				_save_part_metadata(part_metadata_location, dict(part_metadata, preallocated=True))
+				helpers.Utilities.BufferUtility.preallocate(tar_object.fileno(), resume_offset,
+																expected_length - resume_offset)
+
+			# The response is read into one reusable buffer, instead of a fresh chunk per read.
+			read_buffer    = helpers.Utilities.BufferUtility.AdaptiveBuffer()
+			transfer_start = time.perf_counter()
+			try:
+				while True:
+					# Read the "*.tar.gz" response in chunks.
+					# A transfer trickling in past the time budget is given up (and resumed by the retry).
+					# A cancelled one is given up for good.
+					helpers.Utilities.DeadlineUtility.check()
+					helpers.Utilities.CancellationUtility.check()
+					tar_chunk = read_buffer.readinto(binary_response)
+					if not tar_chunk:
+						break
+					# Write the response chunk to the "target on-disk file".
+					tar_object.write(tar_chunk)
+					tar_digests.update(tar_chunk)
+					if tar_extractor is not None:
+						# The extractor keeps the chunk past the next read, hence gets a copy.
+						tar_extractor.feed(bytes(tar_chunk))
+			except http.client.IncompleteRead as webUtility_fetch_tar_binary_error:
+				# The connection dropped mid-transfer. Report it as a short read,
+				# which the `DOWNLOAD_MANAGER` retries (and the retry resumes).
+				raise ContentTooShortError('Retrieval incomplete: ' + str(webUtility_fetch_tar_binary_error), None)
+			finally:
+				# Trim the preallocated space past the downloaded bytes, so that
+				# the size of the partial file is the resume offset again.
+				tar_object.truncate()
+				if helpers.BuildConfig.IO.IOConfig.PREALLOCATE_ENABLED and expected_length is not None:
+					_save_part_metadata(part_metadata_location, part_metadata)
+
+		# A truncated transfer keeps its partial file, to be resumed by the next retry.
+		downloaded_length = os.path.getsize(part_file_location)
+		if mirror_urls:
+			# Record the throughput of the mirror, for the later rankings.
+			helpers.Utilities.MirrorUtility.shared_mirror_selector.record_throughput(range_request_object.full_url,
+											downloaded_length - resume_offset, time.perf_counter() - transfer_start)
+			helpers.Utilities.MirrorUtility.shared_mirror_selector.flush()
+		if expected_length is not None and downloaded_length < expected_length:
+			raise ContentTooShortError('Retrieval incomplete: got only ' + str(downloaded_length) + ' out of ' +
+											str(expected_length) + ' bytes', None)
+	except helpers.Utilities.CancellationUtility.TaskCancelledError:
+		# The transfer isn't retried (hence resumed), drop its partial file.
+		_remove_part_files(tar_file_location)
+		raise
+	finally:
+		# Close the `SOCKET` stream object.
+		binary_response.close()
+
+	# Verify the package before moving it in place. A mismatching package
+	# can't be resumed from, hence the next retry starts over.
+	if expected_checksum is not None:
+		try:
+			helpers.Utilities.ChecksumUtility.verify(expected_checksum, tar_digests.hexdigest(expected_checksum[0]),
+														os.path.basename(tar_file_location))
+		except helpers.Utilities.ChecksumUtility.ChecksumMismatchError:
+			_remove_part_files(tar_file_location)
+			raise
+
+	# The package is complete, move it in place.
+	os.replace(part_file_location, tar_file_location)
+	_remove_part_files(tar_file_location)
+	return tar_digests.hexdigest('sha256')
+
+# Utility Function - 4
+def _fetch_tar_binary_segmented(tar_request_object, tar_file_location, download_segments, expected_checksum=None):
+	"""
+	Fetch the package over `DOWNLOAD_SEGMENTS` concurrent `Range` requests.
+	Returns the `SHA-256` digest of the package, or `NONE` when the segmented
+	mode doesn't apply (small package, no range support), in which case the
+	caller streams the package over a single connection.
+	"""
+
+	# The name of the function for logging purposes.
+	_function_name = _fetch_tar_binary_segmented.__name__
+
+	try:
+		content_length, accepts_ranges, validator = helpers.Utilities.SegmentedDownloadUtility.probe(tar_request_object)
+	except (URLError, HTTPError) as webUtility_fetch_tar_binary_segmented_error:
+		# Some servers don't answer `HEAD` requests, stay on the single connection.
+		web_utility_logger.info('[Function: {' + _function_name + '}] Segment Probe Failed: ' +
+									str(webUtility_fetch_tar_binary_segmented_error) + '. Using a single connection')
+		return None
+
+	if not accepts_ranges or content_length is None or \
+			content_length < helpers.BuildConfig.IO.IOConfig.SEGMENTED_DOWNLOAD_MIN_SIZE:
+		# Logging a comment
+		web_utility_logger.info('[Function: {' + _function_name + '}] Segmented Download not applicable (ACCEPT_RANGES: {' +
+									str(accepts_ranges) + '}, CONTENT_LENGTH: {' + str(content_length) +
+									'}). Using a single connection')
+		return None
+
+	part_file_location = tar_file_location + PART_FILE_EXTENSION
+	try:
+		helpers.Utilities.SegmentedDownloadUtility.download(tar_request_object, part_file_location, content_length,
+																download_segments, validator)
+	except helpers.Utilities.SegmentedDownloadUtility.SegmentedDownloadError as webUtility_fetch_tar_binary_segmented_error:
+		# Logging a comment
+		web_utility_logger.warning('[Function: {' + _function_name + '}] ' + str(webUtility_fetch_tar_binary_segmented_error) +
+									'. Using a single connection')
+		_remove_part_files(tar_file_location)
+		return None
+	except:
+		# The preallocated file has holes, it can't be resumed from. Start over on the next retry.
+		_remove_part_files(tar_file_location)
+		raise
+
+	# The segments completed out of order, hence the digests are taken over the assembled file (in a single pass).
+	tar_digests = helpers.Utilities.ChecksumUtility.StreamDigests.for_checksum(expected_checksum)
+	with open(part_file_location, 'rb') as part_object:
+		for part_chunk in iter(lambda: part_object.read(helpers.Utilities.ArtifactCacheUtility.HASH_CHUNK), b''):
+			tar_digests.update(part_chunk)
+
+	if expected_checksum is not None:
+		try:
+			helpers.Utilities.ChecksumUtility.verify(expected_checksum, tar_digests.hexdigest(expected_checksum[0]),
+														os.path.basename(tar_file_location))
+		except helpers.Utilities.ChecksumUtility.ChecksumMismatchError:
+			_remove_part_files(tar_file_location)
+			raise
+
+	os.replace(part_file_location, tar_file_location)
+	return tar_digests.hexdigest('sha256')
+
+# Utility Function - 5
+@helpers.Utilities.TraceUtility.traced('verify')
+def _verify_cached_tar(tar_request_object, tar_file_location, tar_digest, expected_checksum):
+	"""
+	Verify a package served from the `ARTIFACT` cache against the published checksum.
+	A mismatching package is removed, along with its cache entry, so that it is
+	fetched afresh.
+	"""
+
+	# The name of the function for logging purposes.
+	_function_name = _verify_cached_tar.__name__
+
+	if helpers.Utilities.ChecksumUtility.shared_digest_registry.is_verified(tar_file_location, tar_digest, expected_checksum):
+		return True
+
+	# Logging a comment
+	web_utility_logger.warning('[Function: {' + _function_name + '}] Cached Tar does not match the published Checksum. ' +
+								'Discarding the Artifact Cache entry for URI: {' + tar_request_object.full_url + '}')
+	os.remove(tar_file_location)
+	helpers.Utilities.ArtifactCacheUtility.shared_artifact_cache.discard(tar_request_object.full_url)
+	return False
+
+# Utility Function - 6
+def _load_part_metadata(part_metadata_location):
+	"""
+	Returns the validators recorded for a partial download, or `NONE`.
+	"""
+	try:
+		with open(part_metadata_location, 'r') as part_metadata_object:
+			return json.load(part_metadata_object)
+	except (IOError, OSError, ValueError):
+		return None
+
+# Utility Function - 7
+def _save_part_metadata(part_metadata_location, part_metadata):
+	"""
+	Record the validators for a partial download.
+	"""
+	with open(part_metadata_location, 'w') as part_metadata_object:
+		json.dump(part_metadata, part_metadata_object)
+
+# Utility Function - 8
+def _remove_part_files(tar_file_location):
+	"""
+	Remove the partial download (and its validators) for the package.
+	"""
+	for part_location in (tar_file_location + PART_FILE_EXTENSION, tar_file_location + PART_FILE_EXTENSION + '.json'):
+		if os.path.exists(part_location):
+			os.remove(part_location)
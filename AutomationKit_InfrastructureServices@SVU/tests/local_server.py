@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Local stand-in `HTTP` server for the checks, serving the handlers of a route table
+# (`PATH -> HANDLER(REQUEST_HANDLER)`) over `HTTP/1.1` (keep-alive) on a free port.
+
+import http.server, os, sys, threading
+
+# The checks import the `HELPERS` package from the package directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class LocalServer(object):
+
+	def __init__(self, routes):
+		self.routes      = routes
+		self.connections = 0
+		self.requests    = []
+
+		local_server = self
+
+		class RequestHandler(http.server.BaseHTTPRequestHandler):
+			protocol_version = 'HTTP/1.1'
+
+			def setup(self):
+				super().setup()
+				local_server.connections += 1
+
+			def log_message(self, *args):
+				pass
+
+			def do_GET(self):
+				local_server.requests.append((self.command, self.path, dict(self.headers)))
+				route_handler = local_server.routes.get(self.path)
+				if route_handler is None:
+					self.send_error(404)
+				else:
+					route_handler(self)
+
+			do_HEAD = do_GET
+
+		self.http_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), RequestHandler)
+		self.http_server.daemon_threads = True
+		self.base_url = 'http://127.0.0.1:' + str(self.http_server.server_address[1])
+
+	def url(self, path):
+		return self.base_url + path
+
+	def __enter__(self):
+		threading.Thread(target=self.http_server.serve_forever, daemon=True).start()
+		return self
+
+	def __exit__(self, *exc_info):
+		self.http_server.shutdown()
+		self.http_server.server_close()
+
+def send_body(request_handler, body, status=200, headers=None):
+	"""
+	Answer the request with the `BODY` (nothing for a `HEAD`).
+	"""
+	request_handler.send_response(status)
+	for header_name, header_value in (headers or {}).items():
+		request_handler.send_header(header_name, header_value)
+	request_handler.send_header('Content-Length', str(len(body)))
+	request_handler.end_headers()
+	if request_handler.command != 'HEAD':
+		request_handler.wfile.write(body)
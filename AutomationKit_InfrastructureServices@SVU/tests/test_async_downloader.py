@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Checks of the resolution recipes of the `ASYNCIO` download engine.
+
+import unittest
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.ComponentRegistry, helpers.DownloaderUtilities.AsyncDownloader
+import helpers.BuildConfig.Httpd.HttpdConfig
+
+class DownloadRecipesTest(unittest.TestCase):
+
+	def test_recipes_follow_the_registry(self):
+		download_recipes = helpers.DownloaderUtilities.AsyncDownloader.download_recipes()
+		self.assertEqual(set(download_recipes), {component.component_name
+													for component in helpers.ComponentRegistry.COMPONENT_REGISTRY.values()})
+
+		# The download options are the ones of the configurations module of the component.
+		httpd_recipe = download_recipes[helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME]
+		self.assertEqual(httpd_recipe['segments'], helpers.BuildConfig.Httpd.HttpdConfig.DOWNLOAD_SEGMENTS)
+		self.assertEqual(httpd_recipe['mirrors'], helpers.BuildConfig.Httpd.HttpdConfig.MIRROR_URLS)
+
+	def test_registered_component_gets_a_recipe(self):
+		httpd_component = helpers.ComponentRegistry.COMPONENT_REGISTRY['HTTPD']
+		test_component  = helpers.ComponentRegistry.Component(httpd_component.component_config, 'Test-Main', 'Test',
+																'test', 'Test/', 'Test-Downloader',
+																httpd_component.downloader_thread_worker, 'Test-Untar',
+																download_url='http://127.0.0.1/test.tar.gz')
+		helpers.ComponentRegistry.COMPONENT_REGISTRY['TEST'] = test_component
+		try:
+			download_recipes = helpers.DownloaderUtilities.AsyncDownloader.download_recipes()
+		finally:
+			del helpers.ComponentRegistry.COMPONENT_REGISTRY['TEST']
+		self.assertEqual(download_recipes['Test-Main']['url'], 'http://127.0.0.1/test.tar.gz')
+		self.assertEqual(download_recipes['Test-Main']['hops'], [])
+
+if __name__ == '__main__':
+	unittest.main()
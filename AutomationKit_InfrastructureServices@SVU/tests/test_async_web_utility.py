@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Checks of the package downloads of the `ASYNCIO` engine, against a local stand-in server.
+
+import asyncio, os, tempfile, threading, unittest
+from unittest import mock
+
+from local_server import LocalServer, send_body
+
+import helpers.BuildConfig.IO.IOConfig
+import helpers.Utilities.AsyncWebUtility, helpers.Utilities.WebUtility
+from urllib.request import Request
+
+PACKAGE_BODY = os.urandom(256 * 1024)
+
+def ranged_package(request_handler):
+	# Serves the package, or the byte range asked for.
+	package_headers = {'ETag': '"v1"', 'Accept-Ranges': 'bytes'}
+	if 'Range' not in request_handler.headers:
+		send_body(request_handler, PACKAGE_BODY, headers=package_headers)
+		return
+	range_start, range_end = request_handler.headers['Range'][len('bytes='):].split('-')
+	range_end = int(range_end) if range_end else len(PACKAGE_BODY) - 1
+	send_body(request_handler, PACKAGE_BODY[int(range_start):range_end + 1], status=206,
+				headers=dict(package_headers, **{'Content-Range': 'bytes ' + range_start + '-' + str(range_end) + '/' +
+													str(len(PACKAGE_BODY))}))
+
+class AsyncFetchTest(unittest.TestCase):
+
+	def setUp(self):
+		self.download_base = tempfile.TemporaryDirectory()
+		self.tar_file_location = os.path.join(self.download_base.name, 'package.tar.gz')
+		for option_name, option_value in (('PREALLOCATE_ENABLED', False), ('SEGMENTED_DOWNLOAD_MIN_SIZE', 64 * 1024)):
+			option_patch = mock.patch.object(helpers.BuildConfig.IO.IOConfig, option_name, option_value)
+			option_patch.start()
+			self.addCleanup(option_patch.stop)
+
+	def tearDown(self):
+		self.download_base.cleanup()
+
+	def _fetch(self, package_url, download_segments=1):
+		return asyncio.run(helpers.Utilities.AsyncWebUtility._fetch_tar_binary(Request(package_url), self.tar_file_location,
+																				download_segments))
+
+	def _assert_package(self):
+		with open(self.tar_file_location, 'rb') as tar_object:
+			self.assertEqual(tar_object.read(), PACKAGE_BODY)
+		self.assertFalse(os.path.exists(self.tar_file_location + helpers.Utilities.WebUtility.PART_FILE_EXTENSION))
+
+	def test_partial_download_is_resumed(self):
+		with LocalServer({'/package.tar.gz': ranged_package}) as local_server:
+			package_url = local_server.url('/package.tar.gz')
+			with open(self.tar_file_location + helpers.Utilities.WebUtility.PART_FILE_EXTENSION, 'wb') as part_object:
+				part_object.write(PACKAGE_BODY[:4096])
+			helpers.Utilities.WebUtility._save_part_metadata(
+				self.tar_file_location + helpers.Utilities.WebUtility.PART_FILE_EXTENSION + '.json',
+				{'url': package_url, 'source_url': package_url, 'etag': '"v1"', 'last_modified': None})
+			self._fetch(package_url)
+
+			# Only the remainder of the package is asked for.
+			self.assertEqual(local_server.requests[-1][2].get('Range'), 'bytes=4096-')
+		self._assert_package()
+
+	def test_large_package_is_segmented(self):
+		with LocalServer({'/package.tar.gz': ranged_package}) as local_server:
+			self._fetch(local_server.url('/package.tar.gz'), download_segments=4)
+
+			# A `HEAD` probe, then one range request per segment.
+			segment_ranges = [request_headers.get('Range') for request_command, _, request_headers in local_server.requests
+									if request_command == 'GET']
+			self.assertEqual(len(segment_ranges), 4)
+			self.assertNotIn(None, segment_ranges)
+		self._assert_package()
+
+	def test_writes_run_off_the_event_loop(self):
+		write_threads     = set()
+		open_part_file    = helpers.Utilities.AsyncWebUtility._open_part_file
+
+		class RecordedFile(object):
+			# Notes the threads the writes are made from.
+			def __init__(self, tar_object):
+				self.tar_object = tar_object
+
+			def write(self, tar_chunk):
+				write_threads.add(threading.get_ident())
+				return self.tar_object.write(tar_chunk)
+
+			def __getattr__(self, attribute_name):
+				return getattr(self.tar_object, attribute_name)
+
+		with LocalServer({'/package.tar.gz': ranged_package}) as local_server, \
+				mock.patch.object(helpers.Utilities.AsyncWebUtility, '_open_part_file',
+									lambda *args: RecordedFile(open_part_file(*args))):
+			self._fetch(local_server.url('/package.tar.gz'))
+		self._assert_package()
+
+		# The event loop ran in this thread.
+		self.assertTrue(write_threads)
+		self.assertNotIn(threading.get_ident(), write_threads)
+
+if __name__ == '__main__':
+	unittest.main()
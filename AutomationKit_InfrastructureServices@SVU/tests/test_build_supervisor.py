@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Checks of the build pipeline stages of the `HTTPD` build, as derived from the component registry.
+
+import types, unittest
+from unittest import mock
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.BuildSupervisor, helpers.ComponentRegistry
+import helpers.BuildConfig.Common.CommonConfig, helpers.BuildConfig.Httpd.HttpdConfig
+import helpers.Utilities.PipelineUtility
+
+class HttpdPipelineTest(unittest.TestCase):
+
+	def setUp(self):
+		# The stages only, i.e., without the `__INIT__` of the build (requirements, process pool).
+		for attribute_name, attribute_value in (('build_environment', helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT),
+												('workflow_deadline', None)):
+			attribute_patch = mock.patch.object(helpers.BuildSupervisor.HttpdAutomate, attribute_name, attribute_value,
+												create=True)
+			attribute_patch.start()
+			self.addCleanup(attribute_patch.stop)
+		journal_patch = mock.patch.object(helpers.BuildConfig.Common.CommonConfig, 'WORKFLOW_JOURNAL_ENABLED', False)
+		journal_patch.start()
+		self.addCleanup(journal_patch.stop)
+
+	def _pipeline_stages(self):
+		# Returns the `STAGE NAME -> REQUIRED STAGES` of the pipeline of the build.
+		helpers.BuildSupervisor.HttpdAutomate.component_resolver = helpers.ComponentRegistry.ComponentResolver(
+																	helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT)
+		self.addCleanup(delattr, helpers.BuildSupervisor.HttpdAutomate, 'component_resolver')
+		with mock.patch.object(helpers.Utilities.PipelineUtility, 'PipelineScheduler') as pipeline_scheduler:
+			helpers.BuildSupervisor.HttpdAutomate._run_build_pipeline()
+		return {stage_call.args[0]: set(stage_call.kwargs.get('requires', ()))
+					for stage_call in pipeline_scheduler.return_value.add_stage.call_args_list}
+
+	def test_stages_follow_the_registry(self):
+		component_names = {registry_name: helpers.ComponentRegistry.COMPONENT_REGISTRY[registry_name].component_name
+								for registry_name in ('HTTPD', 'APR', 'APRUtil', 'PCRE')}
+		pipeline_stages = self._pipeline_stages()
+
+		# The srclib sources are copied, the others built, and `HTTPD` is built last.
+		self.assertEqual(pipeline_stages['COPY::' + component_names['APR']],
+							{'EXTRACT::' + component_names['APR'], 'EXTRACT::' + component_names['HTTPD']})
+		self.assertEqual(pipeline_stages['BUILD::' + component_names['PCRE']], {'EXTRACT::' + component_names['PCRE']})
+		self.assertEqual(pipeline_stages['BUILD::' + component_names['HTTPD']],
+							{'EXTRACT::' + component_names['HTTPD'], 'COPY::' + component_names['APR'],
+								'COPY::' + component_names['APRUtil'], 'BUILD::' + component_names['PCRE']})
+
+	def test_registered_srclib_component_is_copied(self):
+		apr_component  = helpers.ComponentRegistry.COMPONENT_REGISTRY['APR']
+		test_config    = types.SimpleNamespace(ENVIRONMENT={'BUILD_TARGET': '__TEST__', 'DEPENDENCY': None})
+		test_component = helpers.ComponentRegistry.Component(test_config, 'Test-Main', 'Test', 'test', 'Test/',
+																'Test-Downloader', apr_component.downloader_thread_worker,
+																'Test-Untar', build_mode='srclib', srclib_directory='test/',
+																source_destination=apr_component.source_destination)
+		with mock.patch.dict(helpers.ComponentRegistry.COMPONENT_REGISTRY, {'TEST': test_component}), \
+				mock.patch.dict(helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT,
+								{'DEPENDENCY': helpers.BuildConfig.Httpd.HttpdConfig.ENVIRONMENT['DEPENDENCY'] + ['TEST']}):
+			pipeline_stages = self._pipeline_stages()
+
+		self.assertEqual(pipeline_stages['COPY::Test-Main'],
+							{'EXTRACT::Test-Main', 'EXTRACT::' + helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME})
+		self.assertIn('COPY::Test-Main', pipeline_stages['BUILD::' + helpers.BuildConfig.Httpd.HttpdConfig.HTTPD_COMPONENT_NAME])
+
+if __name__ == '__main__':
+	unittest.main()
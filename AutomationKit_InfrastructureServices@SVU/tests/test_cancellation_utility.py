@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+# Checks of the cancellation tokens, and of the tokens within them.
+
+import gc, unittest, weakref
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.Utilities.CancellationUtility
+
+class CancellationTokenTest(unittest.TestCase):
+
+	def test_cancel_reaches_the_tokens_within(self):
+		parent_token     = helpers.Utilities.CancellationUtility.CancellationToken(label='Pipeline')
+		child_token      = helpers.Utilities.CancellationUtility.CancellationToken(parent=parent_token, label='Stage')
+		grandchild_token = helpers.Utilities.CancellationUtility.CancellationToken(parent=child_token, label='Task')
+
+		parent_token.cancel('Sibling Failed')
+		self.assertTrue(child_token.cancelled() and grandchild_token.cancelled())
+		self.assertEqual(grandchild_token.reason, 'Sibling Failed')
+
+		# A token started within a cancelled one is cancelled right away.
+		self.assertTrue(helpers.Utilities.CancellationUtility.CancellationToken(parent=parent_token).cancelled())
+
+	def test_finished_tokens_are_not_held_by_the_parent(self):
+		parent_token = helpers.Utilities.CancellationUtility.CancellationToken(label='Pipeline')
+		child_refs   = [weakref.ref(helpers.Utilities.CancellationUtility.CancellationToken(parent=parent_token))
+							for _ in range(100)]
+		gc.collect()
+		self.assertEqual([child_ref for child_ref in child_refs if child_ref() is not None], [])
+
+		# Cancelling the parent later on touches none of them.
+		parent_token.cancel('Build Cancelled')
+
+	def test_cancel_of_a_child_leaves_the_parent(self):
+		parent_token = helpers.Utilities.CancellationUtility.CancellationToken(label='Pipeline')
+		helpers.Utilities.CancellationUtility.CancellationToken(parent=parent_token, label='Stage').cancel('Stage Failed')
+		self.assertFalse(parent_token.cancelled())
+
+if __name__ == '__main__':
+	unittest.main()
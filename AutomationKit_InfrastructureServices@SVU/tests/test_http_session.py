@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Checks of the pooled keep-alive connections, against a local stand-in server.
+
+import time, unittest
+
+from local_server import LocalServer, send_body
+
+import helpers.BuildConfig.IO.IOConfig
+import helpers.Utilities.HttpSessionUtility, helpers.Utilities.CancellationUtility
+from urllib.error import URLError
+from urllib.request import Request
+
+PAGE_BODY = b'<a href="apache-tomcat-8.5.99.tar.gz">apache-tomcat-8.5.99.tar.gz</a>'
+
+def keep_alive_page(request_handler):
+	send_body(request_handler, PAGE_BODY)
+
+def dropped_after_page(request_handler):
+	# Answers as keep-alive, then drops the connection (as a server closing idle connections would).
+	send_body(request_handler, PAGE_BODY)
+	request_handler.close_connection = True
+
+def dropped_page(request_handler):
+	# Drops the connection without an answer.
+	request_handler.close_connection = True
+
+class HttpSessionTest(unittest.TestCase):
+
+	def setUp(self):
+		helpers.BuildConfig.IO.IOConfig.POOL_ENABLED = True
+		self.connect_timeout = helpers.BuildConfig.IO.IOConfig.CONNECT_TIMEOUT
+		self.http_session = helpers.Utilities.HttpSessionUtility.HttpSession(
+								helpers.Utilities.HttpSessionUtility.ConnectionPool(max_connections_per_host=1))
+
+	def tearDown(self):
+		helpers.BuildConfig.IO.IOConfig.CONNECT_TIMEOUT = self.connect_timeout
+		self.http_session.pool.close()
+
+	def _get(self, page_url):
+		with self.http_session.urlopen(page_url) as response_object:
+			return response_object.read()
+
+	def test_keep_alive_connection_is_reused(self):
+		with LocalServer({'/page.html': keep_alive_page}) as local_server:
+			for _ in range(3):
+				self.assertEqual(self._get(local_server.url('/page.html')), PAGE_BODY)
+
+			# The three requests went over a single connection.
+			self.assertEqual(local_server.connections, 1)
+		self.assertEqual(self.http_session.pool.report(), {'new_connections': 1, 'reused_connections': 2})
+
+	def test_stale_pooled_connection_is_replayed(self):
+		with LocalServer({'/page.html': dropped_after_page}) as local_server:
+			self.assertEqual(self._get(local_server.url('/page.html')), PAGE_BODY)
+			time.sleep(0.2)
+
+			# The pooled connection was dropped by the server, the request is replayed on a fresh one.
+			self.assertEqual(self._get(local_server.url('/page.html')), PAGE_BODY)
+			self.assertEqual(local_server.connections, 2)
+			self.assertEqual(len(local_server.requests), 2)
+
+	def test_dropped_fresh_connection_is_not_replayed(self):
+		with LocalServer({'/page.html': dropped_page}) as local_server:
+			with self.assertRaises(URLError):
+				self._get(local_server.url('/page.html'))
+			self.assertEqual(len(local_server.requests), 1)
+
+	def test_failed_requests_free_their_connection(self):
+		helpers.BuildConfig.IO.IOConfig.CONNECT_TIMEOUT = 0.5
+		cancellation_token = helpers.Utilities.CancellationUtility.CancellationToken(label='Upload')
+		cancellation_token.cancel('Build Cancelled')
+
+		def cancelled_upload():
+			# The task is cancelled while the request body is being sent.
+			yield b'part'
+			cancellation_token.check()
+
+		with LocalServer({'/page.html': keep_alive_page}) as local_server:
+			with self.assertRaises(helpers.Utilities.CancellationUtility.TaskCancelledError):
+				self.http_session.urlopen(Request(local_server.url('/page.html'), data=cancelled_upload(), method='POST'))
+			with self.assertRaises(ValueError):
+				self.http_session.urlopen(Request(local_server.url('/page.html'), headers={'X-Build': 'bad\nvalue'}))
+
+			# The pool (of a single connection) still serves the later requests.
+			for _ in range(self.http_session.pool.max_connections_per_host + 1):
+				self.assertEqual(self._get(local_server.url('/page.html')), PAGE_BODY)
+
+	def test_exhausted_pool_wait_is_bounded(self):
+		helpers.BuildConfig.IO.IOConfig.CONNECT_TIMEOUT = 0.5
+		with LocalServer({'/page.html': keep_alive_page}) as local_server:
+			# The only connection of the pool stays in use (its response is never closed).
+			held_response = self.http_session.urlopen(local_server.url('/page.html'))
+			wait_start    = time.monotonic()
+			with self.assertRaises(helpers.Utilities.HttpSessionUtility.PoolExhaustedError):
+				self._get(local_server.url('/page.html'))
+			self.assertLess(time.monotonic() - wait_start, 5)
+			held_response.close()
+
+if __name__ == '__main__':
+	unittest.main()
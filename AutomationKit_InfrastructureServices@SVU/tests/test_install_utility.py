@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Checks of the install of the extracted binaries into their binary locations.
+
+import os, tempfile, unittest
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.Utilities.InstallUtility
+
+class InstallTest(unittest.TestCase):
+
+	def setUp(self):
+		self.binary_base = tempfile.TemporaryDirectory()
+		self.binary_location = os.path.join(self.binary_base.name, 'Tomcat')
+
+	def tearDown(self):
+		helpers.Utilities.InstallUtility._staging_directories.clear()
+		self.binary_base.cleanup()
+
+	def _extract_tree(self, tree_name, member_name):
+		extract_directory = helpers.Utilities.InstallUtility.extract_directory('Tomcat/')
+		os.makedirs(os.path.join(extract_directory, tree_name))
+		open(os.path.join(extract_directory, tree_name, member_name), 'w').close()
+		return os.path.join(extract_directory, tree_name)
+
+	def test_stale_staging_tree_is_cleared(self):
+		helpers.Utilities.InstallUtility.register_staging('Tomcat/', self.binary_location)
+		self._extract_tree('apache-tomcat-stale', 'RELEASE-NOTES')
+
+		# A later build doesn't find the tree the failed one left in staging.
+		helpers.Utilities.InstallUtility.register_staging('Tomcat/', self.binary_location)
+		self.assertFalse(os.path.exists(helpers.Utilities.InstallUtility.extract_directory('Tomcat/')))
+
+	def test_install_replaces_the_former_tree(self):
+		helpers.Utilities.InstallUtility.register_staging('Tomcat/', self.binary_location)
+		install_location = os.path.join(self.binary_location, 'apache-tomcat')
+		for member_name in ('FORMER', 'NEW'):
+			self.assertEqual(helpers.Utilities.InstallUtility.install_tree(
+								self._extract_tree('apache-tomcat', member_name), install_location), 'rename')
+
+		# The new tree replaced the former one (not nested in it), and nothing is left aside or staged.
+		self.assertEqual(os.listdir(install_location), ['NEW'])
+		self.assertEqual(os.listdir(self.binary_location), ['apache-tomcat'])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Checks of the streaming link scanner, against a search of the whole page.
+
+import re, unittest
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.BuildConfig.Tomcat.TomcatConfig
+import helpers.Utilities.LinkScannerUtility
+
+# A download page, where the greedy `(.+)?` of the pattern runs on from the package link to the signature link.
+DOWNLOAD_PAGE = ('<p>Mirrors and release notes. ' * 150 + '</p>\n' +
+					'<li><a href="https://dlcdn.apache.org/tomcat/tomcat-8/v8.5.9/bin/apache-tomcat-8.5.9.tar.gz">tar.gz</a> ' +
+					'(<a href="https://downloads.apache.org/tomcat/tomcat-8/v8.5.9/bin/apache-tomcat-8.5.9.tar.gz.asc">pgp</a>)</li>\n' +
+					'<p>Older releases. ' * 300 + '</p>\n')
+
+class LinkScannerTest(unittest.TestCase):
+
+	def _scan(self, page_bytes, chunk_size, link_pattern):
+		link_scanner = helpers.Utilities.LinkScannerUtility.LinkScanner(link_pattern)
+		for chunk_start in range(0, len(page_bytes), chunk_size):
+			if link_scanner.feed(page_bytes[chunk_start:chunk_start + chunk_size]) is not None:
+				return link_scanner.match_result.group(0)
+		match_result = link_scanner.feed(b'', final=True)
+		return match_result.group(0) if match_result is not None else None
+
+	def test_match_does_not_depend_on_the_chunks(self):
+		link_pattern = helpers.BuildConfig.Tomcat.TomcatConfig.VERSION_DOWNLOAD_PATTERN
+		page_match   = re.search(link_pattern, DOWNLOAD_PAGE).group(0)
+		page_bytes   = DOWNLOAD_PAGE.encode('UTF-8')
+		for chunk_size in (1, 7, 1024, 4096, 5100, 5160, 16 * 1024, len(page_bytes)):
+			self.assertEqual(self._scan(page_bytes, chunk_size, link_pattern), page_match, 'Chunk Size: ' + str(chunk_size))
+
+	def test_match_at_the_end_of_the_page(self):
+		page_bytes = DOWNLOAD_PAGE.encode('UTF-8') + b'/tomcat/tomcat-8/v8.5.10/bin/apache-tomcat-8.5.10.tar.gz'
+		link_pattern = '/tomcat/tomcat-8/v8\\.5\\.1[0-9]+/bin/apache-tomcat-[0-9.]+\\.tar\\.gz'
+		for chunk_size in (1024, len(page_bytes)):
+			self.assertEqual(self._scan(page_bytes, chunk_size, link_pattern), re.search(link_pattern, page_bytes.decode()).group(0))
+
+if __name__ == '__main__':
+	unittest.main()
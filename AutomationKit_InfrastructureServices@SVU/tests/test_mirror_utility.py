@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# Checks of the hedged mirror requests, against two local stand-in servers (a primary and a mirror).
+
+import json, os, tempfile, time, unittest
+
+from local_server import LocalServer, send_body
+
+import helpers.BuildConfig.IO.IOConfig
+import helpers.Utilities.MirrorUtility, helpers.Utilities.HttpSessionUtility
+from urllib.request import Request
+
+PACKAGE_BODY = b'package' * 1024
+
+def served_package(request_handler):
+	send_body(request_handler, PACKAGE_BODY)
+
+def slow_package(request_handler):
+	# The first byte is overdue (well past the hedge delay).
+	time.sleep(1.0)
+	send_body(request_handler, PACKAGE_BODY)
+
+def failed_package(request_handler):
+	send_body(request_handler, b'Internal Server Error', status=500)
+
+class RecordedResponse(object):
+	# Notes whether the raced response was closed.
+	def __init__(self, response_object):
+		self.response_object = response_object
+		self.closed          = False
+
+	def read(self, amt=None):
+		return self.response_object.read(amt)
+
+	def close(self):
+		self.closed = True
+		self.response_object.close()
+
+class MirrorRaceTest(unittest.TestCase):
+
+	def setUp(self):
+		self.history_base = tempfile.TemporaryDirectory()
+		self.history_file = os.path.join(self.history_base.name, 'mirror_history.json')
+		self.mirror_selector = helpers.Utilities.MirrorUtility.MirrorSelector(self.history_file)
+		self.http_session    = helpers.Utilities.HttpSessionUtility.HttpSession(
+									helpers.Utilities.HttpSessionUtility.ConnectionPool(max_connections_per_host=2))
+		self.responses       = {}
+		self.hedge_delay     = helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_DELAY
+		helpers.BuildConfig.IO.IOConfig.MIRROR_SELECTION_ENABLED = True
+
+	def tearDown(self):
+		helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_DELAY = self.hedge_delay
+		self.http_session.pool.close()
+		self.history_base.cleanup()
+
+	def _urlopen(self, request_object):
+		self.responses[request_object.full_url] = RecordedResponse(self.http_session.urlopen(request_object))
+		return self.responses[request_object.full_url]
+
+	def _open_hedged(self, primary_server, mirror_server):
+		return self.mirror_selector.open_hedged(Request(primary_server.url('/package.tar.gz')),
+												[primary_server.base_url, mirror_server.base_url], self._urlopen)
+
+	def test_slow_primary_loses_to_the_hedge(self):
+		helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_DELAY = 0.1
+		with LocalServer({'/package.tar.gz': slow_package}) as primary_server, \
+				LocalServer({'/package.tar.gz': served_package}) as mirror_server:
+			race_response, race_request = self._open_hedged(primary_server, mirror_server)
+			self.assertEqual(race_request.full_url, mirror_server.url('/package.tar.gz'))
+			self.assertEqual(race_response.read(), PACKAGE_BODY)
+			race_response.close()
+
+			# The primary answers later on, and its response is closed.
+			primary_url = primary_server.url('/package.tar.gz')
+			wait_until  = time.monotonic() + 10
+			while not (primary_url in self.responses and self.responses[primary_url].closed) and time.monotonic() < wait_until:
+				time.sleep(0.05)
+			self.assertTrue(self.responses[primary_url].closed)
+
+	def test_failed_primary_fails_over_to_the_mirror(self):
+		helpers.BuildConfig.IO.IOConfig.MIRROR_HEDGE_DELAY = 5.0
+		with LocalServer({'/package.tar.gz': failed_package}) as primary_server, \
+				LocalServer({'/package.tar.gz': served_package}) as mirror_server:
+			race_start = time.monotonic()
+			race_response, race_request = self._open_hedged(primary_server, mirror_server)
+
+			# The mirror is tried straight away, not after the hedge delay.
+			self.assertLess(time.monotonic() - race_start, 2.0)
+			self.assertEqual(race_request.full_url, mirror_server.url('/package.tar.gz'))
+			self.assertEqual(race_response.read(), PACKAGE_BODY)
+			race_response.close()
+
+		# The failure is held against the primary, hence it's ranked last next time.
+		with open(self.history_file) as history_object:
+			self.assertEqual(json.load(history_object)[primary_server.base_url]['failures'], 1)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# Checks of the circuit breaker of the upstream hosts.
+
+import time, unittest
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.BuildConfig.IO.IOConfig
+import helpers.Utilities.RetryUtility
+
+PACKAGE_URL = 'https://archive.apache.org/dist/tomcat/apache-tomcat-8.5.99.tar.gz'
+
+class CircuitBreakerTest(unittest.TestCase):
+
+	def setUp(self):
+		helpers.BuildConfig.IO.IOConfig.CIRCUIT_BREAKER_ENABLED = True
+		self.circuit_breaker = helpers.Utilities.RetryUtility.CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+		for _ in range(2):
+			self.circuit_breaker.record_failure(PACKAGE_URL)
+
+	def _let_through(self):
+		try:
+			self.circuit_breaker.before_request(PACKAGE_URL)
+		except helpers.Utilities.RetryUtility.CircuitOpenError:
+			return False
+		return True
+
+	def test_open_circuit_fails_fast(self):
+		self.assertFalse(self._let_through())
+
+	def test_single_probe_once_half_open(self):
+		time.sleep(0.25)
+
+		# A single request probes the host, the others keep failing fast until it answers.
+		self.assertEqual([self._let_through() for _ in range(5)], [True, False, False, False, False])
+		self.circuit_breaker.record_success(PACKAGE_URL)
+		self.assertEqual([self._let_through() for _ in range(3)], [True, True, True])
+
+	def test_failed_probe_opens_the_circuit_again(self):
+		time.sleep(0.25)
+		self.assertTrue(self._let_through())
+		self.circuit_breaker.record_failure(PACKAGE_URL)
+		self.assertFalse(self._let_through())
+
+		time.sleep(0.25)
+		self.assertTrue(self._let_through())
+
+	def test_probe_without_outcome_is_given_up_on(self):
+		time.sleep(0.25)
+		self.assertTrue(self._let_through())
+
+		# The probe never recorded its outcome (for eg., it was cancelled), another one is let through.
+		time.sleep(0.25)
+		self.assertEqual([self._let_through() for _ in range(2)], [True, False])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Checks of the segmented downloads, against a local stand-in server.
+
+import os, tempfile, time, unittest
+from unittest import mock
+
+from local_server import LocalServer, send_body
+
+import helpers.Utilities.SegmentedDownloadUtility, helpers.Utilities.BufferUtility
+from urllib.request import Request
+from urllib.error   import HTTPError
+
+# The segments are past `HttpSessionUtility.MAX_DRAIN_SIZE`, hence a cancelled one isn't drained.
+PACKAGE_BODY = os.urandom(1024 * 1024)
+
+def failing_first_segment(request_handler):
+	# The first segment fails straight away, the others trickle in (about 6 seconds each).
+	range_start, range_end = (int(range_bound) for range_bound in request_handler.headers['Range'][len('bytes='):].split('-'))
+	if not range_start:
+		send_body(request_handler, b'Internal Server Error', status=500)
+		return
+	request_handler.send_response(206)
+	request_handler.send_header('Content-Range', 'bytes ' + str(range_start) + '-' + str(range_end) + '/' +
+									str(len(PACKAGE_BODY)))
+	request_handler.send_header('Content-Length', str(range_end + 1 - range_start))
+	request_handler.end_headers()
+	try:
+		for chunk_start in range(range_start, range_end + 1, 4096):
+			request_handler.wfile.write(PACKAGE_BODY[chunk_start:min(chunk_start + 4096, range_end + 1)])
+			request_handler.wfile.flush()
+			time.sleep(0.1)
+	except (BrokenPipeError, ConnectionResetError):
+		# The cancelled segment dropped the connection.
+		request_handler.close_connection = True
+
+class SegmentedDownloadTest(unittest.TestCase):
+
+	def setUp(self):
+		self.download_base = tempfile.TemporaryDirectory()
+		self.part_file_location = os.path.join(self.download_base.name, 'package.tar.gz.part')
+
+	def tearDown(self):
+		self.download_base.cleanup()
+
+	def test_failed_segment_cancels_its_siblings(self):
+		with LocalServer({'/package.tar.gz': failing_first_segment}) as local_server:
+			download_start = time.monotonic()
+			with self.assertRaises(HTTPError):
+				helpers.Utilities.SegmentedDownloadUtility.download(Request(local_server.url('/package.tar.gz')),
+																	self.part_file_location, len(PACKAGE_BODY), 4, None)
+
+			# The siblings gave up within a chunk, instead of completing their transfers.
+			self.assertLess(time.monotonic() - download_start, 4.0)
+
+	def test_unsupported_preallocation_extends_the_file(self):
+		# For eg., a file-system answering `EOPNOTSUPP`.
+		with mock.patch.object(helpers.Utilities.BufferUtility.os, 'posix_fallocate',
+								side_effect=OSError(95, 'Operation not supported')), \
+				mock.patch.object(helpers.Utilities.SegmentedDownloadUtility, '_fetch_segment'):
+			helpers.Utilities.SegmentedDownloadUtility.download(Request('http://127.0.0.1/package.tar.gz'),
+																self.part_file_location, len(PACKAGE_BODY), 4, None)
+		self.assertEqual(os.path.getsize(self.part_file_location), len(PACKAGE_BODY))
+
+if __name__ == '__main__':
+	unittest.main()
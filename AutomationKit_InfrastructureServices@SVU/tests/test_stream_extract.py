@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# Checks of the streaming extraction, failed by the extraction thread.
+
+import io, os, tarfile, tempfile, unittest
+
+# Puts the package directory on the path.
+import local_server
+
+import helpers.BuildConfig.Untar.UntarConfig
+import helpers.Utilities.StreamExtractUtility
+
+def package_bytes(member_count):
+	package_buffer = io.BytesIO()
+	with tarfile.open(fileobj=package_buffer, mode='w:gz') as tar_file:
+		for member_number in range(member_count):
+			member_bytes = os.urandom(16 * 1024)
+			tar_member = tarfile.TarInfo('package/member_' + str(member_number))
+			tar_member.size = len(member_bytes)
+			tar_file.addfile(tar_member, io.BytesIO(member_bytes))
+	return package_buffer.getvalue()
+
+class FailingFilter(object):
+	# Raises halfway through the package, as a faulty filter (or a corrupt member) would.
+	def select(self, tar_members):
+		for member_number, tar_member in enumerate(tar_members):
+			if member_number == 10:
+				raise ValueError('Faulty Member Filter')
+			yield tar_member
+
+class StreamExtractTest(unittest.TestCase):
+
+	def setUp(self):
+		self.extract_base = tempfile.TemporaryDirectory()
+		helpers.BuildConfig.Untar.UntarConfig.TAR_BASE_EXTRACT_DIRECTORY = self.extract_base.name + '/'
+		helpers.BuildConfig.Untar.UntarConfig.STREAM_EXTRACT_ENABLED = True
+		self.tar_file_location = os.path.join(self.extract_base.name, 'package.tar.gz')
+		with open(self.tar_file_location, 'wb') as tar_object:
+			tar_object.write(package_bytes(50))
+
+	def tearDown(self):
+		self.extract_base.cleanup()
+
+	def test_extraction_completes(self):
+		stream_extractor = helpers.Utilities.StreamExtractUtility.StreamingExtractor.for_package('package.tar.gz', 'Package/')
+		self.assertTrue(stream_extractor.finish(self.tar_file_location))
+		self.assertEqual(len(os.listdir(os.path.join(stream_extractor.extract_directory, 'package'))), 50)
+
+	def test_unexpected_error_leaves_nothing_in_place(self):
+		stream_extractor = helpers.Utilities.StreamExtractUtility.StreamingExtractor.for_package('package.tar.gz', 'Package/')
+		stream_extractor.member_filter = FailingFilter()
+
+		# The partial extraction is dropped, not moved in place.
+		self.assertFalse(stream_extractor.finish(self.tar_file_location))
+		self.assertFalse(os.path.exists(stream_extractor.extract_directory))
+		self.assertFalse(os.path.exists(stream_extractor.staging_directory))
+
+if __name__ == '__main__':
+	unittest.main()
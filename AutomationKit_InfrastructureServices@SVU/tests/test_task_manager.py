@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Checks of the `TASK_MANAGER` task executor.
+# Run from the package directory: `python3 -m pytest -q tests` (or `python3 -m unittest discover -s tests`).
+
+import os, sys, subprocess, tempfile, textwrap, time, unittest
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A download task that never returns (it ignores its time budget and the cancellation token).
+HUNG_TASK_SCRIPT = textwrap.dedent('''
+	import sys, threading, time
+	sys.path.insert(0, {package_directory!r})
+	import helpers.BuildConfig.Common.CommonConfig as CommonConfig, helpers.BuildConfig.Cache.CacheConfig as CacheConfig
+	CommonConfig.TAR_DOWNLOAD_BASE     = {download_base!r}
+	CommonConfig.COMPONENT_TIME_BUDGET = 0.5
+	CommonConfig.JOIN_GRACE_PERIOD     = 0.2
+	CommonConfig.TASK_RETRIES          = 0
+	CacheConfig.ARTIFACT_CACHE_ENABLED = False
+	import helpers.TaskManager
+
+	class HungDownloaderThread(threading.Thread):
+		def __init__(self, group=None, target=None, name=None, args=(), kwargs=None, *, daemon=None):
+			super().__init__(name=name)
+			self.exception_stacktrace_queue = args[0]
+			self.download_complete = False
+			self.tar_file_name = self.tar_url = self.deadline = None
+
+		def run(self):
+			time.sleep(3600)
+
+	try:
+		helpers.TaskManager.DownloadManager().begin('TOMCAT', {{'Hung': {{'thread_worker': HungDownloaderThread,
+																		'thread_name'  : 'HUNG::DOWNLOADER::THREAD'}}}})
+	except BaseException as hung_error:
+		print('GAVE UP:', type(hung_error).__name__)
+''')
+
+class HungTaskTest(unittest.TestCase):
+
+	def test_hung_task_does_not_block_exit(self):
+		with tempfile.TemporaryDirectory() as download_base:
+			hung_script = HUNG_TASK_SCRIPT.format(package_directory=PACKAGE_DIRECTORY, download_base=download_base + '/')
+			start_time  = time.monotonic()
+			completed   = subprocess.run([sys.executable, '-c', hung_script], cwd=PACKAGE_DIRECTORY, timeout=60,
+											stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+
+		# The manager gives up on the task past its budget, and the process exits right after.
+		self.assertIn('GAVE UP', completed.stdout)
+		self.assertLess(time.monotonic() - start_time, 30)
+
+if __name__ == '__main__':
+	unittest.main()
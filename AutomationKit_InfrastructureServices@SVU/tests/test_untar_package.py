@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+# Checks of the extraction worker processes, never forked while other threads run.
+# Each check runs in a process of its own, started with a single thread (like a build).
+
+import os, sys, subprocess, textwrap, unittest
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POOL_SCRIPT = textwrap.dedent('''
+	import os, sys, threading
+	sys.path.insert(0, {package_directory!r})
+	import helpers.BuildConfig.Untar.UntarConfig as UntarConfig
+	UntarConfig.EXTRACT_BACKEND = 'process'
+	UntarConfig.EXTRACT_ENGINE  = 'tarfile'
+	import helpers.UntarPackage
+
+	if {start_upfront!r}:
+		helpers.UntarPackage.start_process_pool(2)
+	threading.Thread(target=threading.Event().wait, daemon=True).start()
+
+	process_pool = helpers.UntarPackage.extract_process_pool(2)
+	if process_pool is None:
+		print('THREADS')
+	else:
+		helpers.UntarPackage.release_process_pool(process_pool)
+		print('SHARED' if process_pool is helpers.UntarPackage._process_pool else 'OWN',
+				process_pool.submit(os.getpid).result(timeout=30) != os.getpid())
+''')
+
+class ProcessPoolTest(unittest.TestCase):
+
+	def _round_pool(self, start_upfront):
+		return subprocess.run([sys.executable, '-c', POOL_SCRIPT.format(package_directory=PACKAGE_DIRECTORY,
+																			start_upfront=start_upfront)],
+								capture_output=True, text=True, timeout=60).stdout.split()
+
+	def test_no_fork_while_other_threads_run(self):
+		# The packages are extracted within the threads instead.
+		self.assertEqual(self._round_pool(start_upfront=False), ['THREADS'])
+
+	def test_rounds_share_the_pool_started_upfront(self):
+		# A round started alongside other threads gets the workers forked upfront, and leaves them running.
+		self.assertEqual(self._round_pool(start_upfront=True), ['SHARED', 'True'])
+
+if __name__ == '__main__':
+	unittest.main()
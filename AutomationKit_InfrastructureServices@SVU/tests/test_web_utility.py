@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Checks of the resumed package downloads, against a local stand-in server.
+
+import os, tempfile, unittest
+from unittest import mock
+
+from local_server import LocalServer, send_body
+
+import helpers.BuildConfig.IO.IOConfig, helpers.BuildConfig.Common.CommonConfig
+import helpers.Utilities.WebUtility, helpers.Utilities.HttpSessionUtility
+from urllib.request import Request
+
+PACKAGE_BODY = os.urandom(256 * 1024)
+
+def misranged_package(request_handler):
+	# Answers a range with a `206` for the start of the package, whatever the range asked for.
+	if 'Range' in request_handler.headers:
+		send_body(request_handler, PACKAGE_BODY[:1000], status=206,
+					headers={'Content-Range': 'bytes 0-999/' + str(len(PACKAGE_BODY)), 'ETag': '"v1"'})
+	else:
+		send_body(request_handler, PACKAGE_BODY, headers={'ETag': '"v1"'})
+
+class ResumeTest(unittest.TestCase):
+
+	def setUp(self):
+		self.download_base = tempfile.TemporaryDirectory()
+		self.tar_file_location = os.path.join(self.download_base.name, 'package.tar.gz')
+		preallocate_patch = mock.patch.object(helpers.BuildConfig.IO.IOConfig, 'PREALLOCATE_ENABLED', False)
+		preallocate_patch.start()
+		self.addCleanup(preallocate_patch.stop)
+
+	def tearDown(self):
+		self.download_base.cleanup()
+
+	def _leave_partial_download(self, package_url, partial_bytes):
+		with open(self.tar_file_location + helpers.Utilities.WebUtility.PART_FILE_EXTENSION, 'wb') as part_object:
+			part_object.write(partial_bytes)
+		helpers.Utilities.WebUtility._save_part_metadata(
+			self.tar_file_location + helpers.Utilities.WebUtility.PART_FILE_EXTENSION + '.json',
+			{'url': package_url, 'source_url': package_url, 'etag': '"v1"', 'last_modified': None})
+
+	def test_misranged_partial_content_restarts_without_range(self):
+		with LocalServer({'/package.tar.gz': misranged_package}) as local_server:
+			package_url = local_server.url('/package.tar.gz')
+			self._leave_partial_download(package_url, PACKAGE_BODY[:4096])
+			helpers.Utilities.WebUtility._fetch_tar_binary(Request(package_url), self.tar_file_location)
+
+			# The partial `206` body isn't taken for the package, the download starts over without a range.
+			self.assertNotIn('Range', local_server.requests[-1][2])
+		with open(self.tar_file_location, 'rb') as tar_object:
+			self.assertEqual(tar_object.read(), PACKAGE_BODY)
+
+if __name__ == '__main__':
+	unittest.main()